@@ -1,21 +1,39 @@
-﻿import yaml
-import logging
+﻿import logging
 from pathlib import Path
 
 # Caminho correto para o config.yaml (na mesma pasta)
 CONFIG_PATH = Path(__file__).parent / "config.yaml"
 
-# Carregar configurações do YAML
-with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-    config = yaml.safe_load(f)
+_config = None
 
-# Configurar logging baseado nas configurações
-logging.basicConfig(
-    level=getattr(logging, config["logging"]["level"]),
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
 
-logger = logging.getLogger(__name__)
+def load_config() -> dict:
+    """Carrega o YAML e configura o logging na primeira chamada (depois usa o cache)"""
+    global _config
+    if _config is None:
+        import yaml
+
+        with open(CONFIG_PATH, "r", encoding="utf-8") as f:
+            _config = yaml.safe_load(f)
+
+        # Configurar logging baseado nas configurações
+        logging.basicConfig(
+            level=getattr(logging, _config["logging"]["level"]),
+            format='%(asctime)s - %(levelname)s - %(message)s'
+        )
+    return _config
+
+
+def __getattr__(name):
+    # `config` e `logger` são resolvidos só no primeiro acesso, para que importar
+    # este módulo não leia o YAML nem configure o logging
+    if name == "config":
+        return load_config()
+    if name == "logger":
+        load_config()
+        return logging.getLogger(__name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # Exportar variáveis para uso com import *
-__all__ = ['config', 'logger']
+__all__ = ['config', 'logger', 'load_config']
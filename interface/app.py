@@ -1,23 +1,35 @@
 import streamlit as st
 import pandas as pd
-import subprocess
-import pathlib
 import json
 import sys
-import os
+import time
+from datetime import datetime
 from pathlib import Path
 
 # Adicionar src ao path para imports
 src_path = Path(__file__).parent.parent / "src"
 sys.path.insert(0, str(src_path))
 
+from core.results import read_results
+
 try:
     from config.config import config
 except ImportError:
     # Fallback se config não estiver disponível
     config = {
         "paths": {
+            "json_ligas": "./data/processed/leagues/",
             "results": "./data/processed/resultados/"
+        },
+        "simulation": {
+            "random_factor_min": 0.8,
+            "random_factor_max": 1.2,
+            "min_expected_goals": 0.1
+        },
+        "output": {
+            "csv_separator": ";",
+            "timestamp_format": "%Y-%m-%d_%H-%M-%S",
+            "csv_include_index": False
         }
     }
 
@@ -46,135 +58,113 @@ with col1:
     )
 
 with col2:
-    mode = st.radio("🎮 Modo de simulação:", ["Avançado", "Simples"])
+    mode = st.radio("🎮 Modo de simulação:", ["Avançado", "Avançado (lote)", "Simples"])
 
 st.markdown("---")
 
+@st.cache_resource
+def get_engine():
+    """Motor de simulação compartilhado entre sessões (ligas ficam em memória)"""
+    from core.service import SimulationEngine
+    return SimulationEngine(config)
+
+
+def show_results(result):
+    """Exibe o SeasonResult devolvido pelo motor"""
+    st.success(f"✅ Simulação concluída em {result.elapsed:.1f}s!")
+
+    # Mostrar output em expander
+    with st.expander("📋 Log da Simulação"):
+        st.text(result.log)
+
+    summary = result.summary
+    created_at = datetime.now().strftime("%Y-%m-%d")
+
+    # Exibir resumo
+    st.markdown("## 📊 Resultados da Simulação")
+    
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("🏆 Campeão", summary.get("champion", "N/A"))
+    with col2:
+        st.metric("⚽ Total de Gols", summary.get("total_goals", "N/A"))
+    with col3:
+        st.metric("🎯 Artilheiro", summary.get("top_scorer") or "N/A")
+    with col4:
+        st.metric("🥅 Gols do Artilheiro", summary.get("top_scorer_goals", "N/A"))
+
+    # Tabela da liga
+    st.markdown("### 🏆 Tabela Final")
+    df_table = pd.DataFrame(result.table)
+    
+    # Renomear colunas para melhor exibição
+    df_table = df_table.rename(columns={
+        'Time': '🏟️ Time',
+        'J': 'J',
+        'V': 'V', 
+        'E': 'E',
+        'D': 'D',
+        'GP': 'GP',
+        'GC': 'GC', 
+        'SG': 'SG',
+        'P': '📊 Pts'
+    })
+    
+    st.dataframe(df_table, use_container_width=True, hide_index=True)
+
+    # Top artilheiros
+    if result.players:
+        st.markdown("### ⚽ Top 10 Artilheiros")
+        df_scorers = pd.DataFrame(result.top_scorers)
+        df_scorers_display = df_scorers[['Nome', 'Time', 'Gols', 'Jogos']]
+        st.dataframe(df_scorers_display, use_container_width=True, hide_index=True)
+
+    # Botões de download
+    st.markdown("### 💾 Downloads")
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        csv_data = df_table.to_csv(sep=";", index=False).encode("utf-8")
+        st.download_button(
+            label="📊 Baixar Tabela (CSV)",
+            data=csv_data,
+            file_name=f"tabela_{result.league}_{created_at}.csv",
+            mime="text/csv"
+        )
+    
+    with col2:
+        result_file = result.files.get("jsonl") or result.files.get("json")
+        if result_file is not None:
+            data = read_results(result_file, include_matches=False)
+            json_data = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+            st.download_button(
+                label="📋 Baixar Completo (JSON)", 
+                data=json_data,
+                file_name=f"simulacao_{result.league}_{created_at}.json",
+                mime="application/json"
+            )
+
+
 # Botão de simulação
 if st.button("🚀 Rodar Simulação", type="primary", use_container_width=True):
-    
-    with st.spinner(f"🏟️ Simulando {league.replace('_', ' ').title()} no modo {mode}..."):
-        
+    # A temporada roda no worker do motor; a página continua respondendo
+    engine_mode = {"Avançado": "advanced", "Avançado (lote)": "timestep", "Simples": "simple"}[mode]
+    # Com a seed do config a temporada é determinística e repetições saem do cache de resultados
+    seed = config.get("simulation", {}).get("seed")
+    st.session_state["job"] = get_engine().submit_season(league, engine_mode, seed=seed)
+    st.session_state["job_label"] = f"{league.replace('_', ' ').title()} no modo {mode}"
+
+job = st.session_state.get("job")
+if job is not None:
+    if not job.done():
+        st.info(f"🏟️ Simulando {st.session_state['job_label']}...")
+        time.sleep(0.5)
+        st.rerun()
+    else:
         try:
-            if mode == "Avançado":
-                # Usar o script de temporada completa que sabemos que funciona
-                script_path = Path(__file__).parent.parent / "scripts" / "run_season_simulation.py"
-                
-                # Executar simulação avançada com liga selecionada
-                result = subprocess.run(
-                    [sys.executable, str(script_path), "--league", league],
-                    capture_output=True,
-                    text=True,
-                    cwd=str(Path(__file__).parent.parent)
-                )
-                
-            else:
-                # Simulação simples
-                script_path = Path(__file__).parent.parent / "src" / "core" / "simple" / "simulator.py"
-                
-                result = subprocess.run(
-                    [sys.executable, str(script_path)],
-                    capture_output=True, 
-                    text=True,
-                    cwd=str(Path(__file__).parent.parent)
-                )
-
-            if result.returncode != 0:
-                st.error("❌ Erro na simulação!")
-                st.code(result.stderr, language="bash")
-                st.code(result.stdout, language="text")
-            else:
-                st.success("✅ Simulação concluída com sucesso!")
-                
-                # Mostrar output em expander
-                with st.expander("📋 Log da Simulação"):
-                    st.text(result.stdout)
-
-                # Buscar últimos resultados
-                results_base = Path(config["paths"]["results"]) 
-                results_path = results_base / league
-                
-                if results_path.exists():
-                    # Buscar arquivos JSON mais recentes
-                    json_files = sorted(results_path.glob("*.json"), reverse=True)
-                    
-                    if json_files:
-                        latest_file = json_files[0]
-                        
-                        try:
-                            with open(latest_file, "r", encoding="utf-8") as f:
-                                data = json.load(f)
-
-                            # Exibir resumo
-                            st.markdown("## 📊 Resultados da Simulação")
-                            
-                            col1, col2, col3, col4 = st.columns(4)
-                            with col1:
-                                st.metric("🏆 Campeão", data["summary"]["champion"])
-                            with col2:
-                                st.metric("⚽ Total de Gols", data["summary"]["total_goals"])
-                            with col3:
-                                st.metric("🎯 Artilheiro", data["summary"]["top_scorer"])
-                            with col4:
-                                st.metric("🥅 Gols do Artilheiro", data["summary"]["top_scorer_goals"])
-
-                            # Tabela da liga
-                            st.markdown("### 🏆 Tabela Final")
-                            df_table = pd.DataFrame(data["tabela_final"])
-                            
-                            # Renomear colunas para melhor exibição
-                            df_table = df_table.rename(columns={
-                                'Time': '🏟️ Time',
-                                'J': 'J',
-                                'V': 'V', 
-                                'E': 'E',
-                                'D': 'D',
-                                'GP': 'GP',
-                                'GC': 'GC', 
-                                'SG': 'SG',
-                                'P': '📊 Pts'
-                            })
-                            
-                            st.dataframe(df_table, use_container_width=True, hide_index=True)
-
-                            # Top artilheiros
-                            if "top_10_artilheiros" in data:
-                                st.markdown("### ⚽ Top 10 Artilheiros")
-                                df_scorers = pd.DataFrame(data["top_10_artilheiros"])
-                                df_scorers_display = df_scorers[['Nome', 'Time', 'Gols', 'Jogos']].head(10)
-                                st.dataframe(df_scorers_display, use_container_width=True, hide_index=True)
-
-                            # Botões de download
-                            st.markdown("### 💾 Downloads")
-                            col1, col2 = st.columns(2)
-                            
-                            with col1:
-                                csv_data = df_table.to_csv(sep=";", index=False).encode("utf-8")
-                                st.download_button(
-                                    label="📊 Baixar Tabela (CSV)",
-                                    data=csv_data,
-                                    file_name=f"tabela_{league}_{data['created_at'][:10]}.csv",
-                                    mime="text/csv"
-                                )
-                            
-                            with col2:
-                                json_data = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
-                                st.download_button(
-                                    label="📋 Baixar Completo (JSON)", 
-                                    data=json_data,
-                                    file_name=f"simulacao_{league}_{data['created_at'][:10]}.json",
-                                    mime="application/json"
-                                )
-
-                        except Exception as e:
-                            st.error(f"❌ Erro ao carregar resultados: {e}")
-                    else:
-                        st.warning("⚠️ Nenhum resultado encontrado!")
-                else:
-                    st.warning("⚠️ Pasta de resultados não encontrada!")
-                    
+            show_results(job.result())
         except Exception as e:
-            st.error(f"❌ Erro inesperado: {e}")
+            st.error("❌ Erro na simulação!")
             st.exception(e)
 
 # Rodapé
@@ -9,8 +9,6 @@ from pathlib import Path
 # Adicionar src ao path para imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-# Executar o arquivo diretamente
 if __name__ == "__main__":
-    import subprocess
-    data_processor_path = Path(__file__).parent.parent / "src" / "core" / "data_processor.py"
-    subprocess.run([sys.executable, str(data_processor_path)])
\ No newline at end of file
+    from core.data_processor import main
+    main()
@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+"""
+Sobe a API HTTP local de simulação (requer o extra `web`: fastapi + uvicorn)
+Uso: python scripts/run_api.py --port 8000 --workers 4 --leagues premier_league la_liga
+"""
+
+import sys
+from pathlib import Path
+
+# Adicionar src ao path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from core.service.api import main
+
+
+if __name__ == "__main__":
+    main()
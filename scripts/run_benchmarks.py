@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+"""
+Roda a suíte de benchmarks e grava o relatório JSON
+Uso: python scripts/run_benchmarks.py --repeats 5 --only match_full match_stats --output bench.json
+"""
+
+import sys
+from pathlib import Path
+
+# Adicionar src ao path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from core.bench.suite import main
+
+
+if __name__ == "__main__":
+    main()
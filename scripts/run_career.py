@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+"""
+Modo carreira: várias temporadas seguidas com evolução dos jogadores
+Uso: python scripts/run_career.py --seasons 10
+     python scripts/run_career.py --leagues premier_league la_liga --seasons 20 --output carreira.json
+"""
+
+import sys
+from pathlib import Path
+
+# Adicionar src ao path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from core.advanced_sim.simulation.career import main
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+"""
+Modelo Dixon–Coles ajustado e tabela de pontos esperados (sem simulação)
+Uso: python scripts/run_fitted.py
+     python scripts/run_fitted.py --league la_liga --output modelo_la_liga.json
+"""
+
+import sys
+from pathlib import Path
+
+# Adicionar src ao path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from core.simple.dixon_coles import main
+
+
+if __name__ == "__main__":
+    main()
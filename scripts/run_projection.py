@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+"""
+Projeção Monte Carlo adaptativa: simula em blocos até atingir a precisão pedida
+Uso: python scripts/run_projection.py
+     python scripts/run_projection.py --league la_liga --mode fitted --title 0.002
+"""
+
+import sys
+from pathlib import Path
+
+# Adicionar src e config ao path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+sys.path.insert(0, str(src_path.parent / "config"))
+
+from core.projection.montecarlo import main
+
+
+if __name__ == "__main__":
+    main()
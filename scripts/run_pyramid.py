@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+"""
+Pirâmide de divisões com acesso, rebaixamento e playoffs
+Uso: python scripts/run_pyramid.py --tiers 2 --seasons 5                       # Premier League dividida em 2
+     python scripts/run_pyramid.py --leagues premier_league ligue_1 --seasons 10 --workers 2
+"""
+
+import sys
+from pathlib import Path
+
+# Adicionar src ao path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from core.advanced_sim.simulation.pyramid import main
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+"""
+Compara 10⁵+ partidas simuladas com os histogramas de referência de realismo
+Uso: python scripts/run_realism.py --matches 100000 --workers 4
+     python scripts/run_realism.py --update-reference   # após uma mudança intencional no motor
+"""
+
+import sys
+from pathlib import Path
+
+# Adicionar src ao path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from core.bench.realism import main
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+"""
+Cenários "e se" (formação, desfalques e atributos) contra a liga base
+Uso: python scripts/run_scenarios.py
+     python scripts/run_scenarios.py config/scenarios.yaml --workers 4 --seasons 400
+"""
+
+import sys
+from pathlib import Path
+
+# Adicionar src e config ao path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+sys.path.insert(0, str(src_path.parent / "config"))
+
+from core.projection.scenarios import main
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+"""
+Torneio estilo Champions League (grupos e mata-mata) entre as ligas
+Uso: python scripts/run_tournament.py                        # uma edição, grupos e chave
+     python scripts/run_tournament.py --runs 2000             # chance de cada time chegar a cada fase
+"""
+
+import sys
+from pathlib import Path
+
+# Adicionar src ao path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from core.advanced_sim.simulation.tournament import main
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+"""
+Universo: todas as ligas e a copa europeia na mesma temporada
+Uso: python scripts/run_universe.py
+     python scripts/run_universe.py --leagues premier_league la_liga --seed 7
+"""
+
+import sys
+from pathlib import Path
+
+# Adicionar src ao path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from core.advanced_sim.simulation.universe import main
+
+
+if __name__ == "__main__":
+    main()
@@ -1,35 +1,85 @@
-from .models import *
-from .simulation import *
-from .stats import *
+import importlib
 
-__all__ = [
-    # Modelos
+_MODELS = [
     'AdvancedPlayer',
-    'Position', 
+    'Position',
     'PlayerAttributes',
     'SeasonStats',
     'InjuryType',
     'Injury',
-    
-    # Simulação
+]
+
+_SIMULATION = [
     'AdvancedMatchSimulator',
-    'AdvancedMatchResult', 
+    'AdvancedMatchResult',
     'TeamLineup',
     'PlayerMatchPerformance',
     'MatchEvent',
+    'MatchDetail',
     'EventType',
+    'MatchProfiler',
+    'ProgressStream',
+    'ProgressEvent',
+    'ConsolePrinter',
+    'LoggingSubscriber',
+    'TimeSteppedMatchEngine',
+    'TimestepConfig',
+    'MatchBatch',
+    'CareerSimulator',
+    'CareerResult',
+    'PyramidSimulator',
+    'Division',
+    'TournamentSimulator',
+    'TournamentFormat',
+    'TournamentOutcome',
+    'UniverseSimulator',
+    'UniverseConfig',
+    'UniverseResult',
     'SeasonSimulator',
     'SeasonCalendar',
-    'LeagueTable', 
+    'LeagueTable',
     'SeasonFixture',
     'MatchweekStatus',
-    
-    # Táticas
+]
+
+_TACTICS = [
     'Formation',
-    'FormationType', 
+    'FormationType',
     'PlayStyle',
     'FORMATIONS',
     'get_formation_effectiveness',
     'recommend_formation_for_team',
-    'calculate_tactical_advantage'
-]
\ No newline at end of file
+    'calculate_tactical_advantage',
+]
+
+__all__ = [
+    # Modelos
+    *_MODELS,
+
+    # Simulação
+    *_SIMULATION,
+
+    # Táticas
+    *_TACTICS,
+]
+
+# Os submódulos só são importados no primeiro acesso a um nome exportado,
+# para que `import core.advanced_sim` não carregue o motor inteiro
+_LAZY_SUBMODULES = {
+    **dict.fromkeys(_MODELS, '.models'),
+    **dict.fromkeys(_SIMULATION, '.simulation'),
+    **dict.fromkeys(_TACTICS, '.stats.tatics'),
+}
+
+
+def __getattr__(name):
+    submodule = _LAZY_SUBMODULES.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(submodule, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
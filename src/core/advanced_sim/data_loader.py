@@ -6,9 +6,10 @@ Converte dados reais em objetos AdvancedPlayer e TeamLineup para simulação
 
 import json
 import random
+import hashlib
 from pathlib import Path
 from typing import Dict, List, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 # Adicionar src ao path
 import sys
@@ -29,6 +30,7 @@ class TeamData:
     defense_avg: float
     goalkeeper_avg: float
     players: List[Dict]
+    attribute_columns: List[str] = field(default_factory=list)
 
 
 class LeagueDataLoader:
@@ -42,6 +44,17 @@ class LeagueDataLoader:
         'Ataque': [Position.LW, Position.ST, Position.RW]
     }
     
+    # Códigos de posição do CSV (FIFA) para o enum Position
+    POSITION_CODES = {
+        'GK': Position.GK,
+        'CB': Position.CB, 'LB': Position.LB, 'RB': Position.RB,
+        'LWB': Position.LB, 'RWB': Position.RB,
+        'CDM': Position.CDM, 'CM': Position.CM, 'CAM': Position.CAM,
+        'LM': Position.LM, 'RM': Position.RM,
+        'LW': Position.LW, 'RW': Position.RW, 'LF': Position.LW, 'RF': Position.RW,
+        'CF': Position.CF, 'ST': Position.ST
+    }
+    
     # Formações padrão por qualidade do time
     FORMATION_BY_QUALITY = {
         (85, 100): FormationType.F_4_3_3,    # Times de elite
@@ -66,6 +79,9 @@ class LeagueDataLoader:
         with open(league_file, 'r', encoding='utf-8') as f:
             data = json.load(f)
         
+        # Formato 1.1+: bloco numérico de atributos alinhado com estas colunas
+        attribute_columns = data.get('colunas_atributos', [])
+        
         teams = {}
         for team_name, team_info in data['times'].items():
             # Converter jogadores para lista com informações adicionais
@@ -81,49 +97,69 @@ class LeagueDataLoader:
                 midfield_avg=team_info['medias']['meio'], 
                 defense_avg=team_info['medias']['defesa'],
                 goalkeeper_avg=team_info['medias']['goleiro'],
-                players=players
+                players=players,
+                attribute_columns=attribute_columns
             )
         
         return teams
     
-    def _map_setor_to_position(self, setor: str, overall: int) -> Position:
+    def _map_setor_to_position(self, setor: str, overall: int, rng=random) -> Position:
         """Mapeia setor genérico para posição específica baseada no overall"""
         possible_positions = self.POSITION_MAPPING.get(setor, [Position.CM])
         
         if setor == 'Defesa':
             # Jogadores melhores tendem a ser CB, piores LB/RB
             if overall >= 80:
-                return random.choice([Position.CB, Position.CB, Position.LB, Position.RB])
+                return rng.choice([Position.CB, Position.CB, Position.LB, Position.RB])
             else:
-                return random.choice([Position.CB, Position.LB, Position.RB])
+                return rng.choice([Position.CB, Position.LB, Position.RB])
                 
         elif setor == 'Meio':
             # Distribuição baseada no overall
             if overall >= 85:
-                return random.choice([Position.CAM, Position.CM, Position.CDM])
+                return rng.choice([Position.CAM, Position.CM, Position.CDM])
             elif overall >= 75:
-                return random.choice([Position.CM, Position.CDM, Position.LM, Position.RM])
+                return rng.choice([Position.CM, Position.CDM, Position.LM, Position.RM])
             else:
-                return random.choice([Position.CM, Position.CDM])
+                return rng.choice([Position.CM, Position.CDM])
                 
         elif setor == 'Ataque':
             # Atacantes melhores são ST, outros nas pontas
             if overall >= 82:
-                return random.choice([Position.ST, Position.ST, Position.LW, Position.RW])
+                return rng.choice([Position.ST, Position.ST, Position.LW, Position.RW])
             else:
-                return random.choice([Position.LW, Position.RW, Position.ST])
+                return rng.choice([Position.LW, Position.RW, Position.ST])
         
         # Goleiro ou fallback
         return possible_positions[0]
     
+    def _parse_positions(self, codes: List[str]) -> List[Position]:
+        """Converte códigos de posição do FIFA (ST, LW, ...) sem repetir posições"""
+        positions = []
+        for code in codes:
+            position = self.POSITION_CODES.get(code.strip().upper())
+            if position is not None and position not in positions:
+                positions.append(position)
+        return positions
+    
+    def _attributes_from_block(self, values: List[int], columns: List[str]) -> Tuple[PlayerAttributes, int | None]:
+        """Monta PlayerAttributes a partir do bloco numérico (0 = atributo ausente)"""
+        attributes = PlayerAttributes()
+        age = None
+        
+        for column, value in zip(columns, values):
+            if column == 'idade':
+                age = value or None
+            elif value and hasattr(attributes, column):
+                setattr(attributes, column, int(value))
+        
+        return attributes, age
+    
     def _create_player_attributes(self, player_data: Dict, overall: int, setor: str) -> PlayerAttributes:
         """Cria atributos detalhados do jogador baseado nos dados reais"""
         # Usar dados reais do overall em vez de inventar
         attributes = PlayerAttributes()
         
-        # Variação pequena baseada no overall real
-        base_variance = random.randint(-5, 5)
-        
         if setor == 'Goleiro':
             attributes.goalkeeping = overall
             # Goleiros têm outros atributos proporcionais mas menores
@@ -163,8 +199,12 @@ class LeagueDataLoader:
         
         return attributes
     
-    def convert_team_to_lineup(self, team_data: TeamData) -> TeamLineup:
-        """Converte dados do time em TeamLineup para simulação"""
+    def convert_team_to_lineup(self, team_data: TeamData, rng=random) -> TeamLineup:
+        """Converte dados do time em TeamLineup para simulação
+        
+        `rng` é a fonte dos valores sorteados (forma, moral, fitness e, nos JSONs
+        antigos, idade e posição); por padrão usa o módulo `random` global.
+        """
         
         # Calcular overall médio do time para escolher formação
         team_overall = (team_data.attack_avg + team_data.midfield_avg + 
@@ -180,20 +220,31 @@ class LeagueDataLoader:
         # Converter jogadores
         advanced_players = []
         for player_data in team_data.players:
-            position = self._map_setor_to_position(player_data['setor'], player_data['overall'])
-            attributes = self._create_player_attributes(player_data, player_data['overall'], player_data['setor'])
+            positions = self._parse_positions(player_data.get('posicoes', []))
+            age = None
+            
+            if positions:
+                position = positions[0]
+            else:
+                position = self._map_setor_to_position(player_data['setor'], player_data['overall'], rng)
+            
+            if 'atributos' in player_data and team_data.attribute_columns:
+                attributes, age = self._attributes_from_block(player_data['atributos'], team_data.attribute_columns)
+            else:
+                attributes = self._create_player_attributes(player_data, player_data['overall'], player_data['setor'])
             
             # Usar dados reais do jogador
             player = AdvancedPlayer(
                 name=player_data['name'],
-                age=random.randint(18, 35),  # Idade aleatória (não temos no JSON)
+                age=age or rng.randint(18, 35),  # Idade aleatória só para JSONs antigos (1.0)
                 position=position,
+                preferred_positions=positions[1:],
                 current_overall=player_data['overall'],  # Overall real do FIFA
                 potential=player_data['potential'],       # Potential real do FIFA
                 attributes=attributes,
-                current_form=random.randint(60, 90),  # Forma inicial boa
-                morale=random.randint(70, 95),        # Moral inicial alta
-                fitness=random.randint(90, 100)       # Fitness inicial máxima
+                current_form=rng.randint(60, 90),  # Forma inicial boa
+                morale=rng.randint(70, 95),        # Moral inicial alta
+                fitness=rng.randint(90, 100)       # Fitness inicial máxima
             )
             
             advanced_players.append(player)
@@ -209,17 +260,31 @@ class LeagueDataLoader:
             substitutes=substitutes
         )
     
-    def load_league_for_simulation(self, league_name: str) -> Dict[str, TeamLineup]:
-        """Carrega uma liga completa pronta para simulação"""
+    def load_league_for_simulation(self, league_name: str, seed: int | None = None) -> Dict[str, TeamLineup]:
+        """Carrega uma liga completa pronta para simulação
+        
+        Com `seed`, o estado inicial (idades, posições, forma, moral, fitness) é
+        sorteado por um gerador próprio e fica reprodutível.
+        """
         teams_data = self.load_league(league_name)
+        rng = random.Random(seed) if seed is not None else random
         
         league_lineups = {}
         for team_name, team_data in teams_data.items():
-            lineup = self.convert_team_to_lineup(team_data)
+            lineup = self.convert_team_to_lineup(team_data, rng)
             league_lineups[team_name] = lineup
             
         return league_lineups
     
+    def get_league_hash(self, league_name: str) -> str:
+        """Retorna o SHA-256 do arquivo JSON da liga (identifica a versão dos dados)"""
+        league_file = self.data_dir / f"{league_name}_2025.json"
+        
+        if not league_file.exists():
+            raise FileNotFoundError(f"Arquivo da liga não encontrado: {league_file}")
+        
+        return hashlib.sha256(league_file.read_bytes()).hexdigest()
+    
     def get_available_leagues(self) -> List[str]:
         """Retorna lista das ligas disponíveis"""
         leagues = []
@@ -2,9 +2,7 @@ from dataclasses import dataclass, field
 from typing import Dict, List, Optional
 from enum import Enum
 from datetime import datetime, date
-import uuid
 import random
-import numpy as np
 
 class Position(Enum):
     GK = "Goalkeeper"
@@ -116,9 +114,13 @@ class SeasonStats:
             return 0
         return (self.xg * 90) / self.minutes_played
 
+def _new_player_id() -> str:
+    import uuid  # importado no primeiro jogador criado, não no import do módulo
+    return str(uuid.uuid4())
+
 @dataclass
 class AdvancedPlayer:
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_new_player_id)
     name: str = ""
     age: int = 16
     position: Position = Position.CAM
@@ -215,24 +217,24 @@ class AdvancedPlayer:
             fatigue = max(1, minutes_played / 15)  # ~6 pontos para 90min
             self.fitness = max(0, int(self.fitness - fatigue))
     
-    def recover_fitness(self, days_rest: int = 1):
-        """Recupera fitness durante descanso"""
-        recovery = min(15 * days_rest, 100 - self.fitness)
+    def recover_fitness(self, days_rest: int = 1, per_day: float = 15):
+        """Recupera fitness durante descanso (`per_day` pontos por dia)"""
+        recovery = min(per_day * days_rest, 100 - self.fitness)
         self.fitness = min(100, int(self.fitness + recovery))
     
-    def update_form(self, performance: int):
+    def update_form(self, performance: int, rng=random):
         """Atualiza forma baseada na performance do jogo (0-10)"""
         # Performance boa aumenta forma, ruim diminui
         if performance >= 7:
-            self.current_form = min(100, self.current_form + random.randint(2, 5))
+            self.current_form = min(100, self.current_form + rng.randint(2, 5))
         elif performance <= 4:
-            self.current_form = max(0, self.current_form - random.randint(2, 5))
+            self.current_form = max(0, self.current_form - rng.randint(2, 5))
         else:
             # Performance mediana, pequena mudança aleatória
-            change = random.randint(-2, 2)
+            change = rng.randint(-2, 2)
             self.current_form = max(0, min(100, self.current_form + change))
     
-    def check_injury_risk(self) -> bool:
+    def check_injury_risk(self, rng=random) -> bool:
         """Verifica se o jogador se lesiona baseado em vários fatores"""
         base_risk = self.injury_proneness / 1000  # Base 0-0.1
         
@@ -243,13 +245,13 @@ class AdvancedPlayer:
         age_risk = max(0, (self.age - 30) / 1000) if self.age > 30 else 0
         
         total_risk = base_risk + fitness_risk + age_risk
-        return random.random() < total_risk
+        return rng.random() < total_risk
     
-    def get_injured(self, severity: Optional[InjuryType] = None):
-        """Aplica lesão ao jogador"""
+    def get_injured(self, severity: Optional[InjuryType] = None, on: Optional[date] = None, rng=random):
+        """Aplica lesão ao jogador (`on` é a data da lesão; padrão: hoje)"""
         if not severity:
             # Determinar severidade aleatoriamente (lesões menores são mais comuns)
-            rand = random.random()
+            rand = rng.random()
             if rand < 0.6:
                 severity = InjuryType.MINOR
             elif rand < 0.85:
@@ -261,13 +263,13 @@ class AdvancedPlayer:
         
         # Calcular tempo de recuperação
         recovery_days = {
-            InjuryType.MINOR: random.randint(7, 14),
-            InjuryType.MODERATE: random.randint(21, 42), 
-            InjuryType.MAJOR: random.randint(60, 120),
-            InjuryType.SEVERE: random.randint(180, 300)
+            InjuryType.MINOR: rng.randint(7, 14),
+            InjuryType.MODERATE: rng.randint(21, 42), 
+            InjuryType.MAJOR: rng.randint(60, 120),
+            InjuryType.SEVERE: rng.randint(180, 300)
         }
         
-        start_date = date.today()
+        start_date = on or date.today()
         days_out = recovery_days[severity]
         
         self.is_injured = True
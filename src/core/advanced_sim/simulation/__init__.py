@@ -1,11 +1,16 @@
+import importlib
+
 from .advanced_match import (
     AdvancedMatchSimulator, 
     AdvancedMatchResult, 
     TeamLineup, 
     PlayerMatchPerformance,
     MatchEvent,
+    MatchDetail,
     EventType
 )
+from .profiling import MatchProfiler
+from .progress import ProgressStream, ProgressEvent, ConsolePrinter, LoggingSubscriber
 from .season import (
     SeasonSimulator,
     SeasonCalendar, 
@@ -20,10 +25,53 @@ __all__ = [
     'TeamLineup',
     'PlayerMatchPerformance',
     'MatchEvent',
+    'MatchDetail',
     'EventType',
+    'MatchProfiler',
+    'ProgressStream',
+    'ProgressEvent',
+    'ConsolePrinter',
+    'LoggingSubscriber',
     'SeasonSimulator',
     'SeasonCalendar',
     'LeagueTable', 
     'SeasonFixture',
-    'MatchweekStatus'
+    'MatchweekStatus',
+    'TimeSteppedMatchEngine',
+    'TimestepConfig',
+    'MatchBatch',
+    'CareerSimulator',
+    'CareerResult',
+    'PyramidSimulator',
+    'Division',
+    'TournamentSimulator',
+    'TournamentFormat',
+    'TournamentOutcome',
+    'UniverseSimulator',
+    'UniverseConfig',
+    'UniverseResult',
 ]
+
+# Módulos que dependem do NumPy só são importados quando usados
+_LAZY = {
+    'TimeSteppedMatchEngine': '.timestep',
+    'TimestepConfig': '.timestep',
+    'MatchBatch': '.timestep',
+    'CareerSimulator': '.career',
+    'CareerResult': '.career',
+    'PyramidSimulator': '.pyramid',
+    'Division': '.pyramid',
+    'TournamentSimulator': '.tournament',
+    'TournamentFormat': '.tournament',
+    'TournamentOutcome': '.tournament',
+    'UniverseSimulator': '.universe',
+    'UniverseConfig': '.universe',
+    'UniverseResult': '.universe',
+}
+
+
+def __getattr__(name):
+    submodule = _LAZY.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(submodule, __name__), name)
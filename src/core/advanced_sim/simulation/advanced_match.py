@@ -3,10 +3,14 @@ from typing import Dict, List, Optional, Tuple
 from enum import Enum
 from datetime import datetime, date, timedelta
 import random
-import numpy as np
 
 from ..models.player import AdvancedPlayer, Position, SeasonStats
 from ..stats.tatics.formations import Formation, FormationType, FORMATIONS, calculate_tactical_advantage
+from .profiling import MatchProfiler
+
+
+# Chance de um gol ter assistência de um meia
+ASSIST_PROBABILITY = 0.6
 
 
 class EventType(Enum):
@@ -24,6 +28,19 @@ class EventType(Enum):
     KEY_PASS = "Key Pass"
 
 
+class MatchDetail(Enum):
+    """Nível de detalhe da simulação de uma partida
+
+    FULL  -> placar, estatísticas e a lista de MatchEvent
+    STATS -> placar e estatísticas, sem criar eventos (temporadas e lotes)
+
+    Os dois níveis consomem a mesma sequência aleatória, então com a mesma
+    seed produzem o mesmo placar e as mesmas estatísticas.
+    """
+    FULL = "full"
+    STATS = "stats"
+
+
 @dataclass
 class MatchEvent:
     minute: int
@@ -158,8 +175,19 @@ class AdvancedMatchResult:
 class AdvancedMatchSimulator:
     """Simulador avançado de partidas com eventos detalhados"""
     
-    def __init__(self):
+    def __init__(self, detail: MatchDetail = MatchDetail.FULL, profiler: Optional[MatchProfiler] = None,
+                 rng: Optional[random.Random] = None):
         self.random_seed = None
+        self.detail = detail
+        self._record_events = detail is MatchDetail.FULL
+        
+        # Sorteios do módulo random global, ou de um gerador próprio (`rng`), que
+        # deixa partidas em threads diferentes independentes entre si.
+        # Instrumentação opcional; com profiler os sorteios passam por um contador
+        # (mesma sequência da fonte)
+        self.profiler = profiler
+        source = rng if rng is not None else random
+        self.rng = profiler.rng(source) if profiler is not None else source
         
     def simulate_match(
         self, 
@@ -167,13 +195,22 @@ class AdvancedMatchSimulator:
         away_lineup: TeamLineup,
         home_team_name: str,
         away_team_name: str,
-        match_date: date = None
+        match_date: date = None,
+        detail: Optional[MatchDetail] = None
     ) -> AdvancedMatchResult:
-        """Simula uma partida completa com eventos detalhados"""
+        """Simula uma partida completa com eventos detalhados
+
+        `detail` sobrepõe, só nesta partida, o nível de detalhe do simulador.
+        """
         
         if match_date is None:
             match_date = date.today()
         
+        self._record_events = (detail or self.detail) is MatchDetail.FULL
+        profiler = self.profiler
+        if profiler is not None:
+            started = profiler.start()
+        
         # Inicializar resultado
         result = AdvancedMatchResult(
             home_team=home_team_name,
@@ -185,10 +222,15 @@ class AdvancedMatchSimulator:
             match_date=match_date
         )
         
+        if profiler is not None:
+            started = profiler.lap("setup", started)
+        
         # Calcular vantagens táticas
         home_advantage, away_advantage = calculate_tactical_advantage(
             home_lineup.formation, away_lineup.formation
         )
+        if profiler is not None:
+            started = profiler.lap("tactics", started)
         
         # Adicionar bônus de mando de campo
         home_advantage *= 1.1
@@ -196,6 +238,8 @@ class AdvancedMatchSimulator:
         # Calcular força dos times
         home_strength = home_lineup.get_team_rating() * home_advantage
         away_strength = away_lineup.get_team_rating() * away_advantage
+        if profiler is not None:
+            started = profiler.lap("strength", started)
         
         # Inicializar performances dos jogadores
         for player in home_lineup.players[:11]:
@@ -214,9 +258,13 @@ class AdvancedMatchSimulator:
         total_strength = home_strength + away_strength
         result.home_possession = (home_strength / total_strength) * 100
         result.away_possession = 100 - result.home_possession
+        if profiler is not None:
+            started = profiler.lap("setup", started)
         
         # Simular eventos do jogo
         self._simulate_match_events(result, home_lineup, away_lineup, home_strength, away_strength)
+        if profiler is not None:
+            started = profiler.start()
         
         # Calcular ratings dos jogadores
         for performance in result.home_performances.values():
@@ -224,10 +272,18 @@ class AdvancedMatchSimulator:
             
         for performance in result.away_performances.values():
             performance.calculate_match_rating()
+        if profiler is not None:
+            started = profiler.lap("ratings", started)
         
         # Aplicar fadiga e atualizar forma dos jogadores
         self._apply_post_match_effects(home_lineup, away_lineup, result)
         
+        if profiler is not None:
+            profiler.lap("post_match", started)
+            profiler.count("matches")
+            profiler.count("events_created", len(result.events))
+            profiler.count("performances_created", len(result.home_performances) + len(result.away_performances))
+        
         return result
     
     def _simulate_match_events(
@@ -239,6 +295,10 @@ class AdvancedMatchSimulator:
         away_strength: float
     ):
         """Simula eventos específicos durante a partida"""
+        rng = self.rng
+        profiler = self.profiler
+        if profiler is not None:
+            started = profiler.start()
         
         # Calcular número esperado de eventos baseado na força dos times
         total_strength = home_strength + away_strength
@@ -254,11 +314,13 @@ class AdvancedMatchSimulator:
         away_shot_modifier = max(0.7, min(1.3, away_attack_strength / home_defense_strength))
         
         # Chutes mais realistas: 6-15 por time (média ~10-11)
-        expected_home_shots = max(5, int(10 * home_shot_modifier * random.uniform(0.8, 1.2)))
-        expected_away_shots = max(5, int(10 * away_shot_modifier * random.uniform(0.8, 1.2)))
+        expected_home_shots = max(5, int(10 * home_shot_modifier * rng.uniform(0.8, 1.2)))
+        expected_away_shots = max(5, int(10 * away_shot_modifier * rng.uniform(0.8, 1.2)))
         
         result.home_shots = expected_home_shots
         result.away_shots = expected_away_shots
+        if profiler is not None:
+            started = profiler.lap("strength", started)
         
         # Simular chutes e gols para o time da casa
         home_goals = self._simulate_team_attacks(
@@ -272,9 +334,13 @@ class AdvancedMatchSimulator:
         
         result.home_goals = home_goals
         result.away_goals = away_goals
+        if profiler is not None:
+            started = profiler.lap("attacks", started)
         
         # Simular outros eventos (cartões, lesões, etc.)
         self._simulate_disciplinary_events(result, home_lineup, away_lineup)
+        if profiler is not None:
+            profiler.lap("discipline", started)
     
     def _simulate_team_attacks(
         self,
@@ -285,6 +351,7 @@ class AdvancedMatchSimulator:
         is_home_team: bool
     ) -> int:
         """Simula ataques de um time específico"""
+        rng = self.rng
         goals = 0
         shots_on_target = 0
         team_name = result.home_team if is_home_team else result.away_team
@@ -301,44 +368,56 @@ class AdvancedMatchSimulator:
         defending_strength = defending_lineup.get_position_strength("defense")
         goalkeeper_strength = defending_lineup.get_position_strength("goalkeeper")
         
+        # Possíveis assistentes (mesma regra usada quando sai o gol)
+        midfielders = [p for p in attacking_lineup.players[:11] 
+                       if p.position in [Position.CM, Position.CAM, Position.LM, Position.RM]]
+        
         for shot_num in range(expected_shots):
             # Escolher jogador que chuta (atacantes têm mais chance)
-            shooter = random.choice(attacking_players)
-            minute = random.randint(1, 90)
+            shooter = rng.choice(attacking_players)
+            minute = rng.randint(1, 90)
             
             # Calcular probabilidade de acertar o alvo (balanceado)
             shooter_ability = (shooter.attributes.shooting or 50) + (shooter.attributes.finishing or 50)
-            shot_accuracy = max(0.18, min(0.42, (shooter_ability / 200) * random.uniform(0.8, 1.2)))
+            shot_accuracy = max(0.18, min(0.42, (shooter_ability / 200) * rng.uniform(0.8, 1.2)))
+            
+            # Calcular probabilidade de gol (otimizado para ~2.5 gols/jogo)
+            goal_probability = max(0.08, min(0.28, (shooter_ability / 240) / (goalkeeper_strength / 80)))
             
-            if random.random() < shot_accuracy:
+            # xG do chute = P(no alvo) * P(gol | no alvo), com as mesmas probabilidades do motor;
+            # o xA é o crédito esperado de assistência repartido entre os meias
+            shot_xg = shot_accuracy * goal_probability
+            performances[shooter.id].xg += shot_xg
+            if midfielders:
+                shot_xa = shot_xg * ASSIST_PROBABILITY / len(midfielders)
+                for midfielder in midfielders:
+                    performances[midfielder.id].xa += shot_xa
+            
+            if rng.random() < shot_accuracy:
                 # Chute no alvo
                 shots_on_target += 1
                 performances[shooter.id].shots_on_target += 1
                 
                 # Adicionar evento
-                result.events.append(MatchEvent(
-                    minute=minute,
-                    event_type=EventType.SHOT_ON_TARGET,
-                    player_id=shooter.id,
-                    team_name=team_name,
-                    description=f"{shooter.name} shot on target"
-                ))
-                
-                # Calcular probabilidade de gol (otimizado para ~2.5 gols/jogo)
-                goal_probability = max(0.08, min(0.28, (shooter_ability / 240) / (goalkeeper_strength / 80)))
+                if self._record_events:
+                    result.events.append(MatchEvent(
+                        minute=minute,
+                        event_type=EventType.SHOT_ON_TARGET,
+                        player_id=shooter.id,
+                        team_name=team_name,
+                        description=f"{shooter.name} shot on target"
+                    ))
                 
-                if random.random() < goal_probability:
+                if rng.random() < goal_probability:
                     # GOL!
                     goals += 1
                     performances[shooter.id].goals += 1
                     
                     # Possível assistência
                     assisting_player = None
-                    if random.random() < 0.6:  # 60% chance de assistência
-                        midfielders = [p for p in attacking_lineup.players[:11] 
-                                     if p.position in [Position.CM, Position.CAM, Position.LM, Position.RM]]
+                    if rng.random() < ASSIST_PROBABILITY:
                         if midfielders:
-                            assisting_player = random.choice(midfielders)
+                            assisting_player = rng.choice(midfielders)
                             performances[assisting_player.id].assists += 1
                     
                     # Adicionar evento de gol
@@ -346,17 +425,18 @@ class AdvancedMatchSimulator:
                     if assisting_player:
                         description += f" (Assisted by {assisting_player.name})"
                     
-                    result.events.append(MatchEvent(
-                        minute=minute,
-                        event_type=EventType.GOAL,
-                        player_id=shooter.id,
-                        team_name=team_name,
-                        description=description,
-                        assisted_by=assisting_player.id if assisting_player else None,
-                        rating_impact=1.5
-                    ))
+                    if self._record_events:
+                        result.events.append(MatchEvent(
+                            minute=minute,
+                            event_type=EventType.GOAL,
+                            player_id=shooter.id,
+                            team_name=team_name,
+                            description=description,
+                            assisted_by=assisting_player.id if assisting_player else None,
+                            rating_impact=1.5
+                        ))
                     
-                    if assisting_player:
+                    if assisting_player and self._record_events:
                         result.events.append(MatchEvent(
                             minute=minute,
                             event_type=EventType.ASSIST,
@@ -372,24 +452,26 @@ class AdvancedMatchSimulator:
                         defending_performances = result.away_performances if is_home_team else result.home_performances
                         defending_performances[goalkeeper.id].saves += 1
                         
-                        result.events.append(MatchEvent(
-                            minute=minute,
-                            event_type=EventType.SAVE,
-                            player_id=goalkeeper.id,
-                            team_name=result.away_team if is_home_team else result.home_team,
-                            description=f"{goalkeeper.name} makes a save",
-                            rating_impact=0.3
-                        ))
+                        if self._record_events:
+                            result.events.append(MatchEvent(
+                                minute=minute,
+                                event_type=EventType.SAVE,
+                                player_id=goalkeeper.id,
+                                team_name=result.away_team if is_home_team else result.home_team,
+                                description=f"{goalkeeper.name} makes a save",
+                                rating_impact=0.3
+                            ))
             else:
                 # Chute para fora
-                result.events.append(MatchEvent(
-                    minute=minute,
-                    event_type=EventType.SHOT_OFF_TARGET,
-                    player_id=shooter.id,
-                    team_name=team_name,
-                    description=f"{shooter.name} shot off target",
-                    rating_impact=-0.1
-                ))
+                if self._record_events:
+                    result.events.append(MatchEvent(
+                        minute=minute,
+                        event_type=EventType.SHOT_OFF_TARGET,
+                        player_id=shooter.id,
+                        team_name=team_name,
+                        description=f"{shooter.name} shot off target",
+                        rating_impact=-0.1
+                    ))
             
             performances[shooter.id].shots += 1
         
@@ -408,15 +490,16 @@ class AdvancedMatchSimulator:
         away_lineup: TeamLineup
     ):
         """Simula cartões e outros eventos disciplinares"""
+        rng = self.rng
         
         all_players = home_lineup.players[:11] + away_lineup.players[:11]
         
         # Simular cartões amarelos (2-6 por jogo)
-        yellow_cards = random.randint(2, 6)
+        yellow_cards = rng.randint(2, 6)
         
         for _ in range(yellow_cards):
-            player = random.choice(all_players)
-            minute = random.randint(10, 90)
+            player = rng.choice(all_players)
+            minute = rng.randint(10, 90)
             
             is_home = player in home_lineup.players
             team_name = result.home_team if is_home else result.away_team
@@ -424,19 +507,20 @@ class AdvancedMatchSimulator:
             
             performances[player.id].yellow_cards += 1
             
-            result.events.append(MatchEvent(
-                minute=minute,
-                event_type=EventType.YELLOW_CARD,
-                player_id=player.id,
-                team_name=team_name,
-                description=f"{player.name} receives yellow card",
-                rating_impact=-0.3
-            ))
+            if self._record_events:
+                result.events.append(MatchEvent(
+                    minute=minute,
+                    event_type=EventType.YELLOW_CARD,
+                    player_id=player.id,
+                    team_name=team_name,
+                    description=f"{player.name} receives yellow card",
+                    rating_impact=-0.3
+                ))
         
         # Simular cartões vermelhos (0-1 por jogo, raro)
-        if random.random() < 0.15:  # 15% chance de cartão vermelho
-            player = random.choice(all_players)
-            minute = random.randint(20, 85)
+        if rng.random() < 0.15:  # 15% chance de cartão vermelho
+            player = rng.choice(all_players)
+            minute = rng.randint(20, 85)
             
             is_home = player in home_lineup.players
             team_name = result.home_team if is_home else result.away_team
@@ -444,14 +528,15 @@ class AdvancedMatchSimulator:
             
             performances[player.id].red_cards += 1
             
-            result.events.append(MatchEvent(
-                minute=minute,
-                event_type=EventType.RED_CARD,
-                player_id=player.id,
-                team_name=team_name,
-                description=f"{player.name} receives red card",
-                rating_impact=-2.0
-            ))
+            if self._record_events:
+                result.events.append(MatchEvent(
+                    minute=minute,
+                    event_type=EventType.RED_CARD,
+                    player_id=player.id,
+                    team_name=team_name,
+                    description=f"{player.name} receives red card",
+                    rating_impact=-2.0
+                ))
     
     def _apply_post_match_effects(
         self,
@@ -460,6 +545,7 @@ class AdvancedMatchSimulator:
         result: AdvancedMatchResult
     ):
         """Aplica efeitos pós-jogo (fadiga, forma, etc.)"""
+        rng = self.rng
         
         # Aplicar fadiga e atualizar forma para jogadores da casa
         for player in home_lineup.players[:11]:
@@ -469,34 +555,38 @@ class AdvancedMatchSimulator:
             player.apply_fatigue(performance.minutes_played)
             
             # Atualizar forma baseada na performance
-            player.update_form(int(performance.match_rating))
+            player.update_form(int(performance.match_rating), rng)
             
             # Verificar risco de lesão
-            if player.check_injury_risk():
-                player.get_injured()
-                result.events.append(MatchEvent(
-                    minute=random.randint(70, 90),
-                    event_type=EventType.INJURY,
-                    player_id=player.id,
-                    team_name=result.home_team,
-                    description=f"{player.name} gets injured",
-                    rating_impact=-0.5
-                ))
+            if player.check_injury_risk(rng):
+                player.get_injured(on=result.match_date, rng=rng)
+                minute = rng.randint(70, 90)
+                if self._record_events:
+                    result.events.append(MatchEvent(
+                        minute=minute,
+                        event_type=EventType.INJURY,
+                        player_id=player.id,
+                        team_name=result.home_team,
+                        description=f"{player.name} gets injured",
+                        rating_impact=-0.5
+                    ))
         
         # Mesmo para jogadores visitantes
         for player in away_lineup.players[:11]:
             performance = result.away_performances[player.id]
             
             player.apply_fatigue(performance.minutes_played)
-            player.update_form(int(performance.match_rating))
+            player.update_form(int(performance.match_rating), rng)
             
-            if player.check_injury_risk():
-                player.get_injured()
-                result.events.append(MatchEvent(
-                    minute=random.randint(70, 90),
-                    event_type=EventType.INJURY,
-                    player_id=player.id,
-                    team_name=result.away_team,
-                    description=f"{player.name} gets injured",
-                    rating_impact=-0.5
-                ))
\ No newline at end of file
+            if player.check_injury_risk(rng):
+                player.get_injured(on=result.match_date, rng=rng)
+                minute = rng.randint(70, 90)
+                if self._record_events:
+                    result.events.append(MatchEvent(
+                        minute=minute,
+                        event_type=EventType.INJURY,
+                        player_id=player.id,
+                        team_name=result.away_team,
+                        description=f"{player.name} gets injured",
+                        rating_impact=-0.5
+                    ))
\ No newline at end of file
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Modo carreira: várias temporadas seguidas de uma ou mais ligas
+Encadeia temporadas do SeasonSimulator (nível MatchDetail.STATS) e, a cada
+virada, aplica a evolução dos jogadores de todas as ligas de uma vez
+(stats.progression): idade, minutos e estatísticas da temporada movem o
+overall em direção ao potencial ou para baixo. Veteranos aposentados dão
+lugar a jovens da base na mesma posição, e os titulares são escolhidos de
+novo pelo overall atualizado.
+"""
+
+import random
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import date
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from ..data_loader import LeagueDataLoader
+from ..models.player import AdvancedPlayer, PlayerAttributes, Position
+from ..stats.progression import (
+    ATTRIBUTE_FIELDS,
+    ProgressionConfig,
+    apply_season_progression,
+    reset_for_new_season,
+)
+from .advanced_match import MatchDetail, TeamLineup
+from .progress import ProgressStream
+from .season import SeasonSimulator
+
+
+@dataclass
+class CareerSeason:
+    """Resumo de uma temporada de uma liga no modo carreira"""
+    league: str
+    season_year: str
+    champion: str
+    table: List[Dict]
+    top_scorer: Optional[Dict] = None
+    mean_overall: float = 0.0
+
+
+@dataclass
+class CareerResult:
+    leagues: List[str]
+    seasons: List[CareerSeason] = field(default_factory=list)
+    progression: List[Dict] = field(default_factory=list)   # um resumo por virada de temporada
+    elapsed: float = 0.0
+
+    def champions(self, league: str) -> List[str]:
+        return [season.champion for season in self.seasons if season.league == league]
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+def season_label(year: int) -> str:
+    return f"{year}-{(year + 1) % 100:02d}"
+
+
+class CareerSimulator:
+    """Simula N temporadas seguidas com evolução dos jogadores entre elas"""
+
+    def __init__(self, leagues: Sequence[str], seed: Optional[int] = None, start_year: int = 2024,
+                 progression: bool = True, config: Optional[ProgressionConfig] = None,
+                 progress: Optional[ProgressStream] = None,
+                 teams: Optional[Dict[str, Dict[str, TeamLineup]]] = None):
+        self.leagues = list(leagues)
+        self.seed = seed
+        self.year = start_year
+        self.progression = progression
+        self.config = config or ProgressionConfig()
+        self.progress = progress or ProgressStream()
+        self.rng = np.random.default_rng(seed)
+        self._youth_count = 0
+
+        # Escalações por liga (carregadas com a seed, ou passadas prontas)
+        loader = LeagueDataLoader()
+        self.teams: Dict[str, Dict[str, TeamLineup]] = teams or {
+            league: loader.load_league_for_simulation(league, seed=seed) for league in self.leagues
+        }
+
+    def players(self, league: Optional[str] = None) -> List[AdvancedPlayer]:
+        leagues = [league] if league else self.leagues
+        return [
+            player
+            for name in leagues
+            for lineup in self.teams[name].values()
+            for player in lineup.players + lineup.substitutes
+        ]
+
+    # ------------------------------------------------------------------
+    # Temporadas
+
+    def simulate_league_season(self, league: str) -> CareerSeason:
+        lineups = self.teams[league]
+        label = season_label(self.year)
+
+        self.progress.source = f"{league} {label}"
+        season = SeasonSimulator(self.progress, match_detail=MatchDetail.STATS)
+        season.team_lineups = lineups
+        season.initialize_season(list(lineups), season_year=label, start_date=date(self.year, 8, 17))
+        summary = season.simulate_full_season()
+
+        top_scorer = None
+        scorers = [
+            (player.season_stats.goals, player.name, team)
+            for team, lineup in lineups.items()
+            for player in lineup.players + lineup.substitutes
+        ]
+        if scorers:
+            goals, name, team = max(scorers)
+            top_scorer = {"name": name, "team": team, "goals": goals}
+
+        return CareerSeason(
+            league=league,
+            season_year=label,
+            champion=summary["champion"],
+            table=season.table.to_rows(),
+            top_scorer=top_scorer,
+            mean_overall=round(float(np.mean([p.current_overall for p in self.players(league)])), 2),
+        )
+
+    def advance_season(self) -> Dict:
+        """Virada de temporada: evolução, aposentadorias, pré-temporada e novas escalações"""
+        summary = {}
+        if self.progression:
+            players, season_minutes = [], []
+            for league in self.leagues:
+                league_players = self.players(league)
+                n_teams = len(self.teams[league])
+                players.extend(league_players)
+                season_minutes.extend([(n_teams - 1) * 2 * 90] * len(league_players))
+
+            report = apply_season_progression(players, np.array(season_minutes), self.config, self.rng)
+            summary = {"season_year": season_label(self.year), **report.summary()}
+            retired = {player_id for player_id, gone in zip(report.player_ids, report.retired) if gone}
+            self._replace_retired(retired)
+
+        for player in self.players():
+            reset_for_new_season(player)
+        for lineups in self.teams.values():
+            for lineup in lineups.values():
+                self._pick_starters(lineup)
+
+        self.year += 1
+        if summary:
+            self.progress.emit("progression", **summary)
+        return summary
+
+    def run(self, n_seasons: int) -> CareerResult:
+        """Simula `n_seasons` temporadas de todas as ligas"""
+        if self.seed is not None:
+            random.seed(self.seed)
+
+        start = time.perf_counter()
+        result = CareerResult(self.leagues)
+        for k in range(n_seasons):
+            for league in self.leagues:
+                result.seasons.append(self.simulate_league_season(league))
+            if k < n_seasons - 1:
+                result.progression.append(self.advance_season())
+        result.elapsed = time.perf_counter() - start
+        return result
+
+    # ------------------------------------------------------------------
+    # Elencos
+
+    def _replace_retired(self, retired: set) -> None:
+        """Troca cada aposentado por um jovem da base na mesma posição"""
+        if not retired:
+            return
+        for lineups in self.teams.values():
+            for team_name, lineup in lineups.items():
+                level = float(np.mean([p.current_overall for p in lineup.players]))
+                for squad in (lineup.players, lineup.substitutes):
+                    for i, player in enumerate(squad):
+                        if player.id in retired:
+                            squad[i] = self._youth_player(player, team_name, level)
+
+    def _youth_player(self, retiree: AdvancedPlayer, team_name: str, team_level: float) -> AdvancedPlayer:
+        """Jovem da base com o perfil de atributos do aposentado, um pouco abaixo do nível do time"""
+        rng = self.rng
+        self._youth_count += 1
+        overall = int(np.clip(rng.normal(team_level - 9, 3), 45, 85))
+        potential = int(min(94, overall + rng.integers(6, 20)))
+
+        shift = overall - retiree.current_overall
+        attributes = PlayerAttributes(**{
+            name: None if value is None else int(np.clip(value + shift, 1, 99))
+            for name, value in ((name, getattr(retiree.attributes, name)) for name in ATTRIBUTE_FIELDS)
+        })
+        return AdvancedPlayer(
+            name=f"Revelação {team_name} {self._youth_count}",
+            age=int(rng.integers(17, 20)),
+            position=retiree.position,
+            preferred_positions=list(retiree.preferred_positions),
+            current_overall=overall,
+            potential=potential,
+            attributes=attributes,
+        )
+
+    @staticmethod
+    def _pick_starters(lineup: TeamLineup) -> None:
+        """Titulares: o melhor goleiro e os 10 melhores de linha; o resto fica no banco"""
+        squad = sorted(lineup.players + lineup.substitutes, key=lambda p: p.current_overall, reverse=True)
+        keeper = next((p for p in squad if p.position == Position.GK), None)
+        starters = [keeper] if keeper else []
+        starters += [p for p in squad if p is not keeper][:11 - len(starters)]
+        chosen = {id(p) for p in starters}
+        lineup.players = starters
+        lineup.substitutes = [p for p in squad if id(p) not in chosen]
+
+
+def main():
+    """CLI: python scripts/run_career.py [--leagues ...] [--seasons 10] [--seed 42]"""
+    import argparse
+    import json
+    import sys
+    from pathlib import Path
+
+    parser = argparse.ArgumentParser(description='Modo carreira: várias temporadas com evolução dos jogadores')
+    parser.add_argument('--leagues', nargs='*', default=None, help='Ligas (padrão: todas as disponíveis)')
+    parser.add_argument('--seasons', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', type=Path, default=None, help='Grava o resumo da carreira em JSON')
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(Path(__file__).parents[4] / "config"))
+    import config
+    app_config = config.load_config()
+
+    leagues = args.leagues or sorted(LeagueDataLoader().get_available_leagues())
+    career = CareerSimulator(
+        leagues, seed=args.seed,
+        progression=app_config.get("advanced", {}).get("player_progression", True)
+    )
+    result = career.run(args.seasons)
+
+    print(f"\n{'='*72}")
+    print(f"[CARREIRA] {args.seasons} temporadas | {', '.join(leagues)} | {result.elapsed:.1f}s")
+    print(f"{'='*72}")
+    for league in leagues:
+        print(f"\n🏆 {league.replace('_', ' ').title()}")
+        for season in (s for s in result.seasons if s.league == league):
+            scorer = season.top_scorer or {}
+            print(f"   {season.season_year}  {season.champion:<26} "
+                  f"artilheiro: {scorer.get('name', '-')} ({scorer.get('goals', 0)})  "
+                  f"overall médio {season.mean_overall:.1f}")
+    if result.progression:
+        print(f"\n📈 Evolução (variação média do overall por idade, última virada): "
+              f"{result.progression[-1]['delta_by_age']}")
+        print(f"   Aposentadorias: {sum(step['retired'] for step in result.progression)}")
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result.to_dict(), f, ensure_ascii=False, indent=2)
+        print(f"\n📂 Resumo: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
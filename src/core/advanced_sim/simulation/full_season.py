@@ -0,0 +1,580 @@
+#!/usr/bin/env python3
+"""
+Temporada completa com o motor avançado
+Simula todos os confrontos de ida e volta de uma liga, acumula a tabela e as
+estatísticas dos jogadores e exporta os resultados (JSON Lines, CSV, catálogo
+e dataset colunar opcional). Usado pelo script run_season_simulation.py e
+pelo serviço de simulação em processo.
+"""
+
+import csv
+import random
+import sys
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from ..data_loader import LeagueDataLoader
+from ..snapshot import LineupSnapshotCache
+from .advanced_match import AdvancedMatchSimulator, MatchDetail, TeamLineup
+from .profiling import MatchProfiler
+from .progress import ProgressStream
+from ..stats.season_aggregator import SeasonStatsAggregator
+from ...results import StreamingResultSink, ColumnarDatasetWriter, ResultsCatalog, unique_stem
+
+
+# Versão do motor de temporada; altere ao mudar a simulação (invalida o cache de resultados)
+ENGINE_VERSION = "2.2.0"
+
+# Motores de partida: "event" (AdvancedMatchSimulator, lance a lance) ou
+# "timestep" (TimeSteppedMatchEngine, as partidas de cada rodada em lote com NumPy)
+MATCH_ENGINES = ("event", "timestep")
+
+# Calendário do motor em lote: uma rodada por semana a partir desta data
+SEASON_START = date(2025, 8, 16)
+MATCHWEEK_DAYS = 7
+
+
+def engine_version(match_engine: str = "event") -> str:
+    """Versão que identifica os resultados de cada motor (chave do cache de resultados)"""
+    if match_engine == "timestep":
+        from .timestep import TIMESTEP_ENGINE_VERSION
+        return f"{ENGINE_VERSION}+timestep-{TIMESTEP_ENGINE_VERSION}"
+    return ENGINE_VERSION
+
+PROJECT_ROOT = Path(__file__).parents[4]
+DEFAULT_RESULTS_DIR = PROJECT_ROOT / "data" / "processed" / "resultados"
+DEFAULT_DATASET_DIR = PROJECT_ROOT / "data" / "processed" / "dataset"
+
+
+def _write_csv(path: Path, rows: List[Dict]):
+    """Grava linhas de dicionários em CSV separado por ';'"""
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        if rows:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()), delimiter=";")
+            writer.writeheader()
+            writer.writerows(rows)
+
+
+class LeagueTable:
+    """Tabela da liga com pontuação e estatísticas"""
+    
+    def __init__(self, teams: List[str]):
+        self.teams = {team: {
+            'points': 0,
+            'matches': 0,
+            'wins': 0,
+            'draws': 0,
+            'losses': 0,
+            'goals_for': 0,
+            'goals_against': 0,
+            'goal_difference': 0
+        } for team in teams}
+    
+    def add_match_result(self, home_team: str, away_team: str, home_goals: int, away_goals: int):
+        """Adiciona resultado de uma partida à tabela"""
+        
+        # Atualizar estatísticas do time da casa
+        self.teams[home_team]['matches'] += 1
+        self.teams[home_team]['goals_for'] += home_goals
+        self.teams[home_team]['goals_against'] += away_goals
+        
+        # Atualizar estatísticas do time visitante
+        self.teams[away_team]['matches'] += 1
+        self.teams[away_team]['goals_for'] += away_goals
+        self.teams[away_team]['goals_against'] += home_goals
+        
+        # Determinar resultado
+        if home_goals > away_goals:  # Vitória da casa
+            self.teams[home_team]['wins'] += 1
+            self.teams[home_team]['points'] += 3
+            self.teams[away_team]['losses'] += 1
+            
+        elif away_goals > home_goals:  # Vitória visitante
+            self.teams[away_team]['wins'] += 1
+            self.teams[away_team]['points'] += 3
+            self.teams[home_team]['losses'] += 1
+            
+        else:  # Empate
+            self.teams[home_team]['draws'] += 1
+            self.teams[home_team]['points'] += 1
+            self.teams[away_team]['draws'] += 1
+            self.teams[away_team]['points'] += 1
+        
+        # Calcular saldo de gols
+        for team in [home_team, away_team]:
+            self.teams[team]['goal_difference'] = (
+                self.teams[team]['goals_for'] - self.teams[team]['goals_against']
+            )
+    
+    def get_table(self) -> List[Tuple[str, Dict]]:
+        """Retorna tabela ordenada por pontuação"""
+        return sorted(
+            self.teams.items(),
+            key=lambda x: (x[1]['points'], x[1]['goal_difference'], x[1]['goals_for']),
+            reverse=True
+        )
+    
+    def print_table(self, title: str = "TABELA DA LIGA"):
+        """Imprime a tabela formatada"""
+        print(f"\n{'='*80}")
+        print(f"[CAMPEAO] {title}")
+        print(f"{'='*80}")
+        print(f"{'Pos':<3} {'Time':<20} {'J':<3} {'V':<3} {'E':<3} {'D':<3} {'GP':<4} {'GC':<4} {'SG':<4} {'Pts':<4}")
+        print(f"{'-'*80}")
+        
+        for pos, (team, stats) in enumerate(self.get_table(), 1):
+            # Ícones para posições especiais
+            icon = ""
+            if pos == 1:
+                icon = "[1st]"
+            elif pos <= 4:
+                icon = "[CL]"  # Champions League
+            elif pos <= 6:
+                icon = "[EL]"  # Europa League
+            elif pos >= len(self.teams) - 2:
+                icon = "[REL]"  # Rebaixamento
+            
+            print(f"{pos:<3} {team:<18} {icon} {stats['matches']:<3} {stats['wins']:<3} "
+                  f"{stats['draws']:<3} {stats['losses']:<3} {stats['goals_for']:<4} "
+                  f"{stats['goals_against']:<4} {stats['goal_difference']:+4} {stats['points']:<4}")
+
+
+class FullSeasonSimulator:
+    """Simulador de temporada completa"""
+    
+    def __init__(self, league_name: str = "premier_league", seed: int | None = None,
+                 columnar_format: str | None = None, dataset_dir: Path | None = None,
+                 teams: Dict[str, TeamLineup] | None = None, results_dir: Path | None = None,
+                 profile: bool = False, progress: ProgressStream | None = None,
+                 match_engine: str = "event", rng: random.Random | None = None):
+        if match_engine not in MATCH_ENGINES:
+            raise ValueError(f"Motor de partida inválido: '{match_engine}' (use {', '.join(MATCH_ENGINES)})")
+        self.league_name = league_name
+        self.match_engine = match_engine
+        
+        # Saída colunar opcional (npz/parquet) num dataset particionado por liga e execução;
+        # o escritor é criado já aqui para que um formato inválido falhe antes da temporada
+        self.columnar_format = columnar_format
+        self.dataset_dir = dataset_dir or DEFAULT_DATASET_DIR
+        self.columnar_writer = ColumnarDatasetWriter(self.dataset_dir, columnar_format) if columnar_format else None
+        
+        self.loader = LeagueDataLoader()
+        
+        # Sorteios (ordem dos jogos, partidas, seed do lote): o módulo random global
+        # ou um gerador próprio, para temporadas em threads diferentes
+        self.rng = rng if rng is not None else random
+        
+        # Progresso vai para o fluxo de eventos (sem assinantes = silencioso)
+        self.progress = progress or ProgressStream()
+        if not self.progress.source:
+            self.progress.source = league_name
+        
+        # Com profile, tempos por fase e contadores da temporada ficam em self.profiler
+        self.profiler = MatchProfiler() if profile else None
+        
+        # A temporada só usa placar e estatísticas; os eventos lance a lance ficam de fora
+        self.simulator = AdvancedMatchSimulator(MatchDetail.STATS, profiler=self.profiler, rng=rng)
+        
+        # Carregar times da liga (com seed, o estado inicial vem do cache de snapshots;
+        # escalações já carregadas podem ser passadas prontas)
+        self.progress.emit("loading", league=league_name)
+        if teams is not None:
+            self.teams = teams
+        elif seed is not None:
+            self.teams = LineupSnapshotCache().load_or_build(self.loader, league_name, seed)
+        else:
+            self.teams = self.loader.load_league_for_simulation(league_name)
+        self.team_names = list(self.teams.keys())
+        
+        # Criar tabela da liga
+        self.table = LeagueTable(self.team_names)
+        
+        # Agregador de estatísticas dos jogadores (acumula por lote de partidas)
+        self.player_stats = SeasonStatsAggregator(self.teams)
+        self._pending_results = []
+        self._players_by_id = {
+            player.id: player
+            for lineup in self.teams.values()
+            for player in lineup.players + lineup.substitutes
+        }
+        self.stats_batch_size = max(1, len(self.team_names) // 2)  # ~uma rodada
+        
+        # Configurações para exportação
+        self.output_dir = Path(results_dir or DEFAULT_RESULTS_DIR) / league_name
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.result_sink = None
+        
+        self._match_rows = []
+        
+        self.progress.emit("loaded", teams=len(self.team_names))
+        
+    def generate_fixtures(self) -> List[Tuple[str, str]]:
+        """Gera todos os confrontos do campeonato (ida e volta)"""
+        fixtures = []
+        
+        # Cada time joga contra cada outro 2 vezes (casa e fora)
+        for i, home_team in enumerate(self.team_names):
+            for j, away_team in enumerate(self.team_names):
+                if i != j:
+                    fixtures.append((home_team, away_team))
+        
+        # Embaralhar a ordem dos jogos
+        self.rng.shuffle(fixtures)
+        
+        return fixtures
+    
+    def generate_rounds(self) -> List[List[Tuple[str, str]]]:
+        """Gera as rodadas do campeonato (turno e returno), cada time uma vez por rodada"""
+        teams = list(self.team_names)
+        self.rng.shuffle(teams)
+        if len(teams) % 2:
+            teams.append(None)  # folga
+        half = len(teams) // 2
+        
+        # Método do círculo: o primeiro fica parado e os outros giram; o mando alterna
+        first_leg = []
+        for k in range(len(teams) - 1):
+            pairs = zip(teams[:half], reversed(teams[half:]))
+            first_leg.append([(home, away) if k % 2 else (away, home)
+                              for home, away in pairs if home is not None and away is not None])
+            teams = [teams[0], teams[-1]] + teams[1:-1]
+        
+        return first_leg + [[(away, home) for home, away in matchweek] for matchweek in first_leg]
+    
+    def simulate_match(self, home_team: str, away_team: str) -> Tuple[int, int]:
+        """Simula uma partida entre dois times"""
+        home_lineup = self.teams[home_team]
+        away_lineup = self.teams[away_team]
+        
+        match_result = self.simulator.simulate_match(
+            home_lineup=home_lineup,
+            away_lineup=away_lineup,
+            home_team_name=home_team,
+            away_team_name=away_team
+        )
+        return self.record_match(match_result)
+    
+    def record_match(self, match_result) -> Tuple[int, int]:
+        """Leva o resultado de uma partida ao arquivo, ao dataset colunar e às estatísticas"""
+        home_team, away_team = match_result.home_team, match_result.away_team
+        profiler = self.profiler
+        if profiler is not None:
+            started = profiler.start()
+        
+        if self.result_sink is not None and not self.result_sink.closed:
+            self.result_sink.write_match(
+                home_team, away_team, match_result.home_goals, match_result.away_goals,
+                shots=[match_result.home_shots, match_result.away_shots],
+                on_target=[match_result.home_shots_on_target, match_result.away_shots_on_target],
+                possession=[round(match_result.home_possession, 1), round(match_result.away_possession, 1)]
+            )
+        
+        if self.columnar_format:
+            self._match_rows.append({
+                'home': home_team,
+                'away': away_team,
+                'home_goals': match_result.home_goals,
+                'away_goals': match_result.away_goals,
+                'home_shots': match_result.home_shots,
+                'away_shots': match_result.away_shots,
+                'home_shots_on_target': match_result.home_shots_on_target,
+                'away_shots_on_target': match_result.away_shots_on_target,
+                'home_possession': match_result.home_possession,
+            })
+        if profiler is not None:
+            started = profiler.lap("result_output", started)
+        
+        # Estatísticas dos jogadores são acumuladas em lote
+        self._pending_results.append(match_result)
+        if len(self._pending_results) >= self.stats_batch_size:
+            self.flush_player_stats()
+        if profiler is not None:
+            profiler.lap("player_stats", started)
+        
+        return match_result.home_goals, match_result.away_goals
+    
+    def flush_player_stats(self):
+        """Acumula no agregador as partidas ainda pendentes"""
+        if self._pending_results:
+            touched = self.player_stats.add_matches(self._pending_results)
+            self.player_stats.sync_season_stats(self._players_by_id, touched)
+            self._pending_results = []
+    
+    def simulate_full_season(self, stream_results: bool = True) -> LeagueTable:
+        """Simula uma temporada completa
+        
+        O progresso (partidas feitas, partidas/s, ETA, memória) e cada resultado
+        são publicados em `self.progress`.
+        """
+        progress = self.progress
+        if self.match_engine == "timestep":
+            rounds = self.generate_rounds()
+            fixtures = [fixture for matchweek in rounds for fixture in matchweek]
+        else:
+            fixtures = self.generate_fixtures()
+        progress.start(len(fixtures), label=self.league_name.replace('_', ' '))
+        
+        # As partidas vão para o arquivo de resultados assim que terminam
+        if stream_results:
+            self._open_result_sink()
+        
+        # Simular todas as partidas (no motor em passos de tempo, uma rodada por lote)
+        if self.match_engine == "timestep":
+            matches = (self.record_match(result) for result in self._simulate_timestep_rounds(rounds))
+        else:
+            matches = (self.simulate_match(home_team, away_team) for home_team, away_team in fixtures)
+        
+        for (home_team, away_team), (home_goals, away_goals) in zip(fixtures, matches):
+            # Adicionar resultado à tabela
+            self.table.add_match_result(home_team, away_team, home_goals, away_goals)
+            
+            if progress.active:
+                progress.emit("match", home=home_team, away=away_team,
+                              home_goals=home_goals, away_goals=away_goals)
+                progress.advance()
+        
+        self.flush_player_stats()
+        progress.done = len(fixtures)
+        progress.finish()
+        
+        return self.table
+    
+    def _simulate_timestep_rounds(self, rounds: List[List[Tuple[str, str]]]):
+        """Cada rodada num lote do TimeSteppedMatchEngine, com o estado dos jogadores entre elas
+        
+        Depois de cada lote os jogadores de cada partida recebem a fadiga, a forma
+        e as lesões, como no motor de eventos. Antes da rodada seguinte (uma por
+        semana) o elenco descansa, quem já cumpriu a lesão volta e os titulares
+        são escolhidos como no universo. A seed do motor sai de `self.rng`, então
+        a temporada continua reproduzível com random.seed (ou com o gerador passado).
+        """
+        from .timestep import TimeSteppedMatchEngine
+        from .universe import UniverseConfig, pick_matchday_squad
+        
+        profiler = self.profiler
+        config = UniverseConfig()
+        engine = TimeSteppedMatchEngine(seed=self.rng.getrandbits(32))
+        first_choice = {team: list(lineup.players) for team, lineup in self.teams.items()}
+        
+        for week, fixtures in enumerate(rounds):
+            day = SEASON_START + timedelta(days=week * MATCHWEEK_DAYS)
+            for team, lineup in self.teams.items():
+                if week:
+                    for player in lineup.players + lineup.substitutes:
+                        injury = player.current_injury
+                        if player.is_injured and injury is not None and injury.expected_return <= day:
+                            player.recover_from_injury()
+                        player.recover_fitness(MATCHWEEK_DAYS, config.fitness_recovery_per_day)
+                pick_matchday_squad(lineup, first_choice[team], config.rotation_fitness)
+            
+            if profiler is not None:
+                started = profiler.start()
+            batch = engine.simulate(fixtures, self.teams)
+            results = batch.results()
+            if profiler is not None:
+                profiler.lap("timestep_batch", started)
+                profiler.count("matches", len(results))
+            
+            for m, result in enumerate(results):
+                result.match_date = day
+                for side, performances in ((0, result.home_performances), (1, result.away_performances)):
+                    squad = batch.squads[batch.team_index[m, side]]
+                    for slot in batch.played[m, side].nonzero()[0].tolist():
+                        player = squad[slot]
+                        performance = performances[player.id]
+                        player.apply_fatigue(performance.minutes_played)
+                        player.update_form(int(performance.match_rating), self.rng)
+                        if batch.injured[m, side, slot]:
+                            player.get_injured(on=day, rng=self.rng)
+            yield from results
+    
+    def _open_result_sink(self):
+        """Abre o arquivo de resultados que recebe as partidas durante a temporada"""
+        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        base_filename = unique_stem(self.output_dir, f"resultados_{self.league_name}_{timestamp}")
+        self._export_timestamp = base_filename[len(f"resultados_{self.league_name}_"):]
+        self._created_at = datetime.now().isoformat()
+        self.result_sink = StreamingResultSink(
+            self.output_dir / f"{base_filename}.jsonl",
+            header={
+                "simulation_type": "advanced",
+                "created_at": self._created_at,
+                "league": self.league_name.replace("_", " ").title(),
+            }
+        )
+    
+    def result_rows(self) -> Tuple[List[Dict], List[Dict], Dict]:
+        """Linhas da tabela, linhas dos jogadores (por gols) e resumo da temporada"""
+        table_data = self.table.get_table()
+        table_rows = [
+            {
+                'Time': team,
+                'J': stats['matches'], 
+                'V': stats['wins'],
+                'E': stats['draws'],
+                'D': stats['losses'],
+                'GP': stats['goals_for'],
+                'GC': stats['goals_against'], 
+                'SG': stats['goal_difference'],
+                'P': stats['points']
+            }
+            for team, stats in table_data
+        ]
+        
+        # Só jogadores que jogaram, ordenados por gols e assistências
+        player_rows = [
+            {
+                'Nome': stats.player_name,
+                'Time': stats.team_name,
+                'Posicao': stats.position,
+                'Overall': int(stats.overall),
+                'Jogos': int(stats.matches_played),
+                'Minutos': int(stats.minutes_played),
+                'Gols': int(stats.goals),
+                'Assistencias': int(stats.assists),
+                'Finalizacoes': int(stats.shots),
+                'Chutes_Alvo': int(stats.shots_on_target),
+                'Cartoes_Amarelos': int(stats.yellow_cards),
+                'Cartoes_Vermelhos': int(stats.red_cards),
+                'Media_Gols': round(float(stats.goals_per_game), 3),
+                'Media_Assists': round(float(stats.assists_per_game), 3)
+            }
+            for stats in self.player_stats.records()
+        ]
+        player_rows.sort(key=lambda row: (row['Gols'], row['Assistencias']), reverse=True)
+        
+        summary = {
+            "total_matches": int(len(self.team_names) * (len(self.team_names) - 1)),
+            "total_goals": int(sum(team[1]['goals_for'] for team in table_data)),
+            "total_players": len(player_rows),
+            "champion": str(table_data[0][0]),
+            "top_scorer": player_rows[0]['Nome'] if player_rows else None,
+            "top_scorer_goals": player_rows[0]['Gols'] if player_rows else 0
+        }
+        
+        return table_rows, player_rows, summary
+    
+    def export_results(self, file=None):
+        """Exporta resultados em JSON Lines e CSV igual ao simulador simples
+
+        O resumo dos arquivos vai para `file` (padrão: sys.stdout).
+        """
+        if self.result_sink is None or self.result_sink.closed:
+            self._open_result_sink()
+        sink = self.result_sink
+        base_filename = f"resultados_{self.league_name}_{self._export_timestamp}"
+        
+        # 1. Tabela da liga e 2. estatísticas dos jogadores
+        table_rows, player_rows, summary = self.result_rows()
+        sink.write_rows("table", table_rows)
+        player_ids = sink.write_rows("player", player_rows)
+        
+        # 3. Visões derivadas como referências às linhas de jogadores
+        by_assists = sorted(
+            player_ids,
+            key=lambda i: (player_rows[i]['Assistencias'], player_rows[i]['Gols']),
+            reverse=True
+        )
+        sink.write_view("top_10_artilheiros", player_ids[:10])
+        sink.write_view("top_10_assistencias", by_assists[:10])
+        
+        # 4. Resumo e hash do fluxo completo
+        hash_value = sink.close(summary=summary)
+        
+        # 5. CSVs
+        csv_table_path = self.output_dir / f"{base_filename}_tabela.csv"
+        _write_csv(csv_table_path, table_rows)
+        
+        csv_players_path = self.output_dir / f"{base_filename}_jogadores.csv" 
+        _write_csv(csv_players_path, player_rows)
+        
+        # 6. Registro no catálogo de resultados
+        with ResultsCatalog(self.output_dir.parent) as catalog:
+            catalog.add(
+                self.league_name, sink.path,
+                created_at=self._created_at,
+                simulation_type="advanced",
+                champion=summary['champion'],
+                top_scorer=summary['top_scorer'],
+                top_scorer_goals=summary['top_scorer_goals'],
+                hash=f"sha256:{hash_value}",
+                extra_files=[csv_table_path, csv_players_path]
+            )
+        
+        # 7. Dataset colunar (opcional)
+        dataset_path = None
+        if self.columnar_writer is not None:
+            dataset_path = self.columnar_writer.write_run(self.league_name, self._export_timestamp, {
+                'matches': self._match_rows,
+                'table': table_rows,
+                'players': player_rows,
+            })
+        
+        out = file or sys.stdout
+        print(f"\n💾 DADOS EXPORTADOS:", file=out)
+        print(f"   [TABELA] Tabela: {csv_table_path}", file=out)
+        print(f"   👥 Jogadores: {csv_players_path}", file=out)
+        print(f"   📋 Completo: {sink.path}", file=out)
+        if dataset_path is not None:
+            print(f"   🗂️  Colunar: {dataset_path}", file=out)
+        print(f"   🔐 Hash: {hash_value[:16]}...", file=out)
+        
+        return {
+            'table_csv': csv_table_path,
+            'players_csv': csv_players_path, 
+            'jsonl': sink.path,
+            'dataset': dataset_path,
+            'hash': hash_value
+        }
+    
+    def show_final_results(self):
+        """Mostra resultados finais da temporada"""
+        
+        # Tabela final
+        self.table.print_table(f"RESULTADO FINAL - {self.league_name.replace('_', ' ').upper()} 2025")
+        
+        # Estatísticas interessantes
+        table_data = self.table.get_table()
+        
+        print(f"\n[DESTAQUES] DESTAQUES DA TEMPORADA:")
+        
+        # Campeão
+        champion = table_data[0]
+        print(f"[CAMPEAO] CAMPEÃO: {champion[0]} com {champion[1]['points']} pontos")
+        
+        # Vice-campeão
+        runner_up = table_data[1]
+        print(f"[2nd] Vice-campeão: {runner_up[0]} com {runner_up[1]['points']} pontos")
+        
+        # Rebaixados
+        relegated = table_data[-3:]
+        relegated.reverse()  # Mostrar do pior pro melhor
+        print(f"\n🔴 REBAIXAMENTO:")
+        for pos, (team, stats) in enumerate(relegated, len(table_data)-2):
+            print(f"   {pos}º {team} - {stats['points']} pts")
+        
+        # Melhor ataque (mais gols marcados) e melhor defesa (menos gols sofridos)
+        best_attack = max(table_data, key=lambda x: x[1]['goals_for'])
+        print(f"\n[ATAQUE] MELHOR ATAQUE: {best_attack[0]} ({best_attack[1]['goals_for']} gols)")
+        best_defense = min(table_data, key=lambda x: x[1]['goals_against'])
+        print(f"🛡️  MELHOR DEFESA: {best_defense[0]} ({best_defense[1]['goals_against']} gols sofridos)")
+        
+        # Classificação para competições europeias
+        print(f"\n🌍 COMPETIÇÕES EUROPEIAS 2026:")
+        print(f"   🔵 Champions League: {', '.join([team[0] for team in table_data[:4]])}")
+        if len(table_data) > 4:
+            print(f"   🟡 Europa League: {', '.join([team[0] for team in table_data[4:6]])}")
+        
+        # Top scorers e assistências
+        print(f"\n[ARTILHEIROS] TOP 10 ARTILHEIROS:")
+        self.player_stats.print_top_scorers()
+        
+        print(f"\n🎯 TOP 10 ASSISTÊNCIAS:")
+        self.player_stats.print_top_assisters()
+        
+        # Exportar dados
+        print(f"\n📂 EXPORTANDO RESULTADOS...")
+        export_info = self.export_results()
+        
+        return export_info
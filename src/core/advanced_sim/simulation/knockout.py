@@ -0,0 +1,103 @@
+"""
+Confrontos eliminatórios com o motor avançado
+Jogo único ou ida e volta (placar agregado); confronto empatado vai para a
+prorrogação (opcional) e depois para a disputa de pênaltis. Usado pelos
+playoffs de acesso da pirâmide de divisões e pela copa europeia do universo
+(universe.py); os torneios (tournament.py) usam as mesmas regras em lote.
+"""
+
+import random
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+
+from .advanced_match import AdvancedMatchSimulator, TeamLineup
+
+
+# Chance de converter cada cobrança na disputa de pênaltis
+PENALTY_CONVERSION = 0.75
+
+# A prorrogação é uma partida simulada em que cada gol vale com esta chance (30 de 90 minutos)
+EXTRA_TIME_SHARE = 1 / 3
+
+
+@dataclass
+class TieResult:
+    """Resultado de um confronto eliminatório
+
+    `home` é o mandante do primeiro jogo; placares e agregado são sempre do
+    ponto de vista de (home, away).
+    """
+    home: str
+    away: str
+    legs: List[Tuple[int, int]] = field(default_factory=list)
+    extra_time: Optional[Tuple[int, int]] = None
+    penalties: Optional[Tuple[int, int]] = None
+    winner: str = ""
+
+    @property
+    def aggregate(self) -> Tuple[int, int]:
+        """Placar agregado, com a prorrogação"""
+        scores = self.legs + ([self.extra_time] if self.extra_time else [])
+        return sum(score[0] for score in scores), sum(score[1] for score in scores)
+
+    @property
+    def loser(self) -> str:
+        return self.away if self.winner == self.home else self.home
+
+
+def penalty_shootout(rng=random, conversion: float = PENALTY_CONVERSION) -> Tuple[int, int]:
+    """Disputa de pênaltis: 5 cobranças alternadas (com fim antecipado) e morte súbita"""
+    scores = [0, 0]
+    for kick in range(5):
+        for side in (0, 1):
+            scores[side] += rng.random() < conversion
+            taken = [kick + 1, kick + (side == 1)]
+            remaining = [5 - taken[0], 5 - taken[1]]
+            if scores[0] + remaining[0] < scores[1] or scores[1] + remaining[1] < scores[0]:
+                return scores[0], scores[1]
+    while scores[0] == scores[1]:
+        scores[0] += rng.random() < conversion
+        scores[1] += rng.random() < conversion
+    return scores[0], scores[1]
+
+
+def play_tie(simulator: AdvancedMatchSimulator, lineups: Dict[str, TeamLineup], home: str, away: str,
+             legs: int = 1, extra_time: bool = False, rng=random) -> TieResult:
+    """Joga um confronto de `legs` partidas (1 ou 2) entre `home` e `away`
+
+    Com `extra_time`, um empate no agregado vai para a prorrogação (no campo
+    do último jogo) antes dos pênaltis.
+    """
+    if legs not in (1, 2):
+        raise ValueError(f"Confronto com {legs} jogos (use 1 ou 2)")
+
+    tie = TieResult(home, away)
+    result = simulator.simulate_match(lineups[home], lineups[away], home, away)
+    tie.legs.append((result.home_goals, result.away_goals))
+    if legs == 2:
+        result = simulator.simulate_match(lineups[away], lineups[home], away, home)
+        tie.legs.append((result.away_goals, result.home_goals))
+    return settle_tie(simulator, lineups, tie, extra_time, rng)
+
+
+def settle_tie(simulator: AdvancedMatchSimulator, lineups: Dict[str, TeamLineup], tie: TieResult,
+               extra_time: bool = False, rng=random, match_date: Optional[date] = None) -> TieResult:
+    """Decide um confronto com os jogos já disputados em `tie.legs`
+
+    Empate no agregado vai para a prorrogação (com `extra_time`, no campo do
+    último jogo, na data `match_date`) e depois para os pênaltis.
+    """
+    home, away = tie.home, tie.away
+    home_goals, away_goals = tie.aggregate
+    if home_goals == away_goals and extra_time:
+        venue = (home, away) if len(tie.legs) == 1 else (away, home)
+        result = simulator.simulate_match(lineups[venue[0]], lineups[venue[1]], *venue, match_date=match_date)
+        goals = {result.home_team: result.home_goals, result.away_team: result.away_goals}
+        tie.extra_time = tuple(sum(rng.random() < EXTRA_TIME_SHARE for _ in range(goals[team])) for team in (home, away))
+        home_goals, away_goals = tie.aggregate
+    if home_goals == away_goals:
+        tie.penalties = penalty_shootout(rng)
+        home_goals, away_goals = tie.penalties
+    tie.winner = home if home_goals > away_goals else away
+    return tie
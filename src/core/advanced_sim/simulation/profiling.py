@@ -0,0 +1,113 @@
+"""
+Instrumentação opcional do motor de partidas
+Um MatchProfiler ligado ao AdvancedMatchSimulator soma o tempo de cada fase
+de `simulate_match` e conta eventos criados, sorteios do gerador aleatório e
+objetos alocados. Desligado (profiler None), o custo é uma comparação por
+fase. O FullSeasonSimulator usa um profiler por temporada, somando também as
+fases da própria temporada (tabela, estatísticas dos jogadores, arquivo).
+"""
+
+import random as _random
+from collections import defaultdict
+from time import perf_counter
+from typing import Dict
+
+
+# Fases da partida, na ordem em que acontecem
+MATCH_PHASES = ("setup", "tactics", "strength", "attacks", "discipline", "ratings", "post_match")
+
+
+class CountingRandom:
+    """Fonte aleatória que repassa para `source` e conta os sorteios
+
+    Usa a mesma sequência da fonte original, então ligar o profiler não muda
+    os resultados da simulação.
+    """
+
+    def __init__(self, profiler: "MatchProfiler", source=_random):
+        self._profiler = profiler
+        self._source = source
+
+    def _draw(self):
+        self._profiler.counters["rng_draws"] += 1
+
+    def random(self):
+        self._draw()
+        return self._source.random()
+
+    def uniform(self, a, b):
+        self._draw()
+        return self._source.uniform(a, b)
+
+    def randint(self, a, b):
+        self._draw()
+        return self._source.randint(a, b)
+
+    def choice(self, seq):
+        self._draw()
+        return self._source.choice(seq)
+
+
+class MatchProfiler:
+    """Tempos por fase e contadores acumulados de várias partidas"""
+
+    def __init__(self):
+        self.timers: Dict[str, float] = defaultdict(float)
+        self.counters: Dict[str, int] = defaultdict(int)
+
+    @staticmethod
+    def start() -> float:
+        return perf_counter()
+
+    def lap(self, phase: str, started: float) -> float:
+        """Soma o tempo desde `started` à fase e retorna o novo início"""
+        now = perf_counter()
+        self.timers[phase] += now - started
+        return now
+
+    def count(self, name: str, n: int = 1) -> None:
+        self.counters[name] += n
+
+    def rng(self, source=_random) -> CountingRandom:
+        return CountingRandom(self, source)
+
+    def merge(self, other: "MatchProfiler") -> "MatchProfiler":
+        for phase, seconds in other.timers.items():
+            self.timers[phase] += seconds
+        for name, value in other.counters.items():
+            self.counters[name] += value
+        return self
+
+    def summary(self) -> Dict:
+        """Tempos (total, por partida e fração) e contadores, em formato JSON"""
+        matches = max(self.counters.get("matches", 0), 1)
+        total = sum(self.timers.values()) or 1.0
+        return {
+            "matches": self.counters.get("matches", 0),
+            "phases": {
+                phase: {
+                    "total_s": round(seconds, 6),
+                    "per_match_us": round(seconds / matches * 1e6, 2),
+                    "share": round(seconds / total, 4),
+                }
+                for phase, seconds in sorted(self.timers.items(), key=lambda item: item[1], reverse=True)
+            },
+            "counters": {
+                name: {"total": value, "per_match": round(value / matches, 2)}
+                for name, value in sorted(self.counters.items())
+            },
+        }
+
+    def print_summary(self, title: str = "PERFIL DA TEMPORADA") -> None:
+        summary = self.summary()
+        print(f"\n{'='*72}")
+        print(f"[PERFIL] {title} ({summary['matches']} partidas)")
+        print(f"{'='*72}")
+        print(f"{'Fase':<16} {'Total (s)':>10} {'µs/partida':>12} {'%':>7}")
+        print(f"{'-'*72}")
+        for phase, stats in summary["phases"].items():
+            print(f"{phase:<16} {stats['total_s']:>10.4f} {stats['per_match_us']:>12.1f} {stats['share'] * 100:>6.1f}%")
+        print(f"\n{'Contador':<24} {'Total':>10} {'Por partida':>12}")
+        print(f"{'-'*72}")
+        for name, stats in summary["counters"].items():
+            print(f"{name:<24} {stats['total']:>10} {stats['per_match']:>12.2f}")
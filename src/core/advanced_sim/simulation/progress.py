@@ -0,0 +1,205 @@
+"""
+Fluxo estruturado de progresso e métricas das simulações longas
+Os simuladores de temporada publicam ProgressEvent num ProgressStream em vez
+de imprimir no console. Sem assinantes o fluxo fica inativo e os simuladores
+nem montam os eventos (modo silencioso, padrão em lote); a saída de texto
+de antes é o assinante ConsolePrinter, e o LoggingSubscriber envia os eventos
+em JSON para um logger.
+
+Tipos de evento:
+    loading / loaded      carga da liga
+    season_start          início da temporada (total de partidas)
+    matchweek             início de uma rodada
+    match                 resultado de uma partida (e gols, quando houver eventos)
+    progress              partidas feitas, partidas/s, ETA e memória
+    table                 classificação parcial ou final
+    warning               aviso (ex.: escalação ausente)
+    season_end            fim da temporada
+    progression           evolução dos jogadores na virada de temporada (modo carreira)
+    movement              acesso e rebaixamento entre duas divisões (pirâmide)
+"""
+
+import json
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Callable, Dict, List, Optional
+
+
+def max_rss_kb() -> Optional[int]:
+    """Pico de memória residente do processo (None onde `resource` não existe)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss vem em bytes no macOS e em KB no Linux
+    return usage // 1024 if sys.platform == "darwin" else usage
+
+
+@dataclass
+class ProgressEvent:
+    """Um evento do fluxo de progresso"""
+    kind: str
+    source: str
+    done: int = 0
+    total: int = 0
+    elapsed: float = 0.0
+    rate: float = 0.0               # partidas/s desde o início
+    eta: Optional[float] = None     # segundos restantes estimados
+    memory_kb: Optional[int] = None
+    data: Dict = field(default_factory=dict)
+
+    @property
+    def fraction(self) -> float:
+        return self.done / self.total if self.total else 0.0
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+Subscriber = Callable[[ProgressEvent], None]
+
+
+class ProgressStream:
+    """Distribui eventos de progresso para os assinantes
+
+    `every` controla de quantas em quantas partidas sai um evento `progress`.
+    """
+
+    def __init__(self, subscribers: Optional[List[Subscriber]] = None, every: int = 50,
+                 source: str = ""):
+        self.subscribers: List[Subscriber] = list(subscribers or [])
+        self.every = max(1, every)
+        self.source = source
+        self.done = 0
+        self.total = 0
+        self._started = time.perf_counter()
+
+    @property
+    def active(self) -> bool:
+        return bool(self.subscribers)
+
+    def subscribe(self, subscriber: Subscriber) -> Subscriber:
+        self.subscribers.append(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        self.subscribers.remove(subscriber)
+
+    def emit(self, kind: str, **data) -> None:
+        if not self.subscribers:
+            return
+        elapsed = time.perf_counter() - self._started
+        rate = self.done / elapsed if elapsed > 0 else 0.0
+        eta = (self.total - self.done) / rate if rate > 0 and self.total else None
+        event = ProgressEvent(
+            kind=kind,
+            source=self.source,
+            done=self.done,
+            total=self.total,
+            elapsed=elapsed,
+            rate=rate,
+            eta=eta,
+            memory_kb=max_rss_kb() if kind in ("progress", "season_end") else None,
+            data=data
+        )
+        for subscriber in self.subscribers:
+            subscriber(event)
+
+    def start(self, total: int, **data) -> None:
+        """Zera a contagem e publica `season_start`"""
+        self.done = 0
+        self.total = total
+        self._started = time.perf_counter()
+        self.emit("season_start", **data)
+
+    def advance(self, n: int = 1) -> None:
+        """Conta partidas concluídas e publica `progress` a cada `every`"""
+        before = self.done
+        self.done += n
+        if self.done // self.every > before // self.every or self.done == self.total:
+            self.emit("progress")
+
+    def finish(self, **data) -> None:
+        self.emit("season_end", **data)
+
+
+class ConsolePrinter:
+    """Assinante que imprime os eventos como texto legível
+
+    `matches` limita quantos resultados são impressos por temporada (None
+    imprime todos).
+    """
+
+    def __init__(self, matches: Optional[int] = 0, file=None):
+        self.matches = matches
+        self.file = file
+        self._printed_matches = 0
+
+    def _print(self, text: str = "") -> None:
+        print(text, file=self.file or sys.stdout)
+
+    def __call__(self, event: ProgressEvent) -> None:
+        data = event.data
+        kind = event.kind
+
+        if kind == "loading":
+            self._print(f"[LOADING] Carregando {data['league'].replace('_', ' ').title()}...")
+        elif kind == "loaded":
+            self._print(f"[OK] {data['teams']} times carregados!")
+        elif kind == "season_start":
+            self._printed_matches = 0
+            self._print(f"\n[SIMULACAO] INICIANDO SIMULAÇÃO DA TEMPORADA {data.get('label', event.source).upper()}")
+            self._print(f"[INFO] Total de partidas: {event.total}")
+        elif kind == "matchweek":
+            self._print(f"\n=== RODADA {data['matchweek']} ===")
+        elif kind == "match":
+            if self.matches is None or self._printed_matches < self.matches:
+                self._printed_matches += 1
+                symbol = "[DRAW]" if data["home_goals"] == data["away_goals"] else "[WIN]"
+                self._print(f"   {symbol} {data['home']} {data['home_goals']}-{data['away_goals']} {data['away']}")
+                for minute, description in data.get("goals", []):
+                    self._print(f"      {minute}' {description}")
+        elif kind == "progress":
+            eta = f" | ETA {event.eta:.1f}s" if event.eta is not None else ""
+            self._print(f"[PROGRESS] Progresso: {event.fraction * 100:.1f}% ({event.done}/{event.total} jogos)"
+                        f" | {event.rate:.0f} jogos/s{eta}")
+        elif kind == "table":
+            self._print_table(data.get("title", "CLASSIFICAÇÃO"), data["rows"])
+        elif kind == "warning":
+            self._print(f"[WARN] {data['message']}")
+        elif kind == "season_end":
+            self._print(f"[OK] Temporada concluída! {event.done} partidas simuladas.")
+        elif kind == "progression":
+            self._print(f"[EVOLUÇÃO] {data['season_year']}: variação média {data['mean_delta']:+.2f}, "
+                        f"{data['retired']} aposentadorias")
+        elif kind == "movement":
+            self._print(f"[ACESSO] {data['lower']} -> {data['upper']}: {', '.join(data['promoted'])}")
+            self._print(f"[REBAIXAMENTO] {data['upper']} -> {data['lower']}: {', '.join(data['relegated'])}")
+
+    def _print_table(self, title: str, rows: List[Dict]) -> None:
+        self._print(f"\n{'='*70}")
+        self._print(title)
+        self._print(f"{'='*70}")
+        self._print(f"{'Pos':<3} {'Time':<25} {'J':<3} {'V':<3} {'E':<3} {'D':<3} {'GP':<3} {'GC':<3} {'SG':<4} {'Pts':<3}")
+        self._print("-" * 70)
+        for pos, row in enumerate(rows, 1):
+            self._print(f"{pos:<3} {row['Time']:<25} {row['J']:<3} {row['V']:<3} {row['E']:<3} {row['D']:<3} "
+                        f"{row['GP']:<3} {row['GC']:<3} {row['SG']:<4} {row['P']:<3}")
+
+
+class LoggingSubscriber:
+    """Assinante que envia cada evento como JSON para um logger"""
+
+    def __init__(self, logger: Optional["logging.Logger"] = None, level: Optional[int] = None,
+                 kinds: Optional[List[str]] = None):
+        import logging  # só quem assina pelo logger paga o import
+
+        self.logger = logger or logging.getLogger("core.progress")
+        self.level = logging.INFO if level is None else level
+        self.kinds = set(kinds) if kinds else None
+
+    def __call__(self, event: ProgressEvent) -> None:
+        if self.kinds is None or event.kind in self.kinds:
+            self.logger.log(self.level, json.dumps(event.to_dict(), ensure_ascii=False, default=str))
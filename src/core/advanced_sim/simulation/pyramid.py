@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Pirâmide de divisões com acesso, rebaixamento e playoffs
+Várias divisões ligadas (da primeira para baixo) jogam suas temporadas ao
+mesmo tempo, uma por processo quando há workers, e no fim de cada temporada
+os times trocam de divisão: os últimos de cada divisão descem, os primeiros
+da divisão de baixo sobem e, se houver, o vencedor do playoff (semifinais de
+ida e volta e final em jogo único, com prorrogação) fica com a última vaga de
+acesso.
+
+Os times levam o próprio estado (TeamLineup, jogadores e estatísticas) de uma
+divisão para outra; nada é recarregado entre temporadas.
+"""
+
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from ..data_loader import LeagueDataLoader
+from ..stats.progression import reset_for_new_season
+from .advanced_match import AdvancedMatchSimulator, MatchDetail, TeamLineup
+from .career import season_label
+from .knockout import TieResult, play_tie
+from .progress import ProgressStream
+from .season import SeasonSimulator
+
+
+@dataclass
+class Division:
+    """Uma divisão da pirâmide e suas regras de acesso/rebaixamento
+
+    `promoted` são as vagas diretas de acesso para a divisão de cima e
+    `relegated` os rebaixados diretos para a de baixo. `playoff` são as
+    posições (inclusive) que disputam a última vaga de acesso, ex.: (3, 6).
+    """
+    name: str
+    teams: Dict[str, TeamLineup]
+    promoted: int = 0
+    relegated: int = 0
+    playoff: Optional[Tuple[int, int]] = None
+
+    @property
+    def promotion_spots(self) -> int:
+        return self.promoted + (1 if self.playoff else 0)
+
+
+@dataclass
+class DivisionSeason:
+    """Temporada de uma divisão (tabela final e escalações atualizadas)"""
+    division: str
+    table: List[Dict]
+    teams: Dict[str, TeamLineup]
+
+    @property
+    def ranking(self) -> List[str]:
+        return [row["Time"] for row in self.table]
+
+
+@dataclass
+class PyramidSeason:
+    season_year: str
+    tables: Dict[str, List[Dict]]
+    promoted: Dict[str, List[str]] = field(default_factory=dict)     # divisão de origem -> times
+    relegated: Dict[str, List[str]] = field(default_factory=dict)
+    playoffs: Dict[str, List[TieResult]] = field(default_factory=dict)
+
+    def champion(self, division: str) -> str:
+        return self.tables[division][0]["Time"]
+
+
+@dataclass
+class PyramidResult:
+    divisions: List[str]
+    seasons: List[PyramidSeason] = field(default_factory=list)
+    elapsed: float = 0.0
+
+
+def simulate_division_season(division: str, teams: Dict[str, TeamLineup], seed: int,
+                             year: int) -> DivisionSeason:
+    """Temporada completa de uma divisão (função de módulo para rodar em outro processo)"""
+    random.seed(seed)
+    season = SeasonSimulator(ProgressStream(source=division), match_detail=MatchDetail.STATS)
+    season.team_lineups = teams
+    season.initialize_season(list(teams), season_year=season_label(year), start_date=date(year, 8, 17))
+    season.simulate_full_season()
+    return DivisionSeason(division, season.table.to_rows(), teams)
+
+
+def split_league(lineups: Dict[str, TeamLineup], tiers: int) -> List[Dict[str, TeamLineup]]:
+    """Divide uma liga em `tiers` divisões pela força dos times (todas com número par de times)"""
+    ranked = sorted(lineups, key=lambda name: lineups[name].get_team_rating(), reverse=True)
+    size = len(ranked) // tiers
+    size -= size % 2
+    if size < 2 or (len(ranked) - size * (tiers - 1)) % 2:
+        raise ValueError(f"Não dá para dividir {len(ranked)} times em {tiers} divisões com número par de times")
+    bounds = [size * i for i in range(tiers)] + [len(ranked)]
+    return [{name: lineups[name] for name in ranked[bounds[i]:bounds[i + 1]]} for i in range(tiers)]
+
+
+class PyramidSimulator:
+    """Orquestra as divisões ligadas ao longo de várias temporadas"""
+
+    def __init__(self, divisions: Sequence[Division], seed: Optional[int] = None, workers: int = 1,
+                 start_year: int = 2024, playoff_legs: int = 2,
+                 progress: Optional[ProgressStream] = None):
+        self.divisions = list(divisions)
+        self.workers = workers
+        self.year = start_year
+        self.playoff_legs = playoff_legs
+        self.progress = progress or ProgressStream(source="pyramid")
+        self.rng = random.Random(seed)
+        self._validate()
+
+    def _validate(self) -> None:
+        names = [division.name for division in self.divisions]
+        if len(set(names)) != len(names):
+            raise ValueError("Nomes de divisão repetidos na pirâmide")
+        for upper, lower in zip(self.divisions, self.divisions[1:]):
+            if upper.relegated != lower.promotion_spots:
+                raise ValueError(
+                    f"{upper.name} rebaixa {upper.relegated} times, mas {lower.name} "
+                    f"promove {lower.promotion_spots}"
+                )
+        if self.divisions and (self.divisions[0].promotion_spots or self.divisions[-1].relegated):
+            raise ValueError("A primeira divisão não tem acesso e a última não tem rebaixamento")
+        for division in self.divisions:
+            if division.playoff:
+                first, last = division.playoff
+                if last - first + 1 != 4 or first <= division.promoted:
+                    raise ValueError(f"Playoff de {division.name} precisa de 4 posições após as vagas diretas")
+
+    # ------------------------------------------------------------------
+    # Temporada
+
+    def _simulate_divisions(self) -> List[DivisionSeason]:
+        seeds = [self.rng.getrandbits(32) for _ in self.divisions]
+        args = (
+            [d.name for d in self.divisions],
+            [d.teams for d in self.divisions],
+            seeds,
+            [self.year] * len(self.divisions),
+        )
+        if self.workers <= 1 or len(self.divisions) == 1:
+            return list(map(simulate_division_season, *args))
+        # Em outro processo as escalações voltam atualizadas (cópias); elas substituem as daqui
+        with ProcessPoolExecutor(max_workers=min(self.workers, len(self.divisions))) as pool:
+            return list(pool.map(simulate_division_season, *args))
+
+    def _playoff(self, division: Division, ranking: List[str]) -> List[TieResult]:
+        """Semifinais (1º x 4º e 2º x 3º do playoff, mandante da volta é o melhor colocado) e final"""
+        first, last = division.playoff
+        seeds = ranking[first - 1:last]
+        # Os jogos sorteiam de self.rng: o playoff não depende do random global
+        # (que, com workers > 1, nunca é semeado neste processo)
+        simulator = AdvancedMatchSimulator(MatchDetail.STATS, rng=self.rng)
+        semis = [
+            play_tie(simulator, division.teams, seeds[3], seeds[0], legs=self.playoff_legs,
+                     extra_time=True, rng=self.rng),
+            play_tie(simulator, division.teams, seeds[2], seeds[1], legs=self.playoff_legs,
+                     extra_time=True, rng=self.rng),
+        ]
+        finalists = sorted((tie.winner for tie in semis), key=seeds.index)
+        final = play_tie(simulator, division.teams, finalists[0], finalists[1], legs=1, extra_time=True, rng=self.rng)
+        return semis + [final]
+
+    def simulate_season(self) -> PyramidSeason:
+        """Joga a temporada de todas as divisões e aplica acesso e rebaixamento"""
+        label = season_label(self.year)
+        results = self._simulate_divisions()
+
+        season = PyramidSeason(label, {result.division: result.table for result in results})
+        rankings = {}
+        for division, result in zip(self.divisions, results):
+            division.teams = result.teams
+            rankings[division.name] = result.ranking
+            if self.progress.active:
+                self.progress.emit("table", title=f"{division.name.upper()} {label}", rows=result.table)
+
+        # Quem sobe e quem desce é decidido antes de mover qualquer time
+        moves = []
+        for upper, lower in zip(self.divisions, self.divisions[1:]):
+            down = rankings[upper.name][len(rankings[upper.name]) - upper.relegated:]
+            up = rankings[lower.name][:lower.promoted]
+            if lower.playoff:
+                ties = self._playoff(lower, rankings[lower.name])
+                season.playoffs[lower.name] = ties
+                up.append(ties[-1].winner)
+            season.relegated[upper.name] = down
+            season.promoted[lower.name] = up
+            moves.append((upper, lower, down, up))
+
+        for upper, lower, down, up in moves:
+            for team in down:
+                lower.teams[team] = upper.teams.pop(team)
+            for team in up:
+                upper.teams[team] = lower.teams.pop(team)
+            if self.progress.active:
+                self.progress.emit("movement", upper=upper.name, lower=lower.name, promoted=up, relegated=down)
+
+        for division in self.divisions:
+            for lineup in division.teams.values():
+                for player in lineup.players + lineup.substitutes:
+                    reset_for_new_season(player)
+
+        self.year += 1
+        return season
+
+    def run(self, n_seasons: int) -> PyramidResult:
+        start = time.perf_counter()
+        result = PyramidResult([division.name for division in self.divisions])
+        for _ in range(n_seasons):
+            result.seasons.append(self.simulate_season())
+        result.elapsed = time.perf_counter() - start
+        return result
+
+
+def build_pyramid(leagues: Sequence[str], tiers: int = 1, seed: Optional[int] = None,
+                  promoted: int = 2, relegated: int = 3, playoff: bool = True) -> List[Division]:
+    """Divisões a partir das ligas disponíveis
+
+    Com uma liga e `tiers` > 1 a liga é dividida pela força dos times; com
+    várias ligas, cada uma vira uma divisão, na ordem dada (a primeira no topo).
+    """
+    loader = LeagueDataLoader()
+    if len(leagues) == 1 and tiers > 1:
+        lineups = loader.load_league_for_simulation(leagues[0], seed=seed)
+        groups = split_league(lineups, tiers)
+        names = [f"{leagues[0]}_{tier + 1}" for tier in range(tiers)]
+    else:
+        groups = [loader.load_league_for_simulation(league, seed=seed) for league in leagues]
+        names = list(leagues)
+
+    divisions = []
+    for tier, (name, teams) in enumerate(zip(names, groups)):
+        has_upper, has_lower = tier > 0, tier < len(groups) - 1
+        divisions.append(Division(
+            name=name,
+            teams=teams,
+            promoted=(promoted if playoff else relegated) if has_upper else 0,
+            relegated=relegated if has_lower else 0,
+            playoff=(promoted + 1, promoted + 4) if has_upper and playoff else None,
+        ))
+    if playoff and promoted + 1 != relegated:
+        raise ValueError("Com playoff, os rebaixados devem ser as vagas diretas de acesso + 1")
+    return divisions
+
+
+def main():
+    """CLI: python scripts/run_pyramid.py [--leagues ...] [--tiers 2] [--seasons 5]"""
+    import argparse
+    import os
+
+    parser = argparse.ArgumentParser(description='Pirâmide de divisões com acesso e rebaixamento')
+    parser.add_argument('--leagues', nargs='+', default=['premier_league'],
+                        help='Ligas da pirâmide, da primeira divisão para baixo')
+    parser.add_argument('--tiers', type=int, default=2, help='Divisões ao dividir uma única liga')
+    parser.add_argument('--seasons', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--no-playoff', action='store_true', help='Só vagas diretas de acesso')
+    args = parser.parse_args()
+
+    divisions = build_pyramid(args.leagues, args.tiers, seed=args.seed, playoff=not args.no_playoff)
+    pyramid = PyramidSimulator(divisions, seed=args.seed, workers=args.workers)
+    result = pyramid.run(args.seasons)
+
+    print(f"\n{'='*72}")
+    print(f"[PIRÂMIDE] {' > '.join(result.divisions)} | {args.seasons} temporadas | {result.elapsed:.1f}s")
+    print(f"{'='*72}")
+    for season in result.seasons:
+        print(f"\n📅 {season.season_year}")
+        for name in result.divisions:
+            print(f"   🏆 {name:<20} {season.champion(name)}")
+        for name, teams in season.promoted.items():
+            print(f"   ⬆️  {name:<20} {', '.join(teams)}")
+        for name, teams in season.relegated.items():
+            print(f"   ⬇️  {name:<20} {', '.join(teams)}")
+        for name, ties in season.playoffs.items():
+            final = ties[-1]
+            extra = f" (prorr. {final.extra_time[0]}-{final.extra_time[1]})" if final.extra_time else ""
+            penalties = f" ({final.penalties[0]}-{final.penalties[1]} pên.)" if final.penalties else ""
+            print(f"   🎟️  Final do playoff {name}: {final.home} {final.legs[0][0]}-{final.legs[0][1]} "
+                  f"{final.away}{extra}{penalties}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,11 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, asdict
 from typing import Dict, List, Optional, Tuple
 from datetime import date, datetime, timedelta
 from enum import Enum
 import random
 
-from .advanced_match import AdvancedMatchResult, AdvancedMatchSimulator, TeamLineup
+from .advanced_match import AdvancedMatchResult, AdvancedMatchSimulator, EventType, MatchDetail, TeamLineup
+from .progress import ProgressStream
 from ..models.player import AdvancedPlayer
 
 
@@ -235,6 +236,23 @@ class LeagueTable:
             reverse=True
         )
     
+    def to_rows(self) -> List[Dict]:
+        """Tabela ordenada no formato de linhas usado nas exportações"""
+        return [
+            {
+                "Time": team,
+                "J": stats["matches_played"],
+                "V": stats["wins"],
+                "E": stats["draws"],
+                "D": stats["losses"],
+                "GP": stats["goals_for"],
+                "GC": stats["goals_against"],
+                "SG": stats["goal_difference"],
+                "P": stats["points"],
+            }
+            for team, stats in self.get_sorted_table()
+        ]
+    
     def get_team_position(self, team_name: str) -> int:
         """Retorna posição atual do time na tabela"""
         sorted_table = self.get_sorted_table()
@@ -247,14 +265,24 @@ class LeagueTable:
 class SeasonSimulator:
     """Simulador completo de temporada"""
     
-    def __init__(self):
+    def __init__(self, progress: Optional[ProgressStream] = None,
+                 match_detail: MatchDetail = MatchDetail.FULL):
         self.calendar: Optional[SeasonCalendar] = None
         self.table: Optional[LeagueTable] = None
-        self.match_simulator = AdvancedMatchSimulator()
+        # STATS dispensa os eventos lance a lance (temporadas em sequência, carreira)
+        self.match_simulator = AdvancedMatchSimulator(match_detail)
+        
+        # Rodadas, resultados e tabelas parciais vão para o fluxo de eventos
+        # (sem assinantes = silencioso); a impressão é o assinante ConsolePrinter
+        self.progress = progress or ProgressStream(every=10)
         
         # Dados dos times (seriam carregados de um arquivo)
         self.team_lineups: Dict[str, TeamLineup] = {}
         self.player_stats: Dict[str, Dict] = {}  # Estatísticas acumuladas dos jogadores
+        
+        # Agregador vetorizado (criado na primeira rodada, quando os lineups já existem)
+        self.stats_aggregator = None
+        self._players_by_id: Dict[str, AdvancedPlayer] = {}
     
     def initialize_season(
         self, 
@@ -278,8 +306,10 @@ class SeasonSimulator:
         # Gerar calendário completo
         self.calendar.generate_fixtures()
         
-        print(f"Temporada {season_year} inicializada com {len(team_names)} times")
-        print(f"Total de jogos: {len(self.calendar.fixtures)}")
+        if not self.progress.source:
+            self.progress.source = season_year
+        self.progress.total = len(self.calendar.fixtures)
+        self.progress.emit("loaded", teams=len(team_names))
     
     def simulate_matchweek(self, matchweek: int) -> List[AdvancedMatchResult]:
         """Simula uma rodada completa"""
@@ -288,8 +318,9 @@ class SeasonSimulator:
         
         fixtures = self.calendar.get_matchweek_fixtures(matchweek)
         results = []
+        progress = self.progress
         
-        print(f"\n=== RODADA {matchweek} ===")
+        progress.emit("matchweek", matchweek=matchweek)
         
         for fixture in fixtures:
             # Aqui você carregaria os lineups reais dos times
@@ -298,7 +329,7 @@ class SeasonSimulator:
             away_lineup = self.team_lineups.get(fixture.away_team)
             
             if not home_lineup or not away_lineup:
-                print(f"Lineups não encontrados para {fixture.home_team} vs {fixture.away_team}")
+                progress.emit("warning", message=f"Lineups não encontrados para {fixture.home_team} vs {fixture.away_team}")
                 continue
             
             # Simular partida
@@ -320,13 +351,18 @@ class SeasonSimulator:
             
             results.append(result)
             
-            # Mostrar resultado
-            print(f"{result.home_team} {result.home_goals}-{result.away_goals} {result.away_team}")
-            
-            # Mostrar eventos principais (gols)
-            goals = [e for e in result.events if e.event_type.value == "Goal"]
-            for goal in goals:
-                print(f"  {goal.minute}' {goal.description}")
+            # Resultado e gols para os assinantes
+            if progress.active:
+                progress.emit(
+                    "match",
+                    home=result.home_team, away=result.away_team,
+                    home_goals=result.home_goals, away_goals=result.away_goals,
+                    goals=[(e.minute, e.description) for e in result.events if e.event_type is EventType.GOAL]
+                )
+                progress.advance()
+        
+        # Estatísticas individuais acumuladas uma vez por rodada
+        self._accumulate_player_stats(results)
         
         # Atualizar rodada atual
         if self.calendar.is_matchweek_complete(matchweek):
@@ -335,14 +371,38 @@ class SeasonSimulator:
         
         return results
     
+    def _accumulate_player_stats(self, results: List[AdvancedMatchResult]):
+        """Soma as performances da rodada no agregador e atualiza SeasonStats dos jogadores"""
+        if not results:
+            return
+        
+        if self.stats_aggregator is None:
+            from ..stats.season_aggregator import SeasonStatsAggregator
+            
+            self.stats_aggregator = SeasonStatsAggregator(self.team_lineups)
+            self._players_by_id = {
+                player.id: player
+                for lineup in self.team_lineups.values()
+                for player in lineup.players + lineup.substitutes
+            }
+        
+        touched = self.stats_aggregator.add_matches(results)
+        self.stats_aggregator.sync_season_stats(self._players_by_id, touched)
+        
+        for idx in touched.tolist():
+            player = self._players_by_id.get(self.stats_aggregator.player_ids[idx])
+            if player is not None:
+                self.player_stats[player.id] = asdict(player.season_stats)
+    
     def simulate_full_season(self) -> Dict:
         """Simula temporada completa"""
         if not self.calendar:
             raise ValueError("Temporada não foi inicializada")
         
         total_matchweeks = len(self.calendar.teams) * 2 - 2  # Turno e returno
-        
-        print(f"Simulando temporada completa: {total_matchweeks} rodadas")
+        progress = self.progress
+        progress.start(len(self.calendar.fixtures), label=self.calendar.season_year,
+                       matchweeks=total_matchweeks)
         
         season_results = []
         
@@ -350,15 +410,15 @@ class SeasonSimulator:
             matchweek_results = self.simulate_matchweek(matchweek)
             season_results.extend(matchweek_results)
             
-            # Mostrar tabela a cada 5 rodadas
-            if matchweek % 5 == 0:
-                self.print_table()
+            # Tabela parcial a cada 5 rodadas
+            if matchweek % 5 == 0 and progress.active:
+                progress.emit("table", title=f"CLASSIFICAÇÃO - RODADA {matchweek}", rows=self.table.to_rows())
         
         # Tabela final
-        print("\n" + "="*50)
-        print("CLASSIFICAÇÃO FINAL")
-        print("="*50)
-        self.print_table()
+        progress.done = len(season_results)
+        if progress.active:
+            progress.emit("table", title="CLASSIFICAÇÃO FINAL", rows=self.table.to_rows())
+        progress.finish()
         
         return {
             "season_year": self.calendar.season_year,
@@ -0,0 +1,554 @@
+"""
+Motor de partidas em passos de tempo, vetorizado com NumPy
+Alternativa opcional ao AdvancedMatchSimulator para lotes grandes (temporadas
+inteiras, Monte Carlo). Todas as partidas de um lote avançam juntas em blocos
+de minutos (5 por padrão); a cada bloco o estado de cada time muda antes do
+bloco seguinte:
+
+    - finalizações ~ Poisson pela relação ataque x defesa dos jogadores em campo
+      e pela vantagem tática das formações (modificadores de ataque e defesa)
+    - cartões amarelos, segundo amarelo e vermelho direto tiram o jogador de campo
+      (o time com menos jogadores finaliza menos e sofre mais)
+    - fadiga reduz o rendimento ao longo do jogo, conforme a stamina e o dia
+      de cada jogador (uma variação sorteada por partida)
+    - lesões e janelas de substituição trocam jogadores pelo banco
+      (o mais cansado sai, o melhor reserva da mesma faixa do campo entra)
+
+As probabilidades de acerto e de gol por finalização são as mesmas do motor
+de eventos. O motor não altera os jogadores: forma, fitness e lesões depois
+da partida ficam a cargo de quem usa os resultados (o lote marca em `injured`
+quem se lesionou).
+
+Os sorteios de cada lote saem de sequências separadas por finalidade
+(finalizações, que também se separam por bloco de minutos, cartões, vermelhos,
+lesões e fadiga), sempre com o formato do lote inteiro. Com a mesma semente (`stream`), dois lotes com elencos
+diferentes usam os mesmos números para os mesmos papéis (números aleatórios
+comuns, para comparar cenários) e, com `antithetic`, cada u vira 1 - u.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..models.player import Position
+from ..stats.tatics.formations import calculate_tactical_advantage
+from .advanced_match import (
+    ASSIST_PROBABILITY,
+    AdvancedMatchResult,
+    EventType,
+    MatchDetail,
+    MatchEvent,
+    PlayerMatchPerformance,
+    TeamLineup,
+)
+
+
+# Versão do motor em passos de tempo; altere ao mudar a simulação (invalida o cache de resultados)
+TIMESTEP_ENGINE_VERSION = "1.3.0"
+
+# Faixas do campo
+GK, DEF, MID, ATT = range(4)
+_GROUP = {
+    Position.GK: GK,
+    Position.CB: DEF, Position.LB: DEF, Position.RB: DEF,
+    Position.CDM: MID, Position.CM: MID, Position.CAM: MID, Position.LM: MID, Position.RM: MID,
+    Position.LW: ATT, Position.RW: ATT, Position.CF: ATT, Position.ST: ATT,
+}
+# Mesmas regras do motor de eventos para quem finaliza e quem dá assistência
+_SHOOTERS = {Position.ST, Position.CF, Position.LW, Position.RW, Position.CAM}
+_CREATORS = {Position.CM, Position.CAM, Position.LM, Position.RM}
+
+# Finalidades das sequências de sorteios de um lote
+_MATCH, _SHOTS, _CARDS, _REDS, _INJURIES, _FATIGUE = range(6)
+
+# Vagas sorteadas por lado nas lesões e na fadiga: elencos de até este tamanho sorteiam igual
+_INJURY_SLOTS = 32
+
+# Códigos dos eventos registrados durante os passos
+_SHOT_OFF, _SHOT_ON, _GOAL, _ASSIST, _SAVE, _YELLOW, _RED, _INJURY, _SUB = range(9)
+_EVENT_TYPES = {
+    _SHOT_OFF: EventType.SHOT_OFF_TARGET,
+    _SHOT_ON: EventType.SHOT_ON_TARGET,
+    _GOAL: EventType.GOAL,
+    _ASSIST: EventType.ASSIST,
+    _SAVE: EventType.SAVE,
+    _YELLOW: EventType.YELLOW_CARD,
+    _RED: EventType.RED_CARD,
+    _INJURY: EventType.INJURY,
+    _SUB: EventType.SUBSTITUTION,
+}
+
+
+@dataclass
+class TimestepConfig:
+    """Parâmetros do motor em passos de tempo"""
+    bucket_minutes: int = 5
+    shots_per_match: float = 10.0           # finalizações por time com ataque = defesa
+    yellow_cards_per_match: float = 4.0     # amarelos por partida (os dois times)
+    red_cards_per_match: float = 0.08       # vermelhos diretos por partida
+    booked_caution: float = 0.3             # peso de quem já tem amarelo no sorteio do próximo
+    numerical_advantage: float = 1.5        # expoente de (jogadores em campo / adversários)
+    formation_impact: float = 1.0           # expoente da vantagem tática das formações nas finalizações
+    neutral_tactical_advantage: float = 1.05    # vantagem de 4-4-2 x 4-4-2 (finalizações inalteradas)
+    fatigue_per_90: float = 0.25            # energia perdida em 90 min com stamina 50
+    fatigue_impact: float = 0.15            # perda de rendimento com energia zerada
+    fatigue_variation: float = 0.4          # fadiga de cada jogador na partida varia ±40%
+    injury_rate: float = 0.004              # lesões por jogador por partida (propensão 50)
+    max_substitutions: int = 5
+    substitution_minutes: Tuple[int, ...] = (60, 70, 80)
+    substitutions_per_window: int = 2
+    substitution_energy: float = 0.78       # só sai quem estiver abaixo desta energia
+    keeperless_rating: float = 35.0         # "goleiro" de linha após expulsão sem reserva
+
+
+@dataclass
+class MatchBatch:
+    """Resultado de um lote de partidas (arrays por partida, lado e vaga do elenco)"""
+    fixtures: List[Tuple[str, str]]
+    lineups: Dict[str, TeamLineup]
+    squads: List[list]                      # jogadores de cada time do lote, por vaga
+    team_index: np.ndarray                  # (partidas, 2) -> índice em squads
+    possession: np.ndarray                  # posse do mandante (%)
+    played: np.ndarray                      # (partidas, 2, vagas) entrou em campo
+    minutes: np.ndarray
+    stats: Dict[str, np.ndarray]            # goals, assists, shots, ... por jogador
+    substitutions: np.ndarray               # (partidas, 2)
+    injured: np.ndarray                     # (partidas, 2, vagas) se lesionou na partida
+    events: Optional[np.ndarray] = None     # (n, 6): código, partida, lado, vaga, minuto, vaga auxiliar
+
+    @property
+    def goals(self) -> np.ndarray:
+        """Gols por partida e lado, (partidas, 2)"""
+        return self.stats["goals"].sum(axis=-1)
+
+    def team_totals(self, name: str) -> np.ndarray:
+        return self.stats[name].sum(axis=-1)
+
+    def results(self) -> List[AdvancedMatchResult]:
+        """Converte o lote em AdvancedMatchResult (eventos em ordem cronológica, se registrados)"""
+        goals = self.goals
+        shots = self.team_totals("shots")
+        on_target = self.team_totals("shots_on_target")
+
+        by_match: Dict[int, list] = {}
+        if self.events is not None and len(self.events):
+            order = np.lexsort((self.events[:, 4], self.events[:, 1]))
+            for row in self.events[order].tolist():
+                by_match.setdefault(row[1], []).append(row)
+
+        results = []
+        for m, (home, away) in enumerate(self.fixtures):
+            result = AdvancedMatchResult(
+                home_team=home,
+                away_team=away,
+                home_goals=int(goals[m, 0]),
+                away_goals=int(goals[m, 1]),
+                home_formation=self.lineups[home].formation.name,
+                away_formation=self.lineups[away].formation.name,
+                home_possession=float(self.possession[m]),
+                away_possession=float(100 - self.possession[m]),
+                home_shots=int(shots[m, 0]),
+                away_shots=int(shots[m, 1]),
+                home_shots_on_target=int(on_target[m, 0]),
+                away_shots_on_target=int(on_target[m, 1]),
+            )
+            for side, performances in ((0, result.home_performances), (1, result.away_performances)):
+                squad = self.squads[self.team_index[m, side]]
+                for slot in np.flatnonzero(self.played[m, side]).tolist():
+                    performance = PlayerMatchPerformance(
+                        player_id=squad[slot].id,
+                        minutes_played=int(self.minutes[m, side, slot]),
+                        **{name: values[m, side, slot].item() for name, values in self.stats.items()}
+                    )
+                    performance.calculate_match_rating()
+                    performances[squad[slot].id] = performance
+
+            for code, _, side, slot, minute, aux in by_match.get(m, []):
+                squad = self.squads[self.team_index[m, side]]
+                player = squad[slot]
+                description = _describe(code, player.name, squad[aux].name if aux >= 0 else None)
+                result.events.append(MatchEvent(
+                    minute=minute,
+                    event_type=_EVENT_TYPES[code],
+                    player_id=player.id,
+                    team_name=result.home_team if side == 0 else result.away_team,
+                    description=description,
+                    assisted_by=squad[aux].id if code == _GOAL and aux >= 0 else None
+                ))
+            results.append(result)
+        return results
+
+
+class _Draws:
+    """Sequências de sorteios uniformes de um lote, uma por chave (finalidade e, nas finalizações, bloco)"""
+
+    def __init__(self, entropy: int, antithetic: bool = False):
+        self.entropy = entropy
+        self.antithetic = antithetic
+
+    def stream(self, *key: int):
+        generator = np.random.default_rng(np.random.SeedSequence(self.entropy, spawn_key=key))
+        if not self.antithetic:
+            return generator.random
+        # 1 - u fica em (0, 1]; o resto da divisão devolve o 1 para o 0 e mantém [0, 1)
+        return lambda size: (1.0 - generator.random(size)) % 1.0
+
+
+def _poisson(u: np.ndarray, rate: np.ndarray) -> np.ndarray:
+    """Inverso da distribuição de Poisson: menor k com F(k) > u, elemento a elemento"""
+    k = np.zeros(np.shape(u), dtype=np.int64)
+    term = np.exp(-rate) * np.ones(np.shape(u))
+    cdf = term.copy()
+    active = u >= cdf
+    i = 0
+    while active.any() and i < 200:
+        i += 1
+        k += active
+        term = term * rate / i
+        cdf += term
+        active = u >= cdf
+    return k
+
+
+def _minute(start: int, width: int, u: np.ndarray) -> np.ndarray:
+    """Minuto do lance dentro do bloco (1..width depois de `start`)"""
+    return start + 1 + (u * width).astype(np.int64)
+
+
+def _describe(code: int, name: str, other: Optional[str]) -> str:
+    if code == _GOAL:
+        return f"{name} scores!" + (f" (Assisted by {other})" if other else "")
+    if code == _SUB:
+        return f"{other} replaces {name}"
+    return {
+        _SHOT_OFF: f"{name} shot off target",
+        _SHOT_ON: f"{name} shot on target",
+        _ASSIST: f"{name} provides assist",
+        _SAVE: f"{name} makes a save",
+        _YELLOW: f"{name} receives yellow card",
+        _RED: f"{name} receives red card",
+        _INJURY: f"{name} gets injured",
+    }[code]
+
+
+class TimeSteppedMatchEngine:
+    """Simula lotes de partidas avançando todas juntas em blocos de minutos"""
+
+    STAT_FIELDS = ("goals", "assists", "shots", "shots_on_target", "saves",
+                   "yellow_cards", "red_cards", "xg", "xa")
+
+    def __init__(self, config: Optional[TimestepConfig] = None, seed: Optional[int] = None,
+                 detail: MatchDetail = MatchDetail.STATS):
+        self.config = config or TimestepConfig()
+        self.rng = np.random.default_rng(seed)
+        self.detail = detail
+
+    # ------------------------------------------------------------------
+    # Elencos em arrays
+
+    @staticmethod
+    def _squad(lineup: TeamLineup) -> list:
+        """Titulares seguidos dos reservas em condições de jogo"""
+        return lineup.players[:11] + [p for p in lineup.substitutes if p.can_play()]
+
+    def _team_arrays(self, squads: List[list], n_slots: int) -> Dict[str, np.ndarray]:
+        n_teams = len(squads)
+        arrays = {
+            "exists": np.zeros((n_teams, n_slots), dtype=bool),
+            "overall": np.full((n_teams, n_slots), 50.0),
+            "ability": np.full((n_teams, n_slots), 100.0),
+            "group": np.full((n_teams, n_slots), MID, dtype=np.int8),
+            "shooter": np.zeros((n_teams, n_slots), dtype=bool),
+            "creator": np.zeros((n_teams, n_slots), dtype=bool),
+            "stamina": np.full((n_teams, n_slots), 50.0),
+            "proneness": np.full((n_teams, n_slots), 50.0),
+        }
+        for t, squad in enumerate(squads):
+            for s, player in enumerate(squad):
+                attributes = player.attributes
+                arrays["exists"][t, s] = True
+                arrays["overall"][t, s] = player.get_effective_overall()
+                arrays["ability"][t, s] = (attributes.shooting or 50) + (attributes.finishing or 50)
+                arrays["group"][t, s] = _GROUP[player.position]
+                arrays["shooter"][t, s] = player.position in _SHOOTERS
+                arrays["creator"][t, s] = player.position in _CREATORS
+                arrays["stamina"][t, s] = attributes.stamina or 50
+                arrays["proneness"][t, s] = player.injury_proneness
+        return arrays
+
+    # ------------------------------------------------------------------
+    # Lote
+
+    def simulate(self, fixtures: Sequence[Tuple[str, str]], lineups: Dict[str, TeamLineup],
+                 detail: Optional[MatchDetail] = None, stream: Optional[int] = None,
+                 antithetic: bool = False) -> MatchBatch:
+        """Simula todas as partidas de `fixtures` (pares mandante, visitante) num único lote
+
+        `stream` é a semente dos sorteios do lote (por padrão sai do gerador do
+        motor); lotes com o mesmo `stream` e as mesmas partidas usam os mesmos
+        números aleatórios. `antithetic` usa 1 - u em todos os sorteios.
+        """
+        cfg = self.config
+        draws = _Draws(int(self.rng.integers(2 ** 63)) if stream is None else stream, antithetic)
+        record = (detail or self.detail) is MatchDetail.FULL
+        fixtures = list(fixtures)
+
+        names = sorted({team for fixture in fixtures for team in fixture})
+        squads = [self._squad(lineups[name]) for name in names]
+        n_slots = max(len(squad) for squad in squads)
+        team = self._team_arrays(squads, n_slots)
+        position_of = {name: i for i, name in enumerate(names)}
+        team_index = np.array([[position_of[h], position_of[a]] for h, a in fixtures], dtype=np.intp)
+
+        n = len(fixtures)
+        exists = team["exists"][team_index]
+        overall = team["overall"][team_index]
+        ability = team["ability"][team_index]
+        group = team["group"][team_index]
+        shooter = team["shooter"][team_index]
+        creator = team["creator"][team_index]
+        stamina_drain = (1.5 - team["stamina"][team_index] / 100) * cfg.fatigue_per_90
+        injury_risk = cfg.injury_rate * team["proneness"][team_index] / 50
+
+        slots = np.arange(n_slots)
+        on = exists & (slots < 11)
+        played = on.copy()
+        available = exists & (slots >= 11)           # reservas que ainda podem entrar
+        energy = np.ones((n, 2, n_slots))
+        entered = np.zeros((n, 2, n_slots), dtype=np.int16)
+        left = np.full((n, 2, n_slots), 90, dtype=np.int16)
+        substitutions = np.zeros((n, 2), dtype=np.int16)
+        hurt = np.zeros((n, 2, n_slots), dtype=bool)
+        stats = {name: np.zeros((n, 2, n_slots), dtype=np.float64 if name in ("xg", "xa") else np.int16)
+                 for name in self.STAT_FIELDS}
+        events: List[np.ndarray] = []
+
+        def log(code, m, side, slot, minute, aux=None):
+            if record and len(m):
+                aux = np.full(len(m), -1) if aux is None else aux
+                events.append(np.column_stack([np.full(len(m), code), m, side, slot, minute, aux]))
+
+        # Posse pelas forças iniciais, como no motor de eventos; a vantagem tática
+        # (ataque da formação / defesa da adversária) também escala as finalizações
+        advantage = np.array([
+            calculate_tactical_advantage(lineups[home].formation, lineups[away].formation)
+            for home, away in fixtures
+        ])
+        strength = overall[:, :, :11].mean(axis=-1) * advantage * np.array([1.1, 1.0])
+        possession = strength[:, 0] / strength.sum(axis=-1) * 100
+        tactics = (advantage / cfg.neutral_tactical_advantage) ** cfg.formation_impact
+
+        shot_factor = 0.8 + 0.4 * draws.stream(_MATCH)((n, 2))
+        # Quantos cartões e lesões são sorteados não depende do estado do jogo: uma
+        # sequência só para o lote; as finalizações dependem, então cada bloco tem a sua
+        card_draws = draws.stream(_CARDS)
+        red_draws = draws.stream(_REDS)
+        injury_draws = draws.stream(_INJURIES)
+        injury_slots = max(n_slots, _INJURY_SLOTS)
+
+        # Com a mesma stamina (o padrão quando o dado falta) todos cansariam igual e as
+        # janelas trocariam sempre o máximo; a variação do dia espalha quem sai e quantos
+        day = draws.stream(_FATIGUE)((n, 2, injury_slots))[:, :, :n_slots]
+        stamina_drain = stamina_drain * (1 + cfg.fatigue_variation * (2 * day - 1))
+
+        def pick(weights: np.ndarray, u: np.ndarray) -> np.ndarray:
+            """Sorteia uma vaga por linha com os pesos dados (linhas com soma > 0), pelo uniforme `u`"""
+            cumulative = weights.cumsum(axis=-1)
+            u = u[:, None] * cumulative[:, -1:]
+            return np.minimum((cumulative <= u).sum(axis=-1), n_slots - 1)
+
+        def substitute(m, side, out_slot, minute, prefer_group):
+            """Troca jogadores pelo melhor reserva disponível (mesma faixa primeiro)
+
+            Recebe arrays com no máximo uma troca por (partida, lado) e retorna
+            a máscara das trocas feitas (sem trocas restantes, sem reservas ou no
+            último minuto, não troca).
+            """
+            candidates = available[m, side]
+            done = (substitutions[m, side] < cfg.max_substitutions) & candidates.any(axis=-1) & (minute < 90)
+            m, side, out_slot, minute = m[done], side[done], out_slot[done], minute[done]
+            score = np.where(candidates[done],
+                             overall[m, side] + 100 * (group[m, side] == np.asarray(prefer_group)[done][:, None]),
+                             -np.inf)
+            in_slot = score.argmax(axis=-1)
+            on[m, side, out_slot] = False
+            left[m, side, out_slot] = minute
+            on[m, side, in_slot] = played[m, side, in_slot] = True
+            available[m, side, in_slot] = False
+            entered[m, side, in_slot] = minute
+            substitutions[m, side] += 1
+            log(_SUB, m, side, out_slot, minute, in_slot)
+            return done
+
+        def send_off(m, side, slot, minute):
+            on[m, side, slot] = False
+            left[m, side, slot] = minute
+            # Goleiro expulso: o jogador de linha mais cansado dá lugar ao goleiro reserva
+            keeper_out = group[m, side, slot] == GK
+            m, side, minute = m[keeper_out], side[keeper_out], minute[keeper_out]
+            outfield = np.where(on[m, side] & (group[m, side] != GK), energy[m, side], np.inf)
+            has_outfield = np.isfinite(outfield).any(axis=-1)
+            substitute(m[has_outfield], side[has_outfield], outfield[has_outfield].argmin(axis=-1),
+                       minute[has_outfield], np.full(has_outfield.sum(), GK))
+
+        bm = cfg.bucket_minutes
+        n_buckets = -(-90 // bm)
+        for bucket in range(n_buckets):
+            start = bucket * bm
+            width = min(bm, 90 - start)
+            share = width / 90
+            shot_draws = draws.stream(_SHOTS, bucket)
+
+            # Rendimento atual de quem está em campo
+            effective = overall * (1 - cfg.fatigue_impact * (1 - energy))
+
+            def line_mean(mask, fallback):
+                count = mask.sum(axis=-1)
+                total = (effective * mask).sum(axis=-1)
+                return np.where(count > 0, total / np.maximum(count, 1), fallback)
+
+            attack = line_mean(on & (group == ATT), 50.0)
+            defense = line_mean(on & (group == DEF), 50.0)
+            keeper = line_mean(on & (group == GK), cfg.keeperless_rating)
+            on_count = on.sum(axis=-1)
+
+            # Finalizações do bloco
+            modifier = np.clip(attack / defense[:, ::-1], 0.7, 1.3)
+            numbers = (on_count / np.maximum(on_count[:, ::-1], 1)) ** cfg.numerical_advantage
+            n_shots = _poisson(shot_draws((n, 2)), cfg.shots_per_match * modifier * tactics * shot_factor * numbers * share)
+
+            shooters = on & shooter
+            shooters = np.where(shooters.any(axis=-1, keepdims=True), shooters, on & (group != GK))
+            creators = on & creator
+            n_creators = creators.sum(axis=-1)
+            keeper_slot = (on & (group == GK)).argmax(axis=-1)
+            has_keeper = (on & (group == GK)).any(axis=-1)
+
+            for j in range(int(n_shots.max(initial=0))):
+                # Uniformes da j-ésima finalização de cada lado: vaga, precisão, desfecho e minuto.
+                # O desfecho é reaproveitado em cadeia: dado u < p, u / p é uniforme de novo
+                # (no alvo -> gol -> assistência -> quem assiste)
+                u = shot_draws((n, 2, 4))
+                m, side = np.nonzero((n_shots > j) & shooters.any(axis=-1))
+                if not len(m):
+                    break
+                u = u[m, side]
+                slot = pick(shooters[m, side].astype(float), u[:, 0])
+                shot_ability = ability[m, side, slot]
+                accuracy = np.clip(shot_ability / 200 * (0.8 + 0.4 * u[:, 1]), 0.18, 0.42)
+                goal_probability = np.clip((shot_ability / 240) / (keeper[m, 1 - side] / 80), 0.08, 0.28)
+                outcome = u[:, 2] / accuracy
+                on_target = outcome < 1
+                outcome /= goal_probability
+                goal = on_target & (outcome < 1)
+                outcome /= ASSIST_PROBABILITY
+                minute = _minute(start, width, u[:, 3])
+
+                # Cada (partida, lado) aparece uma vez por iteração: soma direta
+                stats["shots"][m, side, slot] += 1
+                stats["shots_on_target"][m, side, slot] += on_target
+                stats["goals"][m, side, slot] += goal
+                shot_xg = accuracy * goal_probability
+                stats["xg"][m, side, slot] += shot_xg
+                has_creators = n_creators[m, side] > 0
+                stats["xa"][m, side] += creators[m, side] * np.where(
+                    has_creators, shot_xg * ASSIST_PROBABILITY / np.maximum(n_creators[m, side], 1), 0
+                )[:, None]
+
+                assisted = goal & has_creators & (outcome < 1)
+                assister = np.full(len(m), -1)
+                if assisted.any():
+                    assister[assisted] = pick(creators[m[assisted], side[assisted]].astype(float), outcome[assisted])
+                    stats["assists"][m[assisted], side[assisted], assister[assisted]] += 1
+
+                saved = on_target & ~goal & has_keeper[m, 1 - side]
+                stats["saves"][m[saved], 1 - side[saved], keeper_slot[m[saved], 1 - side[saved]]] += 1
+
+                if record:
+                    log(_SHOT_OFF, m[~on_target], side[~on_target], slot[~on_target], minute[~on_target])
+                    shot_on = on_target & ~goal
+                    log(_SHOT_ON, m[shot_on], side[shot_on], slot[shot_on], minute[shot_on])
+                    log(_GOAL, m[goal], side[goal], slot[goal], minute[goal], assister[goal])
+                    log(_ASSIST, m[assisted], side[assisted], assister[assisted], minute[assisted])
+                    log(_SAVE, m[saved], 1 - side[saved], keeper_slot[m[saved], 1 - side[saved]], minute[saved])
+
+            # Cartões: amarelos (o segundo vira vermelho) e vermelhos diretos
+            n_yellow = _poisson(card_draws((n, 2)), cfg.yellow_cards_per_match / 2 * share)
+            for j in range(int(n_yellow.max(initial=0))):
+                u = card_draws((n, 2, 2))
+                m, side = np.nonzero(n_yellow > j)
+                u = u[m, side]
+                slot = pick(np.where(stats["yellow_cards"][m, side] > 0, cfg.booked_caution, 1.0) * on[m, side],
+                            u[:, 0])
+                minute = _minute(start, width, u[:, 1])
+                stats["yellow_cards"][m, side, slot] += 1
+                log(_YELLOW, m, side, slot, minute)
+                second = stats["yellow_cards"][m, side, slot] >= 2
+                if second.any():
+                    stats["red_cards"][m[second], side[second], slot[second]] += 1
+                    log(_RED, m[second], side[second], slot[second], minute[second])
+                    send_off(m[second], side[second], slot[second], minute[second])
+
+            u = red_draws((n, 2, 3))
+            red = u[..., 0] < cfg.red_cards_per_match / 2 * share
+            if red.any():
+                m, side = np.nonzero(red)
+                slot = pick(on[m, side].astype(float), u[m, side, 1])
+                minute = _minute(start, width, u[m, side, 2])
+                stats["red_cards"][m, side, slot] += 1
+                log(_RED, m, side, slot, minute)
+                send_off(m, side, slot, minute)
+
+            # Lesões: o jogador sai e, se ainda houver trocas, entra um reserva
+            # (o minuto sai do mesmo uniforme: dado u < risco, u / risco é uniforme)
+            risk = injury_risk * share
+            with np.errstate(divide="ignore", invalid="ignore"):
+                u = injury_draws((n, 2, injury_slots))[:, :, :n_slots] / risk
+            injured = on & (u < 1)
+            while injured.any():
+                m, side = np.nonzero(injured.any(axis=-1))
+                slot = injured[m, side].argmax(axis=-1)
+                injured[m, side, slot] = False
+                hurt[m, side, slot] = True
+                minute = _minute(start, width, u[m, side, slot])
+                log(_INJURY, m, side, slot, minute)
+                replaced = substitute(m, side, slot, minute, group[m, side, slot])
+                send_off(m[~replaced], side[~replaced], slot[~replaced], minute[~replaced])
+
+            # Fadiga de quem jogou o bloco
+            energy -= on * stamina_drain * share
+            np.clip(energy, 0.0, 1.0, out=energy)
+
+            # Janela de substituições: saem os mais cansados abaixo do limite
+            end = start + width
+            if end in cfg.substitution_minutes:
+                tired = np.where(on & (group != GK), energy, np.inf)
+                order = tired.argsort(axis=-1)[..., :cfg.substitutions_per_window]
+                for k in range(order.shape[-1]):
+                    candidate = order[..., k]
+                    wants = (np.take_along_axis(tired, candidate[..., None], axis=-1)[..., 0]
+                             < cfg.substitution_energy) & (substitutions < cfg.max_substitutions)
+                    m, side = np.nonzero(wants)
+                    slot = candidate[m, side]
+                    substitute(m, side, slot, np.full(len(m), end), group[m, side, slot])
+
+        minutes = np.where(played, left - entered, 0)
+        return MatchBatch(
+            fixtures=fixtures,
+            lineups=lineups,
+            squads=squads,
+            team_index=team_index,
+            possession=possession,
+            played=played,
+            minutes=minutes,
+            stats=stats,
+            substitutions=substitutions,
+            injured=hurt,
+            events=np.concatenate(events).astype(np.int64) if record and events else None,
+        )
+
+    def simulate_results(self, fixtures: Sequence[Tuple[str, str]], lineups: Dict[str, TeamLineup],
+                         detail: Optional[MatchDetail] = None) -> List[AdvancedMatchResult]:
+        """Atalho: simula o lote e devolve um AdvancedMatchResult por partida"""
+        return self.simulate(fixtures, lineups, detail).results()
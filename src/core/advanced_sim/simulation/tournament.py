@@ -0,0 +1,467 @@
+#!/usr/bin/env python3
+"""
+Torneios: fase de grupos e mata-mata com o motor avançado
+Um torneio é uma fase de grupos opcional (todos contra todos, turno ou turno e
+returno) seguida de uma chave eliminatória com as regras de knockout.py:
+confrontos de jogo único ou ida e volta, prorrogação e pênaltis. A chave é
+montada pelo chaveamento clássico (os dois melhores cabeças só se cruzam na
+final) e, vindo dos grupos, tem o tamanho da maior potência de 2 que cabe nos
+classificados (primeiros colocados antes, depois os melhores segundos...).
+
+Todas as execuções andam juntas: cada fase joga de uma vez as partidas de
+todas as execuções (TimeSteppedMatchEngine em lote, ou o AdvancedMatchSimulator
+partida a partida) e tabelas, chaves e pênaltis são arrays NumPy. Com muitas
+execuções o resultado é a chance de cada time chegar a cada fase; com uma só,
+as tabelas dos grupos e os confrontos (TieResult) de cada fase.
+
+    champions_league(top=4)   # 4 melhores de cada liga, grupos sem times do mesmo país
+"""
+
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..data_loader import LeagueDataLoader
+from .advanced_match import AdvancedMatchSimulator, MatchDetail, TeamLineup
+from .full_season import MATCH_ENGINES
+from .knockout import EXTRA_TIME_SHARE, PENALTY_CONVERSION, TieResult
+from .timestep import TimeSteppedMatchEngine
+
+
+ROUND_NAMES = {
+    2: "Final",
+    4: "Semifinal",
+    8: "Quartas de final",
+    16: "Oitavas de final",
+    32: "16-avos de final",
+}
+CHAMPION = "Campeão"
+
+@dataclass
+class TournamentFormat:
+    """Regras do torneio"""
+    group_size: int = 4
+    group_legs: int = 2                 # 1: turno único, 2: turno e returno
+    advance_per_group: int = 2
+    knockout_legs: int = 2              # confrontos do mata-mata antes da final
+    final_legs: int = 1
+    extra_time: bool = True
+
+
+@dataclass
+class TournamentOutcome:
+    """Resultado de `runs` execuções do torneio
+
+    `reach[i, k]` é a fração das execuções em que `teams[i]` chegou à fase
+    `rounds[k]` (a última é o título). Com uma execução, `groups` traz as
+    tabelas finais dos grupos e `bracket` os confrontos de cada fase.
+    """
+    teams: List[str]
+    rounds: List[str]
+    reach: np.ndarray
+    runs: int
+    groups: List[List[Dict]] = field(default_factory=list)
+    bracket: Dict[str, List[TieResult]] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+    def probabilities(self) -> List[Dict]:
+        """Uma linha por time (em %), da maior chance de título para a menor"""
+        order = np.lexsort(-self.reach.T)   # título primeiro, depois final, ...
+        return [
+            {"Time": self.teams[i], **{name: round(float(self.reach[i, k]) * 100, 1)
+                                       for k, name in enumerate(self.rounds)}}
+            for i in order
+        ]
+
+    @property
+    def champion(self) -> Optional[str]:
+        """Campeão da execução única (None com várias execuções)"""
+        if self.runs != 1:
+            return None
+        return self.teams[int(np.argmax(self.reach[:, -1]))]
+
+
+def bracket_order(size: int) -> List[int]:
+    """Posições dos cabeças de chave (0 = melhor) numa chave de `size` times
+
+    Os confrontos são as posições em pares: para 8, 1x8, 4x5, 2x7, 3x6.
+    """
+    order = [0]
+    while len(order) < size:
+        mirror = 2 * len(order) - 1
+        order = [seed for top in order for seed in (top, mirror - top)]
+    return order
+
+
+def round_names(size: int) -> List[str]:
+    """Fases de uma chave de `size` times, da primeira até o título"""
+    names = []
+    while size >= 2:
+        names.append(ROUND_NAMES.get(size, f"Fase de {size}"))
+        size //= 2
+    return names + [CHAMPION]
+
+
+# ----------------------------------------------------------------------
+# Motores: jogam listas de partidas por índice de time
+
+class EventBackend:
+    """Partidas uma a uma no AdvancedMatchSimulator (nível STATS)
+
+    O motor de eventos cansa e lesiona os jogadores; a condição de todos é
+    restaurada depois de cada fase, para que as execuções não se contaminem.
+    """
+
+    def __init__(self, lineups: Dict[str, TeamLineup], teams: Sequence[str]):
+        self.lineups = lineups
+        self.teams = list(teams)
+        self.simulator = AdvancedMatchSimulator(MatchDetail.STATS)
+        self._condition = [
+            (player, player.fitness, player.current_form, player.morale, player.is_injured, player.current_injury)
+            for name in self.teams
+            for player in lineups[name].players + lineups[name].substitutes
+        ]
+
+    def play(self, home: np.ndarray, away: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        goals = np.zeros((len(home), 2), dtype=np.int64)
+        for k, (h, a) in enumerate(zip(home.tolist(), away.tolist())):
+            home_name, away_name = self.teams[h], self.teams[a]
+            result = self.simulator.simulate_match(self.lineups[home_name], self.lineups[away_name],
+                                                   home_name, away_name)
+            goals[k] = result.home_goals, result.away_goals
+        for player, fitness, form, morale, injured, injury in self._condition:
+            player.fitness, player.current_form, player.morale = fitness, form, morale
+            player.is_injured, player.current_injury = injured, injury
+        return goals[:, 0], goals[:, 1]
+
+
+class BatchBackend:
+    """Partidas em lote no TimeSteppedMatchEngine (que não altera os jogadores)"""
+
+    def __init__(self, lineups: Dict[str, TeamLineup], teams: Sequence[str],
+                 seed: Optional[int] = None, chunk: int = 20000):
+        self.lineups = lineups
+        self.teams = list(teams)
+        self.engine = TimeSteppedMatchEngine(seed=seed)
+        self.chunk = chunk
+
+    def play(self, home: np.ndarray, away: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        goals = [np.zeros((0, 2), dtype=np.int64)]
+        for start in range(0, len(home), self.chunk):
+            fixtures = [
+                (self.teams[h], self.teams[a])
+                for h, a in zip(home[start:start + self.chunk].tolist(), away[start:start + self.chunk].tolist())
+            ]
+            goals.append(self.engine.simulate(fixtures, self.lineups).goals.astype(np.int64))
+        goals = np.concatenate(goals)
+        return goals[:, 0], goals[:, 1]
+
+
+# ----------------------------------------------------------------------
+# Torneio
+
+class TournamentSimulator:
+    """Fase de grupos (`groups`) e/ou mata-mata (`knockout`, cabeças de chave em ordem)
+
+    Informe `groups` (listas de times) para um torneio com fase de grupos ou
+    `knockout` (número de times potência de 2, do melhor cabeça de chave para
+    o pior) para um mata-mata direto.
+    """
+
+    def __init__(self, lineups: Dict[str, TeamLineup], groups: Optional[Sequence[Sequence[str]]] = None,
+                 knockout: Optional[Sequence[str]] = None, format: Optional[TournamentFormat] = None,
+                 engine: str = "timestep", seed: Optional[int] = None):
+        if (groups is None) == (knockout is None):
+            raise ValueError("Informe a fase de grupos ou a chave do mata-mata (apenas uma delas)")
+        if engine not in MATCH_ENGINES:
+            raise ValueError(f"Motor de partida inválido: '{engine}' (use {', '.join(MATCH_ENGINES)})")
+
+        self.format = format or TournamentFormat()
+        self.groups = [list(group) for group in groups] if groups is not None else None
+        self.teams = [team for group in self.groups for team in group] if groups is not None else list(knockout)
+        if len(set(self.teams)) != len(self.teams):
+            raise ValueError("Time repetido no torneio")
+        missing = [team for team in self.teams if team not in lineups]
+        if missing:
+            raise ValueError(f"Times sem escalação: {', '.join(missing)}")
+
+        if self.groups is not None:
+            sizes = {len(group) for group in self.groups}
+            if len(sizes) != 1 or self.format.advance_per_group >= sizes.pop():
+                raise ValueError("Os grupos precisam ter o mesmo tamanho, maior que o número de classificados")
+            qualified = len(self.groups) * self.format.advance_per_group
+            self.bracket_size = 1 << (qualified.bit_length() - 1)
+        else:
+            self.bracket_size = len(self.teams)
+        if self.bracket_size < 2 or self.bracket_size & (self.bracket_size - 1):
+            raise ValueError(f"A chave do mata-mata precisa de uma potência de 2 times (tem {self.bracket_size})")
+
+        self.rng = np.random.default_rng(seed)
+        if engine == "event":
+            if seed is not None:
+                random.seed(seed)
+            self.backend = EventBackend(lineups, self.teams)
+        else:
+            self.backend = BatchBackend(lineups, self.teams, seed=int(self.rng.integers(2**32)))
+        self.rounds = round_names(self.bracket_size)
+
+    # ------------------------------------------------------------------
+    # Fase de grupos
+
+    def _group_stage(self, runs: int) -> Tuple[np.ndarray, List[List[Dict]]]:
+        """Joga os grupos e devolve os classificados em ordem de cabeça de chave, (runs, chave)"""
+        groups = np.array([[self.teams.index(team) for team in group] for group in self.groups])
+        n_groups, size = groups.shape
+        first, second = np.triu_indices(size, k=1)
+        home, away = groups[:, first].ravel(), groups[:, second].ravel()
+        if self.format.group_legs == 2:
+            home, away = np.concatenate([home, away]), np.concatenate([away, home])
+
+        run = np.repeat(np.arange(runs), len(home))
+        home, away = np.tile(home, runs), np.tile(away, runs)
+        home_goals, away_goals = self.backend.play(home, away)
+
+        shape = (runs, len(self.teams))
+        points, goal_diff, goals_for = np.zeros(shape), np.zeros(shape), np.zeros(shape)
+        np.add.at(points, (run, home), np.where(home_goals > away_goals, 3, home_goals == away_goals))
+        np.add.at(points, (run, away), np.where(away_goals > home_goals, 3, home_goals == away_goals))
+        np.add.at(goal_diff, (run, home), home_goals - away_goals)
+        np.add.at(goal_diff, (run, away), away_goals - home_goals)
+        np.add.at(goals_for, (run, home), home_goals)
+        np.add.at(goals_for, (run, away), away_goals)
+
+        # Pontos, saldo, gols pró e, persistindo o empate, sorteio
+        key = points * 1e6 + (goal_diff + 1000) * 1e3 + goals_for + self.rng.random(shape) * 0.5
+        group_keys = key[:, groups]                                   # (runs, grupos, times)
+        order = np.argsort(-group_keys, axis=-1)
+        ranked = groups[np.arange(n_groups)[:, None], order]          # (runs, grupos, times)
+        ranked_keys = np.take_along_axis(group_keys, order, axis=-1)
+
+        # Classificados: primeiros colocados pela campanha, depois os segundos...
+        advance = self.format.advance_per_group
+        position_keys = ranked_keys[:, :, :advance].transpose(0, 2, 1) - np.arange(advance)[None, :, None] * 1e12
+        qualified = ranked[:, :, :advance].transpose(0, 2, 1).reshape(runs, -1)
+        seeding = np.argsort(-position_keys.reshape(runs, -1), axis=-1)
+        seeded = np.take_along_axis(qualified, seeding, axis=-1)[:, :self.bracket_size]
+
+        tables = []
+        if runs == 1:
+            for g in range(n_groups):
+                tables.append([
+                    {"Time": self.teams[t], "Pts": int(points[0, t]), "SG": int(goal_diff[0, t]),
+                     "GP": int(goals_for[0, t])}
+                    for t in ranked[0, g].tolist()
+                ])
+        return seeded, tables
+
+    # ------------------------------------------------------------------
+    # Mata-mata
+
+    def _shootouts(self, n: int) -> np.ndarray:
+        """Disputas de pênaltis: 5 cobranças alternadas e morte súbita, como penalty_shootout
+
+        Cada disputa para de somar assim que um lado não alcança mais o outro.
+        """
+        kicks = self.rng.random((n, 5, 2)) < PENALTY_CONVERSION
+        scores = np.zeros((n, 2), dtype=np.int64)
+        live = np.ones(n, dtype=bool)
+        for kick in range(5):
+            for side in (0, 1):
+                scores[live, side] += kicks[live, kick, side]
+                remaining = (4 - kick, 5 - kick - side)
+                live &= (scores[:, 0] + remaining[0] >= scores[:, 1]) & (scores[:, 1] + remaining[1] >= scores[:, 0])
+        level = scores[:, 0] == scores[:, 1]
+        while level.any():
+            scores[level] += self.rng.random((int(level.sum()), 2)) < PENALTY_CONVERSION
+            level = scores[:, 0] == scores[:, 1]
+        return scores
+
+    def _ties(self, better: np.ndarray, worse: np.ndarray, legs: int) -> Dict[str, np.ndarray]:
+        """Confrontos em lote; em ida e volta o melhor cabeça de chave decide em casa"""
+        home, away = (worse, better) if legs == 2 else (better, worse)
+        home_goals, away_goals = self.backend.play(home, away)
+        scores = [np.stack([home_goals, away_goals], axis=-1)]
+        if legs == 2:
+            second_home, second_away = self.backend.play(away, home)
+            scores.append(np.stack([second_away, second_home], axis=-1))
+        aggregate = sum(scores)
+
+        extra = np.zeros_like(aggregate)
+        level = aggregate[:, 0] == aggregate[:, 1]
+        if self.format.extra_time and level.any():
+            idx = np.flatnonzero(level)
+            venue = (home[idx], away[idx]) if legs == 1 else (away[idx], home[idx])
+            extra_goals = self.rng.binomial(np.stack(self.backend.play(*venue), axis=-1), EXTRA_TIME_SHARE)
+            extra[idx] = extra_goals if legs == 1 else extra_goals[:, ::-1]
+            level = (aggregate[:, 0] + extra[:, 0]) == (aggregate[:, 1] + extra[:, 1])
+
+        penalties = np.zeros_like(aggregate)
+        if level.any():
+            penalties[level] = self._shootouts(int(level.sum()))
+        total = aggregate + extra
+        home_wins = (total[:, 0] > total[:, 1]) | (level & (penalties[:, 0] > penalties[:, 1]))
+        return {
+            "home": home, "away": away, "legs": np.stack(scores, axis=1), "extra_time": extra,
+            "went_to_extra_time": aggregate[:, 0] == aggregate[:, 1], "penalties": penalties,
+            "shootout": level, "winner": np.where(home_wins, home, away),
+        }
+
+    def _tie_results(self, ties: Dict[str, np.ndarray]) -> List[TieResult]:
+        results = []
+        extra_time = ties["went_to_extra_time"] & self.format.extra_time
+        for k in range(len(ties["home"])):
+            results.append(TieResult(
+                home=self.teams[int(ties["home"][k])],
+                away=self.teams[int(ties["away"][k])],
+                legs=[tuple(int(goals) for goals in leg) for leg in ties["legs"][k]],
+                extra_time=tuple(int(g) for g in ties["extra_time"][k]) if extra_time[k] else None,
+                penalties=tuple(int(g) for g in ties["penalties"][k]) if ties["shootout"][k] else None,
+                winner=self.teams[int(ties["winner"][k])],
+            ))
+        return results
+
+    def run(self, runs: int = 1) -> TournamentOutcome:
+        """Joga o torneio `runs` vezes e conta até onde cada time chegou"""
+        start = time.perf_counter()
+        tables = []
+        if self.groups is not None:
+            seeded, tables = self._group_stage(runs)
+        else:
+            seeded = np.tile(np.arange(len(self.teams)), (runs, 1))
+
+        # Posições na chave e cabeça de chave (0 = melhor) de quem ocupa cada uma
+        seed_of = np.tile(np.array(bracket_order(self.bracket_size)), (runs, 1))
+        slots = np.take_along_axis(seeded, seed_of, axis=-1)
+
+        reach = np.zeros((len(self.teams), len(self.rounds)))
+        bracket: Dict[str, List[TieResult]] = {}
+        for k, name in enumerate(self.rounds[:-1]):
+            np.add.at(reach[:, k], slots.ravel(), 1)
+            first, second = slots[:, 0::2], slots[:, 1::2]
+            first_better = seed_of[:, 0::2] < seed_of[:, 1::2]
+            better = np.where(first_better, first, second)
+            worse = np.where(first_better, second, first)
+
+            legs = self.format.final_legs if name == "Final" else self.format.knockout_legs
+            ties = self._ties(better.ravel(), worse.ravel(), legs)
+            if runs == 1:
+                bracket[name] = self._tie_results(ties)
+
+            winners = ties["winner"].reshape(better.shape)
+            seed_of = np.where(winners == better, np.minimum(seed_of[:, 0::2], seed_of[:, 1::2]),
+                               np.maximum(seed_of[:, 0::2], seed_of[:, 1::2]))
+            slots = winners
+        np.add.at(reach[:, -1], slots.ravel(), 1)
+
+        return TournamentOutcome(
+            teams=self.teams,
+            rounds=self.rounds,
+            reach=reach / runs,
+            runs=runs,
+            groups=tables,
+            bracket=bracket,
+            elapsed=time.perf_counter() - start,
+        )
+
+
+# ----------------------------------------------------------------------
+# Competições prontas
+
+def draw_groups(teams: Sequence[str], country: Dict[str, str], group_size: int,
+                rng: random.Random) -> List[List[str]]:
+    """Sorteio por potes (times já em ordem de força), sem dois do mesmo país num grupo
+
+    Cada pote põe um time em cada grupo; quando um time não cabe em nenhum
+    grupo o sorteio volta atrás. Se não houver sorteio possível, a restrição
+    de país é ignorada.
+    """
+    n_groups = len(teams) // group_size
+    if n_groups * group_size != len(teams):
+        raise ValueError(f"{len(teams)} times não formam grupos de {group_size}")
+    drawn = [team for i in range(0, len(teams), n_groups) for team in rng.sample(teams[i:i + n_groups], n_groups)]
+    groups: List[List[str]] = [[] for _ in range(n_groups)]
+
+    def place(k: int) -> bool:
+        if k == len(drawn):
+            return True
+        team, pot = drawn[k], k // n_groups
+        for group in rng.sample(groups, n_groups):
+            if len(group) == pot and country[team] not in {country[other] for other in group}:
+                group.append(team)
+                if place(k + 1):
+                    return True
+                group.pop()
+        return False
+
+    if not place(0):
+        groups = [drawn[g::n_groups] for g in range(n_groups)]
+    return groups
+
+
+def champions_league(leagues: Optional[Sequence[str]] = None, top: int = 4, seed: Optional[int] = None,
+                     format: Optional[TournamentFormat] = None, engine: str = "timestep") -> TournamentSimulator:
+    """Torneio no estilo Champions League com os `top` melhores (pelo rating) de cada liga"""
+    format = format or TournamentFormat()
+    loader = LeagueDataLoader()
+    leagues = list(leagues or sorted(loader.get_available_leagues()))
+
+    lineups: Dict[str, TeamLineup] = {}
+    country: Dict[str, str] = {}
+    for league in leagues:
+        league_lineups = loader.load_league_for_simulation(league, seed=seed)
+        best = sorted(league_lineups, key=lambda name: league_lineups[name].get_team_rating(), reverse=True)[:top]
+        for name in best:
+            lineups[name] = league_lineups[name]
+            country[name] = league
+
+    teams = sorted(lineups, key=lambda name: lineups[name].get_team_rating(), reverse=True)
+    groups = draw_groups(teams, country, format.group_size, random.Random(seed))
+    return TournamentSimulator(lineups, groups=groups, format=format, engine=engine, seed=seed)
+
+
+def main():
+    """CLI: python scripts/run_tournament.py [--runs 1000] [--engine timestep] [--seed 42]"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Torneio estilo Champions League entre as ligas disponíveis')
+    parser.add_argument('--leagues', nargs='*', default=None, help='Ligas (padrão: todas as disponíveis)')
+    parser.add_argument('--top', type=int, default=4, help='Times de cada liga')
+    parser.add_argument('--runs', type=int, default=1, help='Execuções (mais de 1: chance de chegar a cada fase)')
+    parser.add_argument('--engine', choices=MATCH_ENGINES, default='timestep')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    tournament = champions_league(args.leagues, top=args.top, seed=args.seed, engine=args.engine)
+    outcome = tournament.run(args.runs)
+
+    print(f"\n{'='*72}")
+    print(f"[TORNEIO] {len(outcome.teams)} times | {args.runs} execuções | motor {args.engine} | "
+          f"{outcome.elapsed:.1f}s")
+    print(f"{'='*72}")
+
+    if outcome.runs == 1:
+        for letter, table in zip("ABCDEFGH", outcome.groups):
+            print(f"\nGrupo {letter}")
+            for row in table:
+                print(f"   {row['Time']:<26} {row['Pts']:>3} pts  SG {row['SG']:+d}")
+        for name, ties in outcome.bracket.items():
+            print(f"\n{name}")
+            for tie in ties:
+                legs = " / ".join(f"{home}-{away}" for home, away in tie.legs)
+                extra = f" (prorr. {tie.extra_time[0]}-{tie.extra_time[1]})" if tie.extra_time else ""
+                penalties = f" ({tie.penalties[0]}-{tie.penalties[1]} pên.)" if tie.penalties else ""
+                print(f"   {tie.home} x {tie.away}: {legs}{extra}{penalties} -> {tie.winner}")
+        print(f"\n🏆 Campeão: {outcome.champion}")
+        return
+
+    header = "".join(f"{name:>18}" for name in outcome.rounds)
+    print(f"\n{'Time':<26}{header}")
+    for row in outcome.probabilities():
+        print(f"{row['Time']:<26}" + "".join(f"{row[name]:>17.1f}%" for name in outcome.rounds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,405 @@
+#!/usr/bin/env python3
+"""
+Universo: todas as ligas e uma copa europeia numa só temporada
+As ligas disponíveis são carregadas num único conjunto de times e jogadores
+e seus calendários (sábados) são intercalados por data com os jogos da copa
+europeia (quartas-feiras): fase de grupos com os melhores de cada liga e
+mata-mata com ida e volta, prorrogação e pênaltis.
+
+Todos os jogos ficam numa fila de prioridade global ordenada por data
+(heapq); cada data é retirada da fila de uma vez, e as fases seguintes da
+copa entram na fila quando a anterior termina. Como os times e jogadores são
+os mesmos objetos em todas as competições, fadiga, forma e lesões de um jogo
+de copa valem para a rodada seguinte da liga (e vice-versa). Entre os jogos
+os jogadores recuperam fitness pelos dias de descanso, lesionados voltam na
+data prevista e quem não tem condições de jogo dá lugar ao melhor reserva da
+mesma faixa do campo.
+"""
+
+import heapq
+import itertools
+import random
+import time
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Sequence
+
+from ..data_loader import LeagueDataLoader
+from ..models.player import AdvancedPlayer, Position
+from ..stats.season_aggregator import SeasonStatsAggregator
+from .advanced_match import AdvancedMatchResult, AdvancedMatchSimulator, MatchDetail, TeamLineup
+from .knockout import TieResult, settle_tie
+from .progress import ProgressStream
+from .season import LeagueTable, SeasonCalendar
+from .tournament import TournamentFormat, bracket_order, draw_groups, round_names
+
+
+CUP = "copa_europeia"
+GROUP_LETTERS = "ABCDEFGHIJKLMNOP"
+
+# Faixa do campo de cada posição (reposição de titulares)
+_LINE = {
+    Position.GK: 0,
+    Position.CB: 1, Position.LB: 1, Position.RB: 1,
+    Position.CDM: 2, Position.CM: 2, Position.CAM: 2, Position.LM: 2, Position.RM: 2,
+    Position.LW: 3, Position.RW: 3, Position.CF: 3, Position.ST: 3,
+}
+
+
+@dataclass
+class UniverseConfig:
+    """Calendário e regras do universo"""
+    season_start: date = date(2024, 8, 17)          # primeira rodada das ligas (sábado)
+    cup_teams_per_league: int = 4
+    cup_format: TournamentFormat = field(default_factory=TournamentFormat)
+    cup_group_start: date = date(2024, 9, 18)       # primeira rodada dos grupos (quarta-feira)
+    cup_group_interval: int = 14                    # dias entre rodadas dos grupos
+    cup_final: date = date(2025, 5, 28)             # as fases do mata-mata são contadas a partir da final
+    cup_leg_interval: int = 7                       # dias entre ida e volta
+    cup_round_interval: int = 21                    # dias entre fases do mata-mata
+    fitness_recovery_per_day: float = 1.5           # um jogo de 90 minutos custa ~6 pontos
+    rotation_fitness: int = 70                      # titular abaixo disso vai para o banco
+
+
+@dataclass
+class UniverseFixture:
+    """Um jogo do universo (liga ou copa)"""
+    match_date: date
+    competition: str                    # nome da liga ou CUP
+    home_team: str
+    away_team: str
+    stage: str = ""                     # "Rodada 3", "Grupo A", "Semifinal"...
+    tie: Optional[TieResult] = None     # confronto do mata-mata ao qual o jogo pertence
+    result: Optional[AdvancedMatchResult] = None
+
+
+@dataclass
+class UniverseResult:
+    season_year: str
+    tables: Dict[str, List[Dict]]
+    cup_groups: Dict[str, List[Dict]]
+    cup_bracket: Dict[str, List[TieResult]]
+    cup_champion: str
+    top_scorers: List[Dict] = field(default_factory=list)
+    matches: int = 0
+    injuries: int = 0
+    elapsed: float = 0.0
+
+
+def pick_matchday_squad(lineup: TeamLineup, first_choice: List[AdvancedPlayer], min_fitness: int = 70) -> None:
+    """Titulares do jogo: o time-base, trocando quem não pode jogar (ou está
+    abaixo de `min_fitness`) pelo melhor reserva disponível da mesma faixa do campo
+    """
+    base = {id(p) for p in first_choice}
+    bench = sorted((p for p in lineup.players + lineup.substitutes if id(p) not in base and p.can_play()),
+                   key=lambda p: p.get_effective_overall(), reverse=True)
+    starters = []
+    for player in first_choice:
+        if player.can_play() and player.fitness >= min_fitness:
+            starters.append(player)
+            continue
+        line = _LINE[player.position]
+        replacement = next((p for p in bench if _LINE[p.position] == line), None)
+        if replacement is None and line != _LINE[Position.GK]:
+            replacement = next((p for p in bench if _LINE[p.position] != _LINE[Position.GK]), None)
+        if replacement is None:
+            starters.append(player)
+            continue
+        bench.remove(replacement)
+        starters.append(replacement)
+
+    chosen = {id(p) for p in starters}
+    lineup.substitutes = [p for p in lineup.players + lineup.substitutes if id(p) not in chosen]
+    lineup.players = starters
+
+
+class UniverseSimulator:
+    """Uma temporada de todas as ligas e da copa europeia, em ordem de data"""
+
+    def __init__(self, leagues: Optional[Sequence[str]] = None, seed: Optional[int] = None,
+                 season_year: str = "2024-25", config: Optional[UniverseConfig] = None,
+                 progress: Optional[ProgressStream] = None,
+                 teams: Optional[Dict[str, Dict[str, TeamLineup]]] = None):
+        loader = LeagueDataLoader()
+        self.leagues = list(leagues or (teams and list(teams)) or sorted(loader.get_available_leagues()))
+        self.seed = seed
+        self.season_year = season_year
+        self.config = config or UniverseConfig()
+        self.progress = progress or ProgressStream(source="universo")
+        self.rng = random.Random(seed)
+
+        # Conjunto único de times e jogadores, compartilhado por todas as competições
+        teams = teams or {league: loader.load_league_for_simulation(league, seed=seed) for league in self.leagues}
+        self.lineups: Dict[str, TeamLineup] = {}
+        self.league_of: Dict[str, str] = {}
+        for league in self.leagues:
+            for name, lineup in teams[league].items():
+                if name in self.lineups:
+                    raise ValueError(f"Time '{name}' aparece em mais de uma liga")
+                self.lineups[name] = lineup
+                self.league_of[name] = league
+        self.players = {p.id: p for lineup in self.lineups.values() for p in lineup.players + lineup.substitutes}
+        self._first_choice = {name: list(lineup.players[:11]) for name, lineup in self.lineups.items()}
+
+        self.simulator = AdvancedMatchSimulator(MatchDetail.STATS)
+        self.stats = SeasonStatsAggregator(self.lineups)
+        self.tables: Dict[str, LeagueTable] = {}
+
+        self.cup_tables: Dict[str, LeagueTable] = {}
+        self.cup_bracket: Dict[str, List[TieResult]] = {}
+        self.cup_champion = ""
+        self._rounds: List[str] = []
+        self._bracket_size = 0
+        self._seed_of: Dict[str, int] = {}
+        self._group_games_left = 0
+        self._ties_left = 0
+
+        self._queue: List = []
+        self._sequence = itertools.count()
+        self._last_day: Dict[str, date] = {}
+        self.injuries = 0
+
+    # ------------------------------------------------------------------
+    # Fila de jogos
+
+    def _schedule(self, fixture: UniverseFixture) -> None:
+        heapq.heappush(self._queue, (fixture.match_date, next(self._sequence), fixture))
+
+    def _schedule_leagues(self) -> int:
+        total = 0
+        for league in self.leagues:
+            names = [name for name in self.lineups if self.league_of[name] == league]
+            calendar = SeasonCalendar(season_year=self.season_year, teams=names, start_date=self.config.season_start)
+            calendar.generate_fixtures()
+            for fixture in calendar.fixtures:
+                self._schedule(UniverseFixture(fixture.scheduled_date, league, fixture.home_team,
+                                               fixture.away_team, stage=f"Rodada {fixture.matchweek}"))
+            table = LeagueTable()
+            table.initialize_teams(names)
+            self.tables[league] = table
+            total += len(calendar.fixtures)
+        return total
+
+    def cup_teams(self) -> List[str]:
+        """Os melhores de cada liga pelo rating, do mais forte para o mais fraco"""
+        rating = {name: lineup.get_team_rating() for name, lineup in self.lineups.items()}
+        teams = []
+        for league in self.leagues:
+            names = sorted((name for name in self.lineups if self.league_of[name] == league),
+                           key=rating.get, reverse=True)
+            teams.extend(names[:self.config.cup_teams_per_league])
+        return sorted(teams, key=rating.get, reverse=True)
+
+    def _schedule_cup_groups(self) -> int:
+        """Sorteia os grupos da copa e põe as rodadas na fila; devolve o total de jogos do torneio"""
+        cup = self.config.cup_format
+        groups = draw_groups(self.cup_teams(), self.league_of, cup.group_size, self.rng)
+        rounds_per_leg = cup.group_size - 1
+        for letter, group in zip(GROUP_LETTERS, groups):
+            calendar = SeasonCalendar(season_year=self.season_year, teams=list(group))
+            calendar.generate_fixtures()
+            for fixture in calendar.fixtures:
+                if fixture.matchweek > rounds_per_leg * cup.group_legs:
+                    continue
+                match_date = self.config.cup_group_start + timedelta(
+                    days=(fixture.matchweek - 1) * self.config.cup_group_interval)
+                self._schedule(UniverseFixture(match_date, CUP, fixture.home_team, fixture.away_team,
+                                               stage=f"Grupo {letter}"))
+                self._group_games_left += 1
+            table = LeagueTable()
+            table.initialize_teams(list(group))
+            self.cup_tables[f"Grupo {letter}"] = table
+
+        qualified = len(groups) * cup.advance_per_group
+        self._bracket_size = 1 << (qualified.bit_length() - 1)
+        self._rounds = round_names(self._bracket_size)[:-1]
+        knockout_games = sum(
+            (self._bracket_size >> k) // 2 * (cup.final_legs if name == "Final" else cup.knockout_legs)
+            for k, name in enumerate(self._rounds)
+        )
+        return self._group_games_left + knockout_games
+
+    def _start_knockout(self) -> None:
+        """Classificados dos grupos (primeiros, depois os melhores segundos...) na chave"""
+        cup = self.config.cup_format
+        by_position = [[] for _ in range(cup.advance_per_group)]
+        for table in self.cup_tables.values():
+            for position, (team, stats) in enumerate(table.get_sorted_table()[:cup.advance_per_group]):
+                by_position[position].append(
+                    ((stats["points"], stats["goal_difference"], stats["goals_for"]), team))
+        seeds = [team for ranked in by_position for _, team in sorted(ranked, reverse=True)]
+        seeds = seeds[:self._bracket_size]
+        self._seed_of = {team: k for k, team in enumerate(seeds)}
+        self._schedule_round(0, [seeds[k] for k in bracket_order(self._bracket_size)])
+
+    def _schedule_round(self, index: int, slots: List[str]) -> None:
+        """Põe na fila os jogos de uma fase; `slots` são os times em ordem de chave"""
+        cup = self.config.cup_format
+        name = self._rounds[index]
+        legs = cup.final_legs if name == "Final" else cup.knockout_legs
+        rounds_to_final = len(self._rounds) - 1 - index
+        first_leg = self.config.cup_final - timedelta(days=rounds_to_final * self.config.cup_round_interval)
+
+        ties = []
+        for first, second in zip(slots[0::2], slots[1::2]):
+            better, worse = sorted((first, second), key=self._seed_of.get)
+            tie = TieResult(worse, better) if legs == 2 else TieResult(better, worse)
+            ties.append(tie)
+            self._schedule(UniverseFixture(first_leg, CUP, tie.home, tie.away, stage=name, tie=tie))
+            if legs == 2:
+                second_leg = first_leg + timedelta(days=self.config.cup_leg_interval)
+                self._schedule(UniverseFixture(second_leg, CUP, tie.away, tie.home, stage=name, tie=tie))
+        self.cup_bracket[name] = ties
+        self._ties_left = len(ties)
+
+    # ------------------------------------------------------------------
+    # Jogos
+
+    def _prepare(self, team: str, day: date) -> None:
+        """Descanso desde o último jogo, volta dos lesionados e titulares do dia"""
+        lineup = self.lineups[team]
+        last = self._last_day.get(team)
+        if last is not None:
+            days = (day - last).days
+            for player in lineup.players + lineup.substitutes:
+                injury = player.current_injury
+                if player.is_injured and injury is not None and injury.expected_return <= day:
+                    player.recover_from_injury()
+                player.recover_fitness(days, self.config.fitness_recovery_per_day)
+        self._last_day[team] = day
+        pick_matchday_squad(lineup, self._first_choice[team], self.config.rotation_fitness)
+
+    def _record(self, fixture: UniverseFixture, result: AdvancedMatchResult) -> None:
+        """Resultado na tabela da liga, do grupo ou no confronto do mata-mata"""
+        if fixture.competition != CUP:
+            self.tables[fixture.competition].update_from_result(result)
+            return
+        if fixture.tie is None:
+            self.cup_tables[fixture.stage].update_from_result(result)
+            self._group_games_left -= 1
+            if self._group_games_left == 0:
+                self._start_knockout()
+            return
+
+        tie = fixture.tie
+        goals = (result.home_goals, result.away_goals)
+        tie.legs.append(goals if fixture.home_team == tie.home else goals[::-1])
+        cup = self.config.cup_format
+        legs = cup.final_legs if fixture.stage == "Final" else cup.knockout_legs
+        if len(tie.legs) < legs:
+            return
+
+        settle_tie(self.simulator, self.lineups, tie, cup.extra_time, self.rng, fixture.match_date)
+        self._ties_left -= 1
+        if self._ties_left == 0:
+            index = self._rounds.index(fixture.stage)
+            if index + 1 < len(self._rounds):
+                self._schedule_round(index + 1, [t.winner for t in self.cup_bracket[fixture.stage]])
+            else:
+                self.cup_champion = tie.winner
+
+    def _play_day(self, day: date, fixtures: List[UniverseFixture]) -> List[AdvancedMatchResult]:
+        progress = self.progress
+        results = []
+        for fixture in fixtures:
+            self._prepare(fixture.home_team, day)
+            self._prepare(fixture.away_team, day)
+            result = self.simulator.simulate_match(
+                self.lineups[fixture.home_team], self.lineups[fixture.away_team],
+                fixture.home_team, fixture.away_team, match_date=day
+            )
+            fixture.result = result
+            results.append(result)
+            self.injuries += sum(
+                1 for team in (fixture.home_team, fixture.away_team) for p in self.lineups[team].players
+                if p.current_injury is not None and p.current_injury.start_date == day
+            )
+            self._record(fixture, result)
+
+            if progress.active:
+                progress.emit("match", home=result.home_team, away=result.away_team,
+                              home_goals=result.home_goals, away_goals=result.away_goals)
+                progress.advance()
+
+        # Estatísticas de todas as competições acumuladas uma vez por data
+        touched = self.stats.add_matches(results)
+        self.stats.sync_season_stats(self.players, touched)
+        return results
+
+    def run(self) -> UniverseResult:
+        """Joga a temporada inteira, data a data"""
+        if self.seed is not None:
+            random.seed(self.seed)
+        start = time.perf_counter()
+
+        total = self._schedule_leagues() + self._schedule_cup_groups()
+        self.progress.start(total, label=f"universo {self.season_year}")
+
+        matches = 0
+        while self._queue:
+            day = self._queue[0][0]
+            fixtures = []
+            while self._queue and self._queue[0][0] == day:
+                fixtures.append(heapq.heappop(self._queue)[2])
+            matches += len(self._play_day(day, fixtures))
+
+        tables = {league: table.to_rows() for league, table in self.tables.items()}
+        cup_groups = {stage: table.to_rows() for stage, table in self.cup_tables.items()}
+        if self.progress.active:
+            for league, rows in tables.items():
+                self.progress.emit("table", title=f"{league.upper()} {self.season_year}", rows=rows)
+            for stage, rows in cup_groups.items():
+                self.progress.emit("table", title=f"COPA EUROPEIA - {stage.upper()}", rows=rows)
+        self.progress.finish()
+
+        top_scorers = [
+            {"name": record.player_name, "team": record.team_name, "goals": record.goals}
+            for record in self.stats.get_top_scorers(10)
+        ]
+        return UniverseResult(
+            season_year=self.season_year,
+            tables=tables,
+            cup_groups=cup_groups,
+            cup_bracket=self.cup_bracket,
+            cup_champion=self.cup_champion,
+            top_scorers=top_scorers,
+            matches=matches,
+            injuries=self.injuries,
+            elapsed=time.perf_counter() - start,
+        )
+
+
+def main():
+    """CLI: python scripts/run_universe.py [--leagues ...] [--seed 42]"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Universo: todas as ligas e a copa europeia na mesma temporada')
+    parser.add_argument('--leagues', nargs='*', default=None, help='Ligas (padrão: todas as disponíveis)')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    universe = UniverseSimulator(args.leagues, seed=args.seed)
+    result = universe.run()
+
+    print(f"\n{'='*72}")
+    print(f"[UNIVERSO] {result.season_year} | {', '.join(universe.leagues)} | {result.matches} jogos | "
+          f"{result.elapsed:.1f}s")
+    print(f"{'='*72}")
+    for league, rows in result.tables.items():
+        print(f"   🏆 {league.replace('_', ' ').title():<20} {rows[0]['Time']} ({rows[0]['P']} pts)")
+    for name, ties in result.cup_bracket.items():
+        print(f"\n{name}")
+        for tie in ties:
+            legs = " / ".join(f"{home}-{away}" for home, away in tie.legs)
+            extra = f" (prorr. {tie.extra_time[0]}-{tie.extra_time[1]})" if tie.extra_time else ""
+            penalties = f" ({tie.penalties[0]}-{tie.penalties[1]} pên.)" if tie.penalties else ""
+            print(f"   {tie.home} x {tie.away}: {legs}{extra}{penalties} -> {tie.winner}")
+    print(f"\n🏆 Copa europeia: {result.cup_champion}")
+    print(f"🩹 Lesões na temporada: {result.injuries}")
+    print("⚽ Artilheiros (todas as competições):")
+    for scorer in result.top_scorers[:5]:
+        print(f"   {scorer['name']:<26} {scorer['team']:<24} {scorer['goals']}")
+
+
+if __name__ == "__main__":
+    main()
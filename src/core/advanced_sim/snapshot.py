@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Cache de snapshots das escalações de uma liga
+Persiste as TeamLineup já construídas (chave: liga, hash dos dados e seed) em
+formato colunar compacto, para que simulações com as mesmas condições iniciais
+comecem sem reconstruir tudo a partir do JSON.
+
+Layout de um snapshot (um diretório por chave):
+    players.npy  -> array estruturado, uma linha por jogador
+    meta.json    -> nomes, ids, times e formações
+"""
+
+import json
+import os
+from dataclasses import fields
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from .models.player import AdvancedPlayer, Position, PlayerAttributes
+from .stats.tatics.formations import FormationType, FORMATIONS
+from .simulation.advanced_match import TeamLineup
+
+
+SNAPSHOT_VERSION = 1
+
+POSITIONS: List[Position] = list(Position)
+ATTRIBUTE_FIELDS: List[str] = [f.name for f in fields(PlayerAttributes)]
+
+PLAYER_DTYPE = np.dtype([
+    ('team', np.int16),
+    ('is_starter', np.bool_),
+    ('age', np.int16),
+    ('position', np.int8),
+    ('preferred_mask', np.int32),   # bit i = POSITIONS[i] entre as preferidas
+    ('current_overall', np.int16),
+    ('potential', np.int16),
+    ('current_form', np.int16),
+    ('morale', np.int16),
+    ('fitness', np.int16),
+    ('injury_proneness', np.int16),
+    ('market_value', np.int64),
+    ('attributes', np.int16, (len(ATTRIBUTE_FIELDS),)),  # -1 = None
+])
+
+
+def snapshot_key(league_name: str, data_hash: str, seed: int) -> str:
+    """Chave do snapshot: liga + prefixo do hash dos dados + seed"""
+    return f"{league_name}_{data_hash[:16]}_seed{seed}"
+
+
+class LineupSnapshotCache:
+    """Cache em disco das escalações de uma liga prontas para simulação"""
+
+    def __init__(self, cache_dir: Path | None = None):
+        if cache_dir is None:
+            cache_dir = Path(__file__).parent.parent.parent.parent / "data" / "cache" / "snapshots"
+        self.cache_dir = Path(cache_dir)
+
+    def _snapshot_dir(self, key: str) -> Path:
+        return self.cache_dir / key
+
+    def exists(self, key: str) -> bool:
+        """Verifica se existe um snapshot completo para a chave"""
+        return (self._snapshot_dir(key) / "meta.json").exists()
+
+    def save(self, key: str, lineups: Dict[str, TeamLineup]) -> Path:
+        """Grava o snapshot de forma atômica (diretório temporário + rename)"""
+        rows = []
+        meta = {"version": SNAPSHOT_VERSION, "teams": [], "formations": [], "names": [], "ids": []}
+
+        for team_idx, (team_name, lineup) in enumerate(lineups.items()):
+            meta["teams"].append(team_name)
+            meta["formations"].append(lineup.formation.name.value)
+
+            for is_starter, group in ((True, lineup.players), (False, lineup.substitutes)):
+                for player in group:
+                    preferred_mask = 0
+                    for position in player.preferred_positions:
+                        preferred_mask |= 1 << POSITIONS.index(position)
+
+                    attributes = [getattr(player.attributes, name) for name in ATTRIBUTE_FIELDS]
+                    rows.append((
+                        team_idx, is_starter, player.age, POSITIONS.index(player.position),
+                        preferred_mask, player.current_overall, player.potential,
+                        player.current_form, player.morale, player.fitness,
+                        player.injury_proneness, player.market_value,
+                        [-1 if value is None else value for value in attributes]
+                    ))
+                    meta["names"].append(player.name)
+                    meta["ids"].append(player.id)
+
+        target = self._snapshot_dir(key)
+        tmp = self.cache_dir / f".{key}.{os.getpid()}.tmp"
+        tmp.mkdir(parents=True, exist_ok=True)
+
+        np.save(tmp / "players.npy", np.array(rows, dtype=PLAYER_DTYPE))
+        with open(tmp / "meta.json", "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False)
+
+        try:
+            os.replace(tmp, target)
+        except OSError:
+            # Outro processo gravou o mesmo snapshot primeiro; o conteúdo é equivalente
+            for file in tmp.iterdir():
+                file.unlink()
+            tmp.rmdir()
+
+        return target
+
+    def load(self, key: str) -> Optional[Dict[str, TeamLineup]]:
+        """Reconstrói as escalações a partir do snapshot (None se não existir)"""
+        if not self.exists(key):
+            return None
+
+        snapshot_dir = self._snapshot_dir(key)
+        with open(snapshot_dir / "meta.json", "r", encoding="utf-8") as f:
+            meta = json.load(f)
+
+        if meta.get("version") != SNAPSHOT_VERSION:
+            return None
+
+        # Todas as linhas viram AdvancedPlayer, então o arquivo é lido inteiro de uma vez
+        players = np.load(snapshot_dir / "players.npy")
+
+        starters: List[List[AdvancedPlayer]] = [[] for _ in meta["teams"]]
+        substitutes: List[List[AdvancedPlayer]] = [[] for _ in meta["teams"]]
+
+        for row, row_data in enumerate(players.tolist()):
+            (team_idx, is_starter, age, position, preferred_mask, overall, potential,
+             form, morale, fitness, injury_proneness, market_value, attributes) = row_data
+
+            player = AdvancedPlayer(
+                id=meta["ids"][row],
+                name=meta["names"][row],
+                age=age,
+                position=POSITIONS[position],
+                preferred_positions=[p for i, p in enumerate(POSITIONS) if preferred_mask & (1 << i)],
+                current_overall=overall,
+                potential=potential,
+                attributes=PlayerAttributes(**{
+                    name: (None if value < 0 else value)
+                    for name, value in zip(ATTRIBUTE_FIELDS, attributes)
+                }),
+                current_form=form,
+                morale=morale,
+                fitness=fitness,
+                injury_proneness=injury_proneness,
+                market_value=market_value
+            )
+            (starters if is_starter else substitutes)[team_idx].append(player)
+
+        return {
+            team_name: TeamLineup(
+                formation=FORMATIONS[FormationType(meta["formations"][i])],
+                players=starters[i],
+                substitutes=substitutes[i]
+            )
+            for i, team_name in enumerate(meta["teams"])
+        }
+
+    def load_or_build(self, loader, league_name: str, seed: int) -> Dict[str, TeamLineup]:
+        """Carrega o snapshot da liga ou o constrói com o LeagueDataLoader e grava"""
+        key = snapshot_key(league_name, loader.get_league_hash(league_name), seed)
+
+        lineups = self.load(key)
+        if lineups is None:
+            lineups = loader.load_league_for_simulation(league_name, seed=seed)
+            self.save(key, lineups)
+
+        return lineups
@@ -0,0 +1,12 @@
+#!/usr/bin/env python3
+"""
+Tracking das estatísticas individuais dos jogadores ao longo da temporada
+Mantido por compatibilidade: a implementação fica em `season_aggregator`.
+"""
+
+from .season_aggregator import PlayerSeasonStats, SeasonStatsAggregator
+
+# Nome antigo do tracker (mesma interface pública)
+PlayerStatsTracker = SeasonStatsAggregator
+
+__all__ = ['PlayerSeasonStats', 'PlayerStatsTracker']
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Evolução dos jogadores entre temporadas
+Aplica a progressão de fim de temporada a todos os jogadores de uma vez, em
+arrays NumPy:
+
+    - até os 27 anos o overall se aproxima do potencial, mais rápido quanto mais
+      jovem e quanto mais minutos o jogador teve na temporada
+    - a partir dos 30 anos o overall cai, cada vez mais rápido com a idade
+    - o desempenho da temporada (gols + assistências + defesas por 90 minutos,
+      comparado com quem joga na mesma faixa do campo) dá um ajuste pequeno
+    - os atributos acompanham a variação do overall; velocidade e arrancada
+      caem mais rápido depois dos 30
+
+Jogadores veteranos podem se aposentar; quem usa o relatório decide como
+repor o elenco.
+"""
+
+from dataclasses import dataclass, fields
+from typing import List, Optional, Sequence, Union
+
+import numpy as np
+
+from ..models.player import AdvancedPlayer, PlayerAttributes, Position, SeasonStats
+
+
+ATTRIBUTE_FIELDS = [f.name for f in fields(PlayerAttributes)]
+PACE_FIELDS = ("pace", "acceleration", "sprint_speed", "agility")
+_PACE_COLUMNS = [ATTRIBUTE_FIELDS.index(name) for name in PACE_FIELDS]
+
+# Faixa do campo de cada posição (comparação de desempenho)
+_GROUP = {
+    Position.GK: 0,
+    Position.CB: 1, Position.LB: 1, Position.RB: 1,
+    Position.CDM: 2, Position.CM: 2, Position.CAM: 2, Position.LM: 2, Position.RM: 2,
+    Position.LW: 3, Position.RW: 3, Position.CF: 3, Position.ST: 3,
+}
+
+
+@dataclass
+class ProgressionConfig:
+    """Parâmetros da evolução de fim de temporada"""
+    growth_rate: float = 0.35           # fração da distância até o potencial por temporada (≤ 21 anos)
+    growth_end_age: int = 27            # a partir desta idade não há mais crescimento pelo potencial
+    training_share: float = 0.5         # parte do crescimento que vem mesmo sem jogar
+    decline_start_age: int = 30
+    decline_per_year: float = 1.0       # queda aos 30 anos; aumenta 50% a cada ano a mais
+    pace_decline: float = 1.5           # queda extra de velocidade por ano depois dos 29
+    performance_weight: float = 1.0     # pontos de overall por desvio padrão de desempenho
+    min_minutes_for_performance: int = 900
+    noise: float = 1.0                  # desvio padrão da variação aleatória
+    retirement_age: int = 34
+    retirement_rate: float = 0.25       # chance de aposentar por ano a partir de retirement_age
+
+
+@dataclass
+class ProgressionReport:
+    """Variações aplicadas numa virada de temporada (arrays alinhados aos jogadores)"""
+    player_ids: List[str]
+    age: np.ndarray                     # idade durante a temporada que terminou
+    overall_before: np.ndarray
+    overall_after: np.ndarray
+    retired: np.ndarray
+
+    @property
+    def delta(self) -> np.ndarray:
+        return self.overall_after - self.overall_before
+
+    def summary(self) -> dict:
+        """Variação média por faixa etária e número de aposentadorias"""
+        bands = {"<=21": self.age <= 21, "22-26": (self.age >= 22) & (self.age <= 26),
+                 "27-29": (self.age >= 27) & (self.age <= 29), ">=30": self.age >= 30}
+        return {
+            "players": len(self.player_ids),
+            "mean_delta": round(float(self.delta.mean()), 3) if len(self.player_ids) else 0.0,
+            "delta_by_age": {band: round(float(self.delta[mask].mean()), 3)
+                             for band, mask in bands.items() if mask.any()},
+            "retired": int(self.retired.sum()),
+        }
+
+
+def season_performance(players: Sequence[AdvancedPlayer], minutes: np.ndarray,
+                       min_minutes: int) -> np.ndarray:
+    """Desempenho da temporada em desvios padrão dentro da faixa do campo
+
+    Jogadores com menos de `min_minutes` minutos ficam com 0.
+    """
+    groups = np.array([_GROUP[player.position] for player in players])
+    contributions = np.array([
+        stats.goals + stats.assists + 0.3 * stats.saves
+        for stats in (player.season_stats for player in players)
+    ], dtype=np.float64)
+    per_90 = contributions * 90 / np.maximum(minutes, 1)
+
+    score = np.zeros(len(players))
+    qualified = minutes >= min_minutes
+    for group in range(4):
+        mask = qualified & (groups == group)
+        if mask.sum() >= 2:
+            std = per_90[mask].std()
+            if std > 0:
+                score[mask] = (per_90[mask] - per_90[mask].mean()) / std
+    return score
+
+
+def apply_season_progression(players: Sequence[AdvancedPlayer],
+                             season_minutes: Union[float, np.ndarray],
+                             config: Optional[ProgressionConfig] = None,
+                             rng: Optional[np.random.Generator] = None) -> ProgressionReport:
+    """Evolui overall, potencial, atributos e idade de todos os jogadores
+
+    `season_minutes` é a minutagem de uma temporada inteira (escalar ou um valor
+    por jogador, para ligas com números de rodadas diferentes). Lê os minutos e
+    as estatísticas de `season_stats`, que não são zeradas aqui.
+    """
+    config = config or ProgressionConfig()
+    rng = rng or np.random.default_rng()
+    players = list(players)
+    n = len(players)
+
+    age = np.array([player.age for player in players], dtype=np.int64)
+    overall = np.array([player.current_overall for player in players], dtype=np.int64)
+    potential = np.array([player.potential for player in players], dtype=np.int64)
+    minutes = np.array([player.season_stats.minutes_played for player in players], dtype=np.float64)
+
+    # Crescimento em direção ao potencial: idade x minutos jogados
+    youth = np.clip((config.growth_end_age - age) / max(config.growth_end_age - 21, 1), 0.0, 1.0)
+    playing_time = np.clip(minutes / np.asarray(season_minutes, dtype=np.float64), 0.0, 1.0)
+    gap = np.maximum(potential - overall, 0)
+    growth = gap * config.growth_rate * youth * (config.training_share + (1 - config.training_share) * playing_time)
+
+    # Declínio dos veteranos
+    years_past = age - config.decline_start_age
+    decline = np.where(years_past >= 0, config.decline_per_year * (1 + 0.5 * np.maximum(years_past, 0)), 0.0)
+
+    performance = config.performance_weight * np.clip(
+        season_performance(players, minutes, config.min_minutes_for_performance), -1.5, 1.5
+    )
+    change = growth - decline + performance + rng.normal(0.0, config.noise, n)
+    new_overall = np.clip(overall + np.rint(change).astype(np.int64), 30, 99)
+    delta = new_overall - overall
+
+    # Potencial: os jovens mantêm o teto (ou o superam); depois do pico ele acompanha o overall
+    new_potential = np.where(age < config.growth_end_age, np.maximum(potential, new_overall), new_overall)
+
+    # Atributos acompanham o overall; velocidade cai mais cedo
+    numeric = np.array([
+        [np.nan if value is None else value for value in (getattr(player.attributes, name) for name in ATTRIBUTE_FIELDS)]
+        for player in players
+    ], dtype=np.float64).reshape(n, len(ATTRIBUTE_FIELDS))
+    present = ~np.isnan(numeric)
+    numeric = np.where(present, numeric, 0) + delta[:, None]
+    numeric[:, _PACE_COLUMNS] -= (config.pace_decline * np.maximum(age - 29, 0))[:, None]
+    numeric = np.clip(np.rint(numeric), 1, 99).astype(np.int64)
+
+    retire_chance = np.clip((age - config.retirement_age + 1) * config.retirement_rate, 0.0, 1.0)
+    retired = rng.random(n) < retire_chance
+
+    for i, player in enumerate(players):
+        player.current_overall = int(new_overall[i])
+        player.potential = int(new_potential[i])
+        player.age = int(age[i] + 1)
+        attributes = player.attributes
+        for j in np.flatnonzero(present[i]).tolist():
+            setattr(attributes, ATTRIBUTE_FIELDS[j], int(numeric[i, j]))
+
+    return ProgressionReport(
+        player_ids=[player.id for player in players],
+        age=age,
+        overall_before=overall,
+        overall_after=new_overall,
+        retired=retired,
+    )
+
+
+def reset_for_new_season(player: AdvancedPlayer) -> None:
+    """Pré-temporada: estatísticas zeradas, lesões curadas e condição física restaurada"""
+    player.season_stats = SeasonStats()
+    player.recover_from_injury()
+    player.fitness = 100
+    # Meio das faixas sorteadas pelo LeagueDataLoader no início da carreira
+    player.current_form = 75
+    player.morale = 82
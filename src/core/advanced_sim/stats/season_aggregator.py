@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""
+Agregador vetorizado das estatísticas individuais da temporada
+Mantém os contadores em arrays NumPy indexados pelo jogador, acumula lotes
+inteiros de partidas de uma vez e monta os rankings com argpartition.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List
+
+import numpy as np
+
+from ..models.player import AdvancedPlayer, Position
+from ..simulation.advanced_match import AdvancedMatchResult, TeamLineup
+
+
+# Colunas inteiras da matriz de contadores (uma linha por jogador)
+COUNT_FIELDS = [
+    'matches_played',
+    'minutes_played',
+    'goals',
+    'assists',
+    'shots',
+    'shots_on_target',
+    'key_passes',
+    'tackles',
+    'interceptions',
+    'yellow_cards',
+    'red_cards',
+    'saves',
+    'clean_sheets',
+    'goals_conceded',
+]
+
+# Colunas de ponto flutuante (estatísticas esperadas)
+FLOAT_FIELDS = ['xg', 'xa']
+
+_COL = {name: i for i, name in enumerate(COUNT_FIELDS)}
+_FCOL = {name: i for i, name in enumerate(FLOAT_FIELDS)}
+
+# Campos copiados de PlayerMatchPerformance (mesma ordem de COUNT_FIELDS, até 'saves')
+_PERFORMANCE_FIELDS = COUNT_FIELDS[1:_COL['saves'] + 1]
+
+# Nomes em SeasonStats que diferem de COUNT_FIELDS
+_SEASON_STATS_FIELDS = {'interceptions': 'interceptions_made'}
+
+
+@dataclass
+class PlayerSeasonStats:
+    """Estatísticas de um jogador durante a temporada"""
+    player_name: str
+    team_name: str
+    position: str
+    overall: int
+
+    # Estatísticas de jogo
+    matches_played: int = 0
+    minutes_played: int = 0
+    goals: int = 0
+    assists: int = 0
+    shots: int = 0
+    shots_on_target: int = 0
+    yellow_cards: int = 0
+    red_cards: int = 0
+
+    # Estatísticas avançadas
+    xg: float = 0.0
+    xa: float = 0.0
+    saves: int = 0
+    clean_sheets: int = 0
+    goals_conceded: int = 0
+
+    # Médias calculadas
+    @property
+    def goals_per_game(self) -> float:
+        return self.goals / max(1, self.matches_played)
+
+    @property
+    def assists_per_game(self) -> float:
+        return self.assists / max(1, self.matches_played)
+
+
+class SeasonStatsAggregator:
+    """Contadores da temporada em arrays NumPy, um índice por jogador"""
+
+    def __init__(self, teams: Dict[str, TeamLineup]):
+        self.teams = teams
+
+        self.player_ids: List[str] = []
+        self.player_names: List[str] = []
+        self.team_names: List[str] = []
+        self.positions: List[str] = []
+        overalls = []
+        is_goalkeeper = []
+
+        for team_name, lineup in teams.items():
+            for player in lineup.players + lineup.substitutes:
+                self.player_ids.append(player.id)
+                self.player_names.append(player.name)
+                self.team_names.append(team_name)
+                self.positions.append(player.position.value)
+                overalls.append(player.current_overall)
+                is_goalkeeper.append(player.position == Position.GK)
+
+        self.index: Dict[str, int] = {pid: i for i, pid in enumerate(self.player_ids)}
+        self.overall = np.array(overalls, dtype=np.int16)
+        self.is_goalkeeper = np.array(is_goalkeeper, dtype=bool)
+
+        n_players = len(self.player_ids)
+        self.counts = np.zeros((n_players, len(COUNT_FIELDS)), dtype=np.int32)
+        self.expected = np.zeros((n_players, len(FLOAT_FIELDS)), dtype=np.float64)
+
+        # Rankings calculados sob demanda e invalidados a cada novo lote
+        self._leaderboards: Dict[tuple, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self.player_ids)
+
+    # ------------------------------------------------------------------
+    # Acumulação
+    # ------------------------------------------------------------------
+
+    def add_matches(self, results: Iterable[AdvancedMatchResult]) -> np.ndarray:
+        """Acumula um lote de partidas com uma única soma indexada por campo
+        
+        Retorna os índices (únicos) dos jogadores que entraram em campo no lote.
+        """
+        rows = []
+        expected_rows = []
+        conceded = []
+        indices = []
+
+        for result in results:
+            for performances, goals_against in (
+                (result.home_performances, result.away_goals),
+                (result.away_performances, result.home_goals),
+            ):
+                for player_id, performance in performances.items():
+                    idx = self.index.get(player_id)
+                    if idx is None:
+                        continue
+                    indices.append(idx)
+                    rows.append([getattr(performance, name) for name in _PERFORMANCE_FIELDS])
+                    expected_rows.append((performance.xg, performance.xa))
+                    conceded.append(goals_against)
+
+        if not indices:
+            return np.empty(0, dtype=np.intp)
+
+        idx = np.asarray(indices, dtype=np.intp)
+        goals_against = np.asarray(conceded, dtype=np.int32)
+        keeper = self.is_goalkeeper[idx]
+
+        batch = np.zeros((len(idx), len(COUNT_FIELDS)), dtype=np.int32)
+        batch[:, _COL['matches_played']] = 1
+        batch[:, 1:_COL['saves'] + 1] = rows
+        batch[:, _COL['clean_sheets']] = keeper & (goals_against == 0)
+        batch[:, _COL['goals_conceded']] = np.where(keeper, goals_against, 0)
+
+        np.add.at(self.counts, idx, batch)
+        np.add.at(self.expected, idx, np.asarray(expected_rows, dtype=np.float64))
+        self._leaderboards.clear()
+
+        return np.unique(idx)
+
+    def sync_season_stats(self, players: Dict[str, AdvancedPlayer], indices: Iterable[int] | None = None):
+        """Copia os totais dos arrays para `AdvancedPlayer.season_stats`
+        
+        `players` mapeia id -> jogador; `indices` limita a cópia aos jogadores
+        tocados no último lote (por padrão, todos).
+        """
+        if indices is None:
+            indices = range(len(self))
+
+        for idx in indices:
+            player = players.get(self.player_ids[idx])
+            if player is None:
+                continue
+            stats = player.season_stats
+            counts = self.counts[idx].tolist()
+            for name, value in zip(COUNT_FIELDS, counts):
+                setattr(stats, _SEASON_STATS_FIELDS.get(name, name), value)
+            stats.xg, stats.xa = self.expected[idx].tolist()
+
+    def update_match_stats(self, match_result: AdvancedMatchResult, home_team: str = "", away_team: str = ""):
+        """Atualiza estatísticas após uma partida (atalho para um lote de 1)"""
+        self.add_matches([match_result])
+
+    # ------------------------------------------------------------------
+    # Consultas
+    # ------------------------------------------------------------------
+
+    def column(self, name: str) -> np.ndarray:
+        """Retorna a coluna de um contador (view, sem cópia)"""
+        if name in _COL:
+            return self.counts[:, _COL[name]]
+        return self.expected[:, _FCOL[name]]
+
+    def per_90(self, name: str) -> np.ndarray:
+        """Métrica por 90 minutos para todos os jogadores (0 para quem não jogou)"""
+        minutes = self.column('minutes_played')
+        values = self.column(name).astype(np.float64)
+        return np.divide(values * 90, minutes, out=np.zeros_like(values), where=minutes > 0)
+
+    def top_k(self, metric: str, k: int = 10, tiebreak: str | None = None) -> np.ndarray:
+        """Índices dos k melhores em `metric` (desempate por `tiebreak`), só valores > 0"""
+        cache_key = (metric, k, tiebreak)
+        if cache_key in self._leaderboards:
+            return self._leaderboards[cache_key]
+
+        primary = self.column(metric)
+        candidates = np.flatnonzero(primary > 0)
+
+        if len(candidates) > k:
+            # Chave composta: empates no primário resolvidos pelo secundário
+            key = primary[candidates].astype(np.float64)
+            if tiebreak is not None:
+                secondary = self.column(tiebreak)[candidates].astype(np.float64)
+                key = key * (secondary.max() + 1) + secondary
+            candidates = candidates[np.argpartition(-key, k - 1)[:k]]
+
+        order_keys = [-self.column(metric)[candidates]]
+        if tiebreak is not None:
+            order_keys.insert(0, -self.column(tiebreak)[candidates])
+        leaderboard = candidates[np.lexsort(order_keys)]
+
+        self._leaderboards[cache_key] = leaderboard
+        return leaderboard
+
+    def record(self, idx: int) -> PlayerSeasonStats:
+        """Monta o registro de um jogador a partir das linhas dos arrays"""
+        counts = self.counts[idx]
+        return PlayerSeasonStats(
+            player_name=self.player_names[idx],
+            team_name=self.team_names[idx],
+            position=self.positions[idx],
+            overall=int(self.overall[idx]),
+            matches_played=int(counts[_COL['matches_played']]),
+            minutes_played=int(counts[_COL['minutes_played']]),
+            goals=int(counts[_COL['goals']]),
+            assists=int(counts[_COL['assists']]),
+            shots=int(counts[_COL['shots']]),
+            shots_on_target=int(counts[_COL['shots_on_target']]),
+            yellow_cards=int(counts[_COL['yellow_cards']]),
+            red_cards=int(counts[_COL['red_cards']]),
+            xg=float(self.expected[idx, _FCOL['xg']]),
+            xa=float(self.expected[idx, _FCOL['xa']]),
+            saves=int(counts[_COL['saves']]),
+            clean_sheets=int(counts[_COL['clean_sheets']]),
+            goals_conceded=int(counts[_COL['goals_conceded']])
+        )
+
+    def records(self, played_only: bool = True) -> List[PlayerSeasonStats]:
+        """Registros de todos os jogadores (por padrão só quem entrou em campo)"""
+        indices = range(len(self))
+        if played_only:
+            indices = np.flatnonzero(self.column('matches_played') > 0)
+        return [self.record(int(i)) for i in indices]
+
+    def get_top_scorers(self, limit: int = 10) -> List[PlayerSeasonStats]:
+        """Retorna os artilheiros da temporada"""
+        return [self.record(int(i)) for i in self.top_k('goals', limit, tiebreak='assists')]
+
+    def get_top_assisters(self, limit: int = 10) -> List[PlayerSeasonStats]:
+        """Retorna os maiores assistentes da temporada"""
+        return [self.record(int(i)) for i in self.top_k('assists', limit, tiebreak='goals')]
+
+    def get_team_stats(self, team_name: str) -> List[PlayerSeasonStats]:
+        """Retorna estatísticas de todos os jogadores de um time"""
+        return [stats for stats in self.records() if stats.team_name == team_name]
+
+    # ------------------------------------------------------------------
+    # Impressão
+    # ------------------------------------------------------------------
+
+    def print_top_scorers(self):
+        """Imprime tabela dos artilheiros"""
+        print(f"\n{'='*80}")
+        print(f"⚽ TOP 10 ARTILHEIROS DA TEMPORADA")
+        print(f"{'='*80}")
+        print(f"{'Pos':<3} {'Jogador':<20} {'Time':<18} {'Gols':<5} {'Assist':<6} {'Jogos':<5} {'Média':<5}")
+        print(f"{'-'*80}")
+
+        for i, stats in enumerate(self.get_top_scorers(), 1):
+            print(f"{i:<3} {stats.player_name[:19]:<20} {stats.team_name[:17]:<18} "
+                  f"{stats.goals:<5} {stats.assists:<6} {stats.matches_played:<5} "
+                  f"{stats.goals_per_game:.2f}")
+
+    def print_top_assisters(self):
+        """Imprime tabela dos maiores assistentes"""
+        print(f"\n{'='*80}")
+        print(f"🎯 TOP 10 ASSISTÊNCIAS DA TEMPORADA")
+        print(f"{'='*80}")
+        print(f"{'Pos':<3} {'Jogador':<20} {'Time':<18} {'Assist':<6} {'Gols':<5} {'Jogos':<5} {'Média':<5}")
+        print(f"{'-'*80}")
+
+        for i, stats in enumerate(self.get_top_assisters(), 1):
+            print(f"{i:<3} {stats.player_name[:19]:<20} {stats.team_name[:17]:<18} "
+                  f"{stats.assists:<6} {stats.goals:<5} {stats.matches_played:<5} "
+                  f"{stats.assists_per_game:.2f}")
+
+    def print_team_detailed_stats(self, team_name: str):
+        """Imprime estatísticas detalhadas de um time"""
+        team_players = self.get_team_stats(team_name)
+        if not team_players:
+            print(f"❌ Nenhuma estatística encontrada para {team_name}")
+            return
+
+        # Ordenar por gols + assistências
+        team_players.sort(key=lambda x: (x.goals + x.assists, x.overall), reverse=True)
+
+        print(f"\n{'='*90}")
+        print(f"📊 ESTATÍSTICAS DETALHADAS - {team_name.upper()}")
+        print(f"{'='*90}")
+        print(f"{'Jogador':<20} {'Pos':<4} {'OVR':<3} {'J':<2} {'G':<2} {'A':<2} {'FC':<3} {'CA':<2} {'G/J':<4}")
+        print(f"{'-'*90}")
+
+        for stats in team_players:
+            print(f"{stats.player_name[:19]:<20} {stats.position[:3]:<4} "
+                  f"{stats.overall:<3} {stats.matches_played:<2} {stats.goals:<2} "
+                  f"{stats.assists:<2} {stats.shots:<3} {stats.yellow_cards:<2} "
+                  f"{stats.goals_per_game:.2f}")
@@ -0,0 +1,14 @@
+from .suite import BenchmarkSuite, BenchmarkResult, BENCHMARKS, write_report
+from .realism import RealismSample, RealismReport, collect_sample, compare, load_reference
+
+__all__ = [
+    'BenchmarkSuite',
+    'BenchmarkResult',
+    'BENCHMARKS',
+    'write_report',
+    'RealismSample',
+    'RealismReport',
+    'collect_sample',
+    'compare',
+    'load_reference'
+]
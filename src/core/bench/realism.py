@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""
+Regressão estatística de realismo em larga escala
+Simula 10⁵+ partidas do motor avançado e compara as distribuições com
+histogramas de referência guardados no repositório:
+
+    goals     gols por partida (soma dos dois times)
+    result    vitória da casa / empate / vitória visitante
+    shots     finalizações por partida
+    cards     cartões (amarelos + vermelhos) por partida
+    nil_nil   frequência de 0 a 0
+
+Cada métrica passa por um teste qui-quadrado de duas amostras (tabela de
+contingência amostra x referência, com as caudas raras agrupadas). Com a
+correção de Bonferroni, qualquer otimização do motor que altere uma dessas
+distribuições faz a comparação falhar.
+
+As partidas rodam em blocos de uma temporada (turno e returno com as
+escalações recém-carregadas e a seed do bloco), no nível MatchDetail.STATS e
+em paralelo entre processos; o resultado não depende do número de workers.
+"""
+
+import copy
+import json
+import random
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List
+
+
+REFERENCE_DIR = Path(__file__).parent / "reference"
+REFERENCE_LINEUP_SEED = 42
+REFERENCE_SEED = 0        # seed dos blocos da referência
+SAMPLE_SEED = 1000        # seed padrão das amostras comparadas (independentes da referência)
+DEFAULT_ALPHA = 0.001
+
+METRICS = ("goals", "result", "shots", "cards", "nil_nil")
+COUNT_METRICS = ("goals", "shots", "cards")
+
+# Escalações por liga, carregadas uma vez por processo
+_lineups_cache: Dict[str, Dict] = {}
+
+
+@dataclass
+class RealismSample:
+    """Histogramas das métricas de um conjunto de partidas"""
+    league: str
+    n_matches: int = 0
+    histograms: Dict[str, Dict[str, int]] = field(
+        default_factory=lambda: {metric: {} for metric in METRICS}
+    )
+
+    def _count(self, metric: str, key) -> None:
+        histogram = self.histograms[metric]
+        histogram[str(key)] = histogram.get(str(key), 0) + 1
+
+    def add_match(self, result) -> None:
+        """Acrescenta um AdvancedMatchResult"""
+        cards = sum(
+            performance.yellow_cards + performance.red_cards
+            for performances in (result.home_performances, result.away_performances)
+            for performance in performances.values()
+        )
+        if result.home_goals > result.away_goals:
+            outcome = "H"
+        elif result.home_goals < result.away_goals:
+            outcome = "A"
+        else:
+            outcome = "D"
+
+        self._count("goals", result.home_goals + result.away_goals)
+        self._count("result", outcome)
+        self._count("shots", result.home_shots + result.away_shots)
+        self._count("cards", cards)
+        self._count("nil_nil", int(result.home_goals == 0 and result.away_goals == 0))
+        self.n_matches += 1
+
+    def merge(self, other: "RealismSample") -> "RealismSample":
+        for metric, histogram in other.histograms.items():
+            mine = self.histograms.setdefault(metric, {})
+            for key, count in histogram.items():
+                mine[key] = mine.get(key, 0) + count
+        self.n_matches += other.n_matches
+        return self
+
+    def mean(self, metric: str) -> float:
+        """Média de uma métrica de contagem"""
+        histogram = self.histograms[metric]
+        total = sum(histogram.values())
+        return sum(int(key) * count for key, count in histogram.items()) / max(total, 1)
+
+    def rate(self, metric: str, key: str) -> float:
+        histogram = self.histograms[metric]
+        return histogram.get(key, 0) / max(sum(histogram.values()), 1)
+
+    def to_dict(self) -> Dict:
+        return {"league": self.league, "n_matches": self.n_matches, "histograms": self.histograms}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "RealismSample":
+        return cls(data["league"], data["n_matches"], data["histograms"])
+
+
+@dataclass
+class MetricTest:
+    """Resultado do teste de uma métrica"""
+    metric: str
+    statistic: float
+    p_value: float
+    dof: int
+    sample_value: float
+    reference_value: float
+    passed: bool
+
+
+@dataclass
+class RealismReport:
+    league: str
+    n_matches: int
+    n_reference: int
+    alpha: float
+    tests: List[MetricTest]
+
+    @property
+    def passed(self) -> bool:
+        return all(test.passed for test in self.tests)
+
+    def failures(self) -> List[str]:
+        return [test.metric for test in self.tests if not test.passed]
+
+
+# ----------------------------------------------------------------------
+# Simulação em lote
+
+def _league_lineups(league: str) -> Dict:
+    if league not in _lineups_cache:
+        from ..advanced_sim.data_loader import LeagueDataLoader
+        _lineups_cache[league] = LeagueDataLoader().load_league_for_simulation(
+            league, seed=REFERENCE_LINEUP_SEED
+        )
+    return copy.deepcopy(_lineups_cache[league])
+
+
+def simulate_season_block(league: str, seed: int) -> RealismSample:
+    """Uma temporada (turno e returno) com escalações novas e a seed do bloco"""
+    from ..advanced_sim.simulation.advanced_match import AdvancedMatchSimulator, MatchDetail
+
+    lineups = _league_lineups(league)
+    names = list(lineups)
+    random.seed(seed)
+    fixtures = [(home, away) for home in names for away in names if home != away]
+    random.shuffle(fixtures)
+
+    simulator = AdvancedMatchSimulator(MatchDetail.STATS)
+    sample = RealismSample(league)
+    for home, away in fixtures:
+        sample.add_match(simulator.simulate_match(lineups[home], lineups[away], home, away))
+    return sample
+
+
+def collect_sample(league: str, n_matches: int, seed: int = 0, workers: int = 1) -> RealismSample:
+    """Simula pelo menos `n_matches` partidas em blocos de uma temporada"""
+    n_teams = len(_league_lineups(league))
+    block_size = n_teams * (n_teams - 1)
+    n_blocks = max(1, -(-n_matches // block_size))
+    seeds = [seed + block for block in range(n_blocks)]
+
+    total = RealismSample(league)
+    if workers <= 1:
+        for block_seed in seeds:
+            total.merge(simulate_season_block(league, block_seed))
+        return total
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for block in pool.map(simulate_season_block, [league] * n_blocks, seeds):
+            total.merge(block)
+    return total
+
+
+# ----------------------------------------------------------------------
+# Comparação com a referência
+
+def _aligned_counts(metric: str, sample: RealismSample, reference: RealismSample,
+                    min_expected: float = 5.0):
+    """Contagens das duas amostras nas mesmas categorias, com caudas raras agrupadas
+
+    Nas métricas de contagem as categorias adjacentes são somadas até que a
+    frequência esperada de cada célula da tabela fique acima de `min_expected`.
+    """
+    a, b = sample.histograms[metric], reference.histograms[metric]
+    keys = set(a) | set(b)
+    keys = sorted(keys, key=int) if metric in COUNT_METRICS else sorted(keys)
+
+    n_a, n_b = sum(a.values()), sum(b.values())
+    smallest_share = min(n_a, n_b) / (n_a + n_b)
+
+    groups: List[List[int]] = []
+    pending = [0, 0]
+    for key in keys:
+        pending[0] += a.get(key, 0)
+        pending[1] += b.get(key, 0)
+        if (pending[0] + pending[1]) * smallest_share >= min_expected:
+            groups.append(pending)
+            pending = [0, 0]
+    if pending != [0, 0]:
+        if groups:
+            groups[-1][0] += pending[0]
+            groups[-1][1] += pending[1]
+        else:
+            groups.append(pending)
+    return [group[0] for group in groups], [group[1] for group in groups]
+
+
+def compare(sample: RealismSample, reference: RealismSample,
+            alpha: float = DEFAULT_ALPHA) -> RealismReport:
+    """Testa cada métrica da amostra contra a referência (qui-quadrado de duas amostras)"""
+    from scipy.stats import chi2_contingency
+
+    threshold = alpha / len(METRICS)  # Bonferroni
+    tests = []
+    for metric in METRICS:
+        counts_sample, counts_reference = _aligned_counts(metric, sample, reference)
+        if len(counts_sample) < 2:
+            statistic, p_value, dof = 0.0, 1.0, 0
+        else:
+            statistic, p_value, dof, _ = chi2_contingency([counts_sample, counts_reference])
+
+        if metric in COUNT_METRICS:
+            sample_value, reference_value = sample.mean(metric), reference.mean(metric)
+        elif metric == "result":
+            sample_value, reference_value = sample.rate(metric, "H"), reference.rate(metric, "H")
+        else:
+            sample_value, reference_value = sample.rate(metric, "1"), reference.rate(metric, "1")
+
+        tests.append(MetricTest(
+            metric=metric,
+            statistic=round(float(statistic), 3),
+            p_value=float(p_value),
+            dof=int(dof),
+            sample_value=round(sample_value, 4),
+            reference_value=round(reference_value, 4),
+            passed=bool(p_value >= threshold)
+        ))
+
+    return RealismReport(sample.league, sample.n_matches, reference.n_matches, alpha, tests)
+
+
+def reference_path(league: str) -> Path:
+    return REFERENCE_DIR / f"realism_{league}.json"
+
+
+def load_reference(league: str) -> RealismSample:
+    path = reference_path(league)
+    if not path.exists():
+        raise FileNotFoundError(
+            f"Sem referência de realismo para '{league}' ({path}); gere com --update-reference"
+        )
+    with open(path, "r", encoding="utf-8") as f:
+        return RealismSample.from_dict(json.load(f))
+
+
+def save_reference(sample: RealismSample, seed: int) -> Path:
+    """Grava a amostra como a nova referência da liga"""
+    from .suite import BENCHMARK_VERSION
+
+    path = reference_path(sample.league)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        **sample.to_dict(),
+        "seed": seed,
+        "lineup_seed": REFERENCE_LINEUP_SEED,
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "version": BENCHMARK_VERSION,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False, indent=1, sort_keys=True)
+    return path
+
+
+def print_report(report: RealismReport) -> None:
+    print(f"\n{'='*72}")
+    print(f"[REALISMO] {report.league} | {report.n_matches} partidas vs {report.n_reference} de referência")
+    print(f"{'='*72}")
+    print(f"{'Métrica':<10} {'Amostra':>9} {'Referência':>11} {'Qui²':>10} {'gl':>4} {'p':>10}")
+    print(f"{'-'*72}")
+    for test in report.tests:
+        status = "✅" if test.passed else "❌"
+        print(f"{test.metric:<10} {test.sample_value:>9.4f} {test.reference_value:>11.4f} "
+              f"{test.statistic:>10.2f} {test.dof:>4} {test.p_value:>10.4g} {status}")
+    print(f"\nα = {report.alpha} (Bonferroni: {report.alpha / len(METRICS):.2g} por métrica)")
+
+
+def main():
+    """CLI: python scripts/run_realism.py [--matches 100000] [--update-reference]"""
+    import argparse
+    import os
+    import sys
+
+    parser = argparse.ArgumentParser(description='Regressão estatística de realismo do motor avançado')
+    parser.add_argument('--league', default='premier_league')
+    parser.add_argument('--matches', type=int, default=100_000, help='Partidas simuladas (mínimo)')
+    parser.add_argument('--seed', type=int, default=None,
+                        help=f'Seed do primeiro bloco (padrão: {SAMPLE_SEED}; {REFERENCE_SEED} com --update-reference)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--alpha', type=float, default=DEFAULT_ALPHA)
+    parser.add_argument('--update-reference', action='store_true',
+                        help='Grava a amostra como nova referência em vez de comparar')
+    args = parser.parse_args()
+
+    seed = args.seed
+    if seed is None:
+        seed = REFERENCE_SEED if args.update_reference else SAMPLE_SEED
+    sample = collect_sample(args.league, args.matches, seed=seed, workers=args.workers)
+
+    if args.update_reference:
+        path = save_reference(sample, seed)
+        print(f"📂 Referência gravada: {path} ({sample.n_matches} partidas)")
+        return
+
+    report = compare(sample, load_reference(args.league), alpha=args.alpha)
+    print_report(report)
+    if not report.passed:
+        print(f"\n❌ Distribuições diferentes da referência: {', '.join(report.failures())}")
+        sys.exit(1)
+    print(f"\n✅ Distribuições compatíveis com a referência")
+
+
+if __name__ == "__main__":
+    main()
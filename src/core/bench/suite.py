@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""
+Suíte de benchmarks do simulador
+Mede, com seeds fixas e várias repetições, a vazão dos caminhos principais:
+
+    match_full / match_stats   partidas/s do AdvancedMatchSimulator por nível de detalhe
+    season_simple              temporadas/s do sim_campeonato
+    season_advanced            temporadas/s do FullSeasonSimulator (sem exportar)
+    load_league                tempo de LeagueDataLoader.load_league_for_simulation
+    export                     tempo de FullSeasonSimulator.export_results
+
+Cada caso roda uma vez a mais sob tracemalloc para o pico de memória alocada
+pelo Python (fora das repetições cronometradas, que não pagam esse custo).
+O relatório é um dicionário JSON com a versão da suíte, a máquina e os casos.
+"""
+
+import contextlib
+import copy
+import io
+import json
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from ..advanced_sim.simulation.progress import max_rss_kb
+
+
+BENCHMARK_VERSION = "1.0.0"
+
+PROJECT_ROOT = Path(__file__).parents[3]
+DEFAULT_OUTPUT_DIR = PROJECT_ROOT / "data" / "benchmarks"
+
+BENCHMARKS = ("match_full", "match_stats", "season_simple", "season_advanced", "load_league", "export")
+
+
+@dataclass
+class BenchmarkResult:
+    """Resultado de um caso da suíte"""
+    name: str
+    unit: str                       # unidade da vazão (ex.: "matches/s")
+    items: int                      # itens processados por repetição
+    repeats: int
+    times: List[float] = field(default_factory=list)
+    peak_memory_kb: float = 0.0
+
+    @property
+    def best(self) -> float:
+        return min(self.times)
+
+    @property
+    def mean(self) -> float:
+        return sum(self.times) / len(self.times)
+
+    @property
+    def rate(self) -> float:
+        """Itens por segundo na melhor repetição"""
+        return self.items / self.best if self.best > 0 else float("inf")
+
+    def to_dict(self) -> Dict:
+        data = asdict(self)
+        data["times"] = [round(t, 6) for t in self.times]
+        data.update(best_s=round(self.best, 6), mean_s=round(self.mean, 6), rate=round(self.rate, 3))
+        return data
+
+
+def _run_case(name: str, unit: str, items: int, repeats: int,
+              setup: Callable[[], object], run: Callable[[object], None]) -> BenchmarkResult:
+    """Cronometra `run(setup())` em cada repetição e mede o pico de memória à parte"""
+    result = BenchmarkResult(name, unit, items, repeats)
+    for _ in range(repeats):
+        state = setup()
+        start = time.perf_counter()
+        run(state)
+        result.times.append(time.perf_counter() - start)
+
+    state = setup()
+    tracemalloc.start()
+    try:
+        run(state)
+        result.peak_memory_kb = round(tracemalloc.get_traced_memory()[1] / 1024, 1)
+    finally:
+        tracemalloc.stop()
+    return result
+
+
+def _resolve(path: str) -> str:
+    """Caminhos relativos do config.yaml são relativos à raiz do projeto"""
+    resolved = Path(path)
+    if not resolved.is_absolute():
+        resolved = PROJECT_ROOT / resolved
+    return f"{resolved}/"
+
+
+class BenchmarkSuite:
+    """Casos de benchmark de uma liga com tamanhos e seed fixos"""
+
+    def __init__(self, league: str = "premier_league", config: Optional[Dict] = None,
+                 repeats: int = 3, n_matches: int = 200, n_seasons: int = 1, seed: int = 42):
+        self.league = league
+        self.config = config or {}
+        self.repeats = repeats
+        self.n_matches = n_matches
+        self.n_seasons = n_seasons
+        self.seed = seed
+
+        self.sim_config = {
+            "random_factor_min": 0.8,
+            "random_factor_max": 1.2,
+            "min_expected_goals": 0.1,
+            **self.config.get("simulation", {}),
+        }
+        paths = self.config.get("paths", {})
+        self.paths = {"json_ligas": _resolve(paths.get("json_ligas", "data/processed/leagues/"))}
+
+        self._loader = None
+        self._lineups = None
+        self._simple_teams = None
+
+    # ------------------------------------------------------------------
+    # Dados carregados uma vez e copiados a cada repetição
+
+    @property
+    def loader(self):
+        if self._loader is None:
+            from ..advanced_sim.data_loader import LeagueDataLoader
+            self._loader = LeagueDataLoader()
+        return self._loader
+
+    def lineups(self) -> Dict:
+        if self._lineups is None:
+            self._lineups = self.loader.load_league_for_simulation(self.league, seed=self.seed)
+        return copy.deepcopy(self._lineups)
+
+    def simple_teams(self) -> Dict:
+        if self._simple_teams is None:
+            from ..simple.simulator import carregar_times
+            with contextlib.redirect_stdout(io.StringIO()):
+                self._simple_teams = carregar_times(self.league, self.paths)
+        return self._simple_teams
+
+    # ------------------------------------------------------------------
+    # Casos
+
+    def bench_match(self, detail) -> BenchmarkResult:
+        """Partidas/s do motor avançado com o nível de detalhe pedido"""
+        from ..advanced_sim.simulation.advanced_match import AdvancedMatchSimulator
+
+        def setup():
+            lineups = self.lineups()
+            rng = random.Random(self.seed)
+            names = list(lineups)
+            pairs = [tuple(rng.sample(names, 2)) for _ in range(self.n_matches)]
+            random.seed(self.seed)
+            return lineups, pairs
+
+        def run(state):
+            lineups, pairs = state
+            simulator = AdvancedMatchSimulator(detail)
+            for home, away in pairs:
+                simulator.simulate_match(lineups[home], lineups[away], home, away)
+
+        return _run_case(f"match_{detail.value}", "matches/s", self.n_matches, self.repeats, setup, run)
+
+    def bench_season_simple(self) -> BenchmarkResult:
+        """Temporadas/s do simulador estatístico simples"""
+        import numpy as np
+        from ..simple.simulator import sim_campeonato
+
+        def setup():
+            np.random.seed(self.seed)
+            return self.simple_teams()
+
+        def run(teams):
+            with contextlib.redirect_stdout(io.StringIO()):
+                for _ in range(self.n_seasons):
+                    sim_campeonato(teams, self.sim_config)
+
+        return _run_case("season_simple", "seasons/s", self.n_seasons, self.repeats, setup, run)
+
+    def _season(self, results_dir: Path, stream_results: bool = False):
+        from ..advanced_sim.simulation.full_season import FullSeasonSimulator
+
+        season = FullSeasonSimulator(self.league, teams=self.lineups(), results_dir=results_dir)
+        season.simulate_full_season(stream_results=stream_results)
+        return season
+
+    def bench_season_advanced(self) -> BenchmarkResult:
+        """Temporadas/s do motor avançado (tabela e estatísticas, sem exportar)"""
+        from ..advanced_sim.simulation.full_season import FullSeasonSimulator
+
+        tmp = tempfile.TemporaryDirectory()
+
+        def setup():
+            random.seed(self.seed)
+            return [self.lineups() for _ in range(self.n_seasons)]
+
+        def run(all_lineups):
+            for lineups in all_lineups:
+                season = FullSeasonSimulator(self.league, teams=lineups, results_dir=Path(tmp.name))
+                season.simulate_full_season(stream_results=False)
+
+        try:
+            return _run_case("season_advanced", "seasons/s", self.n_seasons, self.repeats, setup, run)
+        finally:
+            tmp.cleanup()
+
+    def bench_load_league(self) -> BenchmarkResult:
+        """Leitura do JSON da liga e montagem das escalações (sem cache de snapshots)"""
+        from ..advanced_sim.data_loader import LeagueDataLoader
+
+        def run(loader):
+            loader.load_league_for_simulation(self.league, seed=self.seed)
+
+        return _run_case("load_league", "loads/s", 1, self.repeats, LeagueDataLoader, run)
+
+    def bench_export(self) -> BenchmarkResult:
+        """Exportação de uma temporada simulada (JSON Lines, CSVs e catálogo)"""
+        tmp = tempfile.TemporaryDirectory()
+
+        def setup():
+            random.seed(self.seed)
+            return self._season(Path(tmp.name), stream_results=True)
+
+        def run(season):
+            with contextlib.redirect_stdout(io.StringIO()):
+                season.export_results()
+
+        try:
+            return _run_case("export", "exports/s", 1, self.repeats, setup, run)
+        finally:
+            tmp.cleanup()
+
+    def run(self, only: Optional[List[str]] = None) -> Dict:
+        """Roda os casos pedidos (todos por padrão) e monta o relatório"""
+        from ..advanced_sim.simulation.advanced_match import MatchDetail
+
+        cases = {
+            "match_full": lambda: self.bench_match(MatchDetail.FULL),
+            "match_stats": lambda: self.bench_match(MatchDetail.STATS),
+            "season_simple": self.bench_season_simple,
+            "season_advanced": self.bench_season_advanced,
+            "load_league": self.bench_load_league,
+            "export": self.bench_export,
+        }
+        selected = list(only or BENCHMARKS)
+        unknown = [name for name in selected if name not in cases]
+        if unknown:
+            raise ValueError(f"Benchmark desconhecido: {', '.join(unknown)} (use {', '.join(BENCHMARKS)})")
+
+        results = [cases[name]() for name in selected]
+        return {
+            "version": BENCHMARK_VERSION,
+            "created_at": datetime.now().isoformat(),
+            "league": self.league,
+            "seed": self.seed,
+            "repeats": self.repeats,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "max_rss_kb": max_rss_kb(),
+            "benchmarks": {result.name: result.to_dict() for result in results},
+        }
+
+
+def write_report(report: Dict, output: Optional[Path] = None) -> Path:
+    """Grava o relatório em JSON (padrão: data/benchmarks/bench_<timestamp>.json)"""
+    if output is None:
+        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        output = DEFAULT_OUTPUT_DIR / f"bench_{timestamp}.json"
+    output = Path(output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    return output
+
+
+def print_report(report: Dict) -> None:
+    print(f"\n{'='*72}")
+    print(f"[BENCH] {report['league']} | Python {report['python']} | {report['repeats']} repetições")
+    print(f"{'='*72}")
+    print(f"{'Caso':<18} {'Vazão':>16} {'Melhor (s)':>12} {'Média (s)':>12} {'Pico (KB)':>10}")
+    print(f"{'-'*72}")
+    for name, case in report["benchmarks"].items():
+        rate = f"{case['rate']:.1f} {case['unit']}"
+        print(f"{name:<18} {rate:>16} {case['best_s']:>12.4f} {case['mean_s']:>12.4f} "
+              f"{case['peak_memory_kb']:>10.0f}")
+    if report["max_rss_kb"] is not None:
+        print(f"\nRSS máximo do processo: {report['max_rss_kb'] / 1024:.1f} MB")
+
+
+def main():
+    """CLI: python scripts/run_benchmarks.py [--only ...] [--output arquivo.json]"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmarks do simulador')
+    parser.add_argument('--league', default='premier_league')
+    parser.add_argument('--repeats', type=int, default=3, help='Repetições cronometradas por caso')
+    parser.add_argument('--matches', type=int, default=200, help='Partidas por repetição (match_*)')
+    parser.add_argument('--seasons', type=int, default=1, help='Temporadas por repetição (season_*)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--only', nargs='*', choices=BENCHMARKS, help='Casos a rodar (padrão: todos)')
+    parser.add_argument('--output', type=Path, default=None, help='Arquivo JSON do relatório')
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(PROJECT_ROOT / "config"))
+    import config
+
+    suite = BenchmarkSuite(
+        args.league, config.load_config(),
+        repeats=args.repeats, n_matches=args.matches, n_seasons=args.seasons, seed=args.seed
+    )
+    report = suite.run(args.only)
+    print_report(report)
+    print(f"\n📂 Relatório: {write_report(report, args.output)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -207,47 +207,29 @@ class FootballSimulatorCLI:
         print("-" * 40)
         
         try:
-            # Buscar resultados na pasta
-            results_path = Path(self.config["paths"]["results"]) / self.current_league
+            from core.results import ResultsCatalog
             
-            if not results_path.exists():
-                print("[INFO] Nenhum resultado encontrado para esta liga")
-                input("\nPressione Enter para continuar...")
-                return
-                
-            # Buscar arquivos JSON (mais informativos)
-            json_files = sorted(results_path.glob("*.json"), reverse=True)
+            # Listagem vem do catálogo, sem abrir os arquivos de resultado
+            with ResultsCatalog(self.config["paths"]["results"]) as catalog:
+                total = catalog.count(self.current_league)
+                entries = catalog.recent(self.current_league, limit=10)
             
-            if not json_files:
-                print("[INFO] Nenhum resultado em formato JSON encontrado")
+            if not entries:
+                print("[INFO] Nenhum resultado encontrado para esta liga")
                 input("\nPressione Enter para continuar...")
                 return
                 
-            print(f"Encontrados {len(json_files)} resultados:\n")
+            print(f"Encontrados {total} resultados:\n")
             
             # Mostrar últimos 10 resultados
-            for i, file in enumerate(json_files[:10], 1):
-                try:
-                    with open(file, "r", encoding="utf-8") as f:
-                        data = json.load(f)
-                        
-                    created_at = data.get("created_at", "Data não disponível")
-                    simulation_type = data.get("simulation_type", "simples")
-                    
-                    # Tentar extrair campeão
-                    champion = "N/A"
-                    if "tabela_final" in data and data["tabela_final"]:
-                        champion = data["tabela_final"][0].get("index", 
-                                   list(data["tabela_final"][0].keys())[0])
-                    
-                    print(f"{i:2}. {file.name}")
-                    print(f"    Criado em: {created_at}")
-                    print(f"    Tipo: {simulation_type.title()}")
-                    print(f"    Campeão: {champion}")
-                    print()
-                    
-                except Exception as e:
-                    print(f"{i:2}. {file.name} [ERRO: {e}]")
+            for i, entry in enumerate(entries, 1):
+                print(f"{i:2}. {entry.path.name}")
+                print(f"    Criado em: {entry.created_at or 'Data não disponível'}")
+                print(f"    Tipo: {(entry.simulation_type or 'simples').title()}")
+                print(f"    Campeão: {entry.champion or 'N/A'}")
+                if entry.top_scorer:
+                    print(f"    Artilheiro: {entry.top_scorer} ({entry.top_scorer_goals} gols)")
+                print()
                     
             # Opção de ver detalhes
             print("\nOpções:")
@@ -258,9 +240,9 @@ class FootballSimulatorCLI:
             choice = self.get_user_choice(2)
             
             if choice == 1:
-                self.view_result_details(json_files[:10])
+                self.view_result_details([entry.path for entry in entries])
             elif choice == 2:
-                self.clean_old_results(results_path)
+                self.clean_old_results(total)
                 
         except Exception as e:
             print(f"[ERROR] Erro ao buscar resultados: {e}")
@@ -277,8 +259,8 @@ class FootballSimulatorCLI:
         selected_file = files[choice - 1]
         
         try:
-            with open(selected_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            from core.results import read_results
+            data = read_results(selected_file, include_matches=False)
                 
             print(f"\n[DETALHES] {selected_file.name}")
             print("=" * 60)
@@ -314,16 +296,14 @@ class FootballSimulatorCLI:
             
         input("\nPressione Enter para continuar...")
         
-    def clean_old_results(self, results_path):
-        """Opção para limpar resultados antigos"""
+    def clean_old_results(self, total):
+        """Opção para limpar resultados antigos (consulta no catálogo)"""
         print("\n[LIMPEZA DE RESULTADOS]")
-        print(f"Pasta: {results_path}")
-        
-        files = list(results_path.glob("*"))
-        print(f"Total de arquivos: {len(files)}")
+        print(f"Liga: {self.current_league.replace('_', ' ').title()}")
+        print(f"Total de resultados: {total}")
         
-        if len(files) == 0:
-            print("[INFO] Pasta já está vazia")
+        if total == 0:
+            print("[INFO] Nenhum resultado para limpar")
             input("\nPressione Enter para continuar...")
             return
             
@@ -339,25 +319,18 @@ class FootballSimulatorCLI:
             return
             
         try:
-            if choice == 3:
-                # Limpar tudo
-                for file in files:
-                    file.unlink()
-                print(f"[SUCCESS] {len(files)} arquivos removidos")
+            from core.results import ResultsCatalog
+            
+            keep_count = {1: 5, 2: 10, 3: 0}[choice]
+            
+            if total <= keep_count:
+                print(f"[INFO] Apenas {total} resultados encontrados, mantendo todos")
             else:
-                # Manter apenas N mais recentes
-                keep_count = 5 if choice == 1 else 10
-                
-                # Ordenar por data de modificação
-                sorted_files = sorted(files, key=lambda f: f.stat().st_mtime, reverse=True)
-                
-                if len(sorted_files) <= keep_count:
-                    print(f"[INFO] Apenas {len(sorted_files)} arquivos encontrados, mantendo todos")
-                else:
-                    files_to_remove = sorted_files[keep_count:]
-                    for file in files_to_remove:
-                        file.unlink()
-                    print(f"[SUCCESS] {len(files_to_remove)} arquivos antigos removidos")
+                with ResultsCatalog(self.config["paths"]["results"]) as catalog:
+                    removed = catalog.prune(self.current_league, keep_count)
+                files_removed = sum(1 + len(entry.files) for entry in removed)
+                print(f"[SUCCESS] {len(removed)} resultados removidos ({files_removed} arquivos)")
+                if keep_count:
                     print(f"Mantidos os {keep_count} mais recentes")
                     
         except Exception as e:
@@ -1,20 +1,8 @@
-import pandas as pd
 import json
 from datetime import datetime
 import hashlib
 import pathlib
-import sys
-from pathlib import Path
 
-# Adicionar config ao path
-config_path = Path(__file__).parent.parent.parent / "config"
-sys.path.insert(0, str(config_path))
-
-from config import config
-
-# carrega dataset
-df = pd.read_csv("./data/raw/fifa25_players.csv")
-df = df.dropna(subset=["club_name", "overall_rating"])
 
 # set de ligas top 5
 top5_leagues = {
@@ -39,14 +27,128 @@ def classify_sector(positions):
     if pos in gk_pos: return "Goleiro"
     return "Outros"
 
-df["setor"] = df["positions"].apply(classify_sector)
 
-# saída organizada
-out_dir = pathlib.Path("./data/processed/leagues")
-out_dir.mkdir(exist_ok=True)
+# bloco numérico de atributos (uma linha de inteiros por jogador, 0 = ausente)
+COLUNAS_ATRIBUTOS = [
+    "idade",
+    "pace", "shooting", "passing", "dribbling", "defending", "physical", "goalkeeping",
+    "crossing", "finishing", "heading", "short_passing", "volleys", "long_passing",
+    "ball_control", "acceleration", "sprint_speed", "agility", "reactions", "balance",
+    "shot_power", "jumping", "stamina", "strength", "long_shots", "aggression",
+    "interceptions", "positioning", "vision", "penalties", "composure",
+]
+
+# colunas do CSV que alimentam cada atributo (primeira encontrada vence);
+# dribbling e goalkeeping, sem coluna própria no CSV, saem dos pesos abaixo
+CSV_ATRIBUTOS = {
+    "idade": ["age"],
+    "pace": ["pace"],
+    "shooting": ["shooting"],
+    "passing": ["passing"],
+    "defending": ["defending"],
+    "physical": ["physic", "physical"],
+    "crossing": ["crossing"],
+    "finishing": ["finishing"],
+    "heading": ["heading_accuracy", "heading"],
+    "short_passing": ["short_passing"],
+    "volleys": ["volleys"],
+    "long_passing": ["long_passing"],
+    "ball_control": ["ball_control"],
+    "acceleration": ["acceleration"],
+    "sprint_speed": ["sprint_speed"],
+    "agility": ["agility"],
+    "reactions": ["reactions"],
+    "balance": ["balance"],
+    "shot_power": ["shot_power"],
+    "jumping": ["jumping"],
+    "stamina": ["stamina"],
+    "strength": ["strength"],
+    "long_shots": ["long_shots"],
+    "aggression": ["aggression"],
+    "interceptions": ["interceptions"],
+    "positioning": ["positioning"],
+    "vision": ["vision"],
+    "penalties": ["penalties"],
+    "composure": ["composure"],
+}
+
+# pesos do FIFA para os atributos principais quando o CSV só traz os detalhados
+PESOS_PRINCIPAIS = {
+    "pace": {"acceleration": 0.45, "sprint_speed": 0.55},
+    "shooting": {"finishing": 0.45, "shot_power": 0.2, "long_shots": 0.2,
+                 "positioning": 0.05, "penalties": 0.05, "volleys": 0.05},
+    "passing": {"short_passing": 0.35, "vision": 0.2, "crossing": 0.2,
+                "long_passing": 0.15, "curve": 0.05, "fk_accuracy": 0.05},
+    "dribbling": {"dribbling": 0.5, "ball_control": 0.35, "agility": 0.1, "balance": 0.05},
+    "defending": {"defensive_awareness": 0.3, "standing_tackle": 0.3, "interceptions": 0.2,
+                  "heading_accuracy": 0.1, "sliding_tackle": 0.1},
+    "physical": {"strength": 0.5, "stamina": 0.25, "aggression": 0.2, "jumping": 0.05},
+    "goalkeeping": {"gk_diving": 0.2, "gk_handling": 0.2, "gk_kicking": 0.2,
+                    "gk_positioning": 0.2, "gk_reflexes": 0.2},
+}
+
+
+# data de referência da idade quando o CSV só traz a data de nascimento: a data de
+# atualização do próprio dataset, se houver, ou o lançamento do FC 25 (fixa, para
+# o mesmo CSV gerar sempre as mesmas idades e o mesmo hash da liga)
+COLUNAS_DATA_DATASET = ["update_as_of", "fifa_update_date"]
+DATA_REFERENCIA_IDADE = "2024-09-27"
+
+
+def _data_referencia(df):
+    import pandas as pd
+
+    for nome in COLUNAS_DATA_DATASET:
+        if nome in df.columns:
+            datas = pd.to_datetime(df[nome], errors="coerce")
+            if datas.notna().any():
+                return datas.max()
+    return pd.Timestamp(DATA_REFERENCIA_IDADE)
+
+
+def _coluna_numerica(df, nomes):
+    import pandas as pd
+
+    for nome in nomes:
+        if nome in df.columns:
+            return pd.to_numeric(df[nome], errors="coerce")
+    return None
+
+
+def extrair_atributos(df):
+    """Adiciona as colunas attr_* (bloco numérico, 0 = ausente) ao DataFrame"""
+    import pandas as pd
+
+    # toda coluna do bloco existe, mesmo sem coluna de origem nem pesos no CSV
+    for atributo in COLUNAS_ATRIBUTOS:
+        serie = _coluna_numerica(df, CSV_ATRIBUTOS.get(atributo, []))
+        df[f"attr_{atributo}"] = serie if serie is not None else float("nan")
+
+    # idade a partir da data de nascimento se o CSV não tiver a coluna age
+    if df["attr_idade"].isna().all() and "dob" in df.columns:
+        nascimento = pd.to_datetime(df["dob"], errors="coerce")
+        df["attr_idade"] = (_data_referencia(df) - nascimento).dt.days // 365
+
+    for atributo, pesos in PESOS_PRINCIPAIS.items():
+        coluna = f"attr_{atributo}"
+        if df[coluna].notna().any():
+            continue
+        presentes = {c: w for c, w in pesos.items() if c in df.columns}
+        if not presentes:
+            continue
+        total = sum(presentes.values())
+        df[coluna] = sum(pd.to_numeric(df[c], errors="coerce") * w for c, w in presentes.items()) / total
+
+    df[[f"attr_{a}" for a in COLUNAS_ATRIBUTOS]] = (
+        df[[f"attr_{a}" for a in COLUNAS_ATRIBUTOS]].fillna(0).round().astype(int)
+    )
+    return df
+
+
+def gerar_json_liga(df, liga):
+    """Monta o JSON de uma liga (médias por setor e jogadores de cada clube)"""
+    import pandas as pd
 
-# loop por liga
-for liga, fname in top5_leagues.items():
     df_liga = df[df["club_league_id"] == liga].copy()
 
     # médias por clube
@@ -73,7 +175,9 @@ for liga, fname in top5_leagues.items():
                 "peso_kg": int(row["weight_kg"]),
                 "foto": row["image"],
                 "playstyles": row["play_styles"].split(",") if pd.notna(row["play_styles"]) else [],
-                "setor": row["setor"]
+                "setor": row["setor"],
+                "posicoes": [p.strip() for p in row["positions"].split(",") if p.strip()],
+                "atributos": [int(row[f"attr_{a}"]) for a in COLUNAS_ATRIBUTOS]
             }
 
         medias = {
@@ -87,19 +191,48 @@ for liga, fname in top5_leagues.items():
 
     # metadados
     json_final = {
-        "version": "1.0.0",
+        "version": "1.1.0",
         "created_at": datetime.now().isoformat(),
         "hash": hashlib.sha256(str(times).encode()).hexdigest(),
         "liga": liga,
+        "colunas_atributos": COLUNAS_ATRIBUTOS,
         "times": times
     }
 
-    # salva
-    with open(out_dir / f"{fname}_2025.json", "w", encoding="utf-8") as f:
-        json.dump(json_final, f, ensure_ascii=False, indent=2)
+    return json_final
+
+
+def processar_dataset(csv_path="./data/raw/fifa25_players.csv", out_dir="./data/processed/leagues"):
+    """Lê o CSV do FIFA 25 e grava um JSON por liga do top 5"""
+    import pandas as pd
+
+    # carrega dataset
+    df = pd.read_csv(csv_path)
+    df = df.dropna(subset=["club_name", "overall_rating"])
+
+    df["setor"] = df["positions"].apply(classify_sector)
+    df = extrair_atributos(df)
+
+    # saída organizada
+    out_dir = pathlib.Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    # loop por liga
+    for liga, fname in top5_leagues.items():
+        json_final = gerar_json_liga(df, liga)
+
+        # salva
+        with open(out_dir / f"{fname}_2025.json", "w", encoding="utf-8") as f:
+            json.dump(json_final, f, ensure_ascii=False, indent=2)
+
+    print(f"Arquivos gerados em {out_dir}/")
 
-print("Arquivos gerados em ./data/processed/leagues/")
 
 def main():
     """Função principal para ser chamada pelos scripts."""
+    processar_dataset()
     print("✅ Processamento de dados concluído!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,25 @@
+from .montecarlo import (
+    LeagueProjection, ProjectionAccumulator, PrecisionTargets,
+    simulate_block, project_league, project_league_adaptive
+)
+from .compare import ScenarioComparison, SimpleSeasonSampler, TimestepSeasonSampler, compare_scenarios
+from .scenarios import Scenario, ScenarioSpec, ScenarioReport, TeamOverride, load_scenarios, run_scenarios
+
+__all__ = [
+    'LeagueProjection',
+    'ProjectionAccumulator',
+    'PrecisionTargets',
+    'simulate_block',
+    'project_league',
+    'project_league_adaptive',
+    'ScenarioComparison',
+    'SimpleSeasonSampler',
+    'TimestepSeasonSampler',
+    'compare_scenarios',
+    'Scenario',
+    'ScenarioSpec',
+    'ScenarioReport',
+    'TeamOverride',
+    'load_scenarios',
+    'run_scenarios'
+]
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Projeção de liga por Monte Carlo
+Simula várias temporadas e resume, por time, as chances de título, vaga na
+Champions (top 4) e rebaixamento, além dos pontos e da posição esperados.
+
+O acumulador é combinável: cada worker projeta um bloco de temporadas e os
+blocos são somados no processo principal.
+
+Sem saber quantas temporadas bastam, `project_league_adaptive` simula em
+blocos e para quando o erro padrão de cada saída pedida (chance de título,
+de rebaixamento, pontos esperados...) fica abaixo do alvo para todos os times.
+"""
+
+import math
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+
+RELEGATION_SPOTS = 3
+CHAMPIONS_SPOTS = 4
+
+
+@dataclass
+class LeagueProjection:
+    """Resumo de N temporadas simuladas de uma liga"""
+    league: str
+    mode: str
+    n_seasons: int
+    teams: List[str]
+    title_odds: Dict[str, float]
+    top4_odds: Dict[str, float]
+    relegation_odds: Dict[str, float]
+    expected_points: Dict[str, float]
+    expected_position: Dict[str, float]
+    standard_errors: Dict[str, Dict[str, float]] = field(default_factory=dict)  # saída -> time -> erro
+    converged: Optional[bool] = None     # só na projeção adaptativa
+
+    def to_rows(self) -> List[Dict]:
+        """Uma linha por time, ordenada por pontos esperados"""
+        rows = [
+            {
+                "Time": team,
+                "Pts_esperados": round(self.expected_points[team], 2),
+                "Pos_esperada": round(self.expected_position[team], 2),
+                "Titulo": round(self.title_odds[team], 4),
+                "Top4": round(self.top4_odds[team], 4),
+                "Rebaixamento": round(self.relegation_odds[team], 4),
+            }
+            for team in self.teams
+        ]
+        rows.sort(key=lambda row: row["Pts_esperados"], reverse=True)
+        return rows
+
+
+@dataclass
+class ProjectionAccumulator:
+    """Soma as tabelas finais de várias temporadas"""
+    league: str
+    mode: str = "simple"
+    n_seasons: int = 0
+    titles: Dict[str, int] = field(default_factory=dict)
+    top4: Dict[str, int] = field(default_factory=dict)
+    relegations: Dict[str, int] = field(default_factory=dict)
+    points: Dict[str, float] = field(default_factory=dict)
+    points_sq: Dict[str, float] = field(default_factory=dict)
+    positions: Dict[str, float] = field(default_factory=dict)
+
+    def add_table(self, table: List[Dict]) -> None:
+        """Acrescenta uma tabela final (linhas com 'Time' e 'P', já ordenadas)"""
+        n_teams = len(table)
+        for position, row in enumerate(table, 1):
+            team, points = row["Time"], float(row["P"])
+            self.titles[team] = self.titles.get(team, 0) + (position == 1)
+            self.top4[team] = self.top4.get(team, 0) + (position <= CHAMPIONS_SPOTS)
+            self.relegations[team] = self.relegations.get(team, 0) + (position > n_teams - RELEGATION_SPOTS)
+            self.points[team] = self.points.get(team, 0.0) + points
+            self.points_sq[team] = self.points_sq.get(team, 0.0) + points * points
+            self.positions[team] = self.positions.get(team, 0.0) + position
+        self.n_seasons += 1
+
+    def merge(self, other: "ProjectionAccumulator") -> "ProjectionAccumulator":
+        """Soma outro acumulador (de outro bloco/worker) a este"""
+        for name in ("titles", "top4", "relegations", "points", "points_sq", "positions"):
+            mine, theirs = getattr(self, name), getattr(other, name)
+            for team, value in theirs.items():
+                mine[team] = mine.get(team, 0) + value
+        self.n_seasons += other.n_seasons
+        return self
+
+    def standard_errors(self) -> Dict[str, Dict[str, float]]:
+        """Erro padrão de cada estimativa, por saída ('title', 'top4', 'relegation', 'points') e time
+
+        Nas chances usa p = (k + 1) / (n + 2), para que um time que nunca foi
+        campeão (ou sempre foi) não tenha erro zero logo nas primeiras temporadas.
+        """
+        n = self.n_seasons
+        if n < 2:
+            return {}
+
+        def proportion(counts):
+            errors = {}
+            for team, k in counts.items():
+                p = (k + 1) / (n + 2)
+                errors[team] = math.sqrt(p * (1 - p) / n)
+            return errors
+
+        points = {}
+        for team, total in self.points.items():
+            variance = max(self.points_sq[team] - total * total / n, 0.0) / (n - 1)
+            points[team] = math.sqrt(variance / n)
+        return {
+            "title": proportion(self.titles),
+            "top4": proportion(self.top4),
+            "relegation": proportion(self.relegations),
+            "points": points,
+        }
+
+    def result(self) -> LeagueProjection:
+        n = max(self.n_seasons, 1)
+        teams = list(self.points)
+        return LeagueProjection(
+            league=self.league,
+            mode=self.mode,
+            n_seasons=self.n_seasons,
+            teams=teams,
+            title_odds={t: self.titles[t] / n for t in teams},
+            top4_odds={t: self.top4[t] / n for t in teams},
+            relegation_odds={t: self.relegations[t] / n for t in teams},
+            expected_points={t: self.points[t] / n for t in teams},
+            expected_position={t: self.positions[t] / n for t in teams},
+            standard_errors=self.standard_errors(),
+        )
+
+
+@dataclass
+class PrecisionTargets:
+    """Erro padrão máximo aceito em cada saída da projeção (None desliga a saída)
+
+    Chances em fração (0.005 = meio ponto percentual) e pontos em pontos.
+    """
+    title: Optional[float] = 0.005
+    top4: Optional[float] = None
+    relegation: Optional[float] = 0.005
+    points: Optional[float] = 0.25
+
+    def items(self) -> Dict[str, float]:
+        targets = {"title": self.title, "top4": self.top4, "relegation": self.relegation, "points": self.points}
+        return {name: value for name, value in targets.items() if value is not None}
+
+    def worst(self, accumulator: ProjectionAccumulator) -> Dict[str, float]:
+        """Maior erro padrão entre os times em cada saída com alvo"""
+        errors = accumulator.standard_errors()
+        return {name: max(errors[name].values()) if errors else math.inf for name in self.items()}
+
+    def reached(self, accumulator: ProjectionAccumulator) -> bool:
+        targets = self.items()
+        return all(error <= targets[name] for name, error in self.worst(accumulator).items())
+
+
+def simulate_block(engine, league: str, n_seasons: int, mode: str = "simple",
+                   seed: Optional[int] = None) -> ProjectionAccumulator:
+    """Simula um bloco de temporadas com o SimulationEngine (sem exportar arquivos)"""
+    accumulator = ProjectionAccumulator(league, mode)
+    for i in range(n_seasons):
+        season_seed = None if seed is None else seed + i
+        result = engine.simulate_season(league, mode, seed=season_seed, export=False, use_cache=False)
+        accumulator.add_table(result.table)
+    return accumulator
+
+
+def project_league(engine, league: str, n_seasons: int, mode: str = "simple",
+                   seed: Optional[int] = None) -> LeagueProjection:
+    """Projeta a liga com N temporadas simuladas em sequência"""
+    return simulate_block(engine, league, n_seasons, mode, seed).result()
+
+
+def project_league_adaptive(engine, league: str, targets: Optional[PrecisionTargets] = None,
+                            mode: str = "simple", seed: Optional[int] = None, chunk: int = 50,
+                            min_seasons: int = 100, max_seasons: int = 20000,
+                            progress: Optional[Callable[[int, Dict[str, float]], None]] = None
+                            ) -> LeagueProjection:
+    """Projeta a liga em blocos de `chunk` temporadas até atingir os alvos de precisão
+
+    Para quando todas as saídas de `targets` estão abaixo do erro padrão pedido
+    (depois de pelo menos `min_seasons`) ou ao chegar em `max_seasons`; o campo
+    `converged` do resultado diz qual dos dois. Com seed, as temporadas usam as
+    mesmas seeds de `project_league` (seed, seed + 1, ...), então o resultado é
+    o mesmo de uma projeção fixa com o número final de temporadas.
+
+    `progress(n_temporadas, maior_erro_por_saída)` é chamado após cada bloco.
+    """
+    targets = targets or PrecisionTargets()
+    if not targets.items():
+        raise ValueError("Nenhum alvo de precisão definido")
+
+    accumulator = ProjectionAccumulator(league, mode)
+    reached = False
+    while accumulator.n_seasons < max_seasons:
+        size = min(chunk, max_seasons - accumulator.n_seasons)
+        block_seed = None if seed is None else seed + accumulator.n_seasons
+        accumulator.merge(simulate_block(engine, league, size, mode, block_seed))
+        if progress is not None:
+            progress(accumulator.n_seasons, targets.worst(accumulator))
+        if accumulator.n_seasons >= min_seasons and targets.reached(accumulator):
+            reached = True
+            break
+
+    projection = accumulator.result()
+    projection.converged = reached
+    return projection
+
+
+def main():
+    """CLI: python scripts/run_projection.py --league premier_league [--title 0.005 --points 0.25]"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Projeção Monte Carlo com parada pelos alvos de precisão')
+    parser.add_argument('--league', default='premier_league')
+    parser.add_argument('--mode', default='simple', help='Modo do SimulationEngine (simple, fitted, timestep, advanced)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--title', type=float, default=0.005, help='Erro padrão máximo da chance de título')
+    parser.add_argument('--top4', type=float, default=None, help='Erro padrão máximo da chance de top 4')
+    parser.add_argument('--relegation', type=float, default=0.005, help='Erro padrão máximo da chance de rebaixamento')
+    parser.add_argument('--points', type=float, default=0.25, help='Erro padrão máximo dos pontos esperados')
+    parser.add_argument('--chunk', type=int, default=50, help='Temporadas por bloco')
+    parser.add_argument('--max-seasons', type=int, default=20000)
+    args = parser.parse_args()
+
+    import config
+    from ..service import SimulationEngine
+
+    def report(n_seasons, worst):
+        if n_seasons % 1000 >= args.chunk:
+            return
+        errors = " | ".join(f"{name} {error:.4f}" for name, error in worst.items())
+        print(f"   {n_seasons:>6} temporadas | maior erro padrão: {errors}")
+
+    targets = PrecisionTargets(args.title, args.top4, args.relegation, args.points)
+    engine = SimulationEngine(config.load_config())
+    try:
+        projection = project_league_adaptive(engine, args.league, targets, mode=args.mode, seed=args.seed,
+                                             chunk=args.chunk, max_seasons=args.max_seasons, progress=report)
+    finally:
+        engine.shutdown()
+
+    status = "alvos atingidos" if projection.converged else "limite de temporadas"
+    print(f"\n{'='*72}")
+    print(f"[PROJEÇÃO] {args.league} ({args.mode}) | {projection.n_seasons} temporadas | {status}")
+    print(f"{'='*72}")
+    errors = projection.standard_errors
+    print(f"{'Time':<26}{'Pts':>8}{'±':>6}{'Título':>9}{'±':>7}{'Rebaix.':>9}{'±':>7}")
+    for row in projection.to_rows():
+        team = row["Time"]
+        print(f"{team:<26}{row['Pts_esperados']:>8.1f}{errors['points'][team]:>6.2f}"
+              f"{row['Titulo']:>9.1%}{errors['title'][team]:>7.1%}"
+              f"{row['Rebaixamento']:>9.1%}{errors['relegation'][team]:>7.1%}")
@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""
+Cenários "e se" sobre uma liga, descritos em YAML
+Cada cenário lista alterações por time sobre a liga base: formação
+(`TeamLineup.formation`), jogadores indisponíveis (saem do time titular para
+o melhor reserva da mesma faixa do campo) e atributos de jogadores. No
+simulador simples, que só conhece as médias dos times, a alteração é nas
+médias (`ratings`).
+
+O executor carrega a liga uma vez (escalações do cache de snapshots), simula
+a base uma vez e avalia os cenários em paralelo, um por tarefa: cada worker
+recebe a liga base no início e só aplica as alterações do seu cenário. Base e
+cenários usam os mesmos sorteios (comparação pareada, ver compare.py), e o
+resultado é uma tabela curta com a diferença de pontos, título e
+rebaixamento dos times alterados.
+"""
+
+import copy
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from .compare import (
+    ScenarioComparison, SimpleSeasonSampler, TimestepSeasonSampler,
+    observe, paired_comparison, sampling_plan,
+)
+
+
+SCENARIO_ENGINES = ("timestep", "simple")
+
+# Campos do jogador (fora de `attributes`) que um cenário pode alterar
+PLAYER_FIELDS = {
+    "overall": "current_overall",
+    "form": "current_form",
+    "morale": "morale",
+    "fitness": "fitness",
+    "injury_proneness": "injury_proneness",
+}
+
+SIMPLE_RATINGS = ("ataque", "meio", "defesa", "goleiro")
+
+
+@dataclass
+class TeamOverride:
+    """Alterações de um time num cenário"""
+    formation: Optional[str] = None                            # ex.: "4-3-3"
+    unavailable: List[str] = field(default_factory=list)       # nomes de jogadores
+    players: Dict[str, Dict[str, float]] = field(default_factory=dict)   # nome -> atributo -> valor
+    ratings: Dict[str, float] = field(default_factory=dict)    # só no simulador simples
+
+
+@dataclass
+class Scenario:
+    name: str
+    teams: Dict[str, TeamOverride]
+    description: str = ""
+
+
+@dataclass
+class ScenarioSpec:
+    """Arquivo de cenários: a liga base, como simular e a lista de cenários"""
+    league: str
+    scenarios: List[Scenario]
+    engine: str = "timestep"
+    seasons: int = 100
+    seed: Optional[int] = 42
+    chunk: int = 50
+    antithetic: Optional[bool] = None      # padrão: só no simulador simples, onde reduz a variância
+    workers: int = 1
+
+    @property
+    def use_antithetic(self) -> bool:
+        return self.engine == "simple" if self.antithetic is None else self.antithetic
+
+
+def load_scenarios(path: Path) -> ScenarioSpec:
+    """Lê e valida o YAML de cenários"""
+    import yaml
+
+    with open(path, "r", encoding="utf-8") as f:
+        data = yaml.safe_load(f) or {}
+    return parse_scenarios(data)
+
+
+def parse_scenarios(data: Dict) -> ScenarioSpec:
+    """Monta o ScenarioSpec a partir do dicionário do YAML"""
+    if "league" not in data:
+        raise ValueError("O arquivo de cenários precisa de 'league'")
+    scenarios = []
+    for name, body in (data.get("scenarios") or {}).items():
+        body = body or {}
+        teams = {}
+        for team, override in (body.get("teams") or {}).items():
+            unknown = set(override or {}) - {"formation", "unavailable", "players", "ratings"}
+            if unknown:
+                raise ValueError(f"Cenário '{name}', time '{team}': chaves desconhecidas {sorted(unknown)}")
+            override = override or {}
+            teams[team] = TeamOverride(
+                formation=override.get("formation"),
+                unavailable=list(override.get("unavailable") or []),
+                players=dict(override.get("players") or {}),
+                ratings=dict(override.get("ratings") or {}),
+            )
+        scenarios.append(Scenario(name, teams, body.get("description", "")))
+    if not scenarios:
+        raise ValueError("Nenhum cenário definido em 'scenarios'")
+
+    spec = ScenarioSpec(
+        league=data["league"],
+        scenarios=scenarios,
+        engine=data.get("engine", "timestep"),
+        seasons=int(data.get("seasons", 100)),
+        seed=data.get("seed", 42),
+        chunk=int(data.get("chunk", 50)),
+        antithetic=data.get("antithetic"),
+        workers=int(data.get("workers", 1)),
+    )
+    if spec.engine not in SCENARIO_ENGINES:
+        raise ValueError(f"Motor '{spec.engine}' inválido (use {', '.join(SCENARIO_ENGINES)})")
+    return spec
+
+
+# ----------------------------------------------------------------------
+# Aplicar alterações
+
+def _find_player(lineup, name: str, team: str):
+    players = lineup.players + lineup.substitutes
+    for player in players:
+        if player.name == name:
+            return player
+    matches = [player for player in players if name.lower() in player.name.lower()]
+    if len(matches) == 1:
+        return matches[0]
+    raise KeyError(f"Jogador '{name}' não encontrado em {team}" if not matches
+                   else f"'{name}' é ambíguo em {team}: {', '.join(p.name for p in matches)}")
+
+
+def apply_lineup_overrides(lineups: Dict, scenario: Scenario) -> Dict:
+    """Cópia das escalações com as alterações do cenário"""
+    from ..advanced_sim.stats.tatics.formations import FORMATIONS
+    from ..advanced_sim.simulation.universe import pick_matchday_squad
+
+    lineups = copy.deepcopy(lineups)
+    for team, override in scenario.teams.items():
+        if team not in lineups:
+            raise KeyError(f"Cenário '{scenario.name}': time '{team}' não está na liga")
+        if override.ratings:
+            raise ValueError(f"Cenário '{scenario.name}': 'ratings' só vale no motor simples")
+        lineup = lineups[team]
+
+        if override.formation is not None:
+            formation = next((f for f in FORMATIONS if f.value == override.formation), None)
+            if formation is None:
+                valid = ", ".join(f.value for f in FORMATIONS)
+                raise ValueError(f"Formação '{override.formation}' inválida (use {valid})")
+            lineup.formation = FORMATIONS[formation]
+
+        for name, changes in override.players.items():
+            player = _find_player(lineup, name, team)
+            for key, value in changes.items():
+                if key in PLAYER_FIELDS:
+                    setattr(player, PLAYER_FIELDS[key], value)
+                elif hasattr(player.attributes, key):
+                    setattr(player.attributes, key, value)
+                else:
+                    raise ValueError(f"Atributo '{key}' desconhecido para {player.name}")
+
+        if override.unavailable:
+            for name in override.unavailable:
+                _find_player(lineup, name, team).is_injured = True
+            pick_matchday_squad(lineup, list(lineup.players), min_fitness=0)
+    return lineups
+
+
+def apply_rating_overrides(times: Dict[str, Dict], scenario: Scenario) -> Dict[str, Dict]:
+    """Cópia das médias dos times (simulador simples) com as alterações do cenário"""
+    times = copy.deepcopy(times)
+    for team, override in scenario.teams.items():
+        if team not in times:
+            raise KeyError(f"Cenário '{scenario.name}': time '{team}' não está na liga")
+        if override.formation or override.unavailable or override.players:
+            raise ValueError(f"Cenário '{scenario.name}': o motor simples só aceita 'ratings'")
+        for key, value in override.ratings.items():
+            if key not in SIMPLE_RATINGS:
+                raise ValueError(f"Média '{key}' inválida (use {', '.join(SIMPLE_RATINGS)})")
+            times[team][key] = value
+    return times
+
+
+# ----------------------------------------------------------------------
+# Execução
+
+# Liga base de cada processo do pool (recebida uma vez pelo initializer)
+_worker_league: Optional[Dict] = None
+
+
+def _init_worker(league: Dict) -> None:
+    global _worker_league
+    _worker_league = league
+
+
+def _sampler(league: Dict, engine: str, scenario: Optional[Scenario] = None):
+    if engine == "simple":
+        times = league["times"] if scenario is None else apply_rating_overrides(league["times"], scenario)
+        return SimpleSeasonSampler(times, league["sim_config"])
+    lineups = league["lineups"] if scenario is None else apply_lineup_overrides(league["lineups"], scenario)
+    return TimestepSeasonSampler(lineups)
+
+
+def _observe_scenario(scenario: Optional[Scenario], engine: str, plan, antithetic: bool) -> Dict[str, np.ndarray]:
+    """Tarefa do pool: saídas das temporadas de um cenário (None = base)"""
+    return observe(_sampler(_worker_league, engine, scenario), plan, antithetic)
+
+
+@dataclass
+class ScenarioReport:
+    """Base e comparação de cada cenário com ela"""
+    league: str
+    engine: str
+    n_seasons: int
+    comparisons: Dict[str, ScenarioComparison]
+    scenarios: List[Scenario]
+    elapsed: float = 0.0
+
+    def to_rows(self, teams: Optional[List[str]] = None) -> List[Dict]:
+        """Tabela curta: uma linha por cenário e time (por padrão, os times alterados no cenário)"""
+        rows = []
+        for scenario in self.scenarios:
+            focus = teams or list(scenario.teams)
+            for row in self.comparisons[scenario.name].to_rows():
+                if row["Time"] in focus:
+                    rows.append({"Cenario": scenario.name, **row})
+        return rows
+
+
+def run_scenarios(spec: ScenarioSpec, engine=None, workers: Optional[int] = None) -> ScenarioReport:
+    """Simula a base e todos os cenários com os mesmos sorteios e compara
+
+    `engine` é um SimulationEngine já com a liga carregada (reaproveita as
+    escalações em memória e o cache de snapshots); sem ele, um novo é criado.
+    """
+    start = time.perf_counter()
+    workers = spec.workers if workers is None else workers
+    if engine is None:
+        import config
+        from ..service import SimulationEngine
+        engine = SimulationEngine(config.load_config())
+
+    if spec.engine == "simple":
+        league = {"times": engine.simple_teams(spec.league), "sim_config": engine.sim_config}
+    else:
+        league = {"lineups": engine.league_lineups(spec.league)}
+    teams = list(league.get("lineups") or league["times"])
+
+    antithetic = spec.use_antithetic
+    plan = sampling_plan(spec.seasons, np.random.default_rng(spec.seed), spec.chunk, antithetic)
+    n_seasons = sum(size for size, _ in plan) * (2 if antithetic else 1)
+    tasks = [None] + list(spec.scenarios)
+
+    if workers <= 1:
+        _init_worker(league)
+        observations = [_observe_scenario(task, spec.engine, plan, antithetic) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks)), initializer=_init_worker,
+                                 initargs=(league,)) as pool:
+            futures = [pool.submit(_observe_scenario, task, spec.engine, plan, antithetic) for task in tasks]
+            observations = [future.result() for future in futures]
+
+    baseline = observations[0]
+    comparisons = {
+        scenario.name: paired_comparison(teams, baseline, observed, n_seasons, True, antithetic)
+        for scenario, observed in zip(spec.scenarios, observations[1:])
+    }
+    return ScenarioReport(spec.league, spec.engine, n_seasons, comparisons, spec.scenarios,
+                          elapsed=time.perf_counter() - start)
+
+
+def main():
+    """CLI: python scripts/run_scenarios.py [config/scenarios.yaml] [--workers 4] [--seasons 200]"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Compara cenários "e se" contra a liga base')
+    parser.add_argument('spec', nargs='?', type=Path,
+                        default=Path(__file__).parents[3] / "config" / "scenarios.yaml")
+    parser.add_argument('--workers', type=int, default=None, help='Sobrepõe os workers do arquivo')
+    parser.add_argument('--seasons', type=int, default=None, help='Sobrepõe as temporadas do arquivo')
+    parser.add_argument('--teams', nargs='+', default=None, help='Times na tabela (padrão: os alterados)')
+    args = parser.parse_args()
+
+    spec = load_scenarios(args.spec)
+    if args.seasons:
+        spec.seasons = args.seasons
+    report = run_scenarios(spec, workers=args.workers)
+
+    print(f"\n{'='*102}")
+    print(f"[CENÁRIOS] {report.league} ({report.engine}) | {len(report.scenarios)} cenários | "
+          f"{report.n_seasons} temporadas pareadas | {report.elapsed:.1f}s")
+    print(f"{'='*102}")
+    print(f"{'Cenário':<28}{'Time':<24}{'Pts':>7}{'ΔPts':>8}{'±':>6}{'Título':>9}{'ΔTít.':>8}{'±':>7}"
+          f"{'ΔRebaix.':>10}{'±':>7}")
+    for row in report.to_rows(args.teams):
+        print(f"{row['Cenario']:<28}{row['Time']:<24}{row['Pts_base']:>7.1f}{row['Delta_pts']:>+8.2f}"
+              f"{row['EP_delta_pts']:>6.2f}{row['Titulo_base']:>9.1%}{row['Delta_titulo']:>+8.1%}"
+              f"{row['EP_delta_titulo']:>7.1%}{row['Delta_rebaixamento']:>+10.1%}{row['EP_delta_rebaixamento']:>7.1%}")
+    for scenario in report.scenarios:
+        if scenario.description:
+            print(f"   {scenario.name}: {scenario.description}")
+
+
+if __name__ == "__main__":
+    main()
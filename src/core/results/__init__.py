@@ -0,0 +1,18 @@
+from .sink import StreamingResultSink, find_result_files, read_results, unique_stem
+from .columnar import ColumnarDatasetWriter, list_runs, read_table
+from .catalog import CatalogEntry, ResultsCatalog
+from .cache import ResultCache, result_key
+
+__all__ = [
+    'StreamingResultSink',
+    'find_result_files',
+    'read_results',
+    'unique_stem',
+    'ColumnarDatasetWriter',
+    'list_runs',
+    'read_table',
+    'CatalogEntry',
+    'ResultsCatalog',
+    'ResultCache',
+    'result_key'
+]
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Cache de resultados endereçado por conteúdo
+Com os mesmos dados da liga, versão do motor, configuração e seed, os
+simuladores produzem a mesma temporada; este cache guarda a tabela e as
+estatísticas dos jogadores sob o SHA-256 dessas entradas, para que um pedido
+idêntico seja respondido sem simular de novo.
+
+O cache é limitado em bytes; ao passar do limite, as entradas usadas há mais
+tempo (mtime, atualizado a cada leitura) são removidas.
+
+Layout:
+    <cache_dir>/<chave[:2]>/<chave>.json
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, Optional
+
+
+DEFAULT_CACHE_DIR = Path(__file__).parents[3] / "data" / "cache" / "results"
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def result_key(league: str, data_hash: str, engine_version: str, mode: str,
+               config: Dict, seed: int) -> str:
+    """Chave do resultado: SHA-256 das entradas em JSON canônico"""
+    payload = {
+        "league": league,
+        "data_hash": data_hash,
+        "engine_version": engine_version,
+        "mode": mode,
+        "config": config,
+        "seed": seed,
+    }
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """Cache LRU em disco de resultados de temporadas"""
+
+    def __init__(self, cache_dir: Optional[Path] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = Path(cache_dir or DEFAULT_CACHE_DIR)
+        self.max_bytes = max_bytes
+
+    @classmethod
+    def from_config(cls, cache_config: Optional[Dict]) -> Optional["ResultCache"]:
+        """Cache a partir da seção `cache` do config.yaml (None se desligado)"""
+        cache_config = cache_config or {}
+        if not cache_config.get("enabled", True):
+            return None
+        return cls(
+            cache_config.get("results_dir"),
+            max_bytes=int(cache_config.get("max_mb", DEFAULT_MAX_BYTES // (1024 * 1024))) * 1024 * 1024
+        )
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Resultado guardado sob a chave (None se não existir)"""
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                payload = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        # Marca a entrada como usada agora (ordem do LRU)
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return payload
+
+    def put(self, key: str, payload: Dict) -> Path:
+        """Grava o resultado de forma atômica e aplica o limite de tamanho"""
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False, separators=(",", ":"), default=str)
+        os.replace(tmp, path)
+
+        self.evict()
+        return path
+
+    def size(self) -> int:
+        return sum(entry.stat().st_size for entry in self.cache_dir.glob("*/*.json"))
+
+    def evict(self) -> int:
+        """Remove as entradas menos usadas até caber no limite; retorna quantas saíram"""
+        entries = []
+        total = 0
+        for entry in self.cache_dir.glob("*/*.json"):
+            stat = entry.stat()
+            entries.append((stat.st_mtime, stat.st_size, entry))
+            total += stat.st_size
+
+        removed = 0
+        for _, size, entry in sorted(entries, key=lambda item: item[0]):
+            if total <= self.max_bytes:
+                break
+            entry.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        return removed
+
+    def clear(self) -> None:
+        for entry in self.cache_dir.glob("*/*.json"):
+            entry.unlink()
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Catálogo dos resultados exportados
+Índice SQLite atualizado a cada exportação com os metadados de cada execução
+(liga, data, tipo, campeão, artilheiro, hash e arquivos), para que listar,
+filtrar e limpar resultados antigos sejam consultas no índice em vez de abrir
+cada arquivo de resultado.
+
+O catálogo fica em <pasta de resultados>/catalog.sqlite e guarda os caminhos
+relativos a essa pasta. Ao ser criado, é preenchido com os arquivos já
+existentes.
+"""
+
+import json
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+
+from .sink import find_result_files, read_results
+
+
+CATALOG_FILENAME = "catalog.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    league TEXT NOT NULL,
+    created_at TEXT,
+    simulation_type TEXT,
+    champion TEXT,
+    top_scorer TEXT,
+    top_scorer_goals INTEGER,
+    hash TEXT,
+    path TEXT NOT NULL UNIQUE,
+    files TEXT NOT NULL DEFAULT '[]'
+);
+CREATE INDEX IF NOT EXISTS idx_results_league ON results (league, id);
+"""
+
+
+@dataclass
+class CatalogEntry:
+    """Uma execução registrada no catálogo"""
+    id: int
+    league: str
+    created_at: Optional[str]
+    simulation_type: Optional[str]
+    champion: Optional[str]
+    top_scorer: Optional[str]
+    top_scorer_goals: Optional[int]
+    hash: Optional[str]
+    path: Path
+    files: List[Path]
+
+
+class ResultsCatalog:
+    """Índice das execuções exportadas em uma pasta de resultados"""
+
+    def __init__(self, results_dir: Path):
+        self.results_dir = Path(results_dir)
+        self.results_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.results_dir / CATALOG_FILENAME
+
+        is_new = not self.db_path.exists()
+        self._conn = sqlite3.connect(self.db_path)
+        self._conn.executescript(_SCHEMA)
+        if is_new:
+            self.rebuild()
+
+    def close(self):
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _relative(self, path: Path) -> str:
+        path = Path(path).resolve()
+        try:
+            return path.relative_to(self.results_dir.resolve()).as_posix()
+        except ValueError:
+            return str(path)
+
+    def add(self, league: str, path: Path, created_at: Optional[str] = None,
+            simulation_type: Optional[str] = None, champion: Optional[str] = None,
+            top_scorer: Optional[str] = None, top_scorer_goals: Optional[int] = None,
+            hash: Optional[str] = None, extra_files: Optional[List[Path]] = None) -> int:
+        """Registra uma execução exportada; retorna o id no catálogo
+
+        Um arquivo já registrado é atualizado e mantém o id (a ordem e a retenção não mudam).
+        """
+        files = [self._relative(file) for file in (extra_files or [])]
+        with self._conn:
+            cursor = self._conn.execute(
+                "INSERT INTO results (league, created_at, simulation_type, champion, "
+                "top_scorer, top_scorer_goals, hash, path, files) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(path) DO UPDATE SET league = excluded.league, created_at = excluded.created_at, "
+                "simulation_type = excluded.simulation_type, champion = excluded.champion, "
+                "top_scorer = excluded.top_scorer, top_scorer_goals = excluded.top_scorer_goals, "
+                "hash = excluded.hash, files = excluded.files "
+                "RETURNING id",
+                (league, created_at, simulation_type, champion, top_scorer, top_scorer_goals,
+                 hash, self._relative(path), json.dumps(files))
+            )
+            return cursor.fetchone()[0]
+
+    def add_from_file(self, league: str, path: Path, extra_files: Optional[List[Path]] = None) -> int:
+        """Registra um arquivo de resultado lendo seus metadados (.jsonl ou .json)"""
+        data = read_results(path, include_matches=False)
+        summary = data.get("summary", {})
+
+        champion = summary.get("champion")
+        if champion is None and data.get("tabela_final"):
+            first = data["tabela_final"][0]
+            champion = first.get("Time", first.get("index"))
+
+        return self.add(
+            league, path,
+            created_at=data.get("created_at"),
+            simulation_type=data.get("simulation_type", "simple"),
+            champion=champion,
+            top_scorer=summary.get("top_scorer"),
+            top_scorer_goals=summary.get("top_scorer_goals"),
+            hash=data.get("hash"),
+            extra_files=extra_files
+        )
+
+    def rebuild(self) -> int:
+        """Refaz o índice a partir dos arquivos da pasta de resultados"""
+        with self._conn:
+            self._conn.execute("DELETE FROM results")
+
+        count = 0
+        for league_dir in sorted(p for p in self.results_dir.iterdir() if p.is_dir()):
+            # Do mais antigo para o mais recente, para que o id siga a ordem cronológica
+            for file in reversed(find_result_files(league_dir)):
+                extra_files = [f for f in league_dir.glob(f"{file.stem}_*") if f != file]
+                extra_files += [f for f in league_dir.glob(f"{file.stem}.csv")]
+                try:
+                    self.add_from_file(league_dir.name, file, extra_files)
+                    count += 1
+                except (OSError, ValueError, KeyError):
+                    continue
+        return count
+
+    def _entry(self, row) -> CatalogEntry:
+        values = list(row)
+        values[8] = self.results_dir / values[8]
+        values[9] = [self.results_dir / file for file in json.loads(values[9])]
+        return CatalogEntry(*values)
+
+    def recent(self, league: Optional[str] = None, simulation_type: Optional[str] = None,
+               limit: Optional[int] = 10) -> List[CatalogEntry]:
+        """Execuções mais recentes primeiro, com filtros opcionais"""
+        query = "SELECT * FROM results"
+        conditions, params = [], []
+        if league is not None:
+            conditions.append("league = ?")
+            params.append(league)
+        if simulation_type is not None:
+            conditions.append("simulation_type = ?")
+            params.append(simulation_type)
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY id DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        return [self._entry(row) for row in self._conn.execute(query, params)]
+
+    def latest(self, league: Optional[str] = None) -> Optional[CatalogEntry]:
+        """Execução mais recente (da liga, se informada)"""
+        entries = self.recent(league, limit=1)
+        return entries[0] if entries else None
+
+    def count(self, league: Optional[str] = None) -> int:
+        if league is None:
+            return self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        return self._conn.execute("SELECT COUNT(*) FROM results WHERE league = ?", (league,)).fetchone()[0]
+
+    def prune(self, league: str, keep: int) -> List[CatalogEntry]:
+        """Remove do disco e do índice as execuções além das `keep` mais recentes"""
+        rows = self._conn.execute(
+            "SELECT * FROM results WHERE league = ? ORDER BY id DESC LIMIT -1 OFFSET ?",
+            (league, keep)
+        ).fetchall()
+        removed = [self._entry(row) for row in rows]
+
+        for entry in removed:
+            for file in [entry.path, *entry.files]:
+                file.unlink(missing_ok=True)
+
+        with self._conn:
+            self._conn.executemany("DELETE FROM results WHERE id = ?", [(entry.id,) for entry in removed])
+        return removed
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Dataset colunar dos resultados das simulações
+Cada execução grava suas tabelas (partidas, classificação, jogadores) em
+arquivos colunares numa árvore só de acréscimo, particionada por liga e
+execução no estilo Hive, para que análises sobre milhares de execuções leiam
+apenas as colunas necessárias em vez de reinterpretar JSON.
+
+Layout:
+    <dataset_dir>/league=<liga>/run=<id>/matches.npz
+    <dataset_dir>/league=<liga>/run=<id>/table.npz
+    <dataset_dir>/league=<liga>/run=<id>/players.npz
+
+Formatos:
+    npz      -> um array NumPy por coluna (np.load só descomprime as colunas lidas)
+    parquet  -> requer pyarrow; a árvore pode ser lida com pyarrow.dataset
+                (sem pyarrow instalado, grava npz com um aviso)
+"""
+
+import importlib.util
+import os
+import warnings
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+
+COLUMNAR_FORMATS = ("npz", "parquet")
+
+
+def rows_to_columns(rows: List[Dict]) -> Dict[str, np.ndarray]:
+    """Converte linhas (dicionários com as mesmas chaves) em arrays por coluna"""
+    if not rows:
+        return {}
+
+    columns = {}
+    for name in rows[0]:
+        values = [row[name] for row in rows]
+        if all(isinstance(v, str) or v is None for v in values):
+            columns[name] = np.array(["" if v is None else v for v in values], dtype=str)
+        else:
+            columns[name] = np.asarray(values)
+    return columns
+
+
+class ColumnarDatasetWriter:
+    """Grava as tabelas de uma execução no dataset colunar (só acréscimo)"""
+
+    def __init__(self, dataset_dir: Path, fmt: str = "npz"):
+        if fmt not in COLUMNAR_FORMATS:
+            raise ValueError(f"Formato colunar desconhecido: {fmt} (use {', '.join(COLUMNAR_FORMATS)})")
+        # Avisa já na criação (o simulador cria o escritor antes da temporada), não na exportação
+        if fmt == "parquet" and importlib.util.find_spec("pyarrow") is None:
+            warnings.warn("Formato 'parquet' requer pyarrow (pip install pyarrow); gravando npz", RuntimeWarning)
+            fmt = "npz"
+        self.dataset_dir = Path(dataset_dir)
+        self.fmt = fmt
+
+    def run_dir(self, league: str, run_id: str) -> Path:
+        return self.dataset_dir / f"league={league}" / f"run={run_id}"
+
+    def write_run(self, league: str, run_id: str, tables: Dict[str, List[Dict]]) -> Path:
+        """Grava as tabelas de uma execução; execuções já gravadas não são sobrescritas"""
+        target = self.run_dir(league, run_id)
+        if target.exists():
+            raise FileExistsError(f"Execução já existe no dataset: {target}")
+
+        tmp = target.parent / f".run={run_id}.{os.getpid()}.tmp"
+        tmp.mkdir(parents=True, exist_ok=True)
+
+        for name, rows in tables.items():
+            columns = rows_to_columns(rows)
+            if self.fmt == "npz":
+                np.savez_compressed(tmp / f"{name}.npz", **columns)
+            else:
+                self._write_parquet(tmp / f"{name}.parquet", columns)
+
+        os.replace(tmp, target)
+        return target
+
+    @staticmethod
+    def _write_parquet(path: Path, columns: Dict[str, np.ndarray]) -> None:
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError("Formato 'parquet' requer pyarrow (pip install pyarrow)") from e
+
+        pq.write_table(pa.table({name: pa.array(values) for name, values in columns.items()}), path)
+
+
+def list_runs(dataset_dir: Path, league: Optional[str] = None) -> List[Path]:
+    """Diretórios das execuções do dataset (opcionalmente de uma liga), em ordem"""
+    pattern = f"league={league or '*'}/run=*"
+    return sorted(path for path in Path(dataset_dir).glob(pattern) if path.is_dir())
+
+
+def read_table(dataset_dir: Path, table: str, columns: Optional[Iterable[str]] = None,
+               league: Optional[str] = None) -> Dict[str, np.ndarray]:
+    """Concatena uma tabela de todas as execuções lendo só as colunas pedidas
+
+    As colunas de partição `league` e `run` são adicionadas ao resultado.
+    """
+    parts: Dict[str, List[np.ndarray]] = {}
+
+    for run_path in list_runs(dataset_dir, league):
+        npz_path = run_path / f"{table}.npz"
+        parquet_path = run_path / f"{table}.parquet"
+
+        if npz_path.exists():
+            with np.load(npz_path) as data:
+                names = list(columns) if columns is not None else list(data.files)
+                loaded = {name: data[name] for name in names}
+        elif parquet_path.exists():
+            import pyarrow.parquet as pq
+            arrow_table = pq.read_table(parquet_path, columns=list(columns) if columns is not None else None)
+            loaded = {name: arrow_table.column(name).to_numpy() for name in arrow_table.column_names}
+        else:
+            continue
+
+        n_rows = len(next(iter(loaded.values()))) if loaded else 0
+        loaded["league"] = np.full(n_rows, run_path.parent.name.split("=", 1)[1])
+        loaded["run"] = np.full(n_rows, run_path.name.split("=", 1)[1])
+
+        for name, values in loaded.items():
+            parts.setdefault(name, []).append(values)
+
+    return {name: np.concatenate(values) for name, values in parts.items()}
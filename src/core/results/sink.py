@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Escrita incremental dos resultados de uma simulação
+Cada registro é uma linha JSON compacta (JSON Lines) gravada enquanto a
+temporada roda; o SHA-256 é calculado sobre o próprio fluxo. As visões
+derivadas (top 10 artilheiros/assistências) guardam apenas referências às
+linhas de jogadores, sem duplicar os dados.
+
+Formato do arquivo (.jsonl), um objeto por linha:
+    {"type": "header", ...}                       metadados da simulação
+    {"type": "match", "id": 0, "home": ...}       uma linha por partida
+    {"type": "table", "id": 0, "Time": ...}       uma linha por time
+    {"type": "player", "id": 0, "Nome": ...}      uma linha por jogador
+    {"type": "view", "name": ..., "refs": [...]}  visões derivadas
+    {"type": "summary", ...}                      resumo final
+    {"type": "footer", "hash": "sha256:..."}      hash de todas as linhas anteriores
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+
+FORMAT_VERSION = "3.0.0"
+
+
+class StreamingResultSink:
+    """Grava os resultados linha a linha e calcula o hash incrementalmente"""
+
+    def __init__(self, path: Path, header: Dict):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._file = open(self.path, "w", encoding="utf-8")
+        self._hash = hashlib.sha256()
+        self._counters: Dict[str, int] = {}
+        self.lines = 0
+        self.hash_value: Optional[str] = None
+
+        self.write("header", {"version": FORMAT_VERSION, **header})
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if not self.closed:
+            self.close()
+
+    @property
+    def closed(self) -> bool:
+        return self._file.closed
+
+    def write(self, record_type: str, payload: Dict) -> None:
+        """Grava um registro e atualiza o hash"""
+        line = json.dumps({"type": record_type, **payload}, ensure_ascii=False, separators=(",", ":")) + "\n"
+        self._file.write(line)
+        self._hash.update(line.encode("utf-8"))
+        self.lines += 1
+
+    def _write_numbered(self, record_type: str, payload: Dict) -> int:
+        """Grava um registro com id sequencial por tipo e retorna o id"""
+        record_id = self._counters.get(record_type, 0)
+        self._counters[record_type] = record_id + 1
+        self.write(record_type, {"id": record_id, **payload})
+        return record_id
+
+    def write_match(self, home_team: str, away_team: str, home_goals: int, away_goals: int, **stats) -> int:
+        """Grava o resultado de uma partida assim que ela termina"""
+        return self._write_numbered("match", {
+            "home": home_team,
+            "away": away_team,
+            "hg": int(home_goals),
+            "ag": int(away_goals),
+            **stats
+        })
+
+    def write_rows(self, record_type: str, rows: Iterable[Dict]) -> List[int]:
+        """Grava uma sequência de linhas (tabela, jogadores) e retorna seus ids"""
+        return [self._write_numbered(record_type, row) for row in rows]
+
+    def write_view(self, name: str, refs: List[int], ref_type: str = "player") -> None:
+        """Grava uma visão derivada como lista de ids de outro tipo de registro"""
+        self.write("view", {"name": name, "ref_type": ref_type, "refs": list(refs)})
+
+    def close(self, summary: Optional[Dict] = None) -> str:
+        """Grava resumo e rodapé com o hash; retorna o hash hexadecimal"""
+        if summary is not None:
+            self.write("summary", summary)
+
+        self.hash_value = self._hash.hexdigest()
+        footer = {"type": "footer", "hash": f"sha256:{self.hash_value}", "lines": self.lines}
+        self._file.write(json.dumps(footer, separators=(",", ":")) + "\n")
+        self._file.close()
+        return self.hash_value
+
+
+def unique_stem(directory: Path, stem: str) -> str:
+    """Nome-base ainda não usado na pasta (acrescenta -1, -2... se a execução
+    cair no mesmo segundo de outra)"""
+    directory = Path(directory)
+    candidate, n = stem, 0
+    while any(directory.glob(f"{candidate}.*")) or any(directory.glob(f"{candidate}_*")):
+        n += 1
+        candidate = f"{stem}-{n}"
+    return candidate
+
+
+def find_result_files(results_path: Path) -> List[Path]:
+    """Arquivos de resultados de uma pasta (.jsonl e .json antigos), mais recentes primeiro"""
+    results_path = Path(results_path)
+    files = list(results_path.glob("*.jsonl")) + list(results_path.glob("*.json"))
+    return sorted(files, key=lambda file: file.stem, reverse=True)
+
+
+def read_results(path: Path, include_matches: bool = True) -> Dict:
+    """Lê um arquivo de resultados (.jsonl ou o .json antigo) como dicionário
+
+    As visões são resolvidas para as linhas referenciadas, então o formato
+    retornado é o mesmo do JSON antigo (summary, tabela_final, top_10_*).
+    """
+    path = Path(path)
+    if path.suffix == ".json":
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    data: Dict = {"tabela_final": [], "estatisticas_jogadores": []}
+    matches = []
+    views = []
+    digest = hashlib.sha256()
+
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            record = json.loads(line)
+            record_type = record.pop("type")
+
+            if record_type == "footer":
+                data["hash"] = record["hash"]
+                data["hash_ok"] = record["hash"] == f"sha256:{digest.hexdigest()}"
+                break
+
+            digest.update(line.encode("utf-8"))
+
+            if record_type == "header":
+                data.update(record)
+            elif record_type == "match":
+                if include_matches:
+                    matches.append(record)
+            elif record_type == "table":
+                record.pop("id")
+                data["tabela_final"].append(record)
+            elif record_type == "player":
+                record.pop("id")
+                data["estatisticas_jogadores"].append(record)
+            elif record_type == "view":
+                views.append(record)
+            elif record_type == "summary":
+                data["summary"] = record
+
+    targets = {"player": data["estatisticas_jogadores"], "table": data["tabela_final"]}
+    for view in views:
+        rows = targets.get(view["ref_type"], [])
+        data[view["name"]] = [rows[i] for i in view["refs"]]
+
+    if include_matches:
+        data["partidas"] = matches
+
+    return data
@@ -0,0 +1,7 @@
+from .engine import SimulationEngine, SeasonResult, SIMULATION_MODES
+
+__all__ = [
+    'SimulationEngine',
+    'SeasonResult',
+    'SIMULATION_MODES'
+]
@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+API HTTP local de simulação (extra `web`: fastapi + uvicorn)
+Um único processo servidor mantém as ligas carregadas e um pool de processos
+já aquecido (cada worker tem seu próprio SimulationEngine com as ligas
+pré-carregadas), para que Streamlit, CLI e outras ferramentas compartilhem o
+mesmo backend em vez de iniciar um Python novo por pedido.
+
+Endpoints:
+    GET  /health                   estado do servidor e do pool
+    GET  /leagues                  ligas disponíveis
+    POST /simulate/match           uma partida (responde direto)
+    POST /simulate/season          uma temporada (?async=true devolve um job)
+    POST /projection               projeção Monte Carlo (sempre um job)
+    GET  /jobs/{job_id}            estado/resultado de um job
+"""
+
+import asyncio
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from dataclasses import asdict
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .engine import SimulationEngine, SIMULATION_MODES
+
+
+DEFAULT_BLOCK_SIZE = 10  # temporadas por tarefa de projeção
+
+# Jobs concluídos ficam consultáveis por JOB_TTL segundos; o registro guarda no máximo MAX_JOBS
+JOB_TTL = 3600.0
+MAX_JOBS = 1000
+
+# Motor de cada processo do pool (criado pelo initializer)
+_worker_engine: Optional[SimulationEngine] = None
+
+
+def _init_worker(config: Dict, leagues: List[str]) -> None:
+    global _worker_engine
+    _worker_engine = SimulationEngine(config)
+    _worker_engine.preload(leagues)
+
+
+def _ping() -> bool:
+    return _worker_engine is not None
+
+
+def _run_season(league: str, mode: str, seed: Optional[int], export: bool) -> Dict:
+    return season_to_dict(_worker_engine.simulate_season(league, mode, seed=seed, export=export))
+
+
+def _run_projection_block(league: str, n_seasons: int, mode: str, seed: Optional[int]):
+    from ..projection import simulate_block
+    return simulate_block(_worker_engine, league, n_seasons, mode, seed)
+
+
+def season_to_dict(result) -> Dict:
+    """SeasonResult em formato JSON (caminhos como texto, sem o log)"""
+    data = asdict(result)
+    data["files"] = {key: str(path) for key, path in result.files.items()}
+    data.pop("log")
+    return data
+
+
+def match_to_dict(result, player_names: Dict[str, str]) -> Dict:
+    """Resumo de um AdvancedMatchResult em formato JSON"""
+    scorers = {"home": [], "away": []}
+    for side, performances in (("home", result.home_performances), ("away", result.away_performances)):
+        for player_id, performance in performances.items():
+            if performance.goals:
+                scorers[side].append({
+                    "player": player_names.get(player_id, player_id),
+                    "goals": performance.goals
+                })
+
+    return {
+        "home_team": result.home_team,
+        "away_team": result.away_team,
+        "home_goals": result.home_goals,
+        "away_goals": result.away_goals,
+        "home_formation": result.home_formation.value,
+        "away_formation": result.away_formation.value,
+        "home_shots": result.home_shots,
+        "away_shots": result.away_shots,
+        "home_shots_on_target": result.home_shots_on_target,
+        "away_shots_on_target": result.away_shots_on_target,
+        "home_possession": round(result.home_possession, 1),
+        "away_possession": round(result.away_possession, 1),
+        "scorers": scorers,
+    }
+
+
+class Job:
+    """Trabalho assíncrono formado por uma ou mais tarefas no pool"""
+
+    def __init__(self, kind: str, futures: List[Future], combine):
+        self.id = uuid.uuid4().hex[:12]
+        self.kind = kind
+        self.futures = futures
+        self._combine = combine
+        self._result = None
+        self.created = time.monotonic()
+
+    @property
+    def progress(self) -> float:
+        return sum(future.done() for future in self.futures) / len(self.futures)
+
+    @property
+    def finished(self) -> bool:
+        return all(future.done() for future in self.futures)
+
+    def status(self) -> Dict:
+        if not self.finished:
+            return {"id": self.id, "kind": self.kind, "status": "running", "progress": round(self.progress, 3)}
+
+        # exception() de um Future cancelado levanta CancelledError
+        if any(future.cancelled() for future in self.futures):
+            return {"id": self.id, "kind": self.kind, "status": "cancelled"}
+
+        errors = [future.exception() for future in self.futures if future.exception() is not None]
+        if errors:
+            return {"id": self.id, "kind": self.kind, "status": "error", "error": str(errors[0])}
+
+        if self._result is None:
+            self._result = self._combine([future.result() for future in self.futures])
+        return {"id": self.id, "kind": self.kind, "status": "done", "progress": 1.0, "result": self._result}
+
+
+class SimulationService:
+    """Pool de processos aquecido + motor local + registro de jobs"""
+
+    def __init__(self, config: Optional[Dict] = None, leagues: Optional[List[str]] = None,
+                 workers: int = 2, job_ttl: float = JOB_TTL, max_jobs: int = MAX_JOBS):
+        self.config = config or {}
+        self.engine = SimulationEngine(self.config)
+        self.leagues = leagues or self.engine.available_leagues()
+        self.workers = workers
+        self.pool: Optional[ProcessPoolExecutor] = None
+        self.jobs: Dict[str, Job] = {}
+        # Endpoints síncronos rodam em threads do FastAPI: o registro só é lido e alterado com a trava
+        self._jobs_lock = threading.Lock()
+        self.job_ttl = job_ttl
+        self.max_jobs = max_jobs
+
+    def start(self) -> None:
+        """Carrega as ligas no processo principal e aquece todos os workers"""
+        self.engine.preload(self.leagues)
+        self.pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(self.config, self.leagues)
+        )
+        for future in [self.pool.submit(_ping) for _ in range(self.workers)]:
+            future.result()
+
+    def stop(self) -> None:
+        if self.pool is not None:
+            self.pool.shutdown(cancel_futures=True)
+        self.engine.shutdown(wait=False)
+
+    def prune_jobs(self) -> int:
+        """Remove os jobs concluídos há mais de `job_ttl` e, acima de `max_jobs`, os concluídos mais antigos
+
+        Jobs ainda rodando nunca saem; retorna quantos foram removidos.
+        """
+        with self._jobs_lock:
+            return self._prune_jobs()
+
+    def _prune_jobs(self) -> int:
+        expired = time.monotonic() - self.job_ttl
+        finished = [job_id for job_id, job in self.jobs.items() if job.finished]
+        removed = [job_id for job_id in finished if self.jobs[job_id].created < expired]
+        excess = len(self.jobs) - len(removed) - self.max_jobs + 1
+        removed += [job_id for job_id in finished if job_id not in removed][:max(excess, 0)]
+        for job_id in removed:
+            del self.jobs[job_id]
+        return len(removed)
+
+    def _add_job(self, job: Job) -> Job:
+        with self._jobs_lock:
+            self._prune_jobs()
+            self.jobs[job.id] = job
+        return job
+
+    def get_job(self, job_id: str) -> Optional[Job]:
+        with self._jobs_lock:
+            return self.jobs.get(job_id)
+
+    def job_count(self) -> int:
+        with self._jobs_lock:
+            return len(self.jobs)
+
+    def submit_season(self, league: str, mode: str, seed: Optional[int], export: bool) -> Job:
+        future = self.pool.submit(_run_season, league, mode, seed, export)
+        return self._add_job(Job("season", [future], lambda results: results[0]))
+
+    def submit_projection(self, league: str, n_seasons: int, mode: str, seed: Optional[int],
+                          block_size: int = DEFAULT_BLOCK_SIZE) -> Job:
+        """Divide as temporadas em blocos entre os workers e combina no fim"""
+        futures = []
+        for start in range(0, n_seasons, block_size):
+            size = min(block_size, n_seasons - start)
+            block_seed = None if seed is None else seed + start
+            futures.append(self.pool.submit(_run_projection_block, league, size, mode, block_seed))
+
+        def combine(blocks):
+            total = blocks[0]
+            for block in blocks[1:]:
+                total.merge(block)
+            return {"league": league, "mode": mode, "n_seasons": total.n_seasons,
+                    "table": total.result().to_rows()}
+
+        return self._add_job(Job("projection", futures, combine))
+
+
+def create_app(service: SimulationService):
+    """Monta a aplicação FastAPI sobre o serviço"""
+    try:
+        from fastapi import FastAPI, HTTPException, Query
+        from pydantic import BaseModel
+    except ImportError as e:
+        raise ImportError("A API requer o extra 'web' (pip install fastapi uvicorn)") from e
+
+    class MatchRequest(BaseModel):
+        league: str
+        home_team: str
+        away_team: str
+        seed: Optional[int] = None
+
+    class SeasonRequest(BaseModel):
+        league: str
+        mode: str = "advanced"
+        seed: Optional[int] = None
+        export: bool = False
+
+    class ProjectionRequest(BaseModel):
+        league: str
+        n_seasons: int = 100
+        mode: str = "simple"
+        seed: Optional[int] = None
+
+    @asynccontextmanager
+    async def lifespan(app):
+        service.start()
+        try:
+            yield
+        finally:
+            service.stop()
+
+    app = FastAPI(title="Simulador de Ligas", version="1.0.0", lifespan=lifespan)
+
+    def check_request(league: str, mode: Optional[str] = None):
+        if league not in service.leagues:
+            raise HTTPException(404, f"Liga '{league}' não carregada ({', '.join(service.leagues)})")
+        if mode is not None and mode not in SIMULATION_MODES:
+            raise HTTPException(422, f"Modo desconhecido: {mode}")
+
+    @app.get("/health")
+    def health():
+        return {"status": "ok", "workers": service.workers, "leagues": service.leagues,
+                "jobs": service.job_count()}
+
+    @app.get("/leagues")
+    def leagues():
+        return {"leagues": service.leagues}
+
+    @app.post("/simulate/match")
+    def simulate_match(request: MatchRequest):
+        check_request(request.league)
+        try:
+            result = service.engine.simulate_match(
+                request.league, request.home_team, request.away_team, seed=request.seed
+            )
+        except KeyError as e:
+            raise HTTPException(404, str(e))
+        return match_to_dict(result, service.engine.player_names(request.league))
+
+    @app.post("/simulate/season")
+    async def simulate_season(request: SeasonRequest, run_async: bool = Query(False, alias="async")):
+        check_request(request.league, request.mode)
+        job = service.submit_season(request.league, request.mode, request.seed, request.export)
+        if run_async:
+            return {"job_id": job.id, "status_url": f"/jobs/{job.id}"}
+        return await asyncio.wrap_future(job.futures[0])
+
+    @app.post("/projection")
+    def projection(request: ProjectionRequest):
+        check_request(request.league, request.mode)
+        if request.n_seasons < 1:
+            raise HTTPException(422, "n_seasons deve ser positivo")
+        job = service.submit_projection(request.league, request.n_seasons, request.mode, request.seed)
+        return {"job_id": job.id, "status_url": f"/jobs/{job.id}"}
+
+    @app.get("/jobs/{job_id}")
+    def job_status(job_id: str):
+        job = service.get_job(job_id)
+        if job is None:
+            raise HTTPException(404, f"Job '{job_id}' não encontrado")
+        return job.status()
+
+    return app
+
+
+def main():
+    """Sobe o servidor local com uvicorn"""
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description='API local de simulação')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--workers', type=int, default=2, help='Processos no pool de simulação')
+    parser.add_argument('--leagues', nargs='*', default=None, help='Ligas pré-carregadas (padrão: todas)')
+    args = parser.parse_args()
+
+    try:
+        import uvicorn
+    except ImportError:
+        print("[ERROR] A API requer o extra 'web' (pip install fastapi uvicorn)")
+        sys.exit(1)
+
+    sys.path.insert(0, str(Path(__file__).parents[3] / "config"))
+    import config
+
+    service = SimulationService(config.load_config(), leagues=args.leagues, workers=args.workers)
+    uvicorn.run(create_app(service), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
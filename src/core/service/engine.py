@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+"""
+Serviço de simulação em processo
+Mantém as ligas carregadas entre execuções e roda as temporadas num worker em
+segundo plano, devolvendo os resultados como objetos. Usado pela interface
+Streamlit no lugar de iniciar um novo interpretador a cada simulação.
+"""
+
+import copy
+import io
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+# "timestep" é o motor avançado com as partidas simuladas em lote (TimeSteppedMatchEngine);
+# "fitted" sorteia os placares do modelo Dixon–Coles ajustado (simple/dixon_coles.py)
+SIMULATION_MODES = ("advanced", "simple", "timestep", "fitted")
+
+
+@dataclass
+class SeasonResult:
+    """Resultado de uma temporada simulada pelo serviço"""
+    league: str
+    simulation_type: str
+    table: List[Dict]
+    players: List[Dict] = field(default_factory=list)
+    summary: Dict = field(default_factory=dict)
+    files: Dict[str, Path] = field(default_factory=dict)
+    hash: Optional[str] = None
+    log: str = ""
+    elapsed: float = 0.0
+    cached: bool = False
+
+    @property
+    def top_scorers(self) -> List[Dict]:
+        return self.players[:10]
+
+
+class SimulationEngine:
+    """Motor de simulação de vida longa com ligas em memória
+
+    As escalações de cada liga são carregadas uma vez (a partir do cache de
+    snapshots) e copiadas a cada temporada, então execuções seguidas não
+    relêem o JSON. As temporadas rodam em um único worker; a saída de texto
+    dos simuladores é capturada em `SeasonResult.log`. Temporadas com seed
+    passam pelo cache de resultados.
+
+    Cada temporada e partida sorteia de um gerador próprio e escreve o texto
+    num buffer próprio (nada de `random.seed` global nem troca de
+    `sys.stdout`), então pedidos em threads diferentes não se misturam.
+    """
+
+    def __init__(self, config: Optional[Dict] = None, lineup_seed: Optional[int] = None,
+                 max_workers: int = 1, result_cache=None):
+        self.config = config or {}
+        self.paths = self.config.get("paths", {})
+        self.sim_config = self.config.get("simulation", {})
+        self.output_config = self.config.get("output", {})
+
+        if lineup_seed is None:
+            lineup_seed = self.sim_config.get("seed") or 42
+        self.lineup_seed = lineup_seed
+
+        self._lineups: Dict[str, Dict] = {}
+        self._simple_teams: Dict[str, Dict] = {}
+        self._fitted_models: Dict[str, object] = {}
+        self._load_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="simulation")
+        self._loader = None
+
+        # Cache de resultados (desligado se `cache.enabled` for false no config)
+        if result_cache is None:
+            from ..results import ResultCache
+            result_cache = ResultCache.from_config(self.config.get("cache"))
+        self.result_cache = result_cache
+
+    @property
+    def loader(self):
+        if self._loader is None:
+            from ..advanced_sim.data_loader import LeagueDataLoader
+            self._loader = LeagueDataLoader()
+        return self._loader
+
+    def available_leagues(self) -> List[str]:
+        return self.loader.get_available_leagues()
+
+    # ------------------------------------------------------------------
+    # Ligas em memória
+
+    def league_lineups(self, league: str) -> Dict:
+        """Cópia das escalações da liga (carregadas só na primeira chamada)"""
+        with self._load_lock:
+            if league not in self._lineups:
+                from ..advanced_sim.snapshot import LineupSnapshotCache
+                self._lineups[league] = LineupSnapshotCache().load_or_build(
+                    self.loader, league, self.lineup_seed
+                )
+        return copy.deepcopy(self._lineups[league])
+
+    def player_names(self, league: str) -> Dict[str, str]:
+        """Nome de cada jogador da liga por id"""
+        if league not in self._lineups:
+            self.league_lineups(league)
+        return {
+            player.id: player.name
+            for lineup in self._lineups[league].values()
+            for player in lineup.players + lineup.substitutes
+        }
+
+    def simple_teams(self, league: str) -> Dict:
+        """Médias dos times da liga para o simulador simples"""
+        with self._load_lock:
+            if league not in self._simple_teams:
+                from ..simple.simulator import carregar_times
+                self._simple_teams[league] = carregar_times(league, self.paths, file=io.StringIO())
+        return self._simple_teams[league]
+
+    def fitted_model(self, league: str):
+        """Modelo Dixon–Coles da liga (ajustado só na primeira chamada)
+
+        Usa as partidas gravadas em `paths.results` e, se não bastarem,
+        temporadas simuladas em lote com as escalações do serviço.
+        """
+        with self._load_lock:
+            model = self._fitted_models.get(league)
+        if model is None:
+            from ..simple.dixon_coles import fit_league
+            results_dir = self.paths.get("results")
+            model = fit_league(league, Path(results_dir) if results_dir else None,
+                               lineups=self.league_lineups(league), seed=self.lineup_seed)
+            with self._load_lock:
+                model = self._fitted_models.setdefault(league, model)
+        return model
+
+    def expected_table(self, league: str, mode: str = "fitted") -> List[Dict]:
+        """Pontos esperados de cada time, sem simular temporadas
+
+        'fitted' usa o modelo Dixon–Coles; 'simple' integra o próprio modelo do
+        simulador simples (simple/analytic.py).
+        """
+        if mode == "simple":
+            from ..simple.analytic import expected_table
+            return expected_table(self.simple_teams(league), self.sim_config)
+        if mode != "fitted":
+            raise ValueError(f"Sem tabela analítica para o modo '{mode}' (use 'simple' ou 'fitted')")
+        return self.fitted_model(league).expected_table()
+
+    def preload(self, leagues: List[str]) -> None:
+        """Carrega as ligas antecipadamente"""
+        for league in leagues:
+            self.league_lineups(league)
+
+    # ------------------------------------------------------------------
+    # Simulações
+
+    def simulate_match(self, league: str, home_team: str, away_team: str, seed: Optional[int] = None):
+        """Simula uma partida entre dois times da liga e retorna o AdvancedMatchResult"""
+        from ..advanced_sim.simulation.advanced_match import AdvancedMatchSimulator
+
+        lineups = self.league_lineups(league)
+        for team in (home_team, away_team):
+            if team not in lineups:
+                raise KeyError(f"Time '{team}' não encontrado em {league}")
+
+        # Gerador próprio: pedidos simultâneos (threads da API) não mexem nos sorteios uns dos outros
+        return AdvancedMatchSimulator(rng=random.Random(seed)).simulate_match(
+            home_lineup=lineups[home_team],
+            away_lineup=lineups[away_team],
+            home_team_name=home_team,
+            away_team_name=away_team
+        )
+
+    def simulate_advanced_season(self, league: str, seed: Optional[int] = None,
+                                 export: bool = True, match_engine: str = "event") -> SeasonResult:
+        """Temporada completa com o motor avançado (partida a partida ou em lote)"""
+        from ..advanced_sim.simulation.full_season import FullSeasonSimulator
+        from ..advanced_sim.simulation.progress import ConsolePrinter, ProgressStream
+
+        start = time.perf_counter()
+        log = io.StringIO()
+        columnar_format = self.output_config.get("columnar_format")
+        dataset_dir = self.output_config.get("dataset_dir")
+        season = FullSeasonSimulator(
+            league,
+            teams=self.league_lineups(league),
+            results_dir=self.paths.get("results"),
+            columnar_format=None if columnar_format in (None, "none") else columnar_format,
+            dataset_dir=Path(dataset_dir) if dataset_dir else None,
+            progress=ProgressStream([ConsolePrinter(file=log)]),
+            match_engine=match_engine,
+            rng=random.Random(seed)
+        )
+        season.simulate_full_season(stream_results=export)
+
+        files, hash_value = {}, None
+        if export:
+            export_info = season.export_results(file=log)
+            hash_value = export_info.pop('hash')
+            files = {key: value for key, value in export_info.items() if value is not None}
+        else:
+            season.flush_player_stats()
+
+        table_rows, player_rows, summary = season.result_rows()
+
+        return SeasonResult(
+            league=league,
+            simulation_type="timestep" if match_engine == "timestep" else "advanced",
+            table=table_rows,
+            players=player_rows,
+            summary=summary,
+            files=files,
+            hash=hash_value,
+            log=log.getvalue(),
+            elapsed=time.perf_counter() - start
+        )
+
+    def simulate_simple_season(self, league: str, seed: Optional[int] = None,
+                               export: bool = True) -> SeasonResult:
+        """Temporada com o simulador estatístico simples"""
+        import numpy as np
+        from ..simple.simulator import sim_campeonato, exportar_resultados
+
+        start = time.perf_counter()
+        log = io.StringIO()
+        # RandomState(seed) sorteia a mesma sequência que np.random.seed(seed) no CLI
+        df_final = sim_campeonato(self.simple_teams(league), self.sim_config,
+                                  rng=np.random.RandomState(seed), file=log)
+
+        files, hash_value = {}, None
+        if export:
+            export_info = exportar_resultados(df_final, league, self.paths, self.output_config, file=log)
+            hash_value = export_info.pop("hash")
+            files = {key: value for key, value in export_info.items() if value is not None}
+
+        table_rows = df_final.rename_axis("Time").reset_index().to_dict(orient="records")
+        n_teams = len(table_rows)
+        return SeasonResult(
+            league=league,
+            simulation_type="simple",
+            table=table_rows,
+            summary={
+                "total_matches": n_teams * (n_teams - 1),
+                "total_goals": int(df_final["GP"].sum()),
+                "champion": str(df_final.index[0]),
+            },
+            files=files,
+            hash=hash_value,
+            log=log.getvalue(),
+            elapsed=time.perf_counter() - start
+        )
+
+    def simulate_fitted_season(self, league: str, seed: Optional[int] = None,
+                               export: bool = True) -> SeasonResult:
+        """Temporada sorteada pelas matrizes de placar do modelo Dixon–Coles"""
+        import numpy as np
+        import pandas as pd
+        from ..simple.simulator import exportar_resultados
+
+        start = time.perf_counter()
+        model = self.fitted_model(league)
+        table_rows = model.sample_season(np.random.default_rng(seed))
+
+        files, hash_value = {}, None
+        log = io.StringIO()
+        if export:
+            df_final = pd.DataFrame(table_rows).set_index("Time")
+            export_info = exportar_resultados(df_final, league, self.paths, self.output_config,
+                                              simulation_type="fitted", file=log)
+            hash_value = export_info.pop("hash")
+            files = {key: value for key, value in export_info.items() if value is not None}
+
+        n_teams = len(table_rows)
+        return SeasonResult(
+            league=league,
+            simulation_type="fitted",
+            table=table_rows,
+            summary={
+                "total_matches": n_teams * (n_teams - 1),
+                "total_goals": sum(row["GP"] for row in table_rows),
+                "champion": table_rows[0]["Time"],
+            },
+            files=files,
+            hash=hash_value,
+            log=log.getvalue(),
+            elapsed=time.perf_counter() - start
+        )
+
+    def _cache_key(self, league: str, mode: str, seed: int) -> str:
+        """Chave do cache: dados da liga, versão do motor, configuração e seed"""
+        from ..results import result_key
+
+        if mode in ("advanced", "timestep"):
+            from ..advanced_sim.simulation.full_season import engine_version
+            ENGINE_VERSION = engine_version("timestep" if mode == "timestep" else "event")
+            config = {"lineup_seed": self.lineup_seed}
+        elif mode == "fitted":
+            from ..simple.dixon_coles import ENGINE_VERSION
+            config = {"lineup_seed": self.lineup_seed, "matches": self.fitted_model(league).n_matches}
+        else:
+            from ..simple.simulator import ENGINE_VERSION
+            config = {k: v for k, v in self.sim_config.items() if k != "seed"}
+
+        return result_key(league, self.loader.get_league_hash(league), ENGINE_VERSION, mode, config, seed)
+
+    def simulate_season(self, league: str, mode: str = "advanced", seed: Optional[int] = None,
+                        export: bool = True, use_cache: bool = True) -> SeasonResult:
+        """Simula uma temporada no modo pedido ('advanced', 'simple', 'timestep' ou 'fitted')
+
+        Com seed definida o resultado é determinístico, então pedidos repetidos
+        são respondidos pelo cache de resultados (sem gravar novos arquivos).
+        """
+        if mode not in SIMULATION_MODES:
+            raise ValueError(f"Modo desconhecido: {mode} (use {', '.join(SIMULATION_MODES)})")
+
+        key = None
+        if use_cache and self.result_cache is not None and seed is not None:
+            key = self._cache_key(league, mode, seed)
+            cached = self.result_cache.get(key)
+            if cached is not None:
+                files = {name: Path(path) for name, path in cached.pop("files").items() if Path(path).exists()}
+                return SeasonResult(**cached, files=files, cached=True)
+
+        if mode == "advanced":
+            result = self.simulate_advanced_season(league, seed=seed, export=export)
+        elif mode == "timestep":
+            result = self.simulate_advanced_season(league, seed=seed, export=export, match_engine="timestep")
+        elif mode == "fitted":
+            result = self.simulate_fitted_season(league, seed=seed, export=export)
+        else:
+            result = self.simulate_simple_season(league, seed=seed, export=export)
+
+        if key is not None:
+            self.result_cache.put(key, {
+                "league": result.league,
+                "simulation_type": result.simulation_type,
+                "table": result.table,
+                "players": result.players,
+                "summary": result.summary,
+                "files": {name: str(path) for name, path in result.files.items()},
+                "hash": result.hash,
+            })
+        return result
+
+    def submit_season(self, league: str, mode: str = "advanced", **kwargs) -> Future:
+        """Agenda a temporada no worker em segundo plano e retorna o Future"""
+        return self._executor.submit(self.simulate_season, league, mode, **kwargs)
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Probabilidades exatas do simulador simples (sem sorteio)
+O `sim_game` sorteia um fator uniforme e, dado o fator, dois Poissons
+independentes. Aqui a distribuição dos placares sai direto desse modelo:
+
+    P(x, y) = média sobre o fator f de Poisson(x; exp_a(f)) * Poisson(y; exp_b(f))
+
+com a integral em f feita por quadratura de Gauss–Legendre. O piso de
+`min_expected_goals` deixa exp_a(f) e exp_b(f) com uma quina; o intervalo do
+fator é dividido nessas quinas, então em cada pedaço o integrando é suave e a
+quadratura é exata na prática. Os placares vão de 0 a `max_goals` para cada
+lado e a matriz é renormalizada (a massa acima disso é desprezível).
+
+Todos os confrontos de uma liga saem numa chamada vetorizada; a tabela de
+pontos esperados vem dessas matrizes, sem Monte Carlo.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+# Placares considerados em cada matriz (0..MAX_GOALS gols para cada lado)
+MAX_GOALS = 10
+
+# Nós de Gauss–Legendre em cada pedaço do intervalo do fator aleatório
+QUADRATURE_NODES = 16
+
+
+def all_fixtures(n_teams: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Turno e returno: todos os pares (mandante, visitante) por índice de time"""
+    home, away = np.nonzero(~np.eye(n_teams, dtype=bool))
+    return home, away
+
+
+def expected_standings(teams: Sequence[str], home: np.ndarray, away: np.ndarray,
+                       matrices: np.ndarray) -> List[Dict]:
+    """Pontos, resultados e gols esperados por time a partir das matrizes de placar dos confrontos"""
+    n = len(teams)
+    size = matrices.shape[1]
+    home_win = np.tril(np.ones((size, size), dtype=bool), -1)
+    p_home, p_draw = matrices[:, home_win].sum(axis=1), np.trace(matrices, axis1=1, axis2=2)
+    p_away = 1 - p_home - p_draw
+    goals = np.arange(size)
+    home_goals = (matrices.sum(axis=2) * goals).sum(axis=1)
+    away_goals = (matrices.sum(axis=1) * goals).sum(axis=1)
+
+    def per_team(home_value, away_value):
+        return np.bincount(home, home_value, n) + np.bincount(away, away_value, n)
+
+    wins, draws, losses = per_team(p_home, p_away), per_team(p_draw, p_draw), per_team(p_away, p_home)
+    goals_for, goals_against = per_team(home_goals, away_goals), per_team(away_goals, home_goals)
+    points = 3 * wins + draws
+    rows = [
+        {
+            "Time": team,
+            "Pts_esperados": round(float(points[i]), 2),
+            "V": round(float(wins[i]), 2),
+            "E": round(float(draws[i]), 2),
+            "D": round(float(losses[i]), 2),
+            "GP": round(float(goals_for[i]), 2),
+            "GC": round(float(goals_against[i]), 2),
+        }
+        for i, team in enumerate(teams)
+    ]
+    rows.sort(key=lambda row: row["Pts_esperados"], reverse=True)
+    return rows
+
+
+def season_standings(n_teams: int, home: np.ndarray, away: np.ndarray, home_goals: np.ndarray,
+                     away_goals: np.ndarray) -> Dict[str, np.ndarray]:
+    """Tabelas de temporadas sorteadas, vetorizadas
+
+    `home_goals`/`away_goals` são (temporadas, confrontos); devolve arrays
+    (temporadas, times) com P, V, E, D, GP, GC, SG e a posição final
+    (desempate por vitórias, saldo e gols pró, como no simulador simples).
+    """
+    home_goals, away_goals = np.atleast_2d(home_goals), np.atleast_2d(away_goals)
+    n_seasons = home_goals.shape[0]
+    offset = (np.arange(n_seasons) * n_teams)[:, None]
+
+    def per_team(home_value, away_value):
+        total = np.bincount((home + offset).ravel(), np.ravel(home_value), n_seasons * n_teams)
+        total += np.bincount((away + offset).ravel(), np.ravel(away_value), n_seasons * n_teams)
+        return total.reshape(n_seasons, n_teams).astype(np.int64)
+
+    table = {
+        "V": per_team(home_goals > away_goals, away_goals > home_goals),
+        "E": per_team(home_goals == away_goals, home_goals == away_goals),
+        "D": per_team(home_goals < away_goals, away_goals < home_goals),
+        "GP": per_team(home_goals, away_goals),
+        "GC": per_team(away_goals, home_goals),
+    }
+    table["P"] = 3 * table["V"] + table["E"]
+    table["SG"] = table["GP"] - table["GC"]
+    order = np.lexsort((-table["GP"], -table["SG"], -table["V"], -table["P"]), axis=-1)
+    position = np.empty_like(order)
+    np.put_along_axis(position, order, np.arange(1, n_teams + 1)[None, :], axis=-1)
+    table["position"] = position
+    return table
+
+
+def fixture_strengths(times: Dict[str, Dict], home: np.ndarray,
+                      away: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Médias de gols (mandante, visitante) de cada confronto antes do fator aleatório
+
+    Mesmos pesos e bônus de mando do `sim_game`: exp = força / fator.
+    """
+    ratings = np.array([[t["ataque"], t["meio"], t["defesa"], t["goleiro"]] for t in times.values()], dtype=float)
+    attack = ratings[:, 0] * 0.7 + ratings[:, 1] * 0.3
+    defence = ratings[:, 2] * 0.7 + ratings[:, 3] * 0.3
+    home_rate = attack[home] * 1.10 / defence[away]
+    away_rate = attack[away] / (defence[home] * 1.05)
+    return home_rate, away_rate
+
+
+@dataclass
+class FixtureProbabilities:
+    """Matrizes exatas de placar de todos os confrontos de uma liga"""
+    teams: List[str]
+    home: np.ndarray            # índice do mandante por confronto
+    away: np.ndarray
+    matrices: np.ndarray        # (confrontos, gols do mandante, gols do visitante)
+
+    def index(self, team: str) -> int:
+        try:
+            return self.teams.index(team)
+        except ValueError:
+            raise KeyError(f"Time '{team}' não está na liga") from None
+
+    def score_matrix(self, home: str, away: str) -> np.ndarray:
+        hit = np.nonzero((self.home == self.index(home)) & (self.away == self.index(away)))[0]
+        if not len(hit):
+            raise KeyError(f"Confronto {home} x {away} não foi calculado")
+        return self.matrices[hit[0]]
+
+    def outcomes(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(vitória do mandante, empate, vitória do visitante) de cada confronto"""
+        size = self.matrices.shape[1]
+        home_win = np.tril(np.ones((size, size), dtype=bool), -1)
+        away_win = np.triu(np.ones((size, size), dtype=bool), 1)
+        return (self.matrices[:, home_win].sum(axis=1), np.trace(self.matrices, axis1=1, axis2=2),
+                self.matrices[:, away_win].sum(axis=1))
+
+    def outcome_probabilities(self, home: str, away: str) -> Tuple[float, float, float]:
+        matrix = self.score_matrix(home, away)
+        return float(np.tril(matrix, -1).sum()), float(np.trace(matrix)), float(np.triu(matrix, 1).sum())
+
+    def odds_rows(self) -> List[Dict]:
+        """Uma linha por confronto com as chances de 1, X e 2 e os gols esperados"""
+        p_home, p_draw, p_away = self.outcomes()
+        goals = np.arange(self.matrices.shape[1])
+        home_goals = (self.matrices.sum(axis=2) * goals).sum(axis=1)
+        away_goals = (self.matrices.sum(axis=1) * goals).sum(axis=1)
+        return [
+            {
+                "Mandante": self.teams[h],
+                "Visitante": self.teams[a],
+                "Vitoria_mandante": round(float(p_home[f]), 4),
+                "Empate": round(float(p_draw[f]), 4),
+                "Vitoria_visitante": round(float(p_away[f]), 4),
+                "Gols_mandante": round(float(home_goals[f]), 3),
+                "Gols_visitante": round(float(away_goals[f]), 3),
+            }
+            for f, (h, a) in enumerate(zip(self.home.tolist(), self.away.tolist()))
+        ]
+
+    def expected_table(self) -> List[Dict]:
+        """Pontos, resultados e gols esperados de cada time, sem simulação"""
+        return expected_standings(self.teams, self.home, self.away, self.matrices)
+
+
+def exact_fixture_probabilities(times: Dict[str, Dict], sim_config: Dict,
+                                fixtures: Optional[Sequence[Tuple[str, str]]] = None,
+                                max_goals: int = MAX_GOALS,
+                                nodes: int = QUADRATURE_NODES) -> FixtureProbabilities:
+    """Distribuição exata de placares do `sim_game` para os confrontos da liga
+
+    Sem `fixtures`, calcula turno e returno completos.
+    """
+    from scipy.special import gammaln
+
+    teams = list(times)
+    if fixtures is None:
+        home, away = all_fixtures(len(teams))
+    else:
+        home = np.array([teams.index(h) for h, _ in fixtures], dtype=np.int64)
+        away = np.array([teams.index(a) for _, a in fixtures], dtype=np.int64)
+    home_rate, away_rate = fixture_strengths(times, home, away)
+
+    low, high = float(sim_config["random_factor_min"]), float(sim_config["random_factor_max"])
+    floor = float(sim_config["min_expected_goals"])
+
+    # Pedaços do intervalo do fator, cortados onde cada média bate no piso
+    kinks = np.sort(np.clip(np.stack([home_rate / floor, away_rate / floor], axis=1), low, high), axis=1)
+    edges = np.column_stack([np.full(len(home), low), kinks, np.full(len(home), high)])
+    x, w = np.polynomial.legendre.leggauss(nodes)
+    half = (edges[:, 1:] - edges[:, :-1]) / 2                                    # (confrontos, 3)
+    factor = ((edges[:, :-1] + edges[:, 1:]) / 2)[:, :, None] + half[:, :, None] * x
+    weight = (half[:, :, None] * w).reshape(len(home), -1) / (high - low)        # densidade uniforme
+    factor = factor.reshape(len(home), -1)
+
+    exp_home = np.maximum(floor, home_rate[:, None] / factor)
+    exp_away = np.maximum(floor, away_rate[:, None] / factor)
+    goals = np.arange(max_goals + 1)
+    log_factorial = gammaln(goals + 1)
+    home_pmf = np.exp(goals * np.log(exp_home[:, :, None]) - exp_home[:, :, None] - log_factorial)
+    away_pmf = np.exp(goals * np.log(exp_away[:, :, None]) - exp_away[:, :, None] - log_factorial)
+
+    matrices = np.matmul((weight[:, :, None] * home_pmf).transpose(0, 2, 1), away_pmf)
+    matrices /= matrices.sum(axis=(1, 2), keepdims=True)
+    return FixtureProbabilities(teams, home, away, matrices)
+
+
+def expected_table(times: Dict[str, Dict], sim_config: Dict) -> List[Dict]:
+    """Tabela de pontos esperados do simulador simples (turno e returno), sem Monte Carlo"""
+    return exact_fixture_probabilities(times, sim_config).expected_table()
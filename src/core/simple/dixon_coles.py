@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+"""
+Modelo ajustado de força dos times (Dixon–Coles)
+Alternativa ao `sim_game` do simulador simples, cujos pesos são fixos: aqui
+cada time tem um parâmetro de ataque e um de defesa, há uma vantagem de mando
+e uma correlação para placares baixos (0-0, 1-0, 0-1, 1-1), todos ajustados
+por máxima verossimilhança (scipy.optimize) a partir de resultados de
+partidas:
+
+    gols do mandante  ~ Poisson(exp(c + mando + ataque[casa] - defesa[fora]))
+    gols do visitante ~ Poisson(exp(c + ataque[fora] - defesa[casa]))
+
+com o fator tau(x, y; rho) de Dixon e Coles nos placares baixos. As partidas
+vêm dos arquivos .jsonl em data/processed/resultados (registros "match") e,
+quando elas não bastam, de temporadas simuladas com o motor avançado em lote.
+
+Com o modelo ajustado, cada confronto tem a matriz exata de probabilidades de
+placar; a tabela de pontos esperados sai dessas matrizes sem simulação, e as
+temporadas sorteadas usam as mesmas matrizes (um sorteio por jogo).
+"""
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .analytic import all_fixtures, expected_standings, season_standings
+
+
+# Versão do modelo ajustado; altere ao mudar o modelo (invalida o cache de resultados)
+ENGINE_VERSION = "1.0.0"
+
+# Placares considerados em cada matriz (0..MAX_GOALS gols para cada lado)
+MAX_GOALS = 10
+
+# Partidas mínimas para ajustar só com o histórico (abaixo disso, completa com
+# simulações); 3800 são 10 temporadas de uma liga de 20 times
+MIN_MATCHES = 3800
+
+PROJECT_ROOT = Path(__file__).parents[3]
+
+
+def _log_poisson(goals: np.ndarray, rate: np.ndarray) -> np.ndarray:
+    from scipy.special import gammaln
+    return goals * np.log(rate) - rate - gammaln(goals + 1)
+
+
+def _tau(home_goals: np.ndarray, away_goals: np.ndarray, home_rate: np.ndarray,
+         away_rate: np.ndarray, rho: float) -> np.ndarray:
+    """Correção de Dixon–Coles para os placares 0-0, 0-1, 1-0 e 1-1"""
+    tau = np.ones(np.broadcast(home_goals, away_goals, home_rate).shape)
+    tau = np.where((home_goals == 0) & (away_goals == 0), 1 - home_rate * away_rate * rho, tau)
+    tau = np.where((home_goals == 0) & (away_goals == 1), 1 + home_rate * rho, tau)
+    tau = np.where((home_goals == 1) & (away_goals == 0), 1 + away_rate * rho, tau)
+    tau = np.where((home_goals == 1) & (away_goals == 1), 1 - rho, tau)
+    return tau
+
+
+@dataclass
+class DixonColesModel:
+    """Parâmetros ajustados de uma liga"""
+    teams: List[str]
+    attack: np.ndarray
+    defence: np.ndarray
+    home: float
+    rho: float
+    intercept: float
+    n_matches: int = 0
+    log_likelihood: float = 0.0
+    max_goals: int = MAX_GOALS
+    _season: Optional[Dict] = field(default=None, repr=False, compare=False)
+
+    def index(self, team: str) -> int:
+        try:
+            return self.teams.index(team)
+        except ValueError:
+            raise KeyError(f"Time '{team}' não está no modelo") from None
+
+    # ------------------------------------------------------------------
+    # Probabilidades
+
+    def expected_goals(self, home_idx, away_idx) -> Tuple[np.ndarray, np.ndarray]:
+        """Médias de gols (mandante, visitante) por confronto, por índice de time"""
+        home_idx, away_idx = np.asarray(home_idx), np.asarray(away_idx)
+        home_rate = np.exp(self.intercept + self.home + self.attack[home_idx] - self.defence[away_idx])
+        away_rate = np.exp(self.intercept + self.attack[away_idx] - self.defence[home_idx])
+        return home_rate, away_rate
+
+    def score_matrices(self, home_idx, away_idx) -> np.ndarray:
+        """Probabilidade de cada placar, (confrontos, gols do mandante, gols do visitante)"""
+        home_rate, away_rate = self.expected_goals(np.atleast_1d(home_idx), np.atleast_1d(away_idx))
+        goals = np.arange(self.max_goals + 1)
+        home_pmf = np.exp(_log_poisson(goals[None, :], home_rate[:, None]))
+        away_pmf = np.exp(_log_poisson(goals[None, :], away_rate[:, None]))
+        matrices = home_pmf[:, :, None] * away_pmf[:, None, :]
+        matrices[:, :2, :2] *= _tau(goals[:2, None], goals[None, :2], home_rate[:, None, None],
+                                    away_rate[:, None, None], self.rho)
+        return matrices / matrices.sum(axis=(1, 2), keepdims=True)
+
+    def score_matrix(self, home: str, away: str) -> np.ndarray:
+        return self.score_matrices(self.index(home), self.index(away))[0]
+
+    def outcome_probabilities(self, home: str, away: str) -> Tuple[float, float, float]:
+        """(vitória do mandante, empate, vitória do visitante)"""
+        matrix = self.score_matrix(home, away)
+        return float(np.tril(matrix, -1).sum()), float(np.trace(matrix)), float(np.triu(matrix, 1).sum())
+
+    def _fixtures(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Turno e returno: todos os pares (mandante, visitante)"""
+        return all_fixtures(len(self.teams))
+
+    def expected_table(self) -> List[Dict]:
+        """Pontos, resultados e gols esperados de turno e returno, sem simulação"""
+        home, away = self._fixtures()
+        return expected_standings(self.teams, home, away, self.score_matrices(home, away))
+
+    # ------------------------------------------------------------------
+    # Temporadas sorteadas
+
+    def sample_scores(self, n_seasons: int, rng: Optional[np.random.Generator] = None) -> np.ndarray:
+        """Placares de `n_seasons` temporadas, (temporadas, confrontos, 2), pelas matrizes exatas"""
+        rng = rng or np.random.default_rng()
+        if self._season is None:
+            home, away = self._fixtures()
+            cdf = self.score_matrices(home, away).reshape(len(home), -1).cumsum(axis=1)
+            self._season = {"home": home, "away": away, "cdf": cdf}
+        cdf = self._season["cdf"]
+        draws = rng.random((len(cdf), n_seasons))
+        flat = np.empty((len(cdf), n_seasons), dtype=np.int64)
+        for f in range(len(cdf)):
+            flat[f] = np.searchsorted(cdf[f], draws[f], side="right")
+        flat = np.minimum(flat, cdf.shape[1] - 1).T
+        return np.stack(np.divmod(flat, self.max_goals + 1), axis=-1)
+
+    def sample_season(self, rng: Optional[np.random.Generator] = None) -> List[Dict]:
+        """Uma temporada sorteada, no formato de tabela do simulador simples"""
+        scores = self.sample_scores(1, rng)[0]
+        table = season_standings(len(self.teams), self._season["home"], self._season["away"],
+                                 scores[:, 0], scores[:, 1])
+        rows = [
+            {"Time": team, **{column: int(table[column][0, i]) for column in ("P", "V", "E", "D", "GP", "GC", "SG")}}
+            for i, team in enumerate(self.teams)
+        ]
+        rows.sort(key=lambda row: (row["P"], row["V"], row["SG"], row["GP"]), reverse=True)
+        return rows
+
+    # ------------------------------------------------------------------
+    # Persistência
+
+    def to_dict(self) -> Dict:
+        return {
+            "engine_version": ENGINE_VERSION,
+            "teams": self.teams,
+            "attack": self.attack.tolist(),
+            "defence": self.defence.tolist(),
+            "home": self.home,
+            "rho": self.rho,
+            "intercept": self.intercept,
+            "n_matches": self.n_matches,
+            "log_likelihood": self.log_likelihood,
+            "max_goals": self.max_goals,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "DixonColesModel":
+        return cls(
+            teams=list(data["teams"]),
+            attack=np.asarray(data["attack"], dtype=np.float64),
+            defence=np.asarray(data["defence"], dtype=np.float64),
+            home=float(data["home"]),
+            rho=float(data["rho"]),
+            intercept=float(data["intercept"]),
+            n_matches=int(data.get("n_matches", 0)),
+            log_likelihood=float(data.get("log_likelihood", 0.0)),
+            max_goals=int(data.get("max_goals", MAX_GOALS)),
+        )
+
+    def save(self, path: Path) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+
+    @classmethod
+    def load(cls, path: Path) -> "DixonColesModel":
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+
+# ----------------------------------------------------------------------
+# Ajuste
+
+def fit_dixon_coles(matches: Iterable[Dict], teams: Optional[Sequence[str]] = None,
+                    weights: Optional[Sequence[float]] = None) -> DixonColesModel:
+    """Ajusta o modelo por máxima verossimilhança (L-BFGS-B com gradiente analítico)
+
+    `matches` são registros com "home", "away", "hg" e "ag" (o formato das
+    partidas nos arquivos .jsonl). Partidas de times fora de `teams` são
+    ignoradas; `weights` pondera cada partida (ex.: dar menos peso às antigas).
+    """
+    from scipy.optimize import minimize
+
+    matches = list(matches)
+    if weights is not None and len(weights) != len(matches):
+        raise ValueError("É preciso um peso por partida")
+    teams = list(teams) if teams is not None else sorted({m[side] for m in matches for side in ("home", "away")})
+    position = {team: i for i, team in enumerate(teams)}
+    keep = [k for k, m in enumerate(matches) if m["home"] in position and m["away"] in position]
+    if not keep:
+        raise ValueError("Nenhuma partida entre os times do modelo")
+
+    home = np.array([position[matches[k]["home"]] for k in keep])
+    away = np.array([position[matches[k]["away"]] for k in keep])
+    x = np.array([matches[k]["hg"] for k in keep], dtype=np.float64)
+    y = np.array([matches[k]["ag"] for k in keep], dtype=np.float64)
+    w = np.ones(len(keep)) if weights is None else np.asarray(weights, dtype=np.float64)[keep]
+    n = len(teams)
+    low = {(0, 0): (x == 0) & (y == 0), (0, 1): (x == 0) & (y == 1),
+           (1, 0): (x == 1) & (y == 0), (1, 1): (x == 1) & (y == 1)}
+
+    def unpack(params):
+        return params[:n], params[n:2 * n], params[2 * n], params[2 * n + 1], params[2 * n + 2]
+
+    def objective(params):
+        attack, defence, home_adv, rho, intercept = unpack(params)
+        lam = np.exp(intercept + home_adv + attack[home] - defence[away])
+        mu = np.exp(intercept + attack[away] - defence[home])
+        tau = np.maximum(_tau(x, y, lam, mu, rho), 1e-10)
+        loglik = np.log(tau) + x * np.log(lam) - lam + y * np.log(mu) - mu
+
+        # Derivadas em relação a log(lam), log(mu) e rho
+        d_lam, d_mu, d_rho = x - lam, y - mu, np.zeros_like(x)
+        m = low[(0, 0)]
+        d_lam[m] -= lam[m] * mu[m] * rho / tau[m]
+        d_mu[m] -= lam[m] * mu[m] * rho / tau[m]
+        d_rho[m] = -lam[m] * mu[m] / tau[m]
+        m = low[(0, 1)]
+        d_lam[m] += lam[m] * rho / tau[m]
+        d_rho[m] = lam[m] / tau[m]
+        m = low[(1, 0)]
+        d_mu[m] += mu[m] * rho / tau[m]
+        d_rho[m] = mu[m] / tau[m]
+        m = low[(1, 1)]
+        d_rho[m] = -1 / tau[m]
+        d_lam, d_mu, d_rho = w * d_lam, w * d_mu, w * d_rho
+
+        grad = np.empty_like(params)
+        grad[:n] = np.bincount(home, d_lam, n) + np.bincount(away, d_mu, n)
+        grad[n:2 * n] = -np.bincount(away, d_lam, n) - np.bincount(home, d_mu, n)
+        grad[2 * n] = d_lam.sum()
+        grad[2 * n + 1] = d_rho.sum()
+        grad[2 * n + 2] = d_lam.sum() + d_mu.sum()
+
+        # Ataque e defesa somam zero (o nível geral fica no intercepto)
+        penalty = attack.sum() ** 2 + defence.sum() ** 2
+        grad[:n] -= 2 * attack.sum()
+        grad[n:2 * n] -= 2 * defence.sum()
+        return -(w @ loglik - penalty), -grad
+
+    start = np.zeros(2 * n + 3)
+    start[2 * n + 2] = np.log(max((x @ w + y @ w) / (2 * w.sum()), 0.1))
+    bounds = [(None, None)] * (2 * n + 1) + [(-0.3, 0.3), (None, None)]
+    fitted = minimize(objective, start, jac=True, method="L-BFGS-B", bounds=bounds)
+    attack, defence, home_adv, rho, intercept = unpack(fitted.x)
+
+    return DixonColesModel(
+        teams=teams,
+        attack=attack - attack.mean(),
+        defence=defence - defence.mean(),
+        home=float(home_adv),
+        rho=float(rho),
+        intercept=float(intercept + attack.mean() - defence.mean()),
+        n_matches=len(keep),
+        log_likelihood=float(-fitted.fun),
+    )
+
+
+def load_match_history(league: str, results_dir: Optional[Path] = None) -> List[Dict]:
+    """Partidas gravadas nos arquivos .jsonl da liga (os .json antigos só têm a tabela)"""
+    from ..results import find_result_files, read_results
+
+    results_dir = Path(results_dir) if results_dir else PROJECT_ROOT / "data" / "processed" / "resultados"
+    matches = []
+    for path in find_result_files(results_dir / league):
+        if path.suffix == ".jsonl":
+            matches.extend(read_results(path).get("partidas", []))
+    return matches
+
+
+def simulated_matches(lineups: Dict, n_seasons: int = 20, seed: Optional[int] = None) -> List[Dict]:
+    """Partidas de `n_seasons` temporadas (turno e returno) no motor avançado em lote"""
+    from ..advanced_sim.simulation.timestep import TimeSteppedMatchEngine
+
+    fixtures = [(home, away) for home in lineups for away in lineups if home != away] * n_seasons
+    goals = TimeSteppedMatchEngine(seed=seed).simulate(fixtures, lineups).goals
+    return [
+        {"home": home, "away": away, "hg": int(hg), "ag": int(ag)}
+        for (home, away), (hg, ag) in zip(fixtures, goals.tolist())
+    ]
+
+
+def fit_league(league: str, results_dir: Optional[Path] = None, lineups: Optional[Dict] = None,
+               min_matches: int = MIN_MATCHES, seed: Optional[int] = None) -> DixonColesModel:
+    """Ajusta o modelo de uma liga com o histórico gravado, completado por simulações se preciso"""
+    if lineups is None:
+        from ..advanced_sim.data_loader import LeagueDataLoader
+        lineups = LeagueDataLoader().load_league_for_simulation(league, seed=seed)
+    teams = sorted(lineups)
+
+    history = [m for m in load_match_history(league, results_dir) if m["home"] in lineups and m["away"] in lineups]
+    matches = list(history)
+    if len(matches) < min_matches:
+        per_season = len(teams) * (len(teams) - 1)
+        seasons = -(-(min_matches - len(matches)) // per_season)
+        matches.extend(simulated_matches(lineups, seasons, seed=seed))
+    return fit_dixon_coles(matches, teams)
+
+
+def main():
+    """CLI: python scripts/run_fitted.py --league premier_league [--output modelo.json]"""
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description='Ajusta o modelo Dixon–Coles e mostra a tabela de pontos esperados')
+    parser.add_argument('--league', default='premier_league')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--min-matches', type=int, default=MIN_MATCHES,
+                        help='Partidas mínimas para o ajuste (o que faltar vem de simulações)')
+    parser.add_argument('--output', type=Path, default=None, help='Grava os parâmetros ajustados em JSON')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    model = fit_league(args.league, min_matches=args.min_matches, seed=args.seed)
+    fitted = time.perf_counter() - start
+    start = time.perf_counter()
+    table = model.expected_table()
+    analytic = time.perf_counter() - start
+
+    print(f"\n{'='*72}")
+    print(f"[DIXON-COLES] {args.league} | {model.n_matches} partidas | ajuste {fitted:.2f}s | "
+          f"tabela {analytic * 1000:.1f}ms")
+    print(f"{'='*72}")
+    print(f"Mando: x{np.exp(model.home):.3f} | rho: {model.rho:+.3f} | "
+          f"gols por jogo: {sum(row['GP'] for row in table) / (len(table) * (len(table) - 1)):.2f}")
+    print(f"\n{'Pos':<4}{'Time':<26}{'Pts':>7}{'V':>7}{'E':>7}{'D':>7}{'GP':>7}{'GC':>7}")
+    for pos, row in enumerate(table, 1):
+        print(f"{pos:<4}{row['Time']:<26}{row['Pts_esperados']:>7.1f}{row['V']:>7.1f}{row['E']:>7.1f}"
+              f"{row['D']:>7.1f}{row['GP']:>7.1f}{row['GC']:>7.1f}")
+
+    if args.output:
+        model.save(args.output)
+        print(f"\n📂 Parâmetros: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
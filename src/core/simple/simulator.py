@@ -10,16 +10,22 @@ import logging
 from pathlib import Path
 
 import numpy as np
-import pandas as pd
 
 # Adicionar config ao path
 config_path = Path(__file__).parent.parent.parent.parent / "config"
 sys.path.insert(0, str(config_path))
 
+# Adicionar src ao path (core.results)
+src_path = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(src_path))
+
 import config
 
-def sim_game(timeA, timeB, times, sim_config, casa=True):
-    """Simula um jogo entre dois times"""
+# Versão do motor simples; altere ao mudar a simulação (invalida o cache de resultados)
+ENGINE_VERSION = "1.0.0"
+
+def sim_game(timeA, timeB, times, sim_config, casa=True, rng=np.random):
+    """Simula um jogo entre dois times (sorteios de `rng`; padrão: np.random global)"""
     # Calcular força ofensiva (ataque tem mais peso que meio)
     atkA = (times[timeA]["ataque"] * 0.7) + (times[timeA]["meio"] * 0.3)
     atkB = (times[timeB]["ataque"] * 0.7) + (times[timeB]["meio"] * 0.3)
@@ -34,7 +40,7 @@ def sim_game(timeA, timeB, times, sim_config, casa=True):
         defA *= 1.05  # 5% boost na defesa
     
     # Usar fatores aleatórios configuráveis
-    fator = np.random.uniform(
+    fator = rng.uniform(
         sim_config["random_factor_min"], 
         sim_config["random_factor_max"]
     )
@@ -44,14 +50,16 @@ def sim_game(timeA, timeB, times, sim_config, casa=True):
     exp_a = max(sim_config["min_expected_goals"], (atkA / defB) * (divisor/75) / fator)
     exp_b = max(sim_config["min_expected_goals"], (atkB / defA) * (divisor/75) / fator)
 
-    gols_a = np.random.poisson(exp_a)
-    gols_b = np.random.poisson(exp_b)
+    gols_a = rng.poisson(exp_a)
+    gols_b = rng.poisson(exp_b)
     return gols_a, gols_b
 
 
-def sim_campeonato(times_dict, sim_config):
-    """Simula um campeonato completo"""
-    print(f"Iniciando simulação do campeonato com {len(times_dict)} times")
+def sim_campeonato(times_dict, sim_config, rng=np.random, file=None):
+    """Simula um campeonato completo (mensagens em `file`; padrão: sys.stdout)"""
+    import pandas as pd
+
+    print(f"Iniciando simulação do campeonato com {len(times_dict)} times", file=file)
     
     tabela = {t: {"P": 0, "V": 0, "E": 0, "D": 0, "GP": 0, "GC": 0, "SG": 0} for t in times_dict}
     
@@ -62,7 +70,7 @@ def sim_campeonato(times_dict, sim_config):
         for j, timeB in enumerate(times_dict):
             if i != j:
                 # timeA joga em casa
-                gA, gB = sim_game(timeA, timeB, times_dict, sim_config, casa=True)
+                gA, gB = sim_game(timeA, timeB, times_dict, sim_config, casa=True, rng=rng)
                 jogos_simulados += 1
 
                 tabela[timeA]["GP"] += gA
@@ -87,12 +95,95 @@ def sim_campeonato(times_dict, sim_config):
     for t in tabela:
         tabela[t]["SG"] = tabela[t]["GP"] - tabela[t]["GC"]
 
-    print(f"Simulação concluída: {jogos_simulados} jogos simulados")
+    print(f"Simulação concluída: {jogos_simulados} jogos simulados", file=file)
     df = pd.DataFrame(tabela).T
     df = df.sort_values(by=["P", "V", "SG", "GP"], ascending=[False, False, False, False])
     return df
 
 
+def carregar_times(league, paths, file=None):
+    """Lê o JSON da liga e retorna as médias de cada time"""
+    json_file_path = f"{paths['json_ligas']}{league}_2025.json"
+    print(f"Carregando dados de: {json_file_path}", file=file)
+
+    try:
+        with open(json_file_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Liga '{league}' não encontrada em {json_file_path}")
+
+    # Pegar os times já com as médias
+    return {nome: {
+        "ataque": info["medias"]["ataque"], 
+        "meio": info["medias"]["meio"],
+        "defesa": info["medias"]["defesa"],
+        "goleiro": info["medias"]["goleiro"]
+    } for nome, info in data["times"].items()}
+
+
+def exportar_resultados(df_final, league, paths, output_config, simulation_type="simple", file=None):
+    """Salva CSV e JSON da temporada, registra no catálogo e grava o dataset colunar"""
+    # Construir caminhos baseados na configuração
+    subdir = league.replace(" ", "_").lower()
+    results_path = f"{paths['results']}{subdir}"
+    today = datetime.datetime.now().strftime(output_config["timestamp_format"])
+
+    from core.results import unique_stem
+    pathlib.Path(results_path).mkdir(parents=True, exist_ok=True)
+    today = unique_stem(results_path, f"resultados_{league}_{today}")[len(f"resultados_{league}_"):]
+
+    # Gerar hash do resultado
+    hash_value = hashlib.sha256(df_final.to_json().encode()).hexdigest()
+
+    # Criar JSON completo
+    output_data = {
+        "version": "1.0.0",
+        "simulation_type": simulation_type,
+        "created_at": today,
+        "league": league,
+        "tabela_final": df_final.to_dict(orient="records"),
+        "hash": f"sha256:{hash_value}"
+    }
+
+    # Salvar resultados
+    print(f"Salvando resultados em: {results_path}", file=file)
+    pathlib.Path(results_path).mkdir(parents=True, exist_ok=True)
+
+    csv_path = pathlib.Path(results_path) / f"resultados_{league}_{today}.csv"
+    json_path = pathlib.Path(results_path) / f"resultados_{league}_{today}.json"
+
+    df_final.to_csv(csv_path, sep=output_config["csv_separator"], 
+                   index=output_config["csv_include_index"], encoding="utf-8")
+
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump(output_data, f, indent=2, ensure_ascii=False)
+
+    # Registrar no catálogo de resultados
+    from core.results import ResultsCatalog
+    with ResultsCatalog(paths["results"]) as catalog:
+        catalog.add(
+            league, json_path,
+            created_at=today,
+            simulation_type=simulation_type,
+            champion=str(df_final.index[0]),
+            hash=f"sha256:{hash_value}",
+            extra_files=[csv_path]
+        )
+
+    # Dataset colunar opcional, particionado por liga e execução
+    dataset_path = None
+    columnar_format = output_config.get("columnar_format")
+    if columnar_format and columnar_format != "none":
+        from core.results import ColumnarDatasetWriter
+        writer = ColumnarDatasetWriter(
+            output_config.get("dataset_dir", "./data/processed/dataset/"), columnar_format
+        )
+        table_rows = df_final.rename_axis("Time").reset_index().to_dict(orient="records")
+        dataset_path = writer.write_run(league, today, {"table": table_rows})
+
+    return {"csv": csv_path, "json": json_path, "hash": hash_value, "dataset": dataset_path}
+
+
 def main(league_override=None):
     """Função principal do simulador simples"""
     
@@ -103,8 +194,19 @@ def main(league_override=None):
                            type=str, 
                            default=None,
                            help='Liga para simular')
+        parser.add_argument('--exact',
+                           action='store_true',
+                           help='Tabela de pontos esperados exata, sem sorteio')
+        parser.add_argument('--no-cache',
+                           action='store_true',
+                           help='Ignora o cache de resultados e simula de novo')
         args = parser.parse_args()
         league_override = args.league
+        exact = args.exact
+        use_cache = not args.no_cache
+    else:
+        exact = False
+        use_cache = True
     
     # Determinar liga a usar
     if league_override:
@@ -127,62 +229,67 @@ def main(league_override=None):
         np.random.seed(sim_config["seed"])
         print(f"Seed configurada: {sim_config['seed']}")
 
-    # Construir caminhos baseados na configuração
-    subdir = league.replace(" ", "_").lower()
-    results_path = f"{paths['results']}{subdir}"
-    today = datetime.datetime.now().strftime(output_config["timestamp_format"])
-
     # Carregar JSON de times
-    json_file_path = f"{paths['json_ligas']}{league}_2025.json"
-    print(f"Carregando dados de: {json_file_path}")
-    
     try:
-        with open(json_file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-    except FileNotFoundError:
-        print(f"❌ Erro: Liga '{league}' não encontrada em {json_file_path}")
+        times = carregar_times(league, paths)
+    except FileNotFoundError as e:
+        print(f"❌ Erro: {e}")
         return
 
-    # Pegar os times já com as médias
-    times = {nome: {
-        "ataque": info["medias"]["ataque"], 
-        "meio": info["medias"]["meio"],
-        "defesa": info["medias"]["defesa"],
-        "goleiro": info["medias"]["goleiro"]
-    } for nome, info in data["times"].items()}
-
     print(f"Times carregados: {len(times)}")
     print("-" * 50)
 
+    if exact:
+        import pandas as pd
+        from core.simple.analytic import expected_table
+        print("Calculando a tabela de pontos esperados (sem sorteio)...")
+        print(pd.DataFrame(expected_table(times, sim_config)).set_index("Time"))
+        return
+
+    # Mesmos dados, motor, configuração e seed -> mesma temporada (mesma chave do serviço)
+    result_cache, cache_key = None, None
+    if use_cache and sim_config.get("seed"):
+        from core.results import ResultCache, result_key
+        result_cache = ResultCache.from_config(config.config.get("cache"))
+    if result_cache is not None:
+        data_hash = hashlib.sha256(pathlib.Path(f"{paths['json_ligas']}{league}_2025.json").read_bytes()).hexdigest()
+        cache_key = result_key(league, data_hash, ENGINE_VERSION, "simple",
+                               {k: v for k, v in sim_config.items() if k != "seed"}, sim_config["seed"])
+        cached = result_cache.get(cache_key)
+        if cached is not None:
+            import pandas as pd
+            print("Temporada idêntica já simulada; usando o resultado em cache")
+            print(pd.DataFrame(cached["table"]).set_index("Time"))
+            for name, path in cached["files"].items():
+                print(f"{name}: {path}")
+            print("✅ Simulação concluída!")
+            return
+
     # Rodar simulação
     print("Iniciando simulação da temporada...")
     df_final = sim_campeonato(times, sim_config)
 
-    # Gerar hash do resultado
-    hash_value = hashlib.sha256(df_final.to_json().encode()).hexdigest()
-
-    # Criar JSON completo
-    output_data = {
-        "version": "1.0.0",
-        "simulation_type": "simple",
-        "created_at": today,
-        "league": league,
-        "tabela_final": df_final.to_dict(orient="records"),
-        "hash": f"sha256:{hash_value}"
-    }
-
-    # Salvar resultados
-    print(f"Salvando resultados em: {results_path}")
-    pathlib.Path(results_path).mkdir(parents=True, exist_ok=True)
-
-    csv_path = pathlib.Path(results_path) / f"resultados_{league}_{today}.csv"
-    json_path = pathlib.Path(results_path) / f"resultados_{league}_{today}.json"
-
-    df_final.to_csv(csv_path, sep=output_config["csv_separator"], 
-                   index=output_config["csv_include_index"], encoding="utf-8")
+    # Salvar resultados (CSV, JSON, catálogo e dataset colunar opcional)
+    arquivos = exportar_resultados(df_final, league, paths, output_config)
+    csv_path, json_path = arquivos["csv"], arquivos["json"]
+    if arquivos["dataset"] is not None:
+        print(f"Dataset colunar: {arquivos['dataset']}")
 
-    with open(json_path, "w", encoding="utf-8") as f:
-        json.dump(output_data, f, indent=2, ensure_ascii=False)
+    if result_cache is not None:
+        table_rows = df_final.rename_axis("Time").reset_index().to_dict(orient="records")
+        result_cache.put(cache_key, {
+            "league": league,
+            "simulation_type": "simple",
+            "table": table_rows,
+            "players": [],
+            "summary": {
+                "total_matches": len(table_rows) * (len(table_rows) - 1),
+                "total_goals": int(df_final["GP"].sum()),
+                "champion": str(df_final.index[0]),
+            },
+            "files": {name: str(arquivos[name]) for name in ("csv", "json", "dataset") if arquivos[name] is not None},
+            "hash": arquivos["hash"],
+        })
 
     # Mostrar tabela na tela
     print(df_final)
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Teste das probabilidades exatas do simulador simples (sem sorteio)
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Adicionar src ao path
+src_path = Path(__file__).parent.parent
+sys.path.insert(0, str(src_path))
+
+from core.simple.analytic import exact_fixture_probabilities
+from core.simple.simulator import sim_game
+
+TIMES = {
+    "Forte": {"ataque": 85, "meio": 80, "defesa": 82, "goleiro": 84},
+    "Medio": {"ataque": 74, "meio": 75, "defesa": 73, "goleiro": 76},
+    "Fraco": {"ataque": 62, "meio": 65, "defesa": 64, "goleiro": 66},
+}
+SIM_CONFIG = {"random_factor_min": 0.8, "random_factor_max": 1.2, "min_expected_goals": 0.1}
+
+
+def sampled_grid(home, away, sim_config, n=60000):
+    np.random.seed(4)
+    scores = np.array([sim_game(home, away, TIMES, sim_config) for _ in range(n)])
+    scores = np.minimum(scores, 10)
+    grid = np.zeros((11, 11))
+    np.add.at(grid, (scores[:, 0], scores[:, 1]), 1 / n)
+    return grid
+
+
+def test_exact_grid_matches_sim_game():
+    """Matriz exata bate com os placares sorteados pelo sim_game, inclusive com o piso de gols ativo"""
+
+    print("🎯 TESTE DAS PROBABILIDADES EXATAS")
+    print("=" * 50)
+
+    # Com piso alto, a média do visitante fraco bate no piso dentro do intervalo do fator
+    for sim_config in (SIM_CONFIG, dict(SIM_CONFIG, min_expected_goals=0.9)):
+        probabilities = exact_fixture_probabilities(TIMES, sim_config)
+        exact = probabilities.score_matrix("Forte", "Fraco")
+        sampled = sampled_grid("Forte", "Fraco", sim_config)
+        print(f"   piso {sim_config['min_expected_goals']}: 1X2 exato {np.round(probabilities.outcome_probabilities('Forte', 'Fraco'), 3)}")
+        assert abs(exact.sum() - 1) < 1e-9
+        assert np.abs(exact - sampled).max() < 0.006
+
+    p_home, p_draw, p_away = probabilities.outcomes()
+    assert len(p_home) == 6 and np.allclose(p_home + p_draw + p_away, 1)
+
+
+def test_expected_table_without_sampling():
+    """Tabela esperada soma os resultados de turno e returno e ordena pela força"""
+
+    probabilities = exact_fixture_probabilities(TIMES, SIM_CONFIG)
+    table = probabilities.expected_table()
+    assert [row["Time"] for row in table] == ["Forte", "Medio", "Fraco"]
+    for row in table:
+        assert abs(row["V"] + row["E"] + row["D"] - 4) < 0.05
+    assert abs(sum(row["GP"] for row in table) - sum(row["GC"] for row in table)) < 0.05
+
+    rows = probabilities.odds_rows()
+    assert {(row["Mandante"], row["Visitante"]) for row in rows} == {
+        (home, away) for home in TIMES for away in TIMES if home != away
+    }
+    only = exact_fixture_probabilities(TIMES, SIM_CONFIG, fixtures=[("Medio", "Forte")])
+    assert np.allclose(only.matrices[0], probabilities.score_matrix("Medio", "Forte"))
+
+
+if __name__ == "__main__":
+    test_exact_grid_matches_sim_game()
+    test_expected_table_without_sampling()
+    print("\n✅ Testes das probabilidades exatas concluídos")
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Teste da camada de serviço da API (jobs e pool de processos, sem FastAPI)
+"""
+
+import sys
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+
+# Adicionar src ao path
+src_path = Path(__file__).parent.parent
+sys.path.insert(0, str(src_path))
+
+from core.service import SimulationEngine
+from core.service.api import Job, SimulationService, match_to_dict
+
+
+def _future(result=None, error=None, cancel=False) -> Future:
+    future = Future()
+    if cancel:
+        future.cancel()
+    elif error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+    return future
+
+
+def test_job_states_and_registry_limits():
+    """Estados do job (inclusive cancelado) e registro limitado por idade e tamanho"""
+
+    print("🗂️ TESTE DOS JOBS DA API")
+    print("=" * 50)
+
+    assert Job("season", [_future(), Future()], sum).status()["status"] == "running"
+    assert Job("season", [_future(1), _future(2)], sum).status()["result"] == 3
+    error = Job("season", [_future(error=ValueError("falhou"))], sum).status()
+    assert error["status"] == "error" and error["error"] == "falhou"
+    assert Job("season", [_future(1), _future(cancel=True)], sum).status()["status"] == "cancelled"
+
+    service = SimulationService(leagues=["premier_league"], workers=1, job_ttl=60, max_jobs=3)
+    running = service._add_job(Job("season", [Future()], sum))
+    old = service._add_job(Job("season", [_future(1)], sum))
+    old.created -= 120                                          # concluído há mais que o TTL
+    service._add_job(Job("season", [_future(2)], sum))
+    assert old.id not in service.jobs and running.id in service.jobs
+
+    jobs = [service._add_job(Job("season", [_future(k)], sum)) for k in range(5)]
+    assert len(service.jobs) == 3 and running.id in service.jobs
+    assert [job.id for job in jobs[-2:]] == [job_id for job_id in service.jobs if job_id != running.id]
+
+    # Vários pedidos ao mesmo tempo (threads do FastAPI) adicionando e podando o registro
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        added = list(pool.map(lambda k: service._add_job(Job("season", [_future(k)], sum)), range(400)))
+    assert service.job_count() == 3 and service.get_job(running.id) is running
+    service.engine.shutdown()
+    print(f"   {len(service.jobs)} jobs no registro (limite 3, o que ainda roda fica)")
+
+
+def test_service_pool_and_concurrent_matches():
+    """Temporada pelo pool aquecido; partidas com seed iguais mesmo em threads simultâneas"""
+
+    service = SimulationService({"cache": {"enabled": False}}, leagues=["premier_league"], workers=1)
+    service.start()
+    try:
+        job = service.submit_season("premier_league", "timestep", 5, False)
+        job.futures[0].result()
+        status = service.jobs[job.id].status()
+        assert status["status"] == "done" and len(status["result"]["table"]) == 20
+        assert "log" not in status["result"]
+
+        engine: SimulationEngine = service.engine
+        teams = list(engine.league_lineups("premier_league"))[:2]
+        names = engine.player_names("premier_league")
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            matches = list(pool.map(
+                lambda _: match_to_dict(engine.simulate_match("premier_league", *teams, seed=11), names), range(8)
+            ))
+        assert all(match == matches[0] for match in matches)
+        print(f"   {teams[0]} {matches[0]['home_goals']} x {matches[0]['away_goals']} {teams[1]} em 8 threads")
+    finally:
+        service.stop()
+
+
+if __name__ == "__main__":
+    test_job_states_and_registry_limits()
+    test_service_pool_and_concurrent_matches()
+    print("\n✅ Testes da camada de serviço concluídos")
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Teste dos níveis de detalhe da partida e da suíte de benchmarks
+"""
+
+import copy
+import json
+import random
+import sys
+import tempfile
+from pathlib import Path
+
+# Adicionar src ao path
+src_path = Path(__file__).parent.parent
+sys.path.insert(0, str(src_path))
+
+from core.advanced_sim.data_loader import LeagueDataLoader
+from core.advanced_sim.simulation.advanced_match import AdvancedMatchSimulator, MatchDetail
+from core.advanced_sim.simulation.profiling import MATCH_PHASES, MatchProfiler
+from core.bench import BenchmarkSuite, write_report
+
+
+def test_stats_detail_matches_full_detail():
+    """Com a mesma seed, STATS dá o mesmo placar e estatísticas que FULL, sem eventos"""
+    
+    print("⏱️ TESTE DOS NÍVEIS DE DETALHE")
+    print("=" * 50)
+    
+    teams = LeagueDataLoader().load_league_for_simulation("premier_league", seed=7)
+    home, away = list(teams)[:2]
+    
+    results = {}
+    for detail in MatchDetail:
+        lineups = copy.deepcopy(teams)
+        random.seed(11)
+        simulator = AdvancedMatchSimulator(detail)
+        results[detail] = [
+            simulator.simulate_match(lineups[home], lineups[away], home, away)
+            for _ in range(5)
+        ]
+    
+    for full, stats in zip(results[MatchDetail.FULL], results[MatchDetail.STATS]):
+        assert (full.home_goals, full.away_goals) == (stats.home_goals, stats.away_goals)
+        assert (full.home_shots, full.away_shots) == (stats.home_shots, stats.away_shots)
+        assert full.home_performances.keys() == stats.home_performances.keys()
+        assert [p.goals for p in full.home_performances.values()] == \
+               [p.goals for p in stats.home_performances.values()]
+        assert full.events and not stats.events
+    
+    print(f"✅ STATS reproduz FULL sem criar eventos")
+
+
+def test_profiler_preserves_results():
+    """Com o profiler ligado os resultados não mudam e cada fase é cronometrada"""
+    
+    teams = LeagueDataLoader().load_league_for_simulation("premier_league", seed=7)
+    home, away = list(teams)[:2]
+    
+    scores = []
+    profiler = MatchProfiler()
+    for simulator in (AdvancedMatchSimulator(), AdvancedMatchSimulator(profiler=profiler)):
+        lineups = copy.deepcopy(teams)
+        random.seed(5)
+        scores.append([
+            (r.home_goals, r.away_goals, r.home_shots, r.away_shots)
+            for r in (simulator.simulate_match(lineups[home], lineups[away], home, away) for _ in range(4))
+        ])
+    
+    assert scores[0] == scores[1]
+    summary = profiler.summary()
+    assert summary["matches"] == 4
+    assert set(summary["phases"]) == set(MATCH_PHASES)
+    assert summary["counters"]["rng_draws"]["per_match"] > 0
+    assert summary["counters"]["events_created"]["total"] > 0
+    
+    print(f"✅ Profiler com {len(summary['phases'])} fases, resultados idênticos")
+
+
+def test_benchmark_suite_writes_report():
+    """Uma rodada mínima da suíte gera o relatório JSON com todos os casos"""
+    
+    suite = BenchmarkSuite(repeats=1, n_matches=5, n_seasons=1)
+    report = suite.run(["match_full", "match_stats", "load_league", "export"])
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write_report(report, Path(tmp) / "bench.json")
+        saved = json.loads(path.read_text(encoding="utf-8"))
+    
+    assert set(saved["benchmarks"]) == {"match_full", "match_stats", "load_league", "export"}
+    for case in saved["benchmarks"].values():
+        assert case["rate"] > 0 and case["peak_memory_kb"] > 0
+    assert saved["benchmarks"]["match_full"]["unit"] == "matches/s"
+    
+    print(f"✅ Relatório com {len(saved['benchmarks'])} casos")
+
+
+if __name__ == "__main__":
+    test_stats_detail_matches_full_detail()
+    test_profiler_preserves_results()
+    test_benchmark_suite_writes_report()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Orçamento de tempo de importação: módulos leves não podem puxar numpy/pandas/yaml
+nem executar trabalho pesado ao serem importados
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+src_path = Path(__file__).parent.parent
+project_root = src_path.parent
+
+# Orçamento (ms) para o import em si, medido dentro do subprocesso depois da
+# biblioteca padrão que qualquer módulo do projeto usa. Hoje fica em ~40 ms; a folga
+# é para máquinas carregadas (CI) não falharem: o que importa de fato é não puxar
+# os módulos pesados, verificado abaixo sem depender do relógio
+IMPORT_BUDGET_MS = 150
+
+HEAVY_MODULES = ("numpy", "pandas", "yaml")
+BASELINE_MODULES = ("dataclasses", "enum", "json", "pathlib", "typing")
+
+MEASURE_SNIPPET = """
+import sys, time
+sys.path[:0] = {paths!r}
+import {baseline}
+start = time.perf_counter()
+import {module}
+elapsed_ms = (time.perf_counter() - start) * 1000
+heavy = [m for m in {heavy!r} if m in sys.modules]
+print(f"{{elapsed_ms:.1f}}|{{','.join(heavy)}}")
+"""
+
+
+def _measure_import(module: str, extra_paths=()) -> tuple[float, list[str]]:
+    """Importa `module` num interpretador novo e retorna (ms, módulos pesados carregados)"""
+    code = MEASURE_SNIPPET.format(
+        paths=[str(src_path), *map(str, extra_paths)],
+        module=module,
+        baseline=", ".join(BASELINE_MODULES),
+        heavy=HEAVY_MODULES
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True, text=True, check=True, cwd=str(project_root)
+    ).stdout.strip().splitlines()[-1]
+    
+    elapsed, heavy = output.split("|")
+    return float(elapsed), [m for m in heavy.split(",") if m]
+
+
+def test_lightweight_imports_within_budget():
+    """Pacote avançado, loader, config e CLI importam rápido e sem dependências pesadas"""
+    
+    print("⏱️  TESTE DE ORÇAMENTO DE IMPORTAÇÃO")
+    print("=" * 50)
+    
+    cases = [
+        ("core.advanced_sim", ()),
+        ("core.advanced_sim.data_loader", ()),
+        ("core.advanced_sim.simulation.season", ()),
+        ("core.data_processor", ()),
+        ("core.simple.simple_sim", ()),
+        ("config", (project_root / "config",)),
+        ("main_cli", (src_path / "core" / "cli", project_root / "config")),
+    ]
+    
+    for module, extra_paths in cases:
+        elapsed_ms, heavy = _measure_import(module, extra_paths)
+        print(f"   {module:<40} {elapsed_ms:6.1f} ms  {heavy or ''}")
+        
+        if module != "core.simple.simple_sim":
+            assert not heavy, f"{module} importou {heavy}"
+            assert elapsed_ms < IMPORT_BUDGET_MS, f"{module} levou {elapsed_ms:.1f} ms"
+        else:
+            # O simulador simples pode carregar numpy (só ele); sem orçamento de tempo
+            assert "pandas" not in heavy and "yaml" not in heavy
+    
+    print(f"\n✅ Importações dentro do orçamento!")
+
+
+if __name__ == "__main__":
+    test_lightweight_imports_within_budget()
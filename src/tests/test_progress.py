@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Teste do fluxo de progresso das simulações de temporada
+"""
+
+import contextlib
+import io
+import sys
+from pathlib import Path
+
+# Adicionar src ao path
+src_path = Path(__file__).parent.parent
+sys.path.insert(0, str(src_path))
+
+from core.advanced_sim.data_loader import LeagueDataLoader
+from core.advanced_sim.simulation.progress import ConsolePrinter, ProgressStream
+from core.advanced_sim.simulation.season import SeasonSimulator
+
+
+def _season(teams, progress=None):
+    team_names = list(teams)[:4]
+    season = SeasonSimulator(progress)
+    season.team_lineups = {name: teams[name] for name in team_names}
+    season.initialize_season(team_names)
+    return season
+
+
+def test_season_is_quiet_by_default_and_streams_events():
+    """Sem assinantes nada é impresso; com assinantes chegam eventos estruturados"""
+    
+    print("📡 TESTE DO FLUXO DE PROGRESSO")
+    print("=" * 50)
+    
+    loader = LeagueDataLoader()
+    
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        _season(loader.load_league_for_simulation("premier_league", seed=5)).simulate_full_season()
+    assert output.getvalue() == ""
+    
+    events = []
+    printed = io.StringIO()
+    progress = ProgressStream([events.append, ConsolePrinter(matches=None, file=printed)], every=4)
+    summary = _season(loader.load_league_for_simulation("premier_league", seed=5), progress).simulate_full_season()
+    
+    kinds = [event.kind for event in events]
+    assert kinds.count("match") == summary["total_matches"] == 12
+    assert kinds.count("matchweek") == 6
+    assert kinds[-1] == "season_end" and kinds[-2] == "table"
+    
+    updates = [event for event in events if event.kind == "progress"]
+    assert [event.done for event in updates] == [4, 8, 12]
+    assert updates[-1].eta == 0 and updates[-1].rate > 0 and updates[-1].memory_kb
+    
+    # Cada resultado chega com os gols da partida
+    goals = sum(len(event.data["goals"]) for event in events if event.kind == "match")
+    assert goals == sum(row["GP"] for row in events[-2].data["rows"])
+    assert "CLASSIFICAÇÃO FINAL" in printed.getvalue()
+    assert "[OK] Temporada concluída! 12 partidas simuladas." in printed.getvalue()
+    
+    print(f"✅ {len(events)} eventos, {len(updates)} atualizações de progresso")
+
+
+if __name__ == "__main__":
+    test_season_is_quiet_by_default_and_streams_events()
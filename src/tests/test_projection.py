@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Teste da projeção de liga por Monte Carlo
+"""
+
+import sys
+from pathlib import Path
+
+# Adicionar src ao path
+src_path = Path(__file__).parent.parent
+sys.path.insert(0, str(src_path))
+
+from core.projection import (
+    PrecisionTargets, ProjectionAccumulator, project_league, project_league_adaptive, simulate_block
+)
+from core.service import SimulationEngine
+
+
+def test_projection_blocks_merge():
+    """Blocos projetados separadamente somam o mesmo que um bloco único"""
+    
+    print("🔮 TESTE DE PROJEÇÃO MONTE CARLO")
+    print("=" * 50)
+    
+    engine = SimulationEngine()
+    try:
+        whole = simulate_block(engine, "premier_league", 4, mode="advanced", seed=10)
+        first = simulate_block(engine, "premier_league", 2, mode="advanced", seed=10)
+        second = simulate_block(engine, "premier_league", 2, mode="advanced", seed=12)
+    finally:
+        engine.shutdown()
+    
+    merged = ProjectionAccumulator("premier_league", "advanced").merge(first).merge(second)
+    assert merged.n_seasons == whole.n_seasons == 4
+    assert merged.points == whole.points
+    
+    projection = merged.result()
+    assert abs(sum(projection.title_odds.values()) - 1.0) < 1e-9
+    assert abs(sum(projection.relegation_odds.values()) - 3.0) < 1e-9
+    assert abs(sum(projection.expected_position.values()) - sum(range(1, 21))) < 1e-9
+    
+    rows = projection.to_rows()
+    assert rows[0]["Pts_esperados"] >= rows[-1]["Pts_esperados"]
+    print(f"   Favorito: {rows[0]['Time']} ({rows[0]['Titulo']:.0%} de título)")
+    
+    print(f"\n✅ Projeção consistente!")
+
+
+def test_adaptive_projection_stops_on_targets():
+    """Para no primeiro bloco que atinge os alvos; sem atingir, para no limite de temporadas"""
+
+    engine = SimulationEngine()
+    seen = []
+    try:
+        loose = project_league_adaptive(
+            engine, "premier_league", PrecisionTargets(title=0.05, relegation=0.05, points=1.0),
+            mode="fitted", seed=3, chunk=20, min_seasons=40,
+            progress=lambda n, worst: seen.append((n, worst))
+        )
+        tight = project_league_adaptive(
+            engine, "premier_league", PrecisionTargets(title=0.001, relegation=None, points=None),
+            mode="fitted", seed=3, chunk=20, max_seasons=60
+        )
+        fixed = project_league(engine, "premier_league", loose.n_seasons, mode="fitted", seed=3)
+    finally:
+        engine.shutdown()
+
+    print(f"   Alvos folgados: {loose.n_seasons} temporadas | alvo apertado: {tight.n_seasons} (limite)")
+    assert loose.converged and loose.n_seasons % 20 == 0 and loose.n_seasons >= 40
+    assert [n for n, _ in seen] == list(range(20, loose.n_seasons + 1, 20))
+    worst = seen[-1][1]
+    assert set(worst) == {"title", "relegation", "points"}
+    assert worst["title"] <= 0.05 and worst["relegation"] <= 0.05 and worst["points"] <= 1.0
+    assert not tight.converged and tight.n_seasons == 60
+
+    # Mesmas seeds de uma projeção fixa com o mesmo número de temporadas
+    assert loose.expected_points == fixed.expected_points
+    errors = loose.standard_errors
+    assert all(0 < error <= 0.05 for error in errors["title"].values())
+    assert all(error <= 1.0 for error in errors["points"].values())
+
+
+if __name__ == "__main__":
+    test_projection_blocks_merge()
+    test_adaptive_projection_stops_on_targets()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Teste da pirâmide de divisões (acesso, rebaixamento e playoffs)
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# Adicionar src ao path
+src_path = Path(__file__).parent.parent
+sys.path.insert(0, str(src_path))
+
+from core.advanced_sim.data_loader import LeagueDataLoader
+from core.advanced_sim.simulation.knockout import penalty_shootout
+from core.advanced_sim.simulation.pyramid import Division, PyramidSimulator, split_league
+
+
+def _divisions(seed=8):
+    lineups = LeagueDataLoader().load_league_for_simulation("premier_league", seed=seed)
+    top, bottom = split_league({name: lineups[name] for name in list(lineups)[:16]}, 2)
+    return [
+        Division("primeira", top, relegated=3),
+        Division("segunda", bottom, promoted=2, playoff=(3, 6)),
+    ]
+
+
+def test_teams_move_between_divisions():
+    """Rebaixados descem, promovidos e vencedor do playoff sobem, com o mesmo estado"""
+
+    print("🔼 TESTE DA PIRÂMIDE DE DIVISÕES")
+    print("=" * 50)
+
+    divisions = _divisions()
+    lineup_objects = {name: lineup for d in divisions for name, lineup in d.teams.items()}
+    pyramid = PyramidSimulator(divisions, seed=8)
+
+    season = pyramid.simulate_season()
+    ranking_top = [row["Time"] for row in season.tables["primeira"]]
+    ranking_bottom = [row["Time"] for row in season.tables["segunda"]]
+    playoff_final = season.playoffs["segunda"][-1]
+
+    assert season.relegated["primeira"] == ranking_top[-3:]
+    assert season.promoted["segunda"] == ranking_bottom[:2] + [playoff_final.winner]
+    assert playoff_final.winner in ranking_bottom[2:6]
+    assert set(divisions[0].teams) == set(ranking_top[:-3]) | set(season.promoted["segunda"])
+    assert len(divisions[0].teams) == len(divisions[1].teams) == 8
+
+    # Nenhum time recarregado: os mesmos objetos mudaram de divisão
+    for division in divisions:
+        for name, lineup in division.teams.items():
+            assert lineup is lineup_objects[name]
+    print(f"   Sobem: {season.promoted['segunda']} | Descem: {season.relegated['primeira']}")
+
+    # Com processos, tabelas e playoff são os mesmos (duas vezes seguidas e em série)
+    parallel = [PyramidSimulator(_divisions(), seed=8, workers=2).simulate_season() for _ in range(2)]
+    for other in parallel:
+        assert other.tables == season.tables
+        assert [(t.home, t.away, t.legs, t.penalties) for t in other.playoffs["segunda"]] == \
+            [(t.home, t.away, t.legs, t.penalties) for t in season.playoffs["segunda"]]
+
+    result = pyramid.run(2)
+    assert [s.season_year for s in result.seasons] == ["2025-26", "2026-27"]
+
+
+def test_rules_and_penalties():
+    """Regras inconsistentes são recusadas; pênaltis sempre têm vencedor"""
+
+    divisions = _divisions()
+    divisions[0].relegated = 2
+    with pytest.raises(ValueError):
+        PyramidSimulator(divisions)
+
+    rng = random.Random(1)
+    for _ in range(200):
+        home, away = penalty_shootout(rng)
+        assert home != away and max(home, away) <= 5 or abs(home - away) == 1
+
+    print("✅ Pirâmide validada!")
+
+
+if __name__ == "__main__":
+    test_teams_move_between_divisions()
+    test_rules_and_penalties()
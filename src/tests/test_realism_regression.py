@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Teste da regressão estatística de realismo contra os histogramas de referência
+"""
+
+import copy
+import sys
+from pathlib import Path
+
+# Adicionar src ao path
+src_path = Path(__file__).parent.parent
+sys.path.insert(0, str(src_path))
+
+from core.bench import RealismSample, collect_sample, compare, load_reference
+
+
+def test_engine_matches_reference_distributions():
+    """Uma amostra nova do motor é compatível com a referência em todas as métricas"""
+    
+    print("📐 TESTE DE REALISMO EM LARGA ESCALA")
+    print("=" * 50)
+    
+    reference = load_reference("premier_league")
+    assert reference.n_matches >= 100_000
+    
+    sample = collect_sample("premier_league", 3800, seed=2024)
+    report = compare(sample, reference)
+    
+    for test in report.tests:
+        print(f"   {test.metric:<8} {test.sample_value:>8.3f} vs {test.reference_value:>8.3f} (p={test.p_value:.3g})")
+    
+    assert sample.n_matches == 3800
+    assert report.passed, report.failures()
+    
+    print(f"✅ Distribuições preservadas")
+
+
+def test_shifted_distribution_is_detected():
+    """Um deslocamento pequeno nos gols (e no 0 a 0) reprova a comparação"""
+    
+    reference = load_reference("premier_league")
+    shifted = RealismSample.from_dict(copy.deepcopy(reference.to_dict()))
+    
+    # ~10% das partidas com um gol a mais (+0,1 gol por jogo)
+    goals = shifted.histograms["goals"]
+    for key in sorted(goals, key=int, reverse=True):
+        moved = goals[key] // 10
+        goals[key] -= moved
+        goals[str(int(key) + 1)] = goals.get(str(int(key) + 1), 0) + moved
+    
+    report = compare(shifted, reference)
+    assert "goals" in report.failures()
+    assert "result" not in report.failures()
+
+
+if __name__ == "__main__":
+    test_engine_matches_reference_distributions()
+    test_shifted_distribution_is_detected()
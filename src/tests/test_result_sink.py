@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Teste da escrita incremental de resultados (JSON Lines)
+"""
+
+import importlib.util
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# Adicionar src ao path
+src_path = Path(__file__).parent.parent
+sys.path.insert(0, str(src_path))
+
+from core.advanced_sim.simulation.full_season import FullSeasonSimulator
+from core.results import (
+    StreamingResultSink, ColumnarDatasetWriter, ResultsCatalog, ResultCache,
+    find_result_files, read_results, read_table, result_key
+)
+
+
+def test_result_sink_roundtrip():
+    """O arquivo gravado em fluxo é lido de volta no formato antigo, com hash válido"""
+    
+    print("💾 TESTE DO ARQUIVO DE RESULTADOS EM FLUXO")
+    print("=" * 50)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "resultados_teste_2025-01-01_00-00-00.jsonl"
+        
+        with StreamingResultSink(path, header={"league": "Teste"}) as sink:
+            sink.write_match("A", "B", 2, 1, shots=[10, 4])
+            sink.write_match("B", "A", 0, 0, shots=[6, 7])
+            sink.write_rows("table", [{"Time": "A", "P": 4}, {"Time": "B", "P": 1}])
+            ids = sink.write_rows("player", [
+                {"Nome": "Atacante", "Gols": 2, "Assistencias": 0},
+                {"Nome": "Meia", "Gols": 0, "Assistencias": 2},
+            ])
+            sink.write_view("top_10_artilheiros", ids)
+            sink.write_view("top_10_assistencias", ids[::-1])
+            hash_value = sink.close(summary={"champion": "A"})
+        
+        data = read_results(path)
+        
+        assert data["hash"] == f"sha256:{hash_value}"
+        assert data["hash_ok"]
+        assert data["league"] == "Teste"
+        assert data["summary"]["champion"] == "A"
+        assert [row["Time"] for row in data["tabela_final"]] == ["A", "B"]
+        assert [row["Nome"] for row in data["top_10_assistencias"]] == ["Meia", "Atacante"]
+        assert data["partidas"][0]["hg"] == 2 and data["partidas"][1]["id"] == 1
+        
+        # Qualquer alteração no arquivo invalida o hash
+        content = path.read_text(encoding="utf-8").replace('"hg":2', '"hg":3')
+        path.write_text(content, encoding="utf-8")
+        assert not read_results(path)["hash_ok"]
+        
+        assert find_result_files(Path(tmp)) == [path]
+        
+        print(f"   Hash: {hash_value[:16]}...")
+    
+    print(f"\n✅ Hash do fluxo verificado!")
+
+
+
+def test_columnar_dataset_partitions():
+    """Execuções vão para partições liga/execução e são lidas coluna a coluna"""
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        writer = ColumnarDatasetWriter(Path(tmp), "npz")
+        writer.write_run("liga_a", "run1", {"table": [{"Time": "A", "P": 3}, {"Time": "B", "P": 0}]})
+        writer.write_run("liga_b", "run1", {"table": [{"Time": "C", "P": 1}]})
+        
+        # Só acréscimo: a mesma execução não é regravada
+        try:
+            writer.write_run("liga_a", "run1", {"table": []})
+            assert False, "execução duplicada deveria falhar"
+        except FileExistsError:
+            pass
+        
+        points = read_table(Path(tmp), "table", columns=["P"])
+        assert sorted(points) == ["P", "league", "run"]
+        assert points["P"].tolist() == [3, 0, 1]
+        assert points["league"].tolist() == ["liga_a", "liga_a", "liga_b"]
+        
+        only_b = read_table(Path(tmp), "table", league="liga_b")
+        assert only_b["Time"].tolist() == ["C"]
+        
+        # Sem pyarrow, parquet vira npz com aviso (e não ImportError depois da temporada)
+        if importlib.util.find_spec("pyarrow") is None:
+            with pytest.warns(RuntimeWarning, match="pyarrow"):
+                fallback = ColumnarDatasetWriter(Path(tmp), "parquet")
+            run = fallback.write_run("liga_c", "run1", {"table": [{"Time": "D", "P": 3}]})
+            assert (run / "table.npz").exists()
+        
+        # O simulador cria o escritor antes de carregar a liga: formato errado falha já
+        with pytest.raises(ValueError, match="parqet"):
+            FullSeasonSimulator(columnar_format="parqet", dataset_dir=Path(tmp), results_dir=Path(tmp))
+
+
+
+def test_results_catalog_index_and_prune():
+    """O catálogo indexa arquivos existentes, registra novos e limpa pelo índice"""
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        results_dir = Path(tmp)
+        league_dir = results_dir / "liga_a"
+        league_dir.mkdir()
+        
+        # Resultados antigos (.json + .csv) já existentes antes do catálogo
+        for day in (1, 2):
+            stem = f"resultados_liga_a_2025-01-0{day}_00-00-00"
+            (league_dir / f"{stem}.json").write_text(json.dumps({
+                "created_at": f"2025-01-0{day}",
+                "tabela_final": [{"index": f"Time {day}", "P": 90}]
+            }), encoding="utf-8")
+            (league_dir / f"{stem}.csv").write_text("Time;P\n", encoding="utf-8")
+        
+        with ResultsCatalog(results_dir) as catalog:
+            assert catalog.count("liga_a") == 2
+            assert catalog.latest("liga_a").champion == "Time 2"
+            
+            new_path = league_dir / "resultados_liga_a_2025-01-03_00-00-00.jsonl"
+            new_path.write_text("", encoding="utf-8")
+            new_id = catalog.add("liga_a", new_path, simulation_type="advanced", champion="Time 3")
+            
+            # Registrar de novo um arquivo antigo atualiza a linha sem mudar o id (nem a ordem)
+            old_path = league_dir / "resultados_liga_a_2025-01-01_00-00-00.json"
+            old_id = catalog.recent("liga_a")[-1].id
+            old_csv = old_path.with_suffix(".csv")
+            assert catalog.add_from_file("liga_a", old_path, extra_files=[old_csv]) == old_id < new_id
+            
+            recent = catalog.recent("liga_a")
+            assert [entry.champion for entry in recent] == ["Time 3", "Time 2", "Time 1"]
+            assert catalog.recent("liga_a", simulation_type="advanced")[0].path == new_path
+            
+            removed = catalog.prune("liga_a", keep=1)
+            assert [entry.champion for entry in removed] == ["Time 2", "Time 1"]
+            assert catalog.count("liga_a") == 1
+        
+        # Arquivos das execuções removidas (inclusive os CSVs) saíram do disco
+        assert sorted(p.name for p in league_dir.iterdir()) == [new_path.name]
+
+
+
+def test_result_cache_keys_and_lru_eviction():
+    """Entradas idênticas têm a mesma chave; o cache remove as menos usadas"""
+    import os
+    
+    key_a = result_key("liga", "hash", "1.0.0", "advanced", {"x": 1}, 42)
+    assert key_a == result_key("liga", "hash", "1.0.0", "advanced", {"x": 1}, 42)
+    assert key_a != result_key("liga", "hash", "1.0.1", "advanced", {"x": 1}, 42)
+    assert key_a != result_key("liga", "hash", "1.0.0", "advanced", {"x": 1}, 43)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        payload = {"table": [{"Time": "A", "P": 3}], "pad": "x" * 1000}
+        cache = ResultCache(Path(tmp), max_bytes=2500)
+        
+        keys = [result_key("liga", "hash", "1.0.0", "simple", {}, seed) for seed in range(3)]
+        for age, key in enumerate(keys[:2]):
+            path = cache.put(key, payload)
+            os.utime(path, (1000 + age, 1000 + age))
+        
+        # Ler a primeira entrada a torna a mais recente
+        assert cache.get(keys[0])["table"][0]["Time"] == "A"
+        cache.put(keys[2], payload)
+        
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) is not None and cache.get(keys[2]) is not None
+        assert cache.size() <= 2500
+
+
+if __name__ == "__main__":
+    test_result_sink_roundtrip()
+    test_columnar_dataset_partitions()
+    test_results_catalog_index_and_prune()
+    test_result_cache_keys_and_lru_eviction()
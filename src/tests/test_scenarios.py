@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Teste dos cenários "e se" (alterações descritas em YAML comparadas com a liga base)
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Adicionar src ao path
+src_path = Path(__file__).parent.parent
+sys.path.insert(0, str(src_path))
+
+from core.advanced_sim.data_loader import LeagueDataLoader
+from core.advanced_sim.models.player import Position
+from core.advanced_sim.stats.tatics.formations import FormationType
+from core.projection import load_scenarios, run_scenarios
+from core.projection.scenarios import apply_lineup_overrides, parse_scenarios
+from core.service import SimulationEngine
+
+ATTACKERS = (Position.ST, Position.CF, Position.LW, Position.RW)
+
+
+def _star(lineup):
+    return max((p for p in lineup.players if p.position in ATTACKERS), key=lambda p: p.get_effective_overall())
+
+
+def test_overrides_change_only_the_listed_team():
+    """Formação, desfalque e atributo aplicados numa cópia; erros claros para nomes inválidos"""
+
+    print("📝 TESTE DAS ALTERAÇÕES DE CENÁRIO")
+    print("=" * 50)
+
+    spec = load_scenarios(src_path.parent / "config" / "scenarios.yaml")
+    assert spec.league == "premier_league" and spec.scenarios
+
+    lineups = LeagueDataLoader().load_league_for_simulation("premier_league", seed=42)
+    team = max(lineups, key=lambda name: lineups[name].get_team_rating())
+    star = _star(lineups[team])
+    keeper = next(p for p in lineups[team].players if p.position == Position.GK)
+    spec = parse_scenarios({
+        "league": "premier_league",
+        "scenarios": {
+            "mudancas": {"teams": {team: {
+                "formation": "3-5-2",
+                "unavailable": [star.name],
+                "players": {keeper.name: {"finishing": 99, "form": 100}},
+            }}},
+        },
+    })
+    changed = apply_lineup_overrides(lineups, spec.scenarios[0])
+
+    lineup = changed[team]
+    assert lineup.formation.name == FormationType.F_3_5_2
+    assert star.name not in {p.name for p in lineup.players} and len(lineup.players) == 11
+    edited = next(p for p in lineup.players if p.name == keeper.name)
+    assert edited.attributes.finishing == 99 and edited.current_form == 100 and keeper.current_form != 100
+    assert star.name in {p.name for p in lineups[team].players}          # base intacta
+    other = next(name for name in lineups if name != team)
+    assert [p.name for p in changed[other].players] == [p.name for p in lineups[other].players]
+
+    for teams, error in (({"Time Inexistente": {}}, KeyError), ({team: {"formation": "2-2-6"}}, ValueError),
+                         ({team: {"formation": "4-5-1"}}, ValueError),
+                         ({team: {"unavailable": ["Jogador Inexistente"]}}, KeyError),
+                         ({team: {"players": {star.name: {"velocidade": 1}}}}, ValueError)):
+        scenario = parse_scenarios({"league": "premier_league", "scenarios": {"x": {"teams": teams}}}).scenarios[0]
+        with pytest.raises(error):
+            apply_lineup_overrides(lineups, scenario)
+    with pytest.raises(ValueError):
+        parse_scenarios({"league": "premier_league", "engine": "event", "scenarios": {"x": {}}})
+    print(f"   {team}: 3-5-2, sem {star.name}, reserva escalado")
+
+
+def test_scenarios_share_the_baseline_draws():
+    """Sem o principal atacante, com finalização pior ou com três zagueiros o time perde pontos"""
+
+    engine = SimulationEngine()
+    lineups = engine.league_lineups("premier_league")
+    team = max(lineups, key=lambda name: lineups[name].get_team_rating())
+    star = _star(lineups[team])
+    spec = parse_scenarios({
+        "league": "premier_league",
+        "seasons": 40,
+        "chunk": 20,
+        "seed": 3,
+        "scenarios": {
+            "sem_estrela": {"teams": {team: {"unavailable": [star.name]}}},
+            "atacante_pior": {"teams": {team: {"players": {star.name: {"finishing": 20, "shooting": 20}}}}},
+            "tres_zagueiros": {"teams": {team: {"formation": "3-5-2"}}},
+        },
+    })
+    report = run_scenarios(spec, engine=engine, workers=1)
+
+    assert report.n_seasons == 40 and set(report.comparisons) == {"sem_estrela", "atacante_pior", "tres_zagueiros"}
+    for comparison in report.comparisons.values():
+        assert comparison.delta["points"][team] < 0
+        assert comparison.delta_se["points"][team] < abs(comparison.delta["points"][team])
+        assert abs(sum(comparison.delta["title"].values())) < 1e-9
+
+    rows = report.to_rows()
+    assert [(row["Cenario"], row["Time"]) for row in rows] == [
+        ("sem_estrela", team), ("atacante_pior", team), ("tres_zagueiros", team)]
+    for row in rows:
+        print(f"   {row['Cenario']}: ΔPts {row['Delta_pts']:+.2f} ± {row['EP_delta_pts']:.2f}")
+
+
+if __name__ == "__main__":
+    test_overrides_change_only_the_listed_team()
+    test_scenarios_share_the_baseline_draws()
+    print("\n✅ Testes de cenários concluídos")
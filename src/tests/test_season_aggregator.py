@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Teste do agregador vetorizado de estatísticas da temporada
+"""
+
+import sys
+import random
+from pathlib import Path
+
+# Adicionar src ao path
+src_path = Path(__file__).parent.parent
+sys.path.insert(0, str(src_path))
+
+from core.advanced_sim.data_loader import LeagueDataLoader
+from core.advanced_sim.simulation.advanced_match import AdvancedMatchSimulator
+from core.advanced_sim.simulation.season import SeasonSimulator
+from core.advanced_sim.stats.season_aggregator import SeasonStatsAggregator
+
+
+def test_batch_matches_naive_totals():
+    """Lote único == soma partida a partida, e rankings batem com ordenação completa"""
+    
+    print("🧮 TESTE DO AGREGADOR DE TEMPORADA")
+    print("=" * 50)
+    
+    random.seed(3)
+    teams = LeagueDataLoader().load_league_for_simulation("premier_league", seed=3)
+    team_names = list(teams.keys())
+    simulator = AdvancedMatchSimulator()
+    
+    results = []
+    for _ in range(60):
+        home, away = random.sample(team_names, 2)
+        results.append(simulator.simulate_match(teams[home], teams[away], home, away))
+    
+    batched = SeasonStatsAggregator(teams)
+    batched.add_matches(results)
+    
+    one_by_one = SeasonStatsAggregator(teams)
+    for result in results:
+        one_by_one.update_match_stats(result)
+    
+    assert (batched.counts == one_by_one.counts).all()
+    
+    # Totais conferem com as performances
+    total_goals = sum(r.home_goals + r.away_goals for r in results)
+    assert batched.column('goals').sum() == total_goals
+    assert batched.column('matches_played').sum() == 22 * len(results)
+    
+    # Ranking via argpartition == ordenação completa
+    everyone = sorted(
+        [s for s in batched.records() if s.goals > 0],
+        key=lambda s: (s.goals, s.assists),
+        reverse=True
+    )
+    top = batched.get_top_scorers(10)
+    assert [(s.goals, s.assists) for s in top] == [(s.goals, s.assists) for s in everyone[:10]]
+    
+    # Por 90 minutos como expressão de array
+    per_90 = batched.per_90('goals')
+    best = int(batched.top_k('goals', 1)[0])
+    assert abs(per_90[best] - batched.record(best).goals * 90 / batched.record(best).minutes_played) < 1e-9
+    
+    print(f"   Artilheiro: {top[0].player_name} ({top[0].goals} gols)")
+    print(f"\n✅ Agregador consistente!")
+
+
+def test_season_simulator_populates_season_stats():
+    """SeasonSimulator preenche SeasonStats (inclusive xG/xA e goleiros) rodada a rodada"""
+    teams = LeagueDataLoader().load_league_for_simulation("premier_league", seed=5)
+    team_names = list(teams)[:4]
+    
+    season = SeasonSimulator()
+    season.team_lineups = {name: teams[name] for name in team_names}
+    season.initialize_season(team_names)
+    season.simulate_full_season()
+    
+    players = [p for name in team_names for p in teams[name].players]
+    total_goals = sum(t["goals_for"] for t in season.table.teams.values())
+    
+    assert sum(p.season_stats.goals for p in players) == total_goals
+    assert all(p.season_stats.matches_played == 6 for p in players)
+    assert sum(p.season_stats.xg for p in players) > 0
+    
+    keepers = [p for p in players if p.position.name == "GK"]
+    conceded = sum(p.season_stats.goals_conceded for p in keepers)
+    assert conceded == sum(t["goals_against"] for name, t in season.table.teams.items()
+                           if any(k in teams[name].players for k in keepers))
+    
+    # player_stats deixa de ficar vazio
+    assert season.get_player_season_stats(players[0].id)["matches_played"] == 6
+
+
+if __name__ == "__main__":
+    test_batch_matches_naive_totals()
+    test_season_simulator_populates_season_stats()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Teste do serviço de simulação em processo
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Adicionar src ao path
+src_path = Path(__file__).parent.parent
+sys.path.insert(0, str(src_path))
+
+from core.results import ResultCache
+from core.service import SimulationEngine, SeasonResult
+
+
+def test_engine_runs_seasons_in_background():
+    """O motor mantém a liga em memória e devolve o resultado como objeto"""
+    
+    print("🛰️ TESTE DO SERVIÇO DE SIMULAÇÃO")
+    print("=" * 50)
+    
+    tmp = tempfile.TemporaryDirectory()
+    engine = SimulationEngine(result_cache=ResultCache(Path(tmp.name)))
+    try:
+        first = engine.submit_season("premier_league", "advanced", seed=1, export=False).result()
+        second = engine.submit_season("premier_league", "advanced", seed=1, export=False).result()
+        
+        assert isinstance(first, SeasonResult)
+        assert len(first.table) == 20
+        assert first.summary["total_matches"] == 380
+        assert first.files == {} and first.hash is None
+        assert "[OK] Temporada concluída!" in first.log
+        assert second.log == ""
+        
+        # Mesma seed, mesma temporada; a liga foi carregada uma única vez
+        assert first.table == second.table
+        assert list(engine._lineups) == ["premier_league"]
+        assert not first.cached and second.cached
+        
+        match = engine.simulate_match("premier_league", first.table[0]["Time"], first.table[1]["Time"], seed=3)
+        assert match.home_goals >= 0 and match.away_goals >= 0
+        
+        # Sem seed não há cache: a temporada é simulada de novo
+        third = engine.simulate_season("premier_league", "advanced", export=False)
+        assert not third.cached
+        
+        print(f"   Temporada em {first.elapsed:.2f}s, repetida via cache")
+    finally:
+        engine.shutdown()
+        tmp.cleanup()
+    
+    print(f"\n✅ Serviço respondendo em processo!")
+
+
+
+def test_concurrent_seasons_do_not_share_state():
+    """Temporadas simultâneas com a mesma seed: mesmo resultado e cada uma com o próprio log"""
+    
+    tmp = tempfile.TemporaryDirectory()
+    engine = SimulationEngine(max_workers=3, result_cache=ResultCache(Path(tmp.name)))
+    stdout = sys.stdout
+    try:
+        futures = [engine.submit_season("premier_league", "advanced", seed=9, export=False, use_cache=False)
+                   for _ in range(3)]
+        results = [future.result() for future in futures]
+        
+        assert all(result.table == results[0].table for result in results)
+        assert all(result.log.count("[OK] Temporada concluída!") == 1 for result in results)
+        assert sys.stdout is stdout
+        print(f"   3 temporadas em paralelo, campeão {results[0].table[0]['Time']} em todas")
+    finally:
+        engine.shutdown()
+        tmp.cleanup()
+
+
+if __name__ == "__main__":
+    test_engine_runs_seasons_in_background()
+    test_concurrent_seasons_do_not_share_state()
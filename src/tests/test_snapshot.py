@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Teste do cache de snapshots das escalações
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Adicionar src ao path
+src_path = Path(__file__).parent.parent
+sys.path.insert(0, str(src_path))
+
+from core.advanced_sim.data_loader import LeagueDataLoader
+from core.advanced_sim.snapshot import LineupSnapshotCache
+
+
+def test_snapshot_roundtrip():
+    """O snapshot reconstrói exatamente o mesmo estado inicial da liga"""
+    
+    print("📸 TESTE DE SNAPSHOT DAS ESCALAÇÕES")
+    print("=" * 50)
+    
+    loader = LeagueDataLoader()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = LineupSnapshotCache(Path(tmp))
+        built = cache.load_or_build(loader, "premier_league", seed=7)
+        cached = cache.load_or_build(loader, "premier_league", seed=7)
+        
+        assert list(built) == list(cached)
+        for team_name in built:
+            assert built[team_name].formation is cached[team_name].formation
+            assert built[team_name].players == cached[team_name].players
+            assert built[team_name].substitutes == cached[team_name].substitutes
+        
+        print(f"   {len(cached)} times restaurados do snapshot")
+    
+    # Mesma seed sem cache gera o mesmo estado sorteado
+    again = loader.load_league_for_simulation("premier_league", seed=7)
+    team_name = next(iter(again))
+    assert [p.fitness for p in again[team_name].players] == [p.fitness for p in built[team_name].players]
+    
+    print(f"\n✅ Snapshot reprodutível!")
+
+
+if __name__ == "__main__":
+    test_snapshot_roundtrip()
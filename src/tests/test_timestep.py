@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Teste do motor de partidas em passos de tempo (lote vetorizado)
+"""
+
+import random
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+# Adicionar src ao path
+src_path = Path(__file__).parent.parent
+sys.path.insert(0, str(src_path))
+
+from core.advanced_sim.data_loader import LeagueDataLoader
+from core.advanced_sim.simulation.advanced_match import EventType, MatchDetail
+from core.advanced_sim.simulation.full_season import FullSeasonSimulator
+from core.advanced_sim.simulation.timestep import TimeSteppedMatchEngine, TimestepConfig
+
+
+def _round_robin(lineups, repeat=1):
+    names = list(lineups)
+    return [(home, away) for home in names for away in names if home != away] * repeat
+
+
+def test_batch_is_deterministic_and_realistic():
+    """Mesma seed, mesmo lote; médias próximas às do motor de eventos"""
+
+    print("⏱️ TESTE DO MOTOR EM PASSOS DE TEMPO")
+    print("=" * 50)
+
+    lineups = LeagueDataLoader().load_league_for_simulation("premier_league", seed=42)
+    fixtures = _round_robin(lineups, repeat=5)
+
+    batch = TimeSteppedMatchEngine(seed=7).simulate(fixtures, lineups)
+    again = TimeSteppedMatchEngine(seed=7).simulate(fixtures, lineups)
+    assert np.array_equal(batch.goals, again.goals)
+    assert np.array_equal(batch.minutes, again.minutes)
+
+    goals = batch.goals.sum(axis=1)
+    shots = batch.team_totals("shots").sum(axis=1)
+    reds = batch.team_totals("red_cards").sum(axis=1)
+    print(f"   Gols/partida: {goals.mean():.2f} | Finalizações: {shots.mean():.1f} | Vermelhos: {reds.mean():.2f}")
+    assert batch.goals.shape == (len(fixtures), 2)
+    assert 2.0 < goals.mean() < 2.8
+    assert 18 < shots.mean() < 22
+    assert 0.05 < reds.mean() < 0.4
+
+    # Trocas e expulsões mudam quem está em campo
+    # (a quantidade de trocas varia de jogo para jogo, não é sempre o máximo)
+    assert 3.5 < batch.substitutions.mean() < TimestepConfig().max_substitutions
+    assert len(np.unique(batch.substitutions)) >= 3
+    assert (batch.played.sum(axis=-1) == 11 + batch.substitutions).all()
+    assert (batch.minutes[batch.played] > 0).all() and batch.minutes.max() == 90
+
+    # Menos finalizações com um jogador a menos desde o início
+    no_reds = TimeSteppedMatchEngine(TimestepConfig(red_cards_per_match=0.0), seed=1)
+    early_red = TimeSteppedMatchEngine(TimestepConfig(red_cards_per_match=40.0), seed=1)
+    calm = no_reds.simulate(fixtures, lineups).team_totals("shots").mean()
+    chaotic = early_red.simulate(fixtures, lineups).team_totals("shots").mean()
+    assert chaotic < calm
+
+
+def test_results_feed_the_season_pipeline():
+    """Resultados com eventos em ordem e a temporada completa no modo em lote"""
+
+    lineups = LeagueDataLoader().load_league_for_simulation("premier_league", seed=3)
+    fixtures = _round_robin(lineups)[:40]
+    results = TimeSteppedMatchEngine(seed=3).simulate_results(fixtures, lineups, MatchDetail.FULL)
+
+    for result in results:
+        minutes = [event.minute for event in result.events]
+        assert minutes == sorted(minutes)
+        scored = [event for event in result.events if event.event_type == EventType.GOAL]
+        assert len(scored) == result.home_goals + result.away_goals
+        home_goals = sum(p.goals for p in result.home_performances.values())
+        assert home_goals == result.home_goals
+    assert any(event.event_type == EventType.SUBSTITUTION for result in results for event in result.events)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        random.seed(11)
+        season = FullSeasonSimulator("premier_league", teams=lineups, results_dir=Path(tmp),
+                                     match_engine="timestep")
+        rounds = season.generate_rounds()
+        assert len(rounds) == 38 and all(len({t for f in r for t in f}) == 20 for r in rounds)
+        assert sorted(f for r in rounds for f in r) == sorted(_round_robin(lineups))
+
+        # Forma, fadiga e lesões passam de uma rodada para a outra
+        form = {p.id: p.current_form for lineup in lineups.values() for p in lineup.players + lineup.substitutes}
+        table = season.simulate_full_season(stream_results=False)
+        players_after = [p for lineup in lineups.values() for p in lineup.players + lineup.substitutes]
+        assert sum(p.current_form != form[p.id] for p in players_after) > len(players_after) // 2
+        assert any(p.current_injury is not None for p in players_after)
+        season.flush_player_stats()
+
+        rows, players, summary = season.result_rows()
+        assert summary["total_matches"] == 380
+        assert sum(stats["goals_for"] for _, stats in table.get_table()) == summary["total_goals"]
+        assert sum(row["Gols"] for row in players) == summary["total_goals"]
+
+    print("✅ Motor em passos de tempo validado!")
+
+
+if __name__ == "__main__":
+    test_batch_is_deterministic_and_realistic()
+    test_results_feed_the_season_pipeline()
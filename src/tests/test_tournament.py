@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Teste dos torneios (fase de grupos e mata-mata)
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Adicionar src ao path
+src_path = Path(__file__).parent.parent
+sys.path.insert(0, str(src_path))
+
+from core.advanced_sim.data_loader import LeagueDataLoader
+from core.advanced_sim.simulation.knockout import penalty_shootout
+from core.advanced_sim.simulation.tournament import (
+    TournamentFormat,
+    TournamentSimulator,
+    bracket_order,
+    champions_league,
+)
+
+
+class _Replay:
+    """Devolve sorteios já feitos, um por cobrança, depois alterna gol e erro"""
+
+    def __init__(self, values):
+        self.values = values
+        self.used = 0
+
+    def random(self):
+        self.used += 1
+        if self.used <= len(self.values):
+            return self.values[self.used - 1]
+        return 0.0 if self.used % 2 else 0.99
+
+
+def test_knockout_bracket():
+    """Chaveamento clássico, confrontos completos e probabilidades consistentes"""
+
+    print("🏆 TESTE DO MATA-MATA")
+    print("=" * 50)
+
+    assert bracket_order(8) == [0, 7, 3, 4, 1, 6, 2, 5]
+
+    lineups = LeagueDataLoader().load_league_for_simulation("premier_league", seed=5)
+    seeds = sorted(lineups, key=lambda name: lineups[name].get_team_rating(), reverse=True)[:8]
+    tournament = TournamentSimulator(lineups, knockout=seeds, seed=5)
+
+    outcome = tournament.run(1)
+    assert outcome.rounds == ["Quartas de final", "Semifinal", "Final", "Campeão"]
+    assert [len(ties) for ties in outcome.bracket.values()] == [4, 2, 1]
+    quarter = outcome.bracket["Quartas de final"][0]
+    assert {quarter.home, quarter.away} == {seeds[0], seeds[7]} and quarter.home == seeds[7]
+    assert len(quarter.legs) == 2 and len(outcome.bracket["Final"][0].legs) == 1
+    for ties in outcome.bracket.values():
+        for tie in ties:
+            home, away = tie.aggregate
+            if tie.penalties:
+                assert home == away and tie.extra_time is not None
+                assert (tie.penalties[0] > tie.penalties[1]) == (tie.winner == tie.home)
+            else:
+                assert (home > away) == (tie.winner == tie.home)
+    assert outcome.champion == outcome.bracket["Final"][0].winner
+
+    many = tournament.run(300)
+    print(f"   Favorito: {many.probabilities()[0]}")
+    assert np.allclose(many.reach.sum(axis=0), [8, 4, 2, 1])
+    assert np.all(np.diff(many.reach, axis=1) <= 0)
+    assert many.champion is None
+
+    # Mesmas cobranças, mesmo placar da disputa lance a lance (com fim antecipado)
+    kicks = np.random.default_rng(9).random((2000, 5, 2))
+    tournament.rng = np.random.default_rng(9)
+    vectorized = tournament._shootouts(2000).tolist()
+    decided = 0
+    for k, score in enumerate(vectorized):
+        replay = _Replay(kicks[k].ravel().tolist())
+        expected = penalty_shootout(replay)
+        if replay.used <= 10:                      # decidida nas 5 cobranças
+            decided += 1
+            assert tuple(score) == expected
+    assert decided > 1200
+
+    with pytest.raises(ValueError):
+        TournamentSimulator(lineups, knockout=seeds[:6])
+
+
+def test_champions_league_groups():
+    """Grupos sem times do mesmo país, classificados e a mesma seed repete o torneio"""
+
+    fmt = TournamentFormat(group_legs=1)
+    tournament = champions_league(top=4, seed=3, format=fmt)
+    assert len(tournament.groups) == 5 and all(len(group) == 4 for group in tournament.groups)
+
+    leagues = {}
+    loader = LeagueDataLoader()
+    for league in loader.get_available_leagues():
+        leagues.update(dict.fromkeys(loader.load_league_for_simulation(league, seed=3), league))
+    for group in tournament.groups:
+        assert len({leagues[team] for team in group}) == 4
+
+    outcome = tournament.run(1)
+    assert all(len(table) == 4 for table in outcome.groups)
+    assert all(sum(row["Pts"] for row in table) in range(12, 19) for table in outcome.groups)
+    winners = {table[0]["Time"] for table in outcome.groups}
+    quarters = outcome.bracket["Quartas de final"]
+    assert winners <= {team for tie in quarters for team in (tie.home, tie.away)}
+
+    again = champions_league(top=4, seed=3, format=fmt).run(1)
+    assert again.champion == outcome.champion and again.groups == outcome.groups
+
+    print("✅ Torneios validados!")
+
+
+if __name__ == "__main__":
+    test_knockout_bracket()
+    test_champions_league_groups()
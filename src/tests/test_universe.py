@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Teste do universo (todas as ligas e a copa europeia na mesma temporada)
+"""
+
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+# Adicionar src ao path
+src_path = Path(__file__).parent.parent
+sys.path.insert(0, str(src_path))
+
+from core.advanced_sim.data_loader import LeagueDataLoader
+from core.advanced_sim.models.player import InjuryType, Position
+from core.advanced_sim.simulation.universe import CUP, UniverseSimulator
+
+
+def test_universe_interleaves_competitions():
+    """Jogos em ordem de data, copa no meio da semana e estatísticas somando as competições"""
+
+    print("🌍 TESTE DO UNIVERSO")
+    print("=" * 50)
+
+    universe = UniverseSimulator(seed=7)
+    played = []
+    play_day = universe._play_day
+    universe._play_day = lambda day, fixtures: played.append((day, fixtures)) or play_day(day, fixtures)
+    result = universe.run()
+    print(f"   {result.matches} jogos em {result.elapsed:.1f}s | campeão da copa: {result.cup_champion}")
+
+    days = [day for day, _ in played]
+    assert days == sorted(days) and len(set(days)) == len(days)
+    cup_days = {day for day, fixtures in played if any(f.competition == CUP for f in fixtures)}
+    league_days = {day for day, fixtures in played if any(f.competition != CUP for f in fixtures)}
+    assert cup_days and not cup_days & league_days
+    assert min(league_days) < min(cup_days) and max(cup_days) < max(league_days)
+
+    league_games = sum(row["J"] for rows in result.tables.values() for row in rows) // 2
+    cup_games = sum(len(fixtures) for _, fixtures in played) - league_games
+    assert result.matches == league_games + cup_games
+    assert len(result.cup_groups) == 5 and list(result.cup_bracket) == ["Quartas de final", "Semifinal", "Final"]
+    assert result.cup_champion == result.cup_bracket["Final"][0].winner
+
+    # Os jogadores dos finalistas somam jogos de liga e de copa
+    final = result.cup_bracket["Final"][0]
+    for team in (final.home, final.away):
+        league = universe.league_of[team]
+        league_matches = next(row["J"] for row in result.tables[league] if row["Time"] == team)
+        lineup = universe.lineups[team]
+        most_used = max(p.season_stats.matches_played for p in lineup.players + lineup.substitutes)
+        assert most_used > league_matches
+    assert result.injuries > 0 and result.top_scorers
+
+
+def test_injured_starter_misses_next_match():
+    """Lesão vale para o próximo jogo de qualquer competição; o reserva é da mesma faixa do campo"""
+
+    lineups = LeagueDataLoader().load_league_for_simulation("premier_league", seed=2)
+    universe = UniverseSimulator(seed=2, teams={"premier_league": lineups})
+    team = next(iter(lineups))
+    lineup = lineups[team]
+
+    day = date(2024, 9, 18)
+    universe._prepare(team, day)
+    striker = next(p for p in lineup.players if p.position in (Position.ST, Position.CF, Position.LW, Position.RW))
+    striker.get_injured(InjuryType.MINOR, on=day)
+    expected_return = striker.current_injury.expected_return
+
+    universe._prepare(team, day + timedelta(days=3))
+    assert striker not in lineup.players and striker in lineup.substitutes
+    assert len(lineup.players) == 11
+    assert sum(p.position == Position.GK for p in lineup.players) == 1
+    attackers = [p for p in lineup.players if p.position in (Position.ST, Position.CF, Position.LW, Position.RW)]
+    assert attackers
+
+    # Recuperado e descansado, volta ao time-base
+    universe._prepare(team, expected_return + timedelta(days=30))
+    assert not striker.is_injured and striker.fitness >= 70
+    assert striker in lineup.players
+
+    print("✅ Universo validado!")
+
+
+if __name__ == "__main__":
+    test_universe_interleaves_competitions()
+    test_injured_starter_misses_next_match()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Teste da comparação de cenários com números aleatórios comuns e sorteios antitéticos
+"""
+
+import copy
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Adicionar src ao path
+src_path = Path(__file__).parent.parent
+sys.path.insert(0, str(src_path))
+
+from core.advanced_sim.data_loader import LeagueDataLoader
+from core.advanced_sim.models.player import Position
+from core.advanced_sim.simulation.timestep import TimeSteppedMatchEngine
+from core.advanced_sim.simulation.universe import pick_matchday_squad
+from core.projection import SimpleSeasonSampler, compare_scenarios
+
+SIM_CONFIG = {"random_factor_min": 0.8, "random_factor_max": 1.2, "min_expected_goals": 0.1}
+
+
+def test_common_random_numbers_in_batch_engine():
+    """Mesmo `stream`: só mudam os jogos do time alterado; antitético muda os sorteios"""
+
+    print("🎲 TESTE DE NÚMEROS ALEATÓRIOS COMUNS")
+    print("=" * 50)
+
+    lineups = LeagueDataLoader().load_league_for_simulation("premier_league", seed=42)
+    team = max(lineups, key=lambda name: lineups[name].get_team_rating())
+    scenario = copy.deepcopy(lineups)
+    lineup = scenario[team]
+    star = max((p for p in lineup.players if p.position in (Position.ST, Position.CF, Position.LW, Position.RW)),
+               key=lambda p: p.get_effective_overall())
+    star.is_injured = True
+    pick_matchday_squad(lineup, list(lineup.players))
+    assert star not in lineup.players
+
+    fixtures = [(home, away) for home in lineups for away in lineups if home != away]
+    engine = TimeSteppedMatchEngine()
+    base = engine.simulate(fixtures, lineups, stream=5).goals
+    again = engine.simulate(fixtures, lineups, stream=5).goals
+    changed = engine.simulate(fixtures, scenario, stream=5).goals
+    mirrored = engine.simulate(fixtures, lineups, stream=5, antithetic=True).goals
+
+    involved = np.array([team in fixture for fixture in fixtures])
+    assert (base == again).all()
+    assert (base[~involved] == changed[~involved]).all()
+    assert not (base[involved] == changed[involved]).all()
+    assert not (base == mirrored).all()
+    print(f"   {star.name} fora: {int((base[involved] != changed[involved]).any(axis=1).sum())} "
+          f"jogos de {team} mudaram, os outros {int((~involved).sum())} ficaram iguais")
+
+
+def test_paired_delta_needs_far_fewer_seasons():
+    """Diferença entre cenários com erro padrão bem menor que a comparação independente"""
+
+    teams = {
+        f"T{i}": {"ataque": 60 + 2 * i, "meio": 62 + 2 * i, "defesa": 61 + 2 * i, "goleiro": 63 + 2 * i}
+        for i in range(10)
+    }
+    weaker = copy.deepcopy(teams)
+    weaker["T9"]["ataque"] *= 0.9
+
+    baseline, scenario = SimpleSeasonSampler(teams, SIM_CONFIG), SimpleSeasonSampler(weaker, SIM_CONFIG)
+    naive = compare_scenarios(baseline, scenario, 400, seed=2, common_random_numbers=False, antithetic=False)
+    paired = compare_scenarios(baseline, scenario, 400, seed=2)
+
+    gain = naive.delta_se["points"]["T9"] / paired.delta_se["points"]["T9"]
+    print(f"   ΔPts T9: {naive.delta['points']['T9']:+.2f} ± {naive.delta_se['points']['T9']:.2f} (independente) | "
+          f"{paired.delta['points']['T9']:+.2f} ± {paired.delta_se['points']['T9']:.2f} (pareado) -> {gain:.1f}x")
+    assert paired.n_seasons == naive.n_seasons == 400
+    assert paired.delta["points"]["T9"] < 0 and gain > np.sqrt(10)
+    assert abs(paired.delta["points"]["T9"] - naive.delta["points"]["T9"]) < 3 * naive.delta_se["points"]["T9"]
+
+    rows = paired.to_rows()
+    assert rows[0]["Time"] == "T9" and rows[0]["Delta_pts"] == round(paired.delta["points"]["T9"], 2)
+    assert abs(sum(paired.delta["title"].values())) < 1e-9
+
+
+if __name__ == "__main__":
+    test_common_random_numbers_in_batch_engine()
+    test_paired_delta_needs_far_fewer_seasons()
+    print("\n✅ Testes de redução de variância concluídos")